@@ -0,0 +1,181 @@
+"""
+アーカイブからの再解析
+
+ScraperService がアーカイブ（SCRAPER_SNAPSHOT_ARCHIVE=true）に保存した
+ディスカッション一覧・ノートブック一覧のHTML/JSONを再解析し、
+discussions / solutions テーブルを Kaggle に再アクセスせずに更新する。
+セレクタの修正や新しい項目の追加後に、ローカルディスクの速度で全コンペに反映できる。
+
+各URLの最新のスナップショットを使い、JSONがあればJSONを、なければHTMLを解析する。
+称号・称号色は称号キャッシュ（authorsテーブル）から設定する。
+
+Usage:
+    python -m app.batch.reparse                        # アーカイブにある全コンペ
+    python -m app.batch.reparse --comp-id titanic      # 指定したコンペのみ
+    python -m app.batch.reparse --dry-run              # DBに書き込まずに件数だけ表示
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from app.config import SCRAPER_SNAPSHOT_DIR
+from app.services.discussion import sync_listing_items
+from app.services.kaggle_json import extract_discussion_items, extract_notebook_items
+from app.services.snapshot_archive import SnapshotArchive
+
+
+def _latest_pages(archive: SnapshotArchive, page_type: str, comp_id: str) -> List[Dict[str, Any]]:
+    """
+    URLごとに解析するスナップショットを選ぶ（JSONがあればJSON、なければHTML）
+
+    Returns:
+        取得日時の新しい順のスナップショット
+    """
+    pages: Dict[str, Dict[str, Any]] = {}
+    for snapshot in archive.iter_latest(page_type, comp_id):
+        current = pages.get(snapshot['url'])
+        if current is None or (snapshot['content_type'] == 'json' and current['content_type'] != 'json'):
+            pages[snapshot['url']] = snapshot
+    return sorted(pages.values(), key=lambda s: s['fetched_at'], reverse=True)
+
+
+def parse_discussion_pages(archive: SnapshotArchive, scraper: Any, comp_id: str) -> List[Dict[str, Any]]:
+    """
+    アーカイブのディスカッション一覧（Discussions + Writeups）を解析
+
+    同じURLのアイテムが複数ページにある場合は、新しく取得したページの値を使う
+
+    Returns:
+        ScraperService.get_discussions と同じ形式のアイテム（投票数順）
+    """
+    items = []
+    seen_urls = set()
+    for snapshot in _latest_pages(archive, 'discussion_listing', comp_id):
+        if snapshot['content_type'] == 'json':
+            page_items = [
+                item for item in extract_discussion_items(json.loads(snapshot['content']))
+                if not item['is_pinned']
+            ]
+        else:
+            category = 'writeup' if 'tab=writeups' in snapshot['url'] else 'discussion'
+            page_items = scraper._parse_discussion_listing_html(snapshot['content'], category)
+
+        for item in page_items:
+            if item['url'] not in seen_urls:
+                seen_urls.add(item['url'])
+                items.append(item)
+
+    return sorted(items, key=lambda x: x['vote_count'], reverse=True)
+
+
+def parse_notebook_pages(archive: SnapshotArchive, scraper: Any, comp_id: str) -> List[Dict[str, Any]]:
+    """
+    アーカイブのノートブック一覧を解析
+
+    Returns:
+        ScraperService.get_notebooks と同じ形式のアイテム（投票数順）
+    """
+    items = []
+    seen_urls = set()
+    for snapshot in _latest_pages(archive, 'notebook_listing', comp_id):
+        if snapshot['content_type'] == 'json':
+            page_items = extract_notebook_items(json.loads(snapshot['content']))
+        else:
+            page_items = scraper._parse_notebook_listing_html(snapshot['content'])
+
+        for item in page_items:
+            if item['url'] not in seen_urls:
+                seen_urls.add(item['url'])
+                items.append(item)
+
+    return sorted(items, key=lambda x: x['vote_count'], reverse=True)
+
+
+def reparse_competition(
+    comp_id: str,
+    archive: SnapshotArchive,
+    scraper: Any,
+    discussion_service: Any,
+    solution_service: Any,
+    dry_run: bool = False
+) -> Dict[str, Any]:
+    """
+    1コンペ分のアーカイブを再解析してDBに反映
+
+    Args:
+        comp_id: コンペティションID
+        archive: アーカイブ
+        scraper: HTML解析に使う ScraperService
+        discussion_service: DiscussionService
+        solution_service: SolutionService
+        dry_run: DBに書き込まない
+
+    Returns:
+        dict: 解析件数と保存結果
+    """
+    discussions = parse_discussion_pages(archive, scraper, comp_id)
+    notebooks = parse_notebook_pages(archive, scraper, comp_id)
+    result: Dict[str, Any] = {'listing_items': len(discussions), 'notebooks': len(notebooks)}
+
+    if dry_run:
+        return result
+
+    if discussions:
+        result.update(sync_listing_items(comp_id, discussions, discussion_service, solution_service))
+    if notebooks:
+        result['notebook_result'] = solution_service.fetch_and_save_notebooks(
+            competition_id=comp_id,
+            notebooks_data=notebooks
+        )
+    return result
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='アーカイブからディスカッション・解法を再解析')
+    parser.add_argument('--comp-id', action='append', default=None, help='対象のコンペID（複数指定可、省略時は全コンペ）')
+    parser.add_argument('--snapshot-dir', default=str(SCRAPER_SNAPSHOT_DIR), help='アーカイブの保存先')
+    parser.add_argument('--dry-run', action='store_true', help='DBに書き込まずに件数だけ表示')
+    args = parser.parse_args(argv)
+
+    from app.database import get_database
+    from app.repositories.discussion import DiscussionRepository
+    from app.repositories.solution import SolutionRepository
+    from app.services.discussion import DiscussionService
+    from app.services.scraper_service import ScraperService
+    from app.services.solution import SolutionService
+
+    archive = SnapshotArchive(args.snapshot_dir)
+    # HTML解析のみに使う（ブラウザ・HTTP取得・アーカイブ書き込みは行わない）
+    scraper = ScraperService(http_first=False, snapshot_archive=False)
+    db = get_database()
+    discussion_service = DiscussionService(DiscussionRepository(db))
+    solution_service = SolutionService(SolutionRepository(db))
+
+    comp_ids = args.comp_id or sorted(
+        set(archive.comp_ids('discussion_listing')) | set(archive.comp_ids('notebook_listing'))
+    )
+    stats = archive.stats()
+    print(f"📦 アーカイブ: {stats['snapshots']}件のスナップショット（本文 {stats['objects']}件、{stats['bytes'] / 1024 / 1024:.1f}MB）")
+    print(f"🔁 再解析対象: {len(comp_ids)}件のコンペ{'（dry-run）' if args.dry_run else ''}")
+
+    start = time.perf_counter()
+    failed = 0
+    for i, comp_id in enumerate(comp_ids, 1):
+        try:
+            result = reparse_competition(
+                comp_id, archive, scraper, discussion_service, solution_service, dry_run=args.dry_run
+            )
+            print(f"[{i}/{len(comp_ids)}] {comp_id}: {result}")
+        except Exception as e:
+            failed += 1
+            print(f"[{i}/{len(comp_ids)}] ❌ {comp_id}: {e}")
+
+    print(f"\n✅ 完了: {len(comp_ids) - failed}件成功、{failed}件失敗（{time.perf_counter() - start:.1f}秒）")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
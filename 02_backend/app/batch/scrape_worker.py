@@ -0,0 +1,297 @@
+"""
+スクレイピングワーカー
+
+Redis のキュー（app/services/scrape_queue.py）からタスクを取り出して実行する。
+1プロセスで1つのブラウザを使い回し（ScraperService.browser_worker）、結果は
+スクレイピングキャッシュとリポジトリ（discussions / solutions テーブル）に書き込む。
+処理を速くしたい場合は、別コア・別ノードでワーカーを追加で起動する。
+
+複数プロセスで kaggle.com へのリクエスト間隔を揃えるには KAGGLE_RATE_LIMIT_REDIS=true を設定する。
+
+Usage:
+    python -m app.batch.scrape_worker                       # ワーカーを起動
+    python -m app.batch.scrape_worker --until-empty         # キューが空になったら終了
+    python -m app.batch.scrape_worker enqueue discussions titanic house-prices
+    python -m app.batch.scrape_worker enqueue tab_content titanic --tab data
+    python -m app.batch.scrape_worker enqueue discussions --all-active
+    python -m app.batch.scrape_worker stats
+"""
+
+import argparse
+import os
+import signal
+import socket
+import sys
+import time
+import traceback
+from typing import Any, Callable, Dict, Optional
+
+from app.services.rate_limiter import CircuitOpenError
+from app.services.scrape_queue import ScrapeQueue, TASK_TYPES, get_scrape_queue
+
+
+def default_worker_id() -> str:
+    """ワーカーID（ホスト名:プロセスID）"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class ScrapeWorker:
+    """キューのタスクを実行するワーカー"""
+
+    def __init__(
+        self,
+        queue: ScrapeQueue,
+        scraper: Any = None,
+        worker_id: Optional[str] = None,
+        discussion_service: Any = None,
+        solution_service: Any = None,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        初期化
+
+        Args:
+            queue: スクレイピングキュー
+            scraper: ScraperService（None の場合は共有インスタンス）
+            worker_id: ワーカーID（None の場合はホスト名:プロセスID）
+            discussion_service: DiscussionService（None の場合は既定のDB）
+            solution_service: SolutionService（None の場合は既定のDB）
+            sleep: 待機関数（テスト用）
+        """
+        if scraper is None:
+            from app.services.scraper_service import get_scraper_service
+            scraper = get_scraper_service()
+
+        self.queue = queue
+        self.scraper = scraper
+        self.worker_id = worker_id or default_worker_id()
+        self._discussion_service = discussion_service
+        self._solution_service = solution_service
+        self.sleep = sleep
+        self.stopping = False
+        self.completed = 0
+        self.failed = 0
+
+        self.handlers: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            'competition_details': self._run_competition_details,
+            'tab_content': self._run_tab_content,
+            'discussions': self._run_discussions,
+            'notebooks': self._run_notebooks,
+            'discussion_detail': self._run_discussion_detail,
+        }
+
+    @property
+    def discussion_service(self):
+        if self._discussion_service is None:
+            from app.database import get_database
+            from app.repositories.discussion import DiscussionRepository
+            from app.services.discussion import DiscussionService
+            self._discussion_service = DiscussionService(DiscussionRepository(get_database()))
+        return self._discussion_service
+
+    @property
+    def solution_service(self):
+        if self._solution_service is None:
+            from app.database import get_database
+            from app.repositories.solution import SolutionRepository
+            from app.services.solution import SolutionService
+            self._solution_service = SolutionService(SolutionRepository(get_database()))
+        return self._solution_service
+
+    # ==================== タスク ====================
+
+    def _run_competition_details(self, task: Dict[str, Any]) -> Any:
+        result = self.scraper.get_competition_details(task['comp_id'], force_refresh=task.get('force_refresh', False))
+        if not result:
+            raise RuntimeError(f"Failed to scrape competition: {task['comp_id']}")
+        return {'chars': len(result.get('full_text', ''))}
+
+    def _run_tab_content(self, task: Dict[str, Any]) -> Any:
+        result = self.scraper.get_tab_content(
+            task['comp_id'], tab=task['tab'], force_refresh=task.get('force_refresh', False)
+        )
+        if not result:
+            raise RuntimeError(f"Failed to scrape tab: {task['comp_id']}/{task['tab']}")
+        return {'chars': len(result.get('full_text', ''))}
+
+    def _run_discussions(self, task: Dict[str, Any]) -> Any:
+        """ディスカッション・Writeups を差分同期（POST /competitions/{id}/discussions/fetch と同じ処理）"""
+        from app.services.discussion import sync_listing_items
+
+        comp_id = task['comp_id']
+        known_items = {
+            **self.solution_service.get_listing_index(comp_id),
+            **self.discussion_service.get_listing_index(comp_id),
+        }
+        all_items = self.scraper.get_discussions(
+            comp_id=comp_id,
+            max_pages=task.get('max_pages', 3),
+            force_refresh=True,
+            known_items=known_items
+        )
+        if not all_items:
+            raise RuntimeError(f"Failed to fetch discussions: {comp_id}")
+
+        return sync_listing_items(comp_id, all_items, self.discussion_service, self.solution_service, known_items)
+
+    def _run_notebooks(self, task: Dict[str, Any]) -> Any:
+        comp_id = task['comp_id']
+        notebooks = self.scraper.get_notebooks(
+            comp_id=comp_id,
+            max_pages=task.get('max_pages', 3),
+            force_refresh=True
+        )
+        return self.solution_service.fetch_and_save_notebooks(
+            competition_id=comp_id,
+            notebooks_data=notebooks or []
+        )
+
+    def _run_discussion_detail(self, task: Dict[str, Any]) -> Any:
+        result = self.scraper.get_discussion_detail(task['url'], force_refresh=task.get('force_refresh', False))
+        if not result or not result.get('content'):
+            raise RuntimeError(f"Failed to fetch discussion detail: {task['url']}")
+        return {'chars': len(result['content'])}
+
+    # ==================== 実行ループ ====================
+
+    def run_one(self, timeout: int = 5) -> Optional[bool]:
+        """
+        タスクを1つ実行
+
+        Args:
+            timeout: キューが空の場合に待つ秒数
+
+        Returns:
+            成功した場合 True、失敗した場合 False、キューが空の場合 None
+        """
+        self.queue.heartbeat(self.worker_id)
+        reserved = self.queue.reserve(self.worker_id, timeout=timeout)
+        if reserved is None:
+            return None
+
+        raw, task = reserved
+        label = f"{task['type']} {task.get('comp_id') or task.get('url')}"
+        print(f"▶️  [{self.worker_id}] {label} (試行 {task.get('attempts', 0) + 1}回目)", flush=True)
+
+        handler = self.handlers.get(task['type'])
+        start = time.monotonic()
+        try:
+            if handler is None:
+                raise ValueError(f"Unknown task type: {task['type']}")
+            result = handler(task)
+        except CircuitOpenError as e:
+            # kaggle.com へのリクエスト停止中: 試行回数に数えずに戻し、再開まで待つ
+            self.queue.fail(self.worker_id, raw, str(e), count_attempt=False)
+            print(f"🚫 [{self.worker_id}] サーキットオープン: {e.retry_after:.0f}秒待機", flush=True)
+            self.sleep(e.retry_after)
+            return False
+        except Exception as e:
+            retry = self.queue.fail(self.worker_id, raw, f"{type(e).__name__}: {e}")
+            self.failed += 1
+            print(f"❌ [{self.worker_id}] {label}: {e}（{'再試行' if retry else '失敗リストに移動'}）", flush=True)
+            traceback.print_exc()
+            return False
+
+        self.queue.complete(self.worker_id, raw)
+        self.completed += 1
+        print(f"✅ [{self.worker_id}] {label}: {result} ({time.monotonic() - start:.1f}秒)", flush=True)
+        return True
+
+    def run(self, until_empty: bool = False, max_tasks: Optional[int] = None, timeout: int = 5) -> None:
+        """
+        停止シグナル（SIGINT / SIGTERM）を受けるまでタスクを実行
+
+        Args:
+            until_empty: キューが空になったら終了する
+            max_tasks: 実行するタスク数の上限
+            timeout: キューが空の場合に待つ秒数
+        """
+        self.queue.heartbeat(self.worker_id)
+        recovered = self.queue.recover_orphans()
+        if recovered:
+            print(f"♻️  停止したワーカーのタスクを{recovered}件キューに戻しました", flush=True)
+
+        print(f"👷 ワーカー起動: {self.worker_id}", flush=True)
+        executed = 0
+        try:
+            while not self.stopping and (max_tasks is None or executed < max_tasks):
+                outcome = self.run_one(timeout=timeout)
+                if outcome is None:
+                    if until_empty:
+                        break
+                    self.queue.recover_orphans()
+                    continue
+                executed += 1
+        finally:
+            self.queue.unregister(self.worker_id)
+            print(f"👋 ワーカー終了: {self.worker_id}（成功 {self.completed}件、失敗 {self.failed}件）", flush=True)
+
+    def stop(self, *_args) -> None:
+        """現在のタスクが終わったら停止（シグナルハンドラ）"""
+        print(f"⏹️  停止要求を受信: 実行中のタスクの完了後に終了します", flush=True)
+        self.stopping = True
+
+
+def get_active_competition_ids() -> list[str]:
+    """開催中のコンペIDを取得（enqueue --all-active 用）"""
+    from app.database import get_database
+
+    with get_database().get_connection() as conn:
+        rows = conn.execute("SELECT id FROM competitions WHERE status = 'active' ORDER BY id").fetchall()
+    return [row[0] for row in rows]
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='スクレイピングワーカー（Redisキュー）')
+    subparsers = parser.add_subparsers(dest='command')
+
+    parser.add_argument('--until-empty', action='store_true', help='キューが空になったら終了')
+    parser.add_argument('--max-tasks', type=int, default=None, help='実行するタスク数の上限')
+    parser.add_argument('--worker-id', default=None, help='ワーカーID（デフォルト: ホスト名:プロセスID）')
+
+    enqueue_parser = subparsers.add_parser('enqueue', help='タスクを登録')
+    enqueue_parser.add_argument('type', choices=list(TASK_TYPES), help='タスク種別')
+    enqueue_parser.add_argument('targets', nargs='*', help='コンペID（discussion_detail の場合はURL）')
+    enqueue_parser.add_argument('--all-active', action='store_true', help='開催中の全コンペを対象にする')
+    enqueue_parser.add_argument('--tab', default=None, help='tab_content のタブ（例: data）')
+    enqueue_parser.add_argument('--force-refresh', action='store_true', help='キャッシュを無視して再取得')
+
+    subparsers.add_parser('stats', help='キューの状態を表示')
+
+    args = parser.parse_args(argv)
+    queue = get_scrape_queue()
+
+    if args.command == 'stats':
+        for key, value in queue.stats().items():
+            print(f"{key:16s} {value}")
+        return 0
+
+    if args.command == 'enqueue':
+        targets = list(args.targets)
+        if args.all_active:
+            targets.extend(get_active_competition_ids())
+
+        target_param = 'url' if args.type == 'discussion_detail' else 'comp_id'
+        params = {'force_refresh': True} if args.force_refresh else {}
+        if args.tab:
+            params['tab'] = args.tab
+
+        added = sum(queue.enqueue(args.type, **{target_param: target}, **params) for target in targets)
+        print(f"📥 {added}/{len(targets)}件のタスクを登録しました（重複 {len(targets) - added}件）")
+        return 0
+
+    from app.services.scraper_service import get_scraper_service
+
+    scraper = get_scraper_service()
+    worker = ScrapeWorker(queue, scraper=scraper, worker_id=args.worker_id)
+    signal.signal(signal.SIGINT, worker.stop)
+    signal.signal(signal.SIGTERM, worker.stop)
+
+    # プロセス内で1つのブラウザを使い回す（上限でリサイクル）
+    with scraper.browser_worker():
+        worker.run(until_empty=args.until_empty, max_tasks=args.max_tasks)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
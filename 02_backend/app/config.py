@@ -27,9 +27,105 @@ KAGGLE_KEY = os.getenv("KAGGLE_KEY")
 
 # OpenAI API設定
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+# OpenAI互換APIのベースURL（空: api.openai.com。負荷試験では python -m app.services.fake_openai のURL）
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL") or None
+
+# LLMレスポンスの永続キャッシュ（同じ入力の再実行ではAPIを呼び出さない）
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "True").lower() in ("true", "1", "yes")
+LLM_CACHE_PATH = Path(os.getenv("LLM_CACHE_PATH", str(BASE_DIR / "data" / "llm_cache.db")))
+LLM_CACHE_MAX_MB = float(os.getenv("LLM_CACHE_MAX_MB", "512"))  # 超えたら古いものから削除（0 で無制限）
+# LLM呼び出しごとのトークン数・レイテンシの記録（/api/admin/llm-stats・llm_stats_report.py）
+LLM_TELEMETRY_ENABLED = os.getenv("LLM_TELEMETRY_ENABLED", "True").lower() in ("true", "1", "yes")
+LLM_TELEMETRY_PATH = Path(os.getenv("LLM_TELEMETRY_PATH", str(BASE_DIR / "data" / "llm_telemetry.db")))
+# 1件分の互いに依存しないLLM呼び出し（要約・和訳・技術抽出など）を並列に実行する数
+LLM_MAX_PARALLEL_CALLS = int(os.getenv("LLM_MAX_PARALLEL_CALLS", "5"))
+# コンペの充実化で要約・評価指標・タグ・データセット情報を1回の構造化出力で生成する
+# （検証に失敗したフィールドだけ個別の呼び出しで再生成）
+LLM_COMBINED_ENRICHMENT = os.getenv("LLM_COMBINED_ENRICHMENT", "True").lower() in ("true", "1", "yes")
+# 長い本文（ディスカッション・解法・ノートブック）の扱い
+# 各メソッドのトークン予算を超える本文は、チャンクごとに並列で要点を抽出（map）してから
+# 本来のプロンプトで統合する（reduce）。無効の場合は予算で切り詰める
+LLM_MAP_REDUCE_ENABLED = os.getenv("LLM_MAP_REDUCE_ENABLED", "True").lower() in ("true", "1", "yes")
+LLM_CHUNK_TOKENS = int(os.getenv("LLM_CHUNK_TOKENS", "3000"))  # map の1チャンクのトークン数
+# チャンク数の上限（超える場合はチャンクを大きくする）。並列数以下なら map が1巡で終わる
+LLM_MAX_CHUNKS = int(os.getenv("LLM_MAX_CHUNKS", str(LLM_MAX_PARALLEL_CALLS)))
+
+# OpenAI API のレート制限（モデルごとのトークンバケット。0 で無制限）
+LLM_RATE_LIMIT_RPM = float(os.getenv("LLM_RATE_LIMIT_RPM", "500"))
+LLM_RATE_LIMIT_TPM = float(os.getenv("LLM_RATE_LIMIT_TPM", "30000"))
+# Redis でバケットを共有する（APIサーバーと複数のバッチスクリプトで同じ上限を守る）
+LLM_RATE_LIMIT_REDIS = os.getenv("LLM_RATE_LIMIT_REDIS", "False").lower() in ("true", "1", "yes")
+# 429・接続エラー・5xx の再試行（指数バックオフ + ジッター。Retry-After があればそれに従う）
+LLM_RATE_LIMIT_MAX_RETRIES = int(os.getenv("LLM_RATE_LIMIT_MAX_RETRIES", "5"))
+LLM_BACKOFF_BASE_SECONDS = float(os.getenv("LLM_BACKOFF_BASE_SECONDS", "1"))
+LLM_BACKOFF_MAX_SECONDS = float(os.getenv("LLM_BACKOFF_MAX_SECONDS", "60"))
+
+# バッチAPI（enrich_competitions.py --batch など）
+LLM_BATCH_DIR = Path(os.getenv("LLM_BATCH_DIR", str(BASE_DIR / "data" / "llm_batches")))  # 入力JSONLの保存先
+LLM_BATCH_POLL_SECONDS = float(os.getenv("LLM_BATCH_POLL_SECONDS", "30"))
+LLM_BATCH_TIMEOUT_HOURS = float(os.getenv("LLM_BATCH_TIMEOUT_HOURS", "24"))
+
+# Redis設定（キャッシュ・スクレイピングキュー。複数ノードのワーカーは同じRedisを参照する）
+REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
+REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
 
 # デバッグモード
 DEBUG = os.getenv("DEBUG", "False").lower() in ("true", "1", "yes")
 
 # ログレベル
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+
+# スクレイピング設定
+# Kaggle内部APIのJSONレスポンスをキャプチャして解析する（DOM解析はフォールバック）
+SCRAPER_JSON_CAPTURE = os.getenv("SCRAPER_JSON_CAPTURE", "False").lower() in ("true", "1", "yes")
+
+# フィクスチャ記録・再生（"record": 取得したHTML/JSONを保存、"replay": 保存済みの内容で応答、空: 無効）
+SCRAPER_FIXTURE_MODE = os.getenv("SCRAPER_FIXTURE_MODE", "").lower() or None
+SCRAPER_FIXTURE_DIR = Path(os.getenv("SCRAPER_FIXTURE_DIR", str(BASE_DIR / "data" / "fixtures")))
+
+# HTMLパーサー（"auto": lxml があれば lxml、なければ html.parser）
+SCRAPER_HTML_PARSER = os.getenv("SCRAPER_HTML_PARSER", "auto")
+
+# 投稿者の称号キャッシュ（authorsテーブル）の有効期間（日数）。期限切れの投稿者は再判定する
+AUTHOR_TIER_MAX_AGE_DAYS = int(os.getenv("AUTHOR_TIER_MAX_AGE_DAYS", "30"))
+
+# kaggle.com へのリクエストのレート制限（AIMD）とサーキットブレーカー
+KAGGLE_RATE_LIMIT_RPS = float(os.getenv("KAGGLE_RATE_LIMIT_RPS", "0.5"))  # 初期レート（リクエスト/秒）
+KAGGLE_RATE_LIMIT_MIN_RPS = float(os.getenv("KAGGLE_RATE_LIMIT_MIN_RPS", "0.05"))
+KAGGLE_RATE_LIMIT_MAX_RPS = float(os.getenv("KAGGLE_RATE_LIMIT_MAX_RPS", "2.0"))
+KAGGLE_SLOW_RESPONSE_SECONDS = float(os.getenv("KAGGLE_SLOW_RESPONSE_SECONDS", "20"))
+KAGGLE_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("KAGGLE_CIRCUIT_FAILURE_THRESHOLD", "5"))
+KAGGLE_CIRCUIT_COOLDOWN_SECONDS = float(os.getenv("KAGGLE_CIRCUIT_COOLDOWN_SECONDS", "120"))
+# Redis で複数プロセス（APIサーバー・バッチ）のレート制限状態を共有する
+KAGGLE_RATE_LIMIT_REDIS = os.getenv("KAGGLE_RATE_LIMIT_REDIS", "False").lower() in ("true", "1", "yes")
+
+# ブラウザプロファイル（Cookie・ストレージ・HTTPディスクキャッシュ）の保存先。空文字列で毎回新規プロファイル
+SCRAPER_PROFILE_DIR = os.getenv("SCRAPER_PROFILE_DIR", str(BASE_DIR / "data" / "browser_profile"))
+
+# 静的取得可能なページ（コンペ一覧・ディスカッション等の詳細）はまずHTTPで取得し、
+# 必要な内容がない場合だけ Playwright を使う
+SCRAPER_HTTP_FIRST = os.getenv("SCRAPER_HTTP_FIRST", "True").lower() in ("true", "1", "yes")
+SCRAPER_HTTP_TIMEOUT_SECONDS = float(os.getenv("SCRAPER_HTTP_TIMEOUT_SECONDS", "15"))
+
+# 404・内容なしのページを記録する時間（時間）。期間内の再取得はブラウザを起動せずに失敗を返す
+SCRAPER_NEGATIVE_CACHE_TTL_HOURS = float(os.getenv("SCRAPER_NEGATIVE_CACHE_TTL_HOURS", "6"))
+
+# コンペ一覧を並列に取得するページ数（リクエスト間隔はレートリミッターが制御する）
+SCRAPER_LIST_CONCURRENCY = int(os.getenv("SCRAPER_LIST_CONCURRENCY", "4"))
+
+# バッチ用ブラウザワーカーのリサイクル上限（ページ数・プロセスツリーのRSS MB、0 で無制限）
+SCRAPER_BROWSER_MAX_PAGES = int(os.getenv("SCRAPER_BROWSER_MAX_PAGES", "100"))
+SCRAPER_BROWSER_MAX_RSS_MB = float(os.getenv("SCRAPER_BROWSER_MAX_RSS_MB", "1536"))
+
+# スクレイピングワーカー（python -m app.batch.scrape_worker）
+SCRAPE_QUEUE_MAX_ATTEMPTS = int(os.getenv("SCRAPE_QUEUE_MAX_ATTEMPTS", "3"))  # 失敗時の最大試行回数
+# ワーカーの生存確認の有効期間（秒）。期限切れのワーカーが処理中だったタスクはキューに戻す
+SCRAPE_WORKER_HEARTBEAT_TTL_SECONDS = int(os.getenv("SCRAPE_WORKER_HEARTBEAT_TTL_SECONDS", "600"))
+
+# 取得したページのHTML/JSONのアーカイブ（python -m app.batch.reparse で再解析）
+SCRAPER_SNAPSHOT_ARCHIVE = os.getenv("SCRAPER_SNAPSHOT_ARCHIVE", "False").lower() in ("true", "1", "yes")
+SCRAPER_SNAPSHOT_DIR = Path(os.getenv("SCRAPER_SNAPSHOT_DIR", str(BASE_DIR / "data" / "snapshots")))
+
+# ディスカッション詳細の本文クリーニング（ナビゲーション・投票ボタン等を除き、投稿本文と上位コメントだけをLLM・キャッシュに渡す）
+SCRAPER_CLEAN_CONTENT = os.getenv("SCRAPER_CLEAN_CONTENT", "True").lower() in ("true", "1", "yes")
+SCRAPER_CONTENT_MAX_COMMENTS = int(os.getenv("SCRAPER_CONTENT_MAX_COMMENTS", "5"))  # 含めるコメント数（0 でコメントなし）
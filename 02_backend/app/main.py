@@ -4,8 +4,11 @@ FastAPI メインアプリケーション
 KaggleDB のバックエンドAPIエントリーポイント
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+
+from app.services.rate_limiter import CircuitOpenError
 
 # アプリケーション初期化
 app = FastAPI(
@@ -27,10 +30,22 @@ app.add_middleware(
 )
 
 # ルーター登録
-from app.routers import tags, competitions
+from app.routers import tags, competitions, admin
 
 app.include_router(tags.router, prefix="/api", tags=["tags"])
 app.include_router(competitions.router, prefix="/api", tags=["competitions"])
+app.include_router(admin.router, prefix="/api", tags=["admin"])
+
+
+@app.exception_handler(CircuitOpenError)
+def circuit_open_handler(request: Request, exc: CircuitOpenError):
+    """kaggle.com へのリクエスト停止中は 503 と Retry-After を返す"""
+    retry_after = max(1, int(exc.retry_after))
+    return JSONResponse(
+        status_code=503,
+        content={"detail": f"Kaggle is rate limiting requests. Retry after {retry_after} seconds."},
+        headers={"Retry-After": str(retry_after)}
+    )
 
 
 @app.get("/")
@@ -4,12 +4,14 @@
 このパッケージには、アプリケーションで使用するデータモデルが含まれます。
 """
 
+from .author import Author
 from .competition import Competition
 from .discussion import Discussion
 from .solution import Solution
 from .tag import Tag
 
 __all__ = [
+    "Author",
     "Competition",
     "Discussion",
     "Solution",
@@ -0,0 +1,41 @@
+"""
+Authorモデル
+"""
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Optional, Dict, Any
+
+
+@dataclass
+class Author:
+    """投稿者の称号情報（スクレイピング時の称号キャッシュ）"""
+
+    # 必須フィールド
+    name: str
+
+    # オプショナルフィールド
+    tier: Optional[str] = None  # 'Grandmaster', 'Master', 'Expert', 'Contributor', 'Novice'
+    tier_color: Optional[str] = None  # SVG circle の stroke 色（例: "rgb(235, 204, 41)"）
+
+    # メタデータ
+    updated_at: Optional[datetime] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dictに変換"""
+        data = asdict(self)
+
+        if data.get('updated_at') and isinstance(data['updated_at'], datetime):
+            data['updated_at'] = data['updated_at'].isoformat()
+
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Author':
+        """Dictから作成"""
+        if data.get('updated_at') and isinstance(data['updated_at'], str):
+            try:
+                data['updated_at'] = datetime.fromisoformat(data['updated_at'])
+            except (ValueError, TypeError):
+                data['updated_at'] = None
+
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
@@ -26,6 +26,7 @@ class Discussion:
     is_pinned: bool = False
     content: Optional[str] = None
     summary: Optional[str] = None
+    content_hash: Optional[str] = None  # summary生成元の本文の正規化ハッシュ
 
     # メタデータ
     created_at: Optional[datetime] = None
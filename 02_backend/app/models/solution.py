@@ -28,6 +28,7 @@ class Solution:
     content: Optional[str] = None
     summary: Optional[str] = None  # JSON文字列
     techniques: Optional[str] = None  # JSON文字列
+    content_hash: Optional[str] = None  # summary/techniques生成元の本文の正規化ハッシュ
 
     # メタデータ
     created_at: Optional[datetime] = None
@@ -0,0 +1,78 @@
+"""
+AuthorRepository - 投稿者の称号データアクセス
+"""
+from typing import Optional, Dict
+from datetime import datetime
+
+from app.repositories.base import BaseRepository
+from app.models.author import Author
+
+
+class AuthorRepository(BaseRepository):
+    """投稿者リポジトリ"""
+
+    def get_by_name(self, name: str) -> Optional[Author]:
+        """
+        投稿者名で取得
+
+        Args:
+            name: 投稿者名
+
+        Returns:
+            Optional[Author]: 投稿者（存在しない場合はNone）
+        """
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT name, tier, tier_color, updated_at
+                FROM authors WHERE name = ?
+                """,
+                (name,),
+            )
+            row = cursor.fetchone()
+            return Author.from_dict(dict(row)) if row else None
+
+    def get_all(self) -> Dict[str, Author]:
+        """
+        全投稿者を取得
+
+        Returns:
+            dict: {name: Author}
+        """
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT name, tier, tier_color, updated_at FROM authors")
+            return {row['name']: Author.from_dict(dict(row)) for row in cursor.fetchall()}
+
+    def upsert(self, author: Author) -> Author:
+        """
+        投稿者名で既存チェックしてinsert/updateを行う
+
+        Args:
+            author: Authorモデル
+
+        Returns:
+            Author: 作成または更新された投稿者
+        """
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+
+            now = datetime.now()
+
+            cursor.execute(
+                """
+                INSERT INTO authors (name, tier, tier_color, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    tier = excluded.tier,
+                    tier_color = excluded.tier_color,
+                    updated_at = excluded.updated_at
+                """,
+                (author.name, author.tier, author.tier_color, now.isoformat()),
+            )
+            conn.commit()
+
+            author.updated_at = now
+
+        return author
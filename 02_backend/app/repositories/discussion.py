@@ -1,7 +1,7 @@
 """
 DiscussionRepository - ディスカッションデータアクセス
 """
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from datetime import datetime
 
 from app.repositories.base import BaseRepository
@@ -31,8 +31,8 @@ class DiscussionRepository(BaseRepository):
                 INSERT INTO discussions (
                     competition_id, title, author, author_tier, tier_color,
                     url, vote_count, comment_count, category, is_pinned,
-                    content, summary, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    content, summary, content_hash, created_at, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     discussion.competition_id,
@@ -47,6 +47,7 @@ class DiscussionRepository(BaseRepository):
                     1 if discussion.is_pinned else 0,
                     discussion.content,
                     discussion.summary,
+                    discussion.content_hash,
                     now.isoformat(),
                     now.isoformat(),
                 ),
@@ -153,6 +154,7 @@ class DiscussionRepository(BaseRepository):
                     is_pinned = ?,
                     content = ?,
                     summary = ?,
+                    content_hash = ?,
                     updated_at = ?
                 WHERE id = ?
                 """,
@@ -167,6 +169,7 @@ class DiscussionRepository(BaseRepository):
                     1 if discussion.is_pinned else 0,
                     discussion.content,
                     discussion.summary,
+                    discussion.content_hash,
                     now.isoformat(),
                     discussion.id,
                 ),
@@ -198,6 +201,27 @@ class DiscussionRepository(BaseRepository):
             conn.commit()
             return cursor.rowcount > 0
 
+    def get_listing_index(self, competition_id: str) -> Dict[str, Dict[str, Any]]:
+        """
+        一覧ページとの差分判定用に、URLをキーとした既存行の索引を取得
+
+        Args:
+            competition_id: コンペティションID
+
+        Returns:
+            dict: {url: {id, vote_count, comment_count, updated_at}}
+        """
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT id, url, vote_count, comment_count, updated_at
+                FROM discussions WHERE competition_id = ?
+                """,
+                (competition_id,),
+            )
+            return {row['url']: dict(row) for row in cursor.fetchall()}
+
     def upsert_by_url(self, discussion: Discussion) -> Discussion:
         """
         URLで既存チェックしてinsert/updateを行う
@@ -1,7 +1,7 @@
 """
 SolutionRepository - 解法データアクセス
 """
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from datetime import datetime
 
 from app.repositories.base import BaseRepository
@@ -31,8 +31,8 @@ class SolutionRepository(BaseRepository):
                 INSERT INTO solutions (
                     competition_id, title, author, author_tier, tier_color,
                     url, type, medal, rank, vote_count, comment_count,
-                    content, summary, techniques, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    content, summary, techniques, content_hash, created_at, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     solution.competition_id,
@@ -49,6 +49,7 @@ class SolutionRepository(BaseRepository):
                     solution.content,
                     solution.summary,
                     solution.techniques,
+                    solution.content_hash,
                     now.isoformat(),
                     now.isoformat(),
                 ),
@@ -167,6 +168,7 @@ class SolutionRepository(BaseRepository):
                     content = ?,
                     summary = ?,
                     techniques = ?,
+                    content_hash = ?,
                     updated_at = ?
                 WHERE id = ?
                 """,
@@ -183,6 +185,7 @@ class SolutionRepository(BaseRepository):
                     solution.content,
                     solution.summary,
                     solution.techniques,
+                    solution.content_hash,
                     now.isoformat(),
                     solution.id,
                 ),
@@ -214,6 +217,27 @@ class SolutionRepository(BaseRepository):
             conn.commit()
             return cursor.rowcount > 0
 
+    def get_listing_index(self, competition_id: str) -> Dict[str, Dict[str, Any]]:
+        """
+        一覧ページとの差分判定用に、URLをキーとした既存行の索引を取得
+
+        Args:
+            competition_id: コンペティションID
+
+        Returns:
+            dict: {url: {id, vote_count, comment_count, updated_at}}
+        """
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT id, url, vote_count, comment_count, updated_at
+                FROM solutions WHERE competition_id = ?
+                """,
+                (competition_id,),
+            )
+            return {row['url']: dict(row) for row in cursor.fetchall()}
+
     def upsert_by_url(self, solution: Solution) -> Solution:
         """
         URLで既存チェックしてinsert/updateを行う
@@ -0,0 +1,32 @@
+"""
+管理用API ルーター
+
+GET /api/admin/llm-stats - LLM呼び出しのトークン数・レイテンシの集計
+"""
+
+from typing import Optional
+from fastapi import APIRouter, Query
+
+router = APIRouter()
+
+
+@router.get("/admin/llm-stats")
+def get_llm_stats(
+    days: int = Query(7, ge=1, le=90, description="今日を含む直近の日数"),
+    method: Optional[str] = Query(None, description="LLMService のメソッド名でフィルタ")
+):
+    """
+    LLM呼び出しの日・メソッドごとの集計を取得
+
+    Args:
+        days: 集計する日数
+        method: メソッド名でフィルタ
+
+    Returns:
+        dict: {'days': [日・メソッドごとの集計], 'methods': {メソッド: 期間全体の集計}}
+              各集計は calls, cache_hits, errors, retries, prompt_tokens, completion_tokens,
+              p50_ms, p95_ms（レイテンシはキャッシュヒットを除く）
+    """
+    from app.services.llm_telemetry import get_llm_telemetry
+
+    return get_llm_telemetry().stats(days=days, method=method)
@@ -6,9 +6,13 @@ GET /api/competitions/{id} - コンペ詳細取得
 GET /api/competitions/new - 新規コンペ取得
 """
 
-from typing import Optional, Annotated, List
+from typing import Optional, Annotated, Callable, Dict, List
 from fastapi import APIRouter, Query, HTTPException, Depends
+from fastapi.responses import StreamingResponse
+import json
+import queue
 import sqlite3
+import threading
 from app.config import DATABASE_PATH
 from datetime import datetime, timedelta
 import math
@@ -16,6 +20,7 @@ import math
 from app.database import get_database, Database
 from app.repositories.competition import CompetitionRepository
 from app.services.competition import CompetitionService
+from app.services.discussion import sync_listing_items
 
 router = APIRouter()
 
@@ -282,25 +287,17 @@ def get_discussion_content(discussion_id: int):
     }
 
 
-@router.post("/discussions/{discussion_id}/fetch")
-def fetch_discussion_detail(
-    discussion_id: int,
-    service: Annotated["DiscussionService", Depends(get_discussion_service)] = None
-):
+def _discussion_fetch_job(discussion_id: int, service: "DiscussionService"):
     """
-    ディスカッション詳細をスクレイピングして取得・保存
-
-    コンテンツはRedisに3日間キャッシュ、要約のみDBに保存
-
-    Args:
-        discussion_id: ディスカッションID
+    ディスカッション詳細をスクレイピングし、LLM呼び出しと結果の保存処理を返す
 
     Returns:
-        dict: 取得結果と更新されたディスカッション情報
+        (calls, finish): LLM呼び出し（run_many 用）と、その結果を保存してレスポンスを返す関数
     """
     from app.services.scraper_service import get_scraper_service
     from app.services.llm_service import get_llm_service
     from app.services.cache_service import get_cache_service
+    from app.services.content_fingerprint import compute_content_hash, get_fingerprint_stats
 
     # ディスカッションを取得
     discussion = service.get_discussion(discussion_id)
@@ -323,39 +320,102 @@ def fetch_discussion_detail(
     # リンク抽出
     links = extract_links_from_content(content)
 
+    # 本文が前回要約時から変わっていなければLLM出力を使い回す
+    content_hash = compute_content_hash(content)
+    content_unchanged = bool(discussion.summary) and discussion.content_hash == content_hash
+    get_fingerprint_stats().record('discussion', content_unchanged)
+
     # LLMで構造化要約生成と和訳（学習用に詳細な要約を生成）
     llm = get_llm_service()
-    structured_summary = None
-    translated_content = None
+    cached_translation = None
+    calls = {}
 
     if len(content) > 200:  # 200文字以上の場合に処理
-        # 構造化要約生成
-        structured_summary = llm.generate_structured_discussion_summary(
-            content=content,
-            title=discussion.title
-        )
-        # 原文を和訳・整理
-        translated_content = llm.translate_and_organize_discussion(content)
+        if content_unchanged:
+            print(f"✓ 本文に変更なし、既存の要約を使用: discussion {discussion_id}")
+            cached_translation = cache.get_discussion_content(f"{discussion_id}_translated")
+        else:
+            # 構造化要約生成
+            calls["summary"] = lambda: llm.generate_structured_discussion_summary(
+                content=content,
+                title=discussion.title
+            )
+
+        # 原文を和訳・整理（和訳のTTLが切れている場合のみ再生成）
+        if not cached_translation:
+            calls["translation"] = lambda: llm.translate_and_organize_discussion(content)
+
+    def finish(results: dict) -> dict:
+        structured_summary = results.get("summary")
+        translated_content = results.get("translation")
 
         # 和訳もRedisに保存（キーを分ける）
         if translated_content:
             cache.save_discussion_content(f"{discussion_id}_translated", translated_content)
 
-    # データベース更新（contentはNULL、summaryのみ保存）
-    discussion.content = None  # コンテンツはRedisに保存済み
+        # データベース更新（contentはNULL、summaryのみ保存）
+        discussion.content = None  # コンテンツはRedisに保存済み
 
-    if structured_summary:
-        discussion.summary = structured_summary
+        if structured_summary:
+            discussion.summary = structured_summary
+            discussion.content_hash = content_hash
 
-    updated_discussion = service.update_discussion(discussion)
+        updated_discussion = service.update_discussion(discussion)
 
-    return {
-        "success": True,
-        "discussion": updated_discussion.to_dict(),
-        "links": links,
-        "content_cached_in_redis": True,
-        "cache_ttl_days": 3
-    }
+        return {
+            "success": True,
+            "discussion": updated_discussion.to_dict(),
+            "links": links,
+            "content_unchanged": content_unchanged,
+            "content_cached_in_redis": True,
+            "cache_ttl_days": 3
+        }
+
+    return calls, finish
+
+
+@router.post("/discussions/{discussion_id}/fetch")
+def fetch_discussion_detail(
+    discussion_id: int,
+    service: Annotated["DiscussionService", Depends(get_discussion_service)] = None
+):
+    """
+    ディスカッション詳細をスクレイピングして取得・保存
+
+    コンテンツはRedisに3日間キャッシュ、要約のみDBに保存
+    本文の正規化ハッシュが前回要約時と同じ場合は既存の要約を使い回す
+
+    Args:
+        discussion_id: ディスカッションID
+
+    Returns:
+        dict: 取得結果と更新されたディスカッション情報
+    """
+    from app.services.llm_service import get_llm_service
+
+    calls, finish = _discussion_fetch_job(discussion_id, service)
+    # 要約と和訳は互いに依存しないため並列に実行
+    return finish(get_llm_service().run_many(calls))
+
+
+@router.post("/discussions/{discussion_id}/fetch/stream")
+def fetch_discussion_detail_stream(
+    discussion_id: int,
+    service: Annotated["DiscussionService", Depends(get_discussion_service)] = None
+):
+    """
+    ディスカッション詳細の取得・保存（和訳をServer-Sent Eventsで逐次返す）
+
+    イベント: start（接続直後）、delta（{"field": "translation", "text": トークン}）、reset（出力のやり直し）、
+    done（/fetch と同じレスポンス）、error（スクレイピングの失敗なども含む）
+
+    Args:
+        discussion_id: ディスカッションID
+    """
+    return _stream_llm_job(
+        lambda: _discussion_fetch_job(discussion_id, service),
+        {"translate_and_organize_discussion": "translation"}
+    )
 
 
 @router.get("/competitions/{competition_id}/solutions")
@@ -446,6 +506,7 @@ def toggle_favorite(
 @router.post("/competitions/{competition_id}/discussions/fetch")
 def fetch_discussions(
     competition_id: str,
+    incremental: bool = Query(True, description="差分同期（変化のないページで打ち切り、変化した行のみ書き込む）"),
     discussion_service: Annotated["DiscussionService", Depends(get_discussion_service)] = None,
     solution_service: Annotated["SolutionService", Depends(get_solution_service)] = None,
     competition_service: Annotated[CompetitionService, Depends(get_competition_service)] = None
@@ -456,6 +517,7 @@ def fetch_discussions(
 
     Args:
         competition_id: コンペID（slug）
+        incremental: 差分同期モード（Falseの場合は全ページを取得して全件upsert）
 
     Returns:
         dict: 取得結果（ディスカッション・Writeups・解法の新規保存数、更新数、合計数）
@@ -474,12 +536,21 @@ def fetch_discussions(
     # スクレイピング実行
     scraper = get_scraper_service()
 
+    # 差分同期用の既存索引（Discussions は discussions テーブル、Writeups は solutions テーブル）
+    known_items = None
+    if incremental:
+        known_items = {
+            **solution_service.get_listing_index(competition_id),
+            **discussion_service.get_listing_index(competition_id),
+        }
+
     # Discussions + Writeups 両方を取得（新しい実装：重複除去済み）
-    print("\n=== ディスカッション・Writeups取得開始（投票数順・3ページ）===", flush=True)
+    print(f"\n=== ディスカッション・Writeups取得開始（{'新しいコメント順' if incremental else '投票数順'}・3ページ）===", flush=True)
     all_items = scraper.get_discussions(
         comp_id=competition_id,
         max_pages=3,
-        force_refresh=True
+        force_refresh=True,
+        known_items=known_items
     )
 
     if not all_items:
@@ -494,26 +565,36 @@ def fetch_discussions(
 
     print(f"✓ 取得完了: 合計 {len(all_items)}件（Discussions: {discussion_count}件、Writeups: {writeup_count}件）", flush=True)
 
-    # Discussionsを保存（category='discussion' のみ）
-    print(f"\n=== ディスカッション保存開始: {discussion_count}件 ===", flush=True)
-    discussion_result = discussion_service.fetch_and_save_discussions(
-        competition_id=competition_id,
-        discussions_data=discussion_items
-    )
-    print(f"✓ ディスカッション保存完了: {discussion_result}", flush=True)
-
-    # 4. 解法を抽出・保存（全データから）
-    # - Writeups（category='writeup'）は全て解法
-    # - Discussionsはタイトルキーワードでフィルタリング
-    print(f"\n=== 解法抽出・保存開始: {len(all_items)}件のアイテムから ===", flush=True)
-    solution_result = solution_service.fetch_and_save_solutions(
-        competition_id=competition_id,
-        discussions_data=all_items,
-        enable_ai=False,
-        scraper_service=None,
-        llm_service=None
-    )
-    print(f"✓ 解法保存完了: {solution_result}", flush=True)
+    if incremental:
+        # 差分同期（新規・変化ありのアイテムのみ書き込み・解法抽出の対象にする）
+        print(f"\n=== ディスカッション・解法の差分同期開始: {len(all_items)}件 ===", flush=True)
+        sync_result = sync_listing_items(
+            competition_id, all_items, discussion_service, solution_service, known_items
+        )
+        discussion_result = sync_result['discussions']
+        solution_result = sync_result['solutions']
+        print(f"✓ 差分同期完了: {sync_result}", flush=True)
+    else:
+        # Discussionsを保存（category='discussion' のみ）
+        print(f"\n=== ディスカッション保存開始: {discussion_count}件 ===", flush=True)
+        discussion_result = discussion_service.fetch_and_save_discussions(
+            competition_id=competition_id,
+            discussions_data=discussion_items
+        )
+        print(f"✓ ディスカッション保存完了: {discussion_result}", flush=True)
+
+        # 4. 解法を抽出・保存（全データから）
+        # - Writeups（category='writeup'）は全て解法
+        # - Discussionsはタイトルキーワードでフィルタリング
+        print(f"\n=== 解法抽出・保存開始: {len(all_items)}件のアイテムから ===", flush=True)
+        solution_result = solution_service.fetch_and_save_solutions(
+            competition_id=competition_id,
+            discussions_data=all_items,
+            enable_ai=False,
+            scraper_service=None,
+            llm_service=None
+        )
+        print(f"✓ 解法保存完了: {solution_result}", flush=True)
 
     return {
         "success": True,
@@ -677,6 +758,65 @@ def get_notebooks(
     return [dict(nb) for nb in notebooks]
 
 
+# Server-Sent Events
+def _sse_event(event: str, data: dict) -> str:
+    """SSE の1イベント"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _stream_llm_job(job: Callable[[], tuple], fields: Dict[str, str]) -> StreamingResponse:
+    """
+    LLM処理を実行し、fields のメソッドが生成するトークンをSSEで逐次返す
+
+    job（スクレイピングなどの準備を含む）は別スレッドで実行し、start イベントはすぐに返す。
+    クライアントが切断しても最後まで実行して結果を保存する
+
+    Args:
+        job: (calls, finish) を返す関数（calls は run_many 用のLLM呼び出し、
+             finish は呼び出し結果を保存してレスポンスを返す関数で done イベントで送る）。
+             job・finish の HTTPException は error イベントで返す
+        fields: ストリーミングするメソッド名 → イベントのフィールド名
+    """
+    from app.services.llm_service import get_llm_service
+
+    llm = get_llm_service()
+    events: "queue.Queue[tuple]" = queue.Queue()
+
+    def sink(method: str, delta: Optional[str]) -> None:
+        if delta is None:
+            events.put(("reset", {"field": fields[method]}))
+        else:
+            events.put(("delta", {"field": fields[method], "text": delta}))
+
+    def work() -> None:
+        try:
+            calls, finish = job()
+            with llm.streaming(sink, fields):
+                results = llm.run_many(calls) if calls else {}
+            events.put(("done", finish(results)))
+        except HTTPException as e:
+            events.put(("error", {"status_code": e.status_code, "detail": e.detail}))
+        except Exception as e:
+            events.put(("error", {"status_code": 500, "detail": str(e)}))
+
+    threading.Thread(target=work, name="llm-stream", daemon=True).start()
+
+    def generate():
+        # 接続直後に送り、プロキシのバッファリングを避ける
+        yield _sse_event("start", {"fields": sorted(set(fields.values()))})
+        while True:
+            event, data = events.get()
+            yield _sse_event(event, data)
+            if event in ("done", "error"):
+                return
+
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 def extract_links_from_content(content: str) -> dict:
     """
     本文からリンクを抽出
@@ -761,22 +901,17 @@ def get_solution_content(solution_id: int):
     }
 
 
-@router.post("/solutions/{solution_id}/fetch")
-def fetch_solution_detail(solution_id: int):
+def _solution_fetch_job(solution_id: int):
     """
-    解法詳細をスクレイピングして取得・保存
-
-    コンテンツはRedisに3日間キャッシュ、要約と技術情報のみDBに保存
-
-    Args:
-        solution_id: 解法ID
+    解法詳細をスクレイピングし、LLM呼び出しと結果の保存処理を返す
 
     Returns:
-        dict: 取得結果と更新された解法情報
+        (calls, finish): LLM呼び出し（run_many 用）と、その結果を保存してレスポンスを返す関数
     """
     from app.services.scraper_service import get_scraper_service
     from app.services.llm_service import get_llm_service
     from app.services.cache_service import get_cache_service
+    from app.services.content_fingerprint import compute_content_hash, get_fingerprint_stats
 
     # 解法の存在確認
     conn = sqlite3.connect(DATABASE_PATH)
@@ -809,61 +944,120 @@ def fetch_solution_detail(solution_id: int):
     # リンク抽出
     links = extract_links_from_content(content)
 
+    # 本文が前回要約時から変わっていなければLLM出力を使い回す
+    content_hash = compute_content_hash(content)
+    content_unchanged = bool(solution_dict.get('summary')) and solution_dict.get('content_hash') == content_hash
+    get_fingerprint_stats().record('solution', content_unchanged)
+
     # LLMで構造化要約生成と和訳
     llm = get_llm_service()
     structured_summary = None
     translated_content = None
-
-    if len(content) > 200:  # 200文字以上の場合に処理
+    techniques_json = None
+
+    calls = {}
+    if content_unchanged:
+        print(f"✓ 本文に変更なし、既存の要約・技術情報を使用: solution {solution_id}")
+        structured_summary = solution_dict['summary']
+        translated_content = cache.get_solution_content(f"{solution_id}_translated")
+    elif len(content) > 200:  # 200文字以上の場合に処理
         # 構造化要約生成
-        structured_summary = llm.generate_structured_solution_summary(
+        calls["summary"] = lambda: llm.generate_structured_solution_summary(
             content=content,
             title=solution_dict['title']
         )
-        # 原文を和訳・整理
-        translated_content = llm.translate_and_organize_discussion(content)
 
-        # 和訳もRedisに保存
-        if translated_content:
-            cache.save_solution_content(f"{solution_id}_translated", translated_content)
+    # 原文を和訳・整理（和訳のTTLが切れている場合のみ再生成）
+    if len(content) > 200 and not translated_content:
+        calls["translation"] = lambda: llm.translate_and_organize_discussion(content)
 
     # 技術抽出
-    techniques_json = llm.extract_solution_techniques(content, solution_dict['title'])
+    if content_unchanged:
+        techniques_json = solution_dict.get('techniques')
+    else:
+        calls["techniques"] = lambda: llm.extract_solution_techniques(content, solution_dict['title'])
 
-    # データベース更新（contentはNULL、summaryとtechniquesのみ保存）
-    conn = sqlite3.connect(DATABASE_PATH)
-    cursor = conn.cursor()
+    def finish(results: dict) -> dict:
+        summary = results.get("summary", structured_summary)
+        techniques = results.get("techniques", techniques_json)
 
-    cursor.execute("""
-        UPDATE solutions
-        SET content = NULL,
-            summary = ?,
-            techniques = ?,
-            updated_at = ?
-        WHERE id = ?
-    """, (
-        structured_summary,
-        techniques_json,
-        datetime.now().isoformat(),
-        solution_id
-    ))
+        # 和訳もRedisに保存
+        if results.get("translation"):
+            cache.save_solution_content(f"{solution_id}_translated", results["translation"])
 
-    conn.commit()
+        # データベース更新（contentはNULL、summaryとtechniquesのみ保存）
+        conn = sqlite3.connect(DATABASE_PATH)
+        cursor = conn.cursor()
 
-    # 更新後の解法を取得
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM solutions WHERE id = ?", (solution_id,))
-    updated_solution = dict(cursor.fetchone())
-    conn.close()
+        cursor.execute("""
+            UPDATE solutions
+            SET content = NULL,
+                summary = ?,
+                techniques = ?,
+                content_hash = ?,
+                updated_at = ?
+            WHERE id = ?
+        """, (
+            summary,
+            techniques,
+            content_hash if summary else None,
+            datetime.now().isoformat(),
+            solution_id
+        ))
 
-    return {
-        "success": True,
-        "solution": updated_solution,
-        "links": links,
-        "content_cached_in_redis": True,
-        "cache_ttl_days": 3
-    }
+        conn.commit()
+
+        # 更新後の解法を取得
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        cursor.execute("SELECT * FROM solutions WHERE id = ?", (solution_id,))
+        updated_solution = dict(cursor.fetchone())
+        conn.close()
+
+        return {
+            "success": True,
+            "solution": updated_solution,
+            "links": links,
+            "content_unchanged": content_unchanged,
+            "content_cached_in_redis": True,
+            "cache_ttl_days": 3
+        }
+
+    return calls, finish
+
+
+@router.post("/solutions/{solution_id}/fetch")
+def fetch_solution_detail(solution_id: int):
+    """
+    解法詳細をスクレイピングして取得・保存
+
+    コンテンツはRedisに3日間キャッシュ、要約と技術情報のみDBに保存
+    本文の正規化ハッシュが前回要約時と同じ場合は既存の要約・技術情報を使い回す
+
+    Args:
+        solution_id: 解法ID
+
+    Returns:
+        dict: 取得結果と更新された解法情報
+    """
+    from app.services.llm_service import get_llm_service
+
+    calls, finish = _solution_fetch_job(solution_id)
+    # 要約・和訳・技術抽出は互いに依存しないため並列に実行
+    return finish(get_llm_service().run_many(calls))
+
+
+@router.post("/solutions/{solution_id}/fetch/stream")
+def fetch_solution_detail_stream(solution_id: int):
+    """
+    解法詳細の取得・保存（和訳をServer-Sent Eventsで逐次返す）
+
+    イベントは /discussions/{discussion_id}/fetch/stream と同じ（done は /fetch と同じレスポンス）
+
+    Args:
+        solution_id: 解法ID
+    """
+    return _stream_llm_job(lambda: _solution_fetch_job(solution_id), {"translate_and_organize_discussion": "translation"})
 
 
 @router.post("/competitions/{competition_id}/data/fetch")
@@ -1006,23 +1200,20 @@ def generate_competition_summary(
     }
 
 
-@router.post("/notebooks/{notebook_id}/summarize")
-def summarize_notebook(
-    notebook_id: int,
-    solution_service: Annotated["SolutionService", Depends(get_solution_service)] = None
-):
+def _notebook_summary_job(notebook_id: int, refresh: bool):
     """
-    ノートブックの要約を生成
+    ノートブックを取得し、要約のLLM呼び出しと結果の保存処理を返す
 
-    Args:
-        notebook_id: ノートブックID（solutionsテーブルのid）
+    既存の要約を使う場合は LLM 呼び出しなし（calls が空）で、finish がその要約を返す。
+    refresh の場合はキャッシュ（取得済み本文・取得失敗）を使わずに再取得し、常に要約を再生成する
 
     Returns:
-        要約のJSON
+        (calls, finish): LLM呼び出し（run_many 用）と、その結果を保存してレスポンスを返す関数
     """
     import json
     from app.services.scraper_service import get_scraper_service
     from app.services.llm_service import get_llm_service
+    from app.services.content_fingerprint import compute_content_hash
 
     # 1. データベースからノートブック情報を取得
     conn = sqlite3.connect(DATABASE_PATH)
@@ -1035,33 +1226,34 @@ def summarize_notebook(
     """, (notebook_id,))
 
     notebook = cursor.fetchone()
+    conn.close()
 
     if not notebook:
-        conn.close()
         raise HTTPException(status_code=404, detail="Notebook not found")
 
     notebook_dict = dict(notebook)
 
-    # すでに要約がある場合は返す
+    # 既存の要約（JSON解析エラーの場合は再生成）
+    existing_summary = None
     if notebook_dict.get('summary'):
-        conn.close()
         try:
-            summary = json.loads(notebook_dict['summary'])
-            return {
-                "success": True,
-                "summary": summary,
-                "cached": True
-            }
+            existing_summary = json.loads(notebook_dict['summary'])
         except json.JSONDecodeError:
-            # JSON解析エラーの場合は再生成
             pass
 
+    # すでに要約がある場合は返す
+    if existing_summary is not None and not refresh:
+        return {}, lambda results: {
+            "success": True,
+            "summary": existing_summary,
+            "cached": True
+        }
+
     # 2. スクレイパーでノートブックのコンテンツを取得
     scraper = get_scraper_service()
-    detail = scraper.get_discussion_detail(notebook_dict['url'])
+    detail = scraper.get_discussion_detail(notebook_dict['url'], force_refresh=refresh)
 
     if not detail or not detail.get('content'):
-        conn.close()
         raise HTTPException(status_code=500, detail="Failed to fetch notebook content")
 
     content = detail['content']
@@ -1071,33 +1263,107 @@ def summarize_notebook(
     cache = get_cache_service()
     cache.save_solution_content(notebook_id, content)
 
+    # 要約した本文のハッシュ（明示的な refresh では一致しても要約を再生成する）
+    content_hash = compute_content_hash(content)
+
     # 3. LLMで要約を生成
     llm = get_llm_service()
-    summary_json = llm.summarize_notebook(
-        content=content,
-        title=notebook_dict['title']
-    )
+    calls = {"summary": lambda: llm.summarize_notebook(content=content, title=notebook_dict['title'])}
+
+    def finish(results: dict) -> dict:
+        summary_json = results["summary"]
+        if not summary_json or summary_json == "{}":
+            raise HTTPException(status_code=500, detail="Failed to generate summary")
 
-    if not summary_json or summary_json == "{}":
+        # 4. データベースに保存（contentは保存しない）
+        conn = sqlite3.connect(DATABASE_PATH)
+        cursor = conn.cursor()
+        cursor.execute("""
+            UPDATE solutions
+            SET summary = ?, content_hash = ?
+            WHERE id = ?
+        """, (summary_json, content_hash, notebook_id))
+
+        conn.commit()
         conn.close()
-        raise HTTPException(status_code=500, detail="Failed to generate summary")
 
-    # 4. データベースに保存（contentは保存しない）
-    cursor.execute("""
-        UPDATE solutions
-        SET summary = ?
-        WHERE id = ?
-    """, (summary_json, notebook_id))
+        # 5. 要約を返す
+        summary = json.loads(summary_json)
+        return {
+            "success": True,
+            "summary": summary,
+            "cached": False,
+            "content_unchanged": False,
+            "content_cached_in_redis": True,
+            "cache_ttl_days": 3
+        }
 
-    conn.commit()
-    conn.close()
+    return calls, finish
 
-    # 5. 要約を返す
-    summary = json.loads(summary_json)
-    return {
-        "success": True,
-        "summary": summary,
-        "cached": False,
-        "content_cached_in_redis": True,
-        "cache_ttl_days": 3
-    }
+
+@router.post("/notebooks/{notebook_id}/summarize")
+def summarize_notebook(
+    notebook_id: int,
+    refresh: bool = Query(False, description="キャッシュを使わずにノートブックを再取得し、要約を再生成"),
+    solution_service: Annotated["SolutionService", Depends(get_solution_service)] = None
+):
+    """
+    ノートブックの要約を生成
+
+    Args:
+        notebook_id: ノートブックID（solutionsテーブルのid）
+        refresh: 既存の要約があってもキャッシュを使わずに再取得し、要約を再生成する
+
+    Returns:
+        要約のJSON
+    """
+    from app.services.llm_service import get_llm_service
+
+    calls, finish = _notebook_summary_job(notebook_id, refresh)
+    return finish(get_llm_service().run_many(calls) if calls else {})
+
+
+@router.post("/notebooks/{notebook_id}/summarize/stream")
+def summarize_notebook_stream(
+    notebook_id: int,
+    refresh: bool = Query(False, description="キャッシュを使わずにノートブックを再取得し、要約を再生成")
+):
+    """
+    ノートブックの要約を生成（生成中のJSONをServer-Sent Eventsで逐次返す）
+
+    イベント: start、delta（{"field": "summary", "text": トークン}）、reset、
+    done（/summarize と同じレスポンス）、error
+
+    Args:
+        notebook_id: ノートブックID（solutionsテーブルのid）
+        refresh: 既存の要約があってもキャッシュを使わずに再取得し、要約を再生成する
+    """
+    return _stream_llm_job(lambda: _notebook_summary_job(notebook_id, refresh), {"summarize_notebook": "summary"})
+
+
+@router.get("/content-fingerprint/stats")
+def get_content_fingerprint_stats():
+    """
+    本文の正規化ハッシュによるLLM処理スキップのヒット率を取得
+
+    Returns:
+        dict: 種別（discussion / solution）ごとのヒット数・ミス数・ヒット率
+              （サーバープロセス起動後の集計）
+    """
+    from app.services.content_fingerprint import get_fingerprint_stats
+
+    return get_fingerprint_stats().summary()
+
+
+@router.get("/scraper/fetch-stats")
+def get_scraper_fetch_stats():
+    """
+    スクレイピングのページ種別・取得方法（HTTP / Playwright）ごとの成功率とレイテンシを取得
+
+    Returns:
+        dict: {page_type: {method: {attempts, successes, success_rate, avg_seconds}}}
+              （サーバープロセス起動後の集計）
+    """
+    from app.services.http_fetcher import get_fetch_stats
+
+    return get_fetch_stats().summary()
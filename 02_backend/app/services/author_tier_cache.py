@@ -0,0 +1,117 @@
+"""
+投稿者の称号キャッシュ
+
+ディスカッション一覧のスクレイピングでは、投稿者ごとに称号（tier）と称号色を
+アイテムのテキスト・SVGから判定している。同じ上位ユーザーは多くのコンペに
+登場するため、判定結果を authors テーブルに保存し、有効期間内の投稿者は
+アイテムごとの判定を省略する。
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from app.config import AUTHOR_TIER_MAX_AGE_DAYS
+from app.database import get_database
+from app.models.author import Author
+from app.repositories.author import AuthorRepository
+
+
+class AuthorTierCache:
+    """authorsテーブルをバックエンドとする称号キャッシュ"""
+
+    def __init__(
+        self,
+        repository: Optional[AuthorRepository] = None,
+        max_age_days: int = AUTHOR_TIER_MAX_AGE_DAYS
+    ):
+        """
+        初期化
+
+        Args:
+            repository: 投稿者リポジトリ（None の場合は既定のDB）
+            max_age_days: 称号を再判定するまでの日数
+        """
+        self.repository = repository or AuthorRepository(get_database())
+        self.max_age = timedelta(days=max_age_days)
+        self._authors: Optional[Dict[str, Author]] = None  # 初回参照時にまとめて読み込む
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> Dict[str, Author]:
+        """authorsテーブルを読み込む（テーブルがない場合はキャッシュを無効化）"""
+        if self._authors is None:
+            try:
+                self._authors = self.repository.get_all()
+            except sqlite3.OperationalError as e:
+                print(f"⚠️  称号キャッシュを無効化: {e}（migrations/add_authors_table.py を実行してください）")
+                self._authors = {}
+                self.enabled = False
+        return self._authors
+
+    def get(self, name: Optional[str]) -> Optional[Author]:
+        """
+        有効期間内の称号を取得
+
+        Args:
+            name: 投稿者名
+
+        Returns:
+            Author（未登録・期限切れの場合はNone）
+        """
+        if not name:
+            return None
+
+        author = self._load().get(name)
+        if author and author.updated_at and datetime.now() - author.updated_at < self.max_age:
+            self.hits += 1
+            return author
+
+        self.misses += 1
+        return None
+
+    def remember(self, name: Optional[str], tier: Optional[str], tier_color: Optional[str]) -> None:
+        """
+        判定した称号を保存
+
+        称号も色も判定できなかった場合は保存しない（次回また判定する）
+
+        Args:
+            name: 投稿者名
+            tier: 称号
+            tier_color: 称号色
+        """
+        if not name or not (tier or tier_color):
+            return
+
+        authors = self._load()
+        if not self.enabled:
+            return
+
+        known = authors.get(name)
+        if (
+            known and known.tier == tier and known.tier_color == tier_color
+            and known.updated_at and datetime.now() - known.updated_at < self.max_age
+        ):
+            return
+
+        authors[name] = self.repository.upsert(Author(name=name, tier=tier, tier_color=tier_color))
+
+    def stats_line(self) -> str:
+        """ログ出力用の集計"""
+        lookups = self.hits + self.misses
+        rate = self.hits / lookups * 100 if lookups else 0.0
+        return f"称号キャッシュ: {self.hits}/{lookups}件ヒット ({rate:.0f}%)"
+
+
+# グローバルインスタンス（シングルトンパターン）
+_author_tier_cache_instance = None
+
+
+def get_author_tier_cache() -> AuthorTierCache:
+    """称号キャッシュのインスタンスを取得（シングルトン）"""
+    global _author_tier_cache_instance
+    if _author_tier_cache_instance is None:
+        _author_tier_cache_instance = AuthorTierCache()
+    return _author_tier_cache_instance
@@ -0,0 +1,278 @@
+"""
+メモリ上限付きのブラウザワーカー（バッチ処理用）
+
+通常の ScraperService は呼び出しごとにブラウザを起動・終了するが、
+全コンペを処理するバッチでは起動コストが大きく、Playwright ドライバーと
+Chromium のメモリ（RSS）も処理が進むにつれて増えていく。
+
+BrowserWorker は1つのブラウザを複数の呼び出しで使い回し、
+- 呼び出し終了時に開いたままのページを閉じる
+- 処理ページ数・プロセスツリーのRSSが上限を超えたらブラウザとドライバーを再起動（リサイクル）
+- 実行全体のメモリプロファイル（ピーク・世代ごとの増加量・リークの兆候）を記録
+することで、長時間のバッチを一定のメモリ範囲に収める。
+
+sync API を使うため、1つのワーカーは1つのスレッドからのみ使用すること
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+from app.config import SCRAPER_BROWSER_MAX_PAGES, SCRAPER_BROWSER_MAX_RSS_MB
+
+
+# リサイクル直後のRSSがこれ以上増え続けたらリークの兆候とみなす（MB）
+LEAK_WARNING_MB = 50.0
+
+
+def process_tree_rss_mb(pid: Optional[int] = None) -> Optional[float]:
+    """
+    プロセスと全子孫プロセス（Playwright ドライバー・Chromium）のRSS合計
+
+    psutil があれば使用し、なければ Linux の /proc から集計する
+
+    Args:
+        pid: ルートのプロセスID（None の場合は自プロセス）
+
+    Returns:
+        RSS合計（MB）。計測できない環境では None
+    """
+    pid = pid or os.getpid()
+
+    try:
+        import psutil
+        root = psutil.Process(pid)
+        total = 0
+        for process in [root] + root.children(recursive=True):
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                pass
+        return total / 1024 / 1024
+    except ImportError:
+        pass
+
+    proc = Path('/proc')
+    if not proc.exists():
+        return None
+
+    children = {}
+    rss_kb = {}
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            status = (entry / 'status').read_text()
+        except OSError:
+            continue
+        fields = dict(line.split(':', 1) for line in status.splitlines() if ':' in line)
+        child_pid = int(entry.name)
+        children.setdefault(int(fields.get('PPid', '0').strip()), []).append(child_pid)
+        rss_kb[child_pid] = int(fields.get('VmRSS', '0 kB').split()[0])
+
+    total_kb = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        total_kb += rss_kb.get(current, 0)
+        stack.extend(children.get(current, []))
+    return total_kb / 1024
+
+
+class MemoryProfile:
+    """実行全体のメモリ推移（ブラウザの世代ごと）"""
+
+    def __init__(self):
+        self.start_mb: Optional[float] = None
+        self.peak_mb: float = 0.0
+        self.end_mb: Optional[float] = None
+        self.generations: List[dict] = []  # [{'baseline_mb', 'final_mb', 'pages', 'reason'}]
+
+    def record_sample(self, rss_mb: Optional[float]) -> None:
+        if rss_mb is None:
+            return
+        if self.start_mb is None:
+            self.start_mb = rss_mb
+        self.peak_mb = max(self.peak_mb, rss_mb)
+        self.end_mb = rss_mb
+
+    def start_generation(self, rss_mb: Optional[float]) -> None:
+        """ブラウザ起動直後のRSSを記録"""
+        self.record_sample(rss_mb)
+        self.generations.append({'baseline_mb': rss_mb, 'final_mb': None, 'pages': 0, 'reason': None})
+
+    def end_generation(self, rss_mb: Optional[float], pages: int, reason: str) -> None:
+        """ブラウザ終了直前のRSSと処理ページ数を記録"""
+        self.record_sample(rss_mb)
+        if self.generations:
+            self.generations[-1].update(final_mb=rss_mb, pages=pages, reason=reason)
+
+    def leak_suspected(self) -> bool:
+        """
+        リサイクル直後のRSS（ベースライン）が増え続けているか
+
+        ブラウザを再起動しても下がらないメモリは Python プロセス側に残っている
+        """
+        baselines = [g['baseline_mb'] for g in self.generations if g['baseline_mb'] is not None]
+        if len(baselines) < 3:
+            return False
+        increasing = all(later > earlier for earlier, later in zip(baselines, baselines[1:]))
+        return increasing and baselines[-1] - baselines[0] >= LEAK_WARNING_MB
+
+    def report(self) -> List[str]:
+        """ログ出力用のメモリプロファイル"""
+        def mb(value):
+            return f"{value:.0f}MB" if value is not None else "不明"
+
+        recycles = [g['reason'] for g in self.generations[:-1]]
+        lines = [
+            "🧠 メモリプロファイル",
+            f"   開始 {mb(self.start_mb)} / ピーク {mb(self.peak_mb or None)} / 終了 {mb(self.end_mb)}",
+            f"   ブラウザ起動: {len(self.generations)}回"
+            f"（ページ上限でリサイクル: {recycles.count('pages')}回、メモリ上限でリサイクル: {recycles.count('memory')}回）",
+        ]
+        for i, generation in enumerate(self.generations, 1):
+            line = f"   世代{i}: {generation['pages']}ページ  起動直後 {mb(generation['baseline_mb'])} → 終了時 {mb(generation['final_mb'])}"
+            if generation['pages'] and generation['baseline_mb'] is not None and generation['final_mb'] is not None:
+                growth = (generation['final_mb'] - generation['baseline_mb']) / generation['pages']
+                line += f" ({growth:+.1f}MB/ページ)"
+            lines.append(line)
+
+        if self.leak_suspected():
+            baselines = " → ".join(mb(g['baseline_mb']) for g in self.generations if g['baseline_mb'] is not None)
+            lines.append(f"   ⚠️  リサイクル後もメモリが増え続けています（Python側のリークの可能性）: {baselines}")
+        return lines
+
+
+class BrowserLease:
+    """
+    ワーカーのブラウザを1回の呼び出しで使うための貸し出し
+
+    Browser と同じ new_page() / close() を持ち、close() ではブラウザを終了せず
+    この貸し出しで開いたページだけを閉じる
+    """
+
+    def __init__(self, worker: 'BrowserWorker'):
+        self.worker = worker
+        self.pages = []
+        self.closed = False
+
+    def new_page(self):
+        page = self.worker.browser.new_page()
+        self.pages.append(page)
+        return page
+
+    def close(self) -> None:
+        self.worker.release(self)
+
+
+class BrowserWorker:
+    """ページ数・メモリ上限でリサイクルするブラウザワーカー"""
+
+    def __init__(
+        self,
+        launch: Callable[[Any], Any],
+        max_pages: int = SCRAPER_BROWSER_MAX_PAGES,
+        max_rss_mb: float = SCRAPER_BROWSER_MAX_RSS_MB,
+        start_playwright: Optional[Callable[[], Any]] = None,
+        rss_reader: Callable[[], Optional[float]] = process_tree_rss_mb
+    ):
+        """
+        初期化
+
+        Args:
+            launch: Playwright インスタンスからブラウザを起動する関数（new_page() / close() を持つ）
+            max_pages: 1つのブラウザで処理するページ数の上限（0 で無制限）
+            max_rss_mb: プロセスツリーのRSS上限（MB、0 で無制限）
+            start_playwright: Playwright を起動する関数（テスト用。None の場合は sync_playwright().start）
+            rss_reader: RSS計測関数（テスト用）
+        """
+        self.launch = launch
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.start_playwright = start_playwright
+        self.rss_reader = rss_reader
+        self.profile = MemoryProfile()
+
+        self.playwright = None
+        self.browser = None
+        self.pages_served = 0  # 現在のブラウザで開いたページ数
+        self._leases: List[BrowserLease] = []
+        self._depth = 0  # 実行中の呼び出しの入れ子数
+
+    def start(self) -> None:
+        """Playwright とブラウザを起動"""
+        if self.start_playwright is None:
+            from playwright.sync_api import sync_playwright
+            self.playwright = sync_playwright().start()
+        else:
+            self.playwright = self.start_playwright()
+        self.browser = self.launch(self.playwright)
+        self.pages_served = 0
+        self.profile.start_generation(self.rss_reader())
+
+    def stop(self, reason: str = 'end') -> None:
+        """ブラウザと Playwright を終了"""
+        for lease in list(self._leases):
+            self.release(lease)
+        self.profile.end_generation(self.rss_reader(), self.pages_served, reason)
+        try:
+            self.browser.close()
+        finally:
+            self.playwright.stop()
+            self.browser = None
+            self.playwright = None
+
+    def lease(self) -> BrowserLease:
+        """呼び出し1回分のブラウザを貸し出す"""
+        lease = BrowserLease(self)
+        self._leases.append(lease)
+        return lease
+
+    def release(self, lease: BrowserLease) -> None:
+        """貸し出しで開いたページを閉じる（ブラウザは終了しない）"""
+        if lease.closed:
+            return
+        lease.closed = True
+        for page in lease.pages:
+            try:
+                page.close()
+            except Exception:
+                pass
+        self.pages_served += len(lease.pages)
+        self._leases.remove(lease)
+
+    def enter(self) -> None:
+        """スクレイピング呼び出しの開始"""
+        self._depth += 1
+
+    def exit(self) -> None:
+        """
+        スクレイピング呼び出しの終了
+
+        閉じられていない貸し出し（例外で終了した場合など）を片付け、
+        最も外側の呼び出しが終わった時点で上限を超えていればリサイクルする
+        """
+        self._depth -= 1
+        if self._depth > 0:
+            return
+
+        for lease in list(self._leases):
+            self.release(lease)
+
+        reason = self._recycle_reason()
+        if reason:
+            print(f"♻️  ブラウザをリサイクル（{'ページ数' if reason == 'pages' else 'メモリ'}上限）: {self.pages_served}ページ処理")
+            self.stop(reason)
+            self.start()
+
+    def _recycle_reason(self) -> Optional[str]:
+        """リサイクルが必要な理由（'pages' / 'memory'、不要なら None）"""
+        if self.max_pages and self.pages_served >= self.max_pages:
+            return 'pages'
+
+        rss_mb = self.rss_reader()
+        self.profile.record_sample(rss_mb)
+        if self.max_rss_mb and rss_mb is not None and rss_mb >= self.max_rss_mb:
+            return 'memory'
+        return None
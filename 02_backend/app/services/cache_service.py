@@ -9,6 +9,8 @@ from typing import Optional
 import redis
 from datetime import datetime
 
+from app.config import REDIS_HOST, REDIS_PORT
+
 
 class CacheService:
     """Redis を使ったキャッシュサービス"""
@@ -95,12 +97,13 @@ class CacheService:
                 "cached_at": datetime.now().isoformat()
             }
 
-            # 保存
+            # 保存（取得失敗の記録があれば取得できた結果で置き換える）
             self.redis.setex(
                 key,
                 ttl_seconds,
                 json.dumps(cache_data, ensure_ascii=False)
             )
+            self.redis.delete(f"negative:{comp_id}")
 
             print(f"💾 キャッシュ保存: {comp_id} (TTL: {ttl_days}日)")
             return True
@@ -178,6 +181,74 @@ class CacheService:
             print(f"❌ 統計取得エラー: {e}")
             return {"enabled": False, "error": str(e)}
 
+    # ============================================
+    # 取得失敗のネガティブキャッシュ
+    # （404・内容なしのページを短時間記録し、ブラウザを起動せずに失敗を返す）
+    # ============================================
+
+    def get_negative(self, key: str) -> Optional[dict]:
+        """
+        取得失敗の記録を取得
+
+        Args:
+            key: スクレイピングキャッシュと同じキー
+
+        Returns:
+            {'reason', 'failed_at'}（記録がなければ None）
+        """
+        if not self.redis:
+            return None
+
+        try:
+            data = self.redis.get(f"negative:{key}")
+            return json.loads(data) if data else None
+        except Exception as e:
+            print(f"❌ ネガティブキャッシュ取得エラー ({key}): {e}")
+            return None
+
+    def set_negative(self, key: str, reason: str, ttl_seconds: int) -> bool:
+        """
+        取得失敗を記録
+
+        Args:
+            key: スクレイピングキャッシュと同じキー
+            reason: 失敗理由（'not_found' / 'empty'）
+            ttl_seconds: 有効期限（秒）
+
+        Returns:
+            成功したか
+        """
+        if not self.redis or ttl_seconds <= 0:
+            return False
+
+        try:
+            entry = {"reason": reason, "failed_at": datetime.now().isoformat()}
+            self.redis.setex(f"negative:{key}", ttl_seconds, json.dumps(entry))
+            print(f"🚫 取得失敗を記録: {key} ({reason}、TTL: {ttl_seconds // 3600}時間)")
+            return True
+        except Exception as e:
+            print(f"❌ ネガティブキャッシュ保存エラー ({key}): {e}")
+            return False
+
+    def delete_negative(self, key: str) -> bool:
+        """
+        取得失敗の記録を削除
+
+        Args:
+            key: スクレイピングキャッシュと同じキー
+
+        Returns:
+            削除したか
+        """
+        if not self.redis:
+            return False
+
+        try:
+            return bool(self.redis.delete(f"negative:{key}"))
+        except Exception as e:
+            print(f"❌ ネガティブキャッシュ削除エラー ({key}): {e}")
+            return False
+
     # ============================================
     # ディスカッション・解法のコンテンツキャッシュ
     # （容量削減のため、DBではなくRedisに3日間保存）
@@ -316,5 +387,5 @@ def get_cache_service() -> CacheService:
     """キャッシュサービスのインスタンスを取得（シングルトン）"""
     global _cache_service_instance
     if _cache_service_instance is None:
-        _cache_service_instance = CacheService()
+        _cache_service_instance = CacheService(host=REDIS_HOST, port=REDIS_PORT)
     return _cache_service_instance
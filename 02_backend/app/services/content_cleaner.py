@@ -0,0 +1,158 @@
+"""
+LLMに渡す前のページ本文のクリーニング
+
+#site-content のテキストにはナビゲーション・サイドバー・投票ボタン・コメント欄のUIラベル・
+関連トピックの一覧などが含まれ、そのままLLMの入力とRedisのキャッシュに入っていた。
+ディスカッション・Writeup はレンダリング済みの Markdown ブロックから投稿本文と
+上位コメントだけを取り出し、それ以外のページ（ノートブックなど）はUI要素を除去した
+テキストを使う。
+"""
+
+import re
+from typing import List, Optional
+
+from bs4 import NavigableString, Tag
+
+from .html_parser import parse_html
+
+
+# 本文ではない要素（ナビゲーション・ボタン・フォーム・アイコンなど）
+CHROME_SELECTORS = ', '.join([
+    'script', 'style', 'noscript', 'svg', 'img', 'button', 'nav', 'header', 'footer', 'aside',
+    'form', 'textarea', 'input', 'select',
+    '[role="navigation"]', '[role="complementary"]', '[role="banner"]', '[role="menu"]',
+    '[role="toolbar"]', '[role="tablist"]', '[aria-hidden="true"]',
+])
+
+# レンダリング済みの Markdown（投稿本文・コメント本文）
+MARKDOWN_SELECTOR = '[class*="markdown-converter__text"]'
+
+# 投稿本文＋コメントの構造で抽出するページ
+POST_URL_PATTERN = re.compile(r'/discussion/\d+|/writeups/')
+
+# UIラベルだけの行（投票数・Material Icons のアイコン名・ボタン・並び替え・関連トピックなど）
+_UI_LINE_PATTERN = re.compile(
+    r'^(?:'
+    r'[+-]?\d+(?:\.\d+)?[kKmM]?|'
+    r'more_vert|more_horiz|arrow_drop_up|arrow_drop_down|arrow_upward|arrow_downward|'
+    r'expand_more|expand_less|chevron_right|content_copy|push_pin|thumb_up|open_in_new|emoji_events|'
+    r'reply|share|follow|following|unfollow|quote|edit|delete|report|copy link|'
+    r'upvote|downvote|votes?|comments?(?: \(\d+\))?|\d+ (?:comments?|replies|votes?)|'
+    r'sort by|hotness|recent|oldest|newest|'
+    r'related topics|similar topics|appreciation \(\d+\)|sign in|register'
+    r')$',
+    re.IGNORECASE
+)
+_BLANK_LINES_PATTERN = re.compile(r'\n{3,}')
+_INLINE_SPACE_PATTERN = re.compile(r'[ \t\r\f\v]+')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# inner_text で前後に改行が入る要素
+BLOCK_TAGS = frozenset([
+    'address', 'article', 'aside', 'blockquote', 'dd', 'details', 'div', 'dl', 'dt', 'figcaption', 'figure',
+    'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'p',
+    'pre', 'section', 'summary', 'table', 'tr', 'ul',
+])
+# テキストを持たない要素
+_INVISIBLE_TAGS = frozenset(['script', 'style', 'noscript', 'template', 'head'])
+
+
+def clean_page_text(text: str) -> str:
+    """
+    ページテキストからUIラベルだけの行を除去
+
+    Args:
+        text: inner_text / get_text のテキスト
+
+    Returns:
+        クリーニング後のテキスト
+    """
+    lines = [line.rstrip() for line in text.splitlines()]
+    kept = [line for line in lines if not _UI_LINE_PATTERN.match(line.strip())]
+    return _BLANK_LINES_PATTERN.sub('\n\n', '\n'.join(kept)).strip()
+
+
+def inner_text(element: Tag) -> str:
+    """
+    ブラウザの inner_text に近いテキストを取り出す
+
+    get_text('\\n') はインライン要素（リンク・強調・投票数の span など）ごとに改行するため、
+    Playwright の inner_text と行の区切りが変わり、clean_page_text で除く行も変わる。
+    インライン要素は空白でつなぎ、ブロック要素・<br> の境界でだけ改行する（<pre> は改行を保つ）。
+
+    Args:
+        element: 対象の要素
+
+    Returns:
+        行ごとに前後の空白を除いたテキスト（空行は除く）
+    """
+    parts: List[str] = []
+
+    def walk(node: Tag, preformatted: bool) -> None:
+        for child in node.children:
+            if isinstance(child, NavigableString):
+                if type(child) is NavigableString:  # コメント・CDATA などは除く
+                    parts.append(str(child) if preformatted else _WHITESPACE_PATTERN.sub(' ', child))
+            elif child.name in _INVISIBLE_TAGS:
+                continue
+            elif child.name == 'br':
+                parts.append('\n')
+            elif child.name in BLOCK_TAGS:
+                parts.append('\n')
+                walk(child, preformatted or child.name == 'pre')
+                parts.append('\n')
+            elif child.name in ('td', 'th'):
+                walk(child, preformatted)
+                parts.append(' ')
+            else:
+                walk(child, preformatted)
+
+    walk(element, element.name == 'pre')
+    lines = (_INLINE_SPACE_PATTERN.sub(' ', line).strip() for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def _top_level_blocks(root: Tag) -> List[Tag]:
+    """入れ子を除いた Markdown ブロック（文書順）"""
+    blocks = root.select(MARKDOWN_SELECTOR)
+    block_ids = {id(block) for block in blocks}
+    return [block for block in blocks if not any(id(parent) in block_ids for parent in block.parents)]
+
+
+def extract_main_content(html: str, url: str = "", max_comments: int = 5) -> Optional[str]:
+    """
+    ページHTMLからLLMに渡す本文だけを取り出す
+
+    ディスカッション・Writeup は「タイトル + 投稿本文 + 先頭から max_comments 件のコメント」、
+    それ以外のページや Markdown ブロックが見つからない場合は、UI要素を除去した
+    #site-content のテキストを返す
+
+    Args:
+        html: ページのHTML
+        url: ページのURL（ディスカッション・Writeup かの判定用）
+        max_comments: 含めるコメント数（0 でコメントなし）
+
+    Returns:
+        本文テキスト（本文がない場合は None）
+    """
+    soup = parse_html(html)
+    root = soup.select_one('#site-content')
+    if root is None:
+        return None
+    for element in root.select(CHROME_SELECTORS):
+        element.decompose()
+
+    blocks = _top_level_blocks(root) if POST_URL_PATTERN.search(url) else []
+    if blocks:
+        title = root.select_one('h1')
+        sections = [title.get_text(' ', strip=True)] if title else []
+        sections.append(blocks[0].get_text('\n', strip=True))
+        for index, block in enumerate(blocks[1:max_comments + 1]):
+            comment = block.get_text('\n', strip=True)
+            if comment:
+                sections.append(f"[コメント {index + 1}]\n{comment}")
+        text = '\n\n'.join(section for section in sections if section)
+    else:
+        text = clean_page_text(root.get_text('\n', strip=True))
+
+    return text or None
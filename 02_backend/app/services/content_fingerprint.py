@@ -0,0 +1,111 @@
+"""
+本文の正規化ハッシュ（コンテンツフィンガープリント）
+
+ディスカッション・解法・ノートブックの本文を再取得した際、
+前回 summary を生成した本文と同じであれば LLM 処理（要約・和訳・技術抽出）を
+再実行せずに既存の出力を使い回す。
+
+ページテキストには「3 days ago」のような相対日時が含まれ、本文が同じでも
+取得日によって変わるため、ハッシュ計算前に取り除く。
+投票数・アイコン名などUIラベルだけの行（clean_page_text で除く行）も取得のたびに変わり、
+取得経路（HTMLから抽出した本文・Playwright の inner_text・HTTP取得の content_cleaner.inner_text）によって含まれたり
+含まれなかったりするため、同じく取り除いてから計算する。
+
+導入時の注意: 本文のクリーニング（SCRAPER_CLEAN_CONTENT）の有効化や
+SCRAPER_CONTENT_MAX_COMMENTS の変更でハッシュの入力が変わるため、既存のアイテムは
+次回の再取得時に1回だけ要約を再生成する（以降はハッシュが一致する）。
+一度に再生成させたくない場合は、再取得のバッチを分けて実行する。
+"""
+
+import hashlib
+import re
+from threading import Lock
+from typing import Any, Dict
+
+from .content_cleaner import clean_page_text
+
+
+# 相対日時（"3 days ago", "an hour ago", "yesterday" など）
+_RELATIVE_TIME_PATTERN = re.compile(
+    r'\b(?:\d+|an?)\s+(?:second|minute|hour|day|week|month|year)s?\s+ago\b|\byesterday\b',
+    re.IGNORECASE
+)
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def normalize_content(content: str) -> str:
+    """
+    ハッシュ計算用に本文を正規化
+
+    UIラベルだけの行と相対日時を除去し、連続する空白を1つにまとめる
+
+    Args:
+        content: ページ本文
+
+    Returns:
+        正規化した本文
+    """
+    text = _RELATIVE_TIME_PATTERN.sub('', clean_page_text(content or ''))
+    return _WHITESPACE_PATTERN.sub(' ', text).strip()
+
+
+def compute_content_hash(content: str) -> str:
+    """
+    本文の正規化ハッシュ（SHA-256）を計算
+
+    Args:
+        content: ページ本文
+
+    Returns:
+        16進数のハッシュ文字列
+    """
+    return hashlib.sha256(normalize_content(content).encode('utf-8')).hexdigest()
+
+
+class ContentFingerprintStats:
+    """種別（discussion / solution）ごとのハッシュ一致率（プロセス内）"""
+
+    def __init__(self):
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._lock = Lock()
+
+    def record(self, kind: str, hit: bool) -> None:
+        """
+        判定結果を記録
+
+        Args:
+            kind: 種別
+            hit: 本文が変わっておらず既存出力を使い回したか
+        """
+        with self._lock:
+            counts = self._counts.setdefault(kind, {'hits': 0, 'misses': 0})
+            counts['hits' if hit else 'misses'] += 1
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        種別ごとのヒット数・ミス数・ヒット率
+
+        Returns:
+            {kind: {'hits', 'misses', 'hit_rate'}}
+        """
+        with self._lock:
+            result = {}
+            for kind, counts in self._counts.items():
+                total = counts['hits'] + counts['misses']
+                result[kind] = {
+                    **counts,
+                    'hit_rate': round(counts['hits'] / total, 3) if total else 0.0,
+                }
+            return result
+
+
+# グローバルインスタンス（シングルトンパターン）
+_fingerprint_stats_instance = None
+
+
+def get_fingerprint_stats() -> ContentFingerprintStats:
+    """ハッシュ一致率の集計インスタンスを取得（シングルトン）"""
+    global _fingerprint_stats_instance
+    if _fingerprint_stats_instance is None:
+        _fingerprint_stats_instance = ContentFingerprintStats()
+    return _fingerprint_stats_instance
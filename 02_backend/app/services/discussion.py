@@ -2,11 +2,115 @@
 DiscussionService - ディスカッションビジネスロジック
 """
 from typing import List, Optional, Dict, Any
+from datetime import datetime
 
 from app.repositories.discussion import DiscussionRepository
 from app.models.discussion import Discussion
 
 
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """
+    ISO形式の日時をローカル時刻（タイムゾーンなし）に揃えて変換
+
+    Args:
+        value: ISO形式の文字列またはdatetime
+
+    Returns:
+        datetime（変換できない場合はNone）
+    """
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str) and value:
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    else:
+        return None
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+def is_listing_item_changed(item: Dict[str, Any], known_row: Optional[Dict[str, Any]]) -> bool:
+    """
+    スクレイピングした一覧アイテムが既存行から変化しているかを判定
+
+    - URLが未登録なら新規（変化あり）
+    - 投票数・コメント数が異なれば変化あり
+    - Kaggle側の更新日時（JSONキャプチャ時のみ取得）が既存行の updated_at より新しければ変化あり
+
+    Args:
+        item: スクレイピングで取得したアイテム
+        known_row: get_listing_index の値（未登録ならNone）
+
+    Returns:
+        bool: 新規または変化ありの場合True
+    """
+    if known_row is None:
+        return True
+
+    if item.get('vote_count', 0) != known_row.get('vote_count'):
+        return True
+    if item.get('comment_count', 0) != known_row.get('comment_count'):
+        return True
+
+    item_updated_at = _parse_timestamp(item.get('updated_at'))
+    row_updated_at = _parse_timestamp(known_row.get('updated_at'))
+    if item_updated_at and row_updated_at and item_updated_at > row_updated_at:
+        return True
+
+    return False
+
+
+def sync_listing_items(
+    competition_id: str,
+    all_items: List[Dict[str, Any]],
+    discussion_service: "DiscussionService",
+    solution_service: Any,
+    known_items: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """
+    ディスカッション一覧（Discussions + Writeups）を discussions / solutions テーブルに差分同期
+
+    Discussions は discussions テーブルへ、新規・変化ありのアイテムは解法抽出の対象として
+    solutions テーブルへ書き込む（AI分析なし）
+
+    Args:
+        competition_id: コンペティションID
+        all_items: ScraperService.get_discussions と同じ形式のアイテム
+        discussion_service: DiscussionService
+        solution_service: SolutionService
+        known_items: 既存索引（省略時はDBから取得）
+
+    Returns:
+        dict: {'discussions': 同期結果, 'solutions': 保存結果}
+    """
+    if known_items is None:
+        known_items = {
+            **solution_service.get_listing_index(competition_id),
+            **discussion_service.get_listing_index(competition_id),
+        }
+
+    discussion_result = discussion_service.sync_discussions(
+        competition_id=competition_id,
+        discussions_data=[item for item in all_items if item.get('category') == 'discussion'],
+        known_items=known_items
+    )
+    solution_result = solution_service.fetch_and_save_solutions(
+        competition_id=competition_id,
+        discussions_data=[
+            item for item in all_items
+            if is_listing_item_changed(item, known_items.get(item['url']))
+        ],
+        enable_ai=False,
+        scraper_service=None,
+        llm_service=None
+    )
+    return {'discussions': discussion_result, 'solutions': solution_result}
+
+
 class DiscussionService:
     """ディスカッションサービス"""
 
@@ -121,6 +225,86 @@ class DiscussionService:
             "total": saved_count + updated_count
         }
 
+    def get_listing_index(self, competition_id: str) -> Dict[str, Dict[str, Any]]:
+        """
+        差分同期用の既存ディスカッション索引を取得
+
+        Args:
+            competition_id: コンペティションID
+
+        Returns:
+            dict: {url: 既存行の比較用フィールド}
+        """
+        return self.repository.get_listing_index(competition_id)
+
+    def sync_discussions(
+        self,
+        competition_id: str,
+        discussions_data: List[Dict[str, Any]],
+        known_items: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Dict[str, int]:
+        """
+        ディスカッションデータを差分同期（変化した行のみ書き込む）
+
+        既存行の要約（summary）は保持したまま、一覧ページ由来の項目だけを更新する
+
+        Args:
+            competition_id: コンペティションID
+            discussions_data: スクレイピングで取得したディスカッションデータのリスト
+            known_items: 既存索引（省略時はDBから取得）
+
+        Returns:
+            dict: 同期結果（saved: 新規, updated: 更新, unchanged: 変化なし, total: 書き込み数）
+        """
+        if known_items is None:
+            known_items = self.get_listing_index(competition_id)
+
+        saved_count = 0
+        updated_count = 0
+        unchanged_count = 0
+
+        for disc_data in discussions_data:
+            known_row = known_items.get(disc_data['url'])
+
+            if not is_listing_item_changed(disc_data, known_row):
+                unchanged_count += 1
+                continue
+
+            if known_row is None:
+                self.repository.create(Discussion(
+                    id=0,
+                    competition_id=competition_id,
+                    title=disc_data['title'],
+                    author=disc_data['author'],
+                    author_tier=disc_data.get('author_tier'),
+                    tier_color=disc_data.get('tier_color'),
+                    url=disc_data['url'],
+                    vote_count=disc_data['vote_count'],
+                    comment_count=disc_data['comment_count'],
+                    category=disc_data.get('category'),
+                    is_pinned=disc_data.get('is_pinned', False)
+                ))
+                saved_count += 1
+                continue
+
+            existing = self.repository.get_by_id(known_row['id'])
+            existing.title = disc_data['title']
+            existing.author = disc_data['author']
+            existing.author_tier = disc_data.get('author_tier') or existing.author_tier
+            existing.tier_color = disc_data.get('tier_color') or existing.tier_color
+            existing.vote_count = disc_data['vote_count']
+            existing.comment_count = disc_data['comment_count']
+            existing.category = disc_data.get('category') or existing.category
+            self.repository.update(existing)
+            updated_count += 1
+
+        return {
+            "saved": saved_count,
+            "updated": updated_count,
+            "unchanged": unchanged_count,
+            "total": saved_count + updated_count
+        }
+
     def _check_existing(self, competition_id: str, url: str) -> bool:
         """
         URLで既存ディスカッションをチェック
@@ -0,0 +1,394 @@
+"""
+OpenAI互換のローカル代替サーバー（LLMパイプラインの負荷試験・CI用）
+
+Chat Completions API（/v1/chat/completions、stream 含む）だけを実装し、
+プロンプトの種類（LLMService のメソッド）を判定して、各メソッドの検証を通る
+スキーマどおりのJSON・テキストを返す。Structured Outputs（json_schema）は
+リクエストのスキーマから生成する。APIキーなしで LLMService を実行でき、
+レイテンシ・429・不正な出力を注入して再試行の挙動とスループットを計測できる。
+
+起動:
+    python -m app.services.fake_openai --port 8100 --latency 0.5 --rate-limit-rate 0.05
+    OPENAI_BASE_URL=http://127.0.0.1:8100/v1 OPENAI_API_KEY=fake python enrich_competitions.py ...
+
+統計（プロンプトの種類ごとのリクエスト数・429・不正出力の件数）は GET /fake/stats
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from .llm_chunking import count_tokens
+from .llm_service import LLMService
+
+
+# json_object で呼び出すメソッドの判定（ユーザープロンプトに含まれるJSONのキー。上から順に判定）
+JSON_FAMILY_MARKERS: List[Tuple[str, str]] = [
+    ('"useful_for"', 'summarize_notebook'),
+    ('"main_topic"', 'generate_structured_discussion_summary'),
+    ('"key_challenges"', 'generate_summary'),
+    ('"data_types"', 'generate_tags'),
+    ('"total_size"', 'extract_dataset_info'),
+    ('"approach"', 'generate_structured_solution_summary'),
+    ('"english"', 'extract_solution_techniques'),
+]
+
+# テキストで返すメソッドの判定（システム・ユーザープロンプトに含まれる文言。上から順に判定）
+TEXT_FAMILY_MARKERS: List[Tuple[str, str]] = [
+    ('要点を漏れなく抽出', 'condense_chunk'),
+    ('構造化・整理専門家', 'translate_and_organize_discussion'),
+    ('ディスカッションの要約専門家', 'summarize_discussion'),
+    ('評価指標の名前を簡潔に', 'extract_evaluation_metric'),
+    ('分かりやすい説明を作成', 'generate_metric_description'),
+]
+
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+
+
+def _object(properties: Dict[str, Any]) -> Dict[str, Any]:
+    return {"type": "object", "properties": properties, "required": list(properties), "additionalProperties": False}
+
+
+def _named_list(name_key: str, text_key: str) -> Dict[str, Any]:
+    return {"type": "array", "items": _object({name_key: {"type": "string"}, text_key: {"type": "string"}})}
+
+
+# 各メソッドのレスポンスのスキーマ（コンペ情報は generate_enrichment と同じ）
+FAMILY_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    'generate_summary': LLMService.ENRICHMENT_SCHEMAS['summary'],
+    'generate_tags': LLMService.ENRICHMENT_SCHEMAS['tags'],
+    'extract_dataset_info': LLMService.ENRICHMENT_SCHEMAS['dataset_info'],
+    'generate_structured_discussion_summary': _object({
+        'overview': {"type": "string"},
+        'main_topic': {"type": "string"},
+        'key_points': _STRING_LIST,
+        'technical_details': {"type": "string"},
+        'glossary': _named_list('term', 'explanation'),
+        'approaches': _STRING_LIST,
+        'code_examples': {"type": "string"},
+        'results': {"type": "string"},
+        'related_links': {"type": "string"},
+    }),
+    'generate_structured_solution_summary': _object({
+        'overview': {"type": "string"},
+        'approach': {"type": "string"},
+        'key_points': _STRING_LIST,
+        'results': {"type": "string"},
+        'techniques': {"type": "array", "items": _object({
+            'name': {"type": "string"}, 'english': {"type": "string"}, 'description': {"type": "string"},
+        })},
+    }),
+    'extract_solution_techniques': _object({
+        'techniques': {"type": "array", "items": _object({
+            'name': {"type": "string"}, 'english': {"type": "string"}, 'description': {"type": "string"},
+        })},
+    }),
+    'summarize_notebook': _object({
+        'purpose': {"type": "string"},
+        'data_overview': {"type": "string"},
+        'input_data': _object({'format': {"type": "string"}, 'columns': _STRING_LIST, 'size': {"type": "string"}}),
+        'output_data': _object({'type': {"type": "string"}, 'description': {"type": "string"}}),
+        'processing_steps': _STRING_LIST,
+        'approach': {"type": "string"},
+        'key_techniques': _named_list('name', 'explanation'),
+        'models_used': _named_list('name', 'explanation'),
+        'glossary': _named_list('term', 'explanation'),
+        'results': {"type": "string"},
+        'useful_for': {"type": "string"},
+    }),
+}
+
+# テキストのメソッドの固定出力（それ以外は max_tokens に応じた長さのダミー文）
+TEXT_RESPONSES = {
+    'extract_evaluation_metric': "二乗平均平方根誤差（RMSE）",
+    'generate_metric_description': (
+        "予測値と実際の値の差を二乗して平均し、平方根を取った指標です。値が小さいほど予測が正確で、"
+        "大きな誤差をより重く評価するため、外れた予測を減らすことが重要なこのコンペに適しています。"
+    ),
+}
+
+_FILLER = "これは負荷試験用のダミー出力です。"
+
+
+def detect_family(messages: List[Dict[str, Any]], response_format: Optional[Dict[str, Any]] = None) -> str:
+    """
+    リクエストからプロンプトの種類（LLMService のメソッド名）を判定
+
+    Args:
+        messages: チャットメッセージ
+        response_format: response_format パラメータ
+
+    Returns:
+        メソッド名（判定できない場合は 'generate'、JSONの場合は 'json'）
+    """
+    format_type = (response_format or {}).get('type')
+    if format_type == 'json_schema':
+        return 'generate_enrichment'
+
+    text = "\n".join(str(message.get('content', '')) for message in messages)
+    markers = JSON_FAMILY_MARKERS if format_type == 'json_object' else TEXT_FAMILY_MARKERS
+    for marker, family in markers:
+        if marker in text:
+            return family
+    return 'json' if format_type == 'json_object' else 'generate'
+
+
+def value_from_schema(schema: Dict[str, Any], name: str = "value", items: int = 2) -> Any:
+    """
+    JSON Schema を満たすダミー値
+
+    Args:
+        schema: JSON Schema（object / array / string / number / integer / boolean）
+        name: プロパティ名（文字列の内容に使う）
+        items: 配列の要素数
+
+    Returns:
+        スキーマどおりの値
+    """
+    schema_type = schema.get('type')
+    if schema_type == 'object':
+        return {key: value_from_schema(sub, key, items) for key, sub in schema.get('properties', {}).items()}
+    if schema_type == 'array':
+        return [value_from_schema(schema.get('items', {}), f"{name}{index + 1}", items) for index in range(items)]
+    if schema_type in ('number', 'integer'):
+        return 1
+    if schema_type == 'boolean':
+        return True
+    if 'enum' in schema:
+        return schema['enum'][0]
+    return f"{name}のダミー"
+
+
+class FakeOpenAI:
+    """Chat Completions API の代替（レイテンシ・429・不正出力の注入つき）"""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        tokens_per_second: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = 1.0,
+        malformed_rate: float = 0.0,
+        seed: Optional[int] = 0
+    ):
+        """
+        初期化
+
+        Args:
+            latency: 1リクエストの基本レイテンシ（秒）
+            latency_jitter: レイテンシに加える 0〜latency_jitter 秒の揺らぎ
+            tokens_per_second: 出力トークンの生成速度（0 で出力長による遅延なし）
+            rate_limit_rate: 429 を返す割合（0〜1）
+            retry_after: 429 の Retry-After ヘッダー（秒、0 でヘッダーなし）
+            malformed_rate: JSONを途中で切った不正な出力を返す割合（0〜1）
+            seed: 乱数シード（None の場合は毎回異なる）
+        """
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.tokens_per_second = tokens_per_second
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.malformed_rate = malformed_rate
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _roll(self, rate: float) -> bool:
+        with self._lock:
+            return rate > 0 and self._random.random() < rate
+
+    def _count(self, family: str, field: str) -> None:
+        with self._lock:
+            counts = self._stats.setdefault(family, {'requests': 0, 'rate_limited': 0, 'malformed': 0})
+            counts[field] += 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """プロンプトの種類ごとのリクエスト数・429・不正出力の件数"""
+        with self._lock:
+            return {family: dict(counts) for family, counts in sorted(self._stats.items())}
+
+    def reset(self) -> None:
+        """統計をリセット"""
+        with self._lock:
+            self._stats.clear()
+
+    def content_for(self, family: str, body: Dict[str, Any]) -> str:
+        """
+        プロンプトの種類に応じたレスポンス本文
+
+        Args:
+            family: detect_family の結果
+            body: リクエストボディ
+
+        Returns:
+            レスポンス本文（JSON の種類はJSON文字列）
+        """
+        response_format = body.get('response_format') or {}
+        if family == 'generate_enrichment':
+            schema = response_format.get('json_schema', {}).get('schema', {})
+            return json.dumps(value_from_schema(schema), ensure_ascii=False)
+        if family in FAMILY_SCHEMAS:
+            return json.dumps(value_from_schema(FAMILY_SCHEMAS[family]), ensure_ascii=False)
+        if family == 'json':
+            return json.dumps({"result": "ダミー"}, ensure_ascii=False)
+        if family in TEXT_RESPONSES:
+            return TEXT_RESPONSES[family]
+
+        # 出力長は max_tokens の半分程度（日本語は概ね1文字1トークン）
+        length = max(len(_FILLER), min(int(body.get('max_tokens') or 1000) // 2, 2000))
+        return (_FILLER * (length // len(_FILLER) + 1))[:length]
+
+    def complete(self, body: Dict[str, Any]) -> Tuple[int, Dict[str, str], Dict[str, Any]]:
+        """
+        1リクエストを処理（レイテンシの待機を含む）
+
+        Args:
+            body: /v1/chat/completions のリクエストボディ
+
+        Returns:
+            (HTTPステータス, ヘッダー, レスポンスボディ)
+        """
+        messages = body.get('messages') or []
+        family = detect_family(messages, body.get('response_format'))
+        self._count(family, 'requests')
+
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.latency_jitter) if self.latency_jitter else 0.0)
+        if self._roll(self.rate_limit_rate):
+            self._count(family, 'rate_limited')
+            headers = {'retry-after': f"{self.retry_after:g}"} if self.retry_after else {}
+            return 429, headers, {"error": {
+                "message": "Rate limit reached (fake server)",
+                "type": "requests",
+                "code": "rate_limit_exceeded",
+            }}
+
+        model = body.get('model', 'gpt-4o')
+        content = self.content_for(family, body)
+        if self._roll(self.malformed_rate):
+            self._count(family, 'malformed')
+            content = content[:max(1, len(content) // 2)]
+
+        prompt_tokens = count_tokens("\n".join(str(message.get('content', '')) for message in messages), model)
+        completion_tokens = count_tokens(content, model)
+        if self.tokens_per_second:
+            delay += completion_tokens / self.tokens_per_second
+        time.sleep(delay)
+
+        return 200, {}, {
+            "id": f"chatcmpl-fake-{uuid.uuid4().hex[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    @staticmethod
+    def stream_chunks(response: Dict[str, Any], chunk_chars: int = 4) -> Iterator[str]:
+        """完了レスポンスを chat.completion.chunk の SSE に分割"""
+        content = response['choices'][0]['message']['content']
+        base = {"id": response['id'], "object": "chat.completion.chunk",
+                "created": response['created'], "model": response['model']}
+        for start in range(0, len(content), chunk_chars):
+            delta = {"content": content[start:start + chunk_chars]}
+            chunk = dict(base, choices=[{"index": 0, "delta": delta, "finish_reason": None}])
+            yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+        yield f"data: {json.dumps(dict(base, choices=[{'index': 0, 'delta': {}, 'finish_reason': 'stop'}]))}\n\n"
+        yield "data: [DONE]\n\n"
+
+    def create_app(self) -> FastAPI:
+        """Chat Completions API の FastAPI アプリ"""
+        app = FastAPI(title="Fake OpenAI")
+
+        @app.post("/v1/chat/completions")
+        def chat_completions(body: Dict[str, Any]):
+            status, headers, response = self.complete(body)
+            if status != 200 or not body.get('stream'):
+                return JSONResponse(response, status_code=status, headers=headers)
+            return StreamingResponse(self.stream_chunks(response), media_type="text/event-stream")
+
+        @app.get("/fake/stats")
+        def fake_stats():
+            return self.stats()
+
+        @app.post("/fake/reset")
+        def fake_reset():
+            self.reset()
+            return {"success": True}
+
+        return app
+
+
+def serve_in_thread(fake: FakeOpenAI, host: str = "127.0.0.1", port: int = 0):
+    """
+    uvicorn をバックグラウンドスレッドで起動（ベンチマーク用）
+
+    Args:
+        fake: FakeOpenAI
+        host: ホスト
+        port: ポート（0 で空きポート）
+
+    Returns:
+        (ベースURL（.../v1）, uvicorn.Server)。停止は server.should_exit = True
+    """
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(fake.create_app(), host=host, port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError("フェイクOpenAIサーバーの起動に失敗しました")
+        time.sleep(0.05)
+    bound_port = server.servers[0].sockets[0].getsockname()[1]
+    return f"http://{host}:{bound_port}/v1", server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='OpenAI互換のローカル代替サーバー')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8100)
+    parser.add_argument('--latency', type=float, default=0.0, help='基本レイテンシ（秒）')
+    parser.add_argument('--latency-jitter', type=float, default=0.0, help='レイテンシの揺らぎ（秒）')
+    parser.add_argument('--tokens-per-second', type=float, default=0.0, help='出力トークンの生成速度（0 で無制限）')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='429 を返す割合（0〜1）')
+    parser.add_argument('--retry-after', type=float, default=1.0, help='429 の Retry-After（秒）')
+    parser.add_argument('--malformed-rate', type=float, default=0.0, help='不正なJSONを返す割合（0〜1）')
+    parser.add_argument('--seed', type=int, default=0, help='乱数シード')
+    args = parser.parse_args()
+
+    import uvicorn
+
+    fake = FakeOpenAI(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        tokens_per_second=args.tokens_per_second,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        malformed_rate=args.malformed_rate,
+        seed=args.seed
+    )
+    print(f"🧪 フェイクOpenAIサーバー: http://{args.host}:{args.port}/v1")
+    uvicorn.run(fake.create_app(), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+スクレイピング用オフラインフィクスチャストア
+
+ScraperService の record モードで取得したページHTMLとネットワークJSONを
+URL単位で gzip 圧縮して保存し、replay モードでは Playwright のルーティング経由で
+同じ内容を返す。kaggle.com にアクセスせずにセレクタの正しさや
+スクレイピングのスループットを決定的に検証するために使う。
+
+ディレクトリ構成:
+    <root>/index.json          URL → ファイル名の索引
+    <root>/<sha1(url)>.json.gz 1URL分のフィクスチャ
+"""
+
+import gzip
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+class FixtureStore:
+    """URL単位の圧縮フィクスチャストア"""
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, root_dir: str | Path):
+        """
+        Args:
+            root_dir: フィクスチャの保存ディレクトリ
+        """
+        self.root_dir = Path(root_dir)
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """フラグメントを除いたURL（同じページの記録を共有する）"""
+        return url.split('#')[0]
+
+    def _file_name(self, url: str) -> str:
+        digest = hashlib.sha1(self.normalize_url(url).encode('utf-8')).hexdigest()
+        return f"{digest}.json.gz"
+
+    def _load_index(self) -> Dict[str, str]:
+        index_path = self.root_dir / self.INDEX_FILE
+        if not index_path.exists():
+            return {}
+        with open(index_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save_index(self, index: Dict[str, str]) -> None:
+        with open(self.root_dir / self.INDEX_FILE, 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+    def save(
+        self,
+        url: str,
+        html: str,
+        status: int = 200,
+        responses: Optional[List[Dict[str, Any]]] = None
+    ) -> Path:
+        """
+        1ページ分のフィクスチャを保存（同じURLは上書き）
+
+        Args:
+            url: ページURL
+            html: レンダリング後のHTML
+            status: HTTPステータス
+            responses: ページが受信したJSONレスポンス
+                       [{'url', 'status', 'content_type', 'body'}]
+
+        Returns:
+            保存したファイルのパス
+        """
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+
+        url = self.normalize_url(url)
+        file_name = self._file_name(url)
+        fixture = {
+            'url': url,
+            'status': status,
+            'recorded_at': datetime.now().isoformat(),
+            'html': html,
+            'responses': responses or [],
+        }
+
+        path = self.root_dir / file_name
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            json.dump(fixture, f, ensure_ascii=False)
+
+        index = self._load_index()
+        index[url] = file_name
+        self._save_index(index)
+
+        return path
+
+    def load(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        フィクスチャを読み込み
+
+        Args:
+            url: ページURL
+
+        Returns:
+            フィクスチャの辞書（未記録の場合はNone）
+        """
+        path = self.root_dir / self._file_name(url)
+        if not path.exists():
+            return None
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return json.load(f)
+
+    def has(self, url: str) -> bool:
+        """記録済みか"""
+        return (self.root_dir / self._file_name(url)).exists()
+
+    def urls(self) -> List[str]:
+        """記録済みURLの一覧"""
+        return sorted(self._load_index().keys())
@@ -0,0 +1,52 @@
+"""
+HTML解析バックエンド
+
+BeautifulSoup のパーサーを切り替え可能にする。
+lxml（C実装）がインストールされていればそれを使い、なければ標準ライブラリの
+html.parser にフォールバックする。要素の検索は要素ごとの lambda ではなく
+soup.select() の CSS セレクタで行う。
+"""
+
+from typing import List, Optional
+
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+from app.config import SCRAPER_HTML_PARSER
+
+
+# 優先順（先頭ほど高速）
+PARSER_BACKENDS = ['lxml', 'html.parser']
+
+
+def available_backends() -> List[str]:
+    """インストール済みのパーサー一覧（優先順）"""
+    return [backend for backend in PARSER_BACKENDS if builder_registry.lookup(backend) is not None]
+
+
+def get_default_backend() -> str:
+    """
+    使用するパーサーを決定
+
+    設定 SCRAPER_HTML_PARSER が "auto" の場合は利用可能な最速のものを選ぶ
+
+    Returns:
+        BeautifulSoup に渡すパーサー名
+    """
+    if SCRAPER_HTML_PARSER and SCRAPER_HTML_PARSER != 'auto':
+        return SCRAPER_HTML_PARSER
+    return available_backends()[0]
+
+
+def parse_html(html: str, backend: Optional[str] = None) -> BeautifulSoup:
+    """
+    HTMLをパース
+
+    Args:
+        html: HTML文字列
+        backend: パーサー名（None の場合は get_default_backend()）
+
+    Returns:
+        BeautifulSoup オブジェクト
+    """
+    return BeautifulSoup(html, backend or get_default_backend())
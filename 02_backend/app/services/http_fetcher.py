@@ -0,0 +1,180 @@
+"""
+軽量HTTP取得（Playwright を使わないページ取得）
+
+一部のページ（コンペ一覧、ディスカッション・Writeup・ノートブックの詳細）は
+サーバーが返すHTMLに必要な内容が含まれる場合があり、ブラウザを起動せずに取得できる。
+ScraperService はこれらのページ種別でまず HttpFetcher を試し、必要な内容が
+見つからない場合だけ Playwright にフォールバックする。
+
+- 接続は httpx.Client でプール（keep-alive）し、プロセス内で使い回す
+- h2 パッケージがインストールされていれば HTTP/2 を使用（任意）
+- gzip / deflate の圧縮レスポンスは httpx が自動で展開する
+- kaggle.com へのリクエストなので Playwright と同じレートリミッターを通す
+"""
+
+import time
+from threading import Lock
+from typing import Any, Dict, Optional
+
+import httpx
+
+from app.config import SCRAPER_HTTP_TIMEOUT_SECONDS
+from .rate_limiter import AdaptiveRateLimiter, get_kaggle_rate_limiter, parse_retry_after
+
+
+# ブラウザ相当のヘッダー（ボット向けの簡易ページが返らないようにする）
+DEFAULT_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    ),
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+
+def is_http2_available() -> bool:
+    """HTTP/2 に必要な h2 パッケージがインストールされているか"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class HttpFetcher:
+    """接続プール付きのHTTPクライアント"""
+
+    def __init__(
+        self,
+        timeout: float = SCRAPER_HTTP_TIMEOUT_SECONDS,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        transport: Optional[httpx.BaseTransport] = None
+    ):
+        """
+        初期化
+
+        Args:
+            timeout: リクエストのタイムアウト（秒）
+            rate_limiter: kaggle.com 用レートリミッター（None の場合はプロセス共有のリミッター）
+            transport: httpx のトランスポート（テスト用）
+        """
+        self.rate_limiter = rate_limiter or get_kaggle_rate_limiter()
+        self.http2 = is_http2_available() and transport is None
+        self.client = httpx.Client(
+            http2=self.http2,
+            headers=DEFAULT_HEADERS,
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            transport=transport,
+        )
+
+    def fetch(self, url: str) -> Optional[httpx.Response]:
+        """
+        ページを取得
+
+        Args:
+            url: 取得するURL
+
+        Returns:
+            レスポンス（接続エラー・タイムアウトの場合は None）
+
+        Raises:
+            CircuitOpenError: サーキットが開いている場合
+        """
+        self.rate_limiter.acquire()
+        start = time.monotonic()
+        try:
+            response = self.client.get(url)
+        except httpx.HTTPError as e:
+            self.rate_limiter.record(None, time.monotonic() - start)
+            print(f"⚠️  HTTP取得エラー ({url}): {e}")
+            return None
+
+        self.rate_limiter.record(
+            response.status_code,
+            time.monotonic() - start,
+            retry_after=parse_retry_after(response.headers.get('retry-after'))
+        )
+        return response
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class FetchStats:
+    """ページ種別・取得方法（http / playwright）ごとの成功率とレイテンシ（プロセス内）"""
+
+    def __init__(self):
+        self._counts: Dict[str, Dict[str, Dict[str, float]]] = {}
+        self._lock = Lock()
+
+    def record(self, page_type: str, method: str, success: bool, elapsed: float) -> None:
+        """
+        取得結果を記録
+
+        Args:
+            page_type: ページ種別（'competitions_list' など）
+            method: 'http' または 'playwright'
+            success: 必要な内容を取得できたか
+            elapsed: 取得にかかった秒数
+        """
+        with self._lock:
+            counts = self._counts.setdefault(page_type, {}).setdefault(
+                method, {'attempts': 0, 'successes': 0, 'total_seconds': 0.0}
+            )
+            counts['attempts'] += 1
+            counts['successes'] += int(success)
+            counts['total_seconds'] += elapsed
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        ページ種別・取得方法ごとの試行数・成功率・平均レイテンシ
+
+        Returns:
+            {page_type: {method: {'attempts', 'successes', 'success_rate', 'avg_seconds'}}}
+        """
+        with self._lock:
+            result = {}
+            for page_type, methods in self._counts.items():
+                result[page_type] = {}
+                for method, counts in methods.items():
+                    attempts = counts['attempts']
+                    result[page_type][method] = {
+                        'attempts': attempts,
+                        'successes': counts['successes'],
+                        'success_rate': round(counts['successes'] / attempts, 3) if attempts else 0.0,
+                        'avg_seconds': round(counts['total_seconds'] / attempts, 3) if attempts else 0.0,
+                    }
+            return result
+
+    def stats_line(self, page_type: str) -> str:
+        """ログ出力用の集計"""
+        parts = []
+        for method, counts in self.summary().get(page_type, {}).items():
+            parts.append(
+                f"{method} {counts['successes']}/{counts['attempts']}件成功 平均{counts['avg_seconds']:.2f}秒"
+            )
+        return f"取得方法 ({page_type}): " + (", ".join(parts) or "なし")
+
+
+# グローバルインスタンス（シングルトンパターン）
+_http_fetcher_instance = None
+_fetch_stats_instance = None
+
+
+def get_http_fetcher() -> HttpFetcher:
+    """HTTPクライアントのインスタンスを取得（シングルトン）"""
+    global _http_fetcher_instance
+    if _http_fetcher_instance is None:
+        _http_fetcher_instance = HttpFetcher()
+    return _http_fetcher_instance
+
+
+def get_fetch_stats() -> FetchStats:
+    """取得方法ごとの集計インスタンスを取得（シングルトン）"""
+    global _fetch_stats_instance
+    if _fetch_stats_instance is None:
+        _fetch_stats_instance = FetchStats()
+    return _fetch_stats_instance
@@ -5,18 +5,58 @@ Kaggle APIを使ってコンペティション情報を取得するクライア
 """
 
 import os
-from typing import List, Dict, Optional
+import time
+from typing import Any, Callable, List, Dict, Optional
 from datetime import datetime
 from kaggle.api.kaggle_api_extended import KaggleApi
 
+from .rate_limiter import AdaptiveRateLimiter, CircuitOpenError, get_kaggle_rate_limiter, parse_retry_after
+
 
 class KaggleClient:
     """Kaggle API クライアント"""
 
-    def __init__(self):
-        """初期化（環境変数から認証情報を読み込む）"""
+    def __init__(self, rate_limiter: Optional[AdaptiveRateLimiter] = None):
+        """
+        初期化（環境変数から認証情報を読み込む）
+
+        Args:
+            rate_limiter: API呼び出しに使うレートリミッター
+                          （None の場合は ScraperService と共有のリミッター）
+        """
         self.api = KaggleApi()
         self.api.authenticate()
+        self.rate_limiter = rate_limiter or get_kaggle_rate_limiter()
+
+    def _call_api(self, func: Callable[..., Any], **kwargs) -> Any:
+        """
+        Kaggle API を呼び出す（レート制限・サーキットブレーカー経由）
+
+        Args:
+            func: KaggleApi のメソッド
+            **kwargs: メソッドの引数
+
+        Returns:
+            メソッドの返り値
+
+        Raises:
+            CircuitOpenError: サーキットが開いている場合
+        """
+        self.rate_limiter.acquire()
+        start = time.monotonic()
+        try:
+            result = func(**kwargs)
+        except Exception as e:
+            # ApiException は status / headers を持つ（それ以外は接続エラー扱い）
+            headers = getattr(e, 'headers', None) or {}
+            self.rate_limiter.record(
+                getattr(e, 'status', None),
+                time.monotonic() - start,
+                retry_after=parse_retry_after(headers.get('Retry-After'))
+            )
+            raise
+        self.rate_limiter.record(200, time.monotonic() - start)
+        return result
 
     def get_competitions(
         self,
@@ -41,7 +81,7 @@ class KaggleClient:
             if category:
                 params["category"] = category
 
-            competitions = self.api.competitions_list(**params)
+            competitions = self._call_api(self.api.competitions_list, **params)
 
             result = []
             for comp in competitions:
@@ -53,6 +93,8 @@ class KaggleClient:
 
             return result
 
+        except CircuitOpenError:
+            raise
         except Exception as e:
             print(f"Error fetching competitions: {e}")
             return []
@@ -69,7 +111,7 @@ class KaggleClient:
         """
         try:
             # Kaggle APIで検索して取得（competition_viewメソッドは存在しないため）
-            comps = self.api.competitions_list(search=competition_id)
+            comps = self._call_api(self.api.competitions_list, search=competition_id)
 
             # 完全一致するものを探す
             for comp in comps:
@@ -83,6 +125,8 @@ class KaggleClient:
             # 見つからない場合
             return None
 
+        except CircuitOpenError:
+            raise
         except Exception as e:
             print(f"Error fetching competition {competition_id}: {e}")
             return None
@@ -164,7 +208,7 @@ class KaggleClient:
         """
         try:
             # 簡単なAPI呼び出しでテスト
-            self.api.competitions_list(page=1)
+            self._call_api(self.api.competitions_list, page=1)
             return True
         except Exception as e:
             print(f"Connection test failed: {e}")
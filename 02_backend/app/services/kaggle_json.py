@@ -0,0 +1,285 @@
+"""
+Kaggle 内部 JSON API レスポンスの解析
+
+Kaggle のディスカッション・ノートブック・コンペ一覧ページは、
+ブラウザが `/api/i/...` への XHR で取得した JSON から描画されている。
+レンダリング後の DOM（`sc-kSaXSp` のようなクラス名やツールチップ）を
+辿る代わりに、この JSON から投票数・称号・日時などを直接取り出す。
+
+レスポンスの構造は公開仕様ではないため、キー名の揺れを吸収しつつ
+「それらしい辞書」を再帰的に探す実装にしている。
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+
+# 内部APIのパス（例: /api/i/discussions.DiscussionsService/GetTopicListByForumId）
+KAGGLE_API_PATH = "/api/i/"
+
+# コンペのURL（/competitions/<slug> または https://www.kaggle.com/competitions/<slug>、タブのパスは除く）
+_COMPETITION_URL_PATTERN = re.compile(r'^(?:https?://(?:www\.)?kaggle\.com)?/competitions/([\w-]+)/?(?:[?#].*)?$')
+
+# コンペの辞書にだけ現れるキー（slug だけではデータセット・ユーザーなどと区別できない）
+COMPETITION_KEYS = ('competitionId', 'competitionName', 'competitionTitle', 'deadline', 'totalTeams')
+
+# 称号（表示順は既存のDOM解析と合わせる）
+TIERS = ['Grandmaster', 'Master', 'Expert', 'Contributor', 'Novice']
+
+# Kaggleの称号アイコン（SVG circle）の配色
+TIER_COLORS = {
+    'Grandmaster': 'rgb(235, 204, 41)',
+    'Master': 'rgb(241, 95, 0)',
+    'Expert': 'rgb(149, 98, 143)',
+    'Contributor': 'rgb(32, 190, 255)',
+    'Novice': 'rgb(93, 184, 128)',
+}
+
+
+def is_kaggle_api_response(url: str, content_type: Optional[str]) -> bool:
+    """
+    キャプチャ対象の JSON レスポンスかを判定
+
+    Args:
+        url: レスポンスURL
+        content_type: Content-Type ヘッダー
+
+    Returns:
+        Kaggle内部APIのJSONレスポンスならTrue
+    """
+    if not url or KAGGLE_API_PATH not in url:
+        return False
+    return bool(content_type) and 'json' in content_type.lower()
+
+
+def normalize_tier(value: Any) -> Optional[str]:
+    """
+    JSON 上の称号表現を正規化
+
+    "GRANDMASTER", "grandmaster", "PERFORMANCE_TIER_GRANDMASTER" などを
+    "Grandmaster" に揃える（Master は Grandmaster より後に判定する）
+
+    Args:
+        value: 称号を表す値
+
+    Returns:
+        称号（Grandmaster, Master, Expert, Contributor, Novice）またはNone
+    """
+    if not isinstance(value, str):
+        return None
+
+    value_lower = value.lower()
+    for tier in TIERS:
+        if tier.lower() in value_lower:
+            return tier
+    return None
+
+
+def _first(data: Dict[str, Any], keys: Iterable[str]) -> Any:
+    """候補キーのうち最初に値が入っているものを返す"""
+    for key in keys:
+        value = data.get(key)
+        if value not in (None, ''):
+            return value
+    return None
+
+
+def _to_int(value: Any) -> int:
+    """数値に変換（変換できない場合は0）"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _absolute_url(url: str) -> str:
+    """相対URLを絶対URLに変換"""
+    return f"https://www.kaggle.com{url}" if url.startswith('/') else url
+
+
+def _walk_dicts(data: Any) -> Iterable[Dict[str, Any]]:
+    """JSON 内の全ての辞書を深さ優先で列挙"""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            yield node
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def _extract_author(item: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    """
+    アイテムから投稿者名・称号・称号色を抽出
+
+    Args:
+        item: トピック/ノートブックの辞書
+
+    Returns:
+        {'author', 'author_tier', 'tier_color'}
+    """
+    user = _first(item, ['authorUser', 'author', 'user', 'owner', 'userAvatar', 'firstAuthor'])
+
+    author = None
+    tier = None
+    if isinstance(user, dict):
+        author = _first(user, ['displayName', 'userName', 'name'])
+        tier = normalize_tier(_first(user, ['tier', 'performanceTier', 'userTier', 'progressionTier']))
+    elif isinstance(user, str):
+        author = user
+
+    if not author:
+        author = _first(item, ['authorDisplayName', 'authorName', 'authorUserName'])
+    if not tier:
+        tier = normalize_tier(_first(item, ['authorTier', 'authorPerformanceTier', 'tier']))
+
+    return {
+        'author': author,
+        'author_tier': tier,
+        'tier_color': TIER_COLORS.get(tier) if tier else None,
+    }
+
+
+def extract_discussion_items(payloads: List[Any]) -> List[Dict[str, Any]]:
+    """
+    キャプチャした JSON からディスカッション一覧を抽出
+
+    返り値の各要素は DOM スクレイピング（get_discussions）と同じキーに加え、
+    JSON でしか取れない posted_at / updated_at を持つ
+
+    Args:
+        payloads: レスポンスJSONのリスト
+
+    Returns:
+        ディスカッション情報のリスト（ピン留めを含む。URL重複は除去済み）
+    """
+    items = []
+    seen_urls = set()
+
+    for payload in payloads:
+        for node in _walk_dicts(payload):
+            title = node.get('title') or node.get('name')
+            url = _first(node, ['topicUrl', 'url', 'writeUpUrl'])
+            if not isinstance(title, str) or not isinstance(url, str):
+                continue
+            if '/discussion/' not in url and '/writeups/' not in url:
+                continue
+
+            discussion_url = _absolute_url(url)
+            if discussion_url in seen_urls:
+                continue
+            seen_urls.add(discussion_url)
+
+            items.append({
+                'title': title.strip(),
+                'url': discussion_url,
+                **_extract_author(node),
+                'vote_count': _to_int(_first(node, ['votes', 'voteCount', 'totalVotes', 'upvoteCount'])),
+                'comment_count': _to_int(_first(node, ['commentCount', 'totalMessages', 'numComments', 'totalReplies'])),
+                'category': 'writeup' if '/writeups/' in discussion_url else 'discussion',
+                'is_pinned': bool(_first(node, ['isSticky', 'pinned', 'isPinned'])),
+                'posted_at': _first(node, ['postDate', 'createTime', 'dateCreated', 'publishTime']),
+                'updated_at': _first(node, ['lastCommentPostDate', 'lastUpdateTime', 'lastActivityTime', 'updateTime']),
+            })
+
+    return items
+
+
+def extract_notebook_items(payloads: List[Any]) -> List[Dict[str, Any]]:
+    """
+    キャプチャした JSON からノートブック一覧を抽出
+
+    Args:
+        payloads: レスポンスJSONのリスト
+
+    Returns:
+        ノートブック情報のリスト（get_notebooks と同じキー）
+    """
+    items = []
+    seen_urls = set()
+
+    for payload in payloads:
+        for node in _walk_dicts(payload):
+            title = node.get('title')
+            url = _first(node, ['scriptUrl', 'kernelUrl', 'url'])
+            if not isinstance(title, str) or not isinstance(url, str):
+                continue
+            if '/code/' not in url:
+                continue
+
+            notebook_url = _absolute_url(url.replace('/comments', ''))
+            if notebook_url in seen_urls:
+                continue
+            seen_urls.add(notebook_url)
+
+            items.append({
+                'title': title.strip(),
+                'url': notebook_url,
+                **_extract_author(node),
+                'vote_count': _to_int(_first(node, ['totalVotes', 'voteCount', 'votes'])),
+                'comment_count': _to_int(_first(node, ['totalComments', 'commentCount', 'numComments'])),
+                'type': 'notebook',
+                'updated_at': _first(node, ['lastRunTime', 'scriptVersionDateCreated', 'dateUpdated', 'updateTime']),
+            })
+
+    return items
+
+
+def _competition_id(node: Dict[str, Any]) -> Optional[str]:
+    """
+    コンペの辞書ならコンペIDを返す
+
+    competitionName、またはコンペのURL（competitionUrl / url）から取り出す。
+    slug は COMPETITION_KEYS のいずれかがある辞書でのみ使う
+    """
+    comp_id = node.get('competitionName')
+    if isinstance(comp_id, str) and comp_id:
+        return comp_id
+
+    url = _first(node, ['competitionUrl', 'url'])
+    match = _COMPETITION_URL_PATTERN.match(url) if isinstance(url, str) else None
+    if match:
+        return match.group(1)
+
+    slug = node.get('slug')
+    if isinstance(slug, str) and slug and any(node.get(key) not in (None, '') for key in COMPETITION_KEYS):
+        return slug
+    return None
+
+
+def extract_competition_items(payloads: List[Any]) -> List[Dict[str, Any]]:
+    """
+    キャプチャした JSON からコンペ一覧を抽出
+
+    コンペ固有のキー（COMPETITION_KEYS）かコンペのURLを持つ辞書だけを対象にする
+    （slug と title だけならデータセット・ノートブックなどの辞書にもある）
+
+    Args:
+        payloads: レスポンスJSONのリスト
+
+    Returns:
+        コンペ情報のリスト（scrape_competitions_list の include_details=True と同じキー）
+    """
+    items = []
+    seen_ids = set()
+
+    for payload in payloads:
+        for node in _walk_dicts(payload):
+            comp_id = _competition_id(node)
+            title = _first(node, ['title', 'competitionTitle'])
+            if not isinstance(comp_id, str) or not isinstance(title, str):
+                continue
+            if comp_id in seen_ids:
+                continue
+            seen_ids.add(comp_id)
+
+            items.append({
+                'id': comp_id,
+                'title': title.strip(),
+                'description': (_first(node, ['briefDescription', 'subtitle', 'description']) or '').strip(),
+                'url': f"https://www.kaggle.com/competitions/{comp_id}",
+                'deadline': _first(node, ['deadline', 'deadlineDate']),
+            })
+
+    return items
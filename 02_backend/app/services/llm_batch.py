@@ -0,0 +1,266 @@
+"""
+LLMのバッチ実行（OpenAI Batch API）
+
+大量の要約・充実化を同期APIの代わりにバッチAPIで実行する（料金・レート制限が緩い）。
+LLMService.prefetch_batch から使用する:
+
+1. 収集: 各アイテムの処理を実行し、レスポンスキャッシュにない呼び出しを LLMBatch に追加する
+   （呼び出し時点で BatchDeferred を送出して処理を中断する）
+2. 送信: リクエストをJSONLファイルに書き出して送信し、完了までポーリングする
+3. 結果を呼び出しと同じキーでレスポンスキャッシュに保存する
+4. 通常の処理を実行すると、全ての呼び出しがキャッシュから返り、各行に結果が反映される
+
+送信先は BatchBackend で差し替えられる（テスト用に LocalBatchBackend を用意）
+"""
+
+import json
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+
+from app.config import LLM_BATCH_DIR, LLM_BATCH_POLL_SECONDS, LLM_BATCH_TIMEOUT_HOURS
+
+
+# バッチの終了状態（completed 以外は途中までの結果だけを取得する）
+TERMINAL_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+
+
+class BatchDeferred(BaseException):
+    """
+    バッチ収集中にキャッシュにない呼び出しが行われたことを示す
+
+    各メソッドのリトライ処理（except Exception）で捕捉されないよう BaseException を継承する
+    """
+
+
+class BatchBackend(ABC):
+    """バッチAPIの送信先"""
+
+    @abstractmethod
+    def submit(self, input_path: Path) -> str:
+        """JSONLファイルを送信してバッチIDを返す"""
+
+    @abstractmethod
+    def retrieve(self, batch_id: str) -> Dict[str, Any]:
+        """バッチの状態（'status', 'completed', 'failed', 'total'）"""
+
+    @abstractmethod
+    def download_results(self, batch_id: str) -> str:
+        """結果（出力・エラー）のJSONL"""
+
+
+class OpenAIBatchBackend(BatchBackend):
+    """OpenAI Batch API（/v1/files・/v1/batches）"""
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.openai.com/v1",
+        transport: Optional[httpx.BaseTransport] = None
+    ):
+        """
+        初期化
+
+        Args:
+            api_key: OpenAI APIキー
+            base_url: APIのベースURL
+            transport: HTTPトランスポート（テスト用）
+        """
+        self.client = httpx.Client(
+            base_url=base_url,
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=120,
+            transport=transport
+        )
+
+    def submit(self, input_path: Path) -> str:
+        with open(input_path, 'rb') as f:
+            response = self.client.post(
+                "/files",
+                data={"purpose": "batch"},
+                files={"file": (Path(input_path).name, f, "application/jsonl")}
+            )
+        response.raise_for_status()
+
+        response = self.client.post("/batches", json={
+            "input_file_id": response.json()["id"],
+            "endpoint": "/v1/chat/completions",
+            "completion_window": "24h",
+        })
+        response.raise_for_status()
+        return response.json()["id"]
+
+    def retrieve(self, batch_id: str) -> Dict[str, Any]:
+        response = self.client.get(f"/batches/{batch_id}")
+        response.raise_for_status()
+        batch = response.json()
+        counts = batch.get("request_counts") or {}
+        return {
+            'status': batch["status"],
+            'completed': counts.get("completed", 0),
+            'failed': counts.get("failed", 0),
+            'total': counts.get("total", 0),
+            'output_file_id': batch.get("output_file_id"),
+            'error_file_id': batch.get("error_file_id"),
+        }
+
+    def download_results(self, batch_id: str) -> str:
+        batch = self.retrieve(batch_id)
+        parts = []
+        for file_id in (batch['output_file_id'], batch['error_file_id']):
+            if file_id:
+                response = self.client.get(f"/files/{file_id}/content")
+                response.raise_for_status()
+                parts.append(response.text.strip())
+        return "\n".join(part for part in parts if part)
+
+
+class LocalBatchBackend(BatchBackend):
+    """
+    ローカルで即時に実行するバッチ（テスト・動作確認用）
+
+    respond にリクエストの body を渡し、返り値をレスポンス本文とする（例外はエラー行になる）
+    """
+
+    def __init__(self, respond: Callable[[Dict[str, Any]], str]):
+        self.respond = respond
+        self.batches: Dict[str, str] = {}
+        self.submitted: list = []
+
+    def submit(self, input_path: Path) -> str:
+        lines = []
+        for line in Path(input_path).read_text(encoding='utf-8').splitlines():
+            request = json.loads(line)
+            self.submitted.append(request)
+            try:
+                content = self.respond(request["body"])
+                result = {
+                    "custom_id": request["custom_id"],
+                    "response": {
+                        "status_code": 200,
+                        "body": {"choices": [{"message": {"role": "assistant", "content": content}}]},
+                    },
+                    "error": None,
+                }
+            except Exception as e:
+                result = {"custom_id": request["custom_id"], "response": None, "error": {"message": str(e)}}
+            lines.append(json.dumps(result, ensure_ascii=False))
+
+        batch_id = f"local_batch_{len(self.batches) + 1}"
+        self.batches[batch_id] = "\n".join(lines)
+        return batch_id
+
+    def retrieve(self, batch_id: str) -> Dict[str, Any]:
+        total = len(self.batches[batch_id].splitlines())
+        return {'status': 'completed', 'completed': total, 'failed': 0, 'total': total}
+
+    def download_results(self, batch_id: str) -> str:
+        return self.batches[batch_id]
+
+
+def parse_batch_results(text: str) -> tuple[Dict[str, str], Dict[str, str]]:
+    """
+    結果のJSONLを解析
+
+    Returns:
+        ({custom_id: レスポンス本文}, {custom_id: エラー内容})
+    """
+    responses: Dict[str, str] = {}
+    errors: Dict[str, str] = {}
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        result = json.loads(line)
+        custom_id = result["custom_id"]
+        response = result.get("response") or {}
+        if response.get("status_code") == 200:
+            content = response["body"]["choices"][0]["message"].get("content")
+            if content:
+                responses[custom_id] = content
+                continue
+        error = result.get("error") or response.get("body", {}).get("error") or {}
+        errors[custom_id] = error.get("message", "empty response")
+    return responses, errors
+
+
+class LLMBatch:
+    """バッチで実行するリクエストの集まり（キーはレスポンスキャッシュのキー）"""
+
+    def __init__(self):
+        self.requests: Dict[str, Dict[str, Any]] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.requests)
+
+    def add(self, key: str, method: str, model: str, messages: list, params: Dict[str, Any]) -> None:
+        """リクエストを追加（同じキーは1回だけ）"""
+        with self._lock:
+            self.requests[key] = {
+                'method': method,
+                'model': model,
+                'body': {'model': model, 'messages': messages, **params},
+            }
+
+    def write(self, path: Path) -> Path:
+        """Batch API の入力形式（JSONL）で書き出す"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            for key, request in self.requests.items():
+                f.write(json.dumps({
+                    "custom_id": key,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": request['body'],
+                }, ensure_ascii=False) + "\n")
+        return path
+
+    def run(
+        self,
+        backend: BatchBackend,
+        batch_dir: Path = LLM_BATCH_DIR,
+        poll_interval: float = LLM_BATCH_POLL_SECONDS,
+        timeout: float = LLM_BATCH_TIMEOUT_HOURS * 3600,
+        sleep: Callable[[float], None] = time.sleep
+    ) -> Dict[str, str]:
+        """
+        送信して完了まで待ち、結果を返す
+
+        Args:
+            backend: 送信先
+            batch_dir: 入力ファイルの書き出し先
+            poll_interval: 状態を確認する間隔（秒）
+            timeout: 待機の上限（秒）
+            sleep: 待機関数（テスト用）
+
+        Returns:
+            {キー: レスポンス本文}（失敗したリクエストは含まない）
+
+        Raises:
+            TimeoutError: timeout までに終了しなかった場合
+        """
+        input_path = self.write(Path(batch_dir) / f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.jsonl")
+        batch_id = backend.submit(input_path)
+        print(f"📤 バッチ送信: {batch_id}（{len(self)}件、{input_path}）")
+
+        waited = 0.0
+        while True:
+            batch = backend.retrieve(batch_id)
+            if batch['status'] in TERMINAL_STATUSES:
+                break
+            if waited >= timeout:
+                raise TimeoutError(f"Batch {batch_id} did not finish within {timeout:.0f}s (status: {batch['status']})")
+            print(f"   ⏳ {batch['status']}: {batch['completed']}/{batch['total']}件完了")
+            sleep(poll_interval)
+            waited += poll_interval
+
+        responses, errors = parse_batch_results(backend.download_results(batch_id))
+        print(f"📥 バッチ終了: {batch['status']}（成功 {len(responses)}件、失敗 {len(errors)}件）")
+        for key, error in list(errors.items())[:5]:
+            print(f"   ⚠️ {self.requests.get(key, {}).get('method', key)}: {error}")
+        return responses
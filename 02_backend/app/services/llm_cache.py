@@ -0,0 +1,200 @@
+"""
+LLMレスポンスの永続キャッシュ
+
+LLMService の呼び出し（モデル・メソッド・メッセージ・パラメータ）をハッシュしたキーで
+レスポンス本文を SQLite に保存する。同じ入力でバッチスクリプトを再実行した場合
+（途中で停止した後の再開など）は API を呼び出さずにキャッシュから返す。
+
+- 合計サイズが上限を超えたら、最後に使われた日時の古いものから削除する
+- メソッドごとのヒット・ミス数をプロセス内で集計する
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from app.config import LLM_CACHE_PATH, LLM_CACHE_MAX_MB
+
+
+def cache_key(model: str, method: str, messages: list, params: Dict[str, Any]) -> str:
+    """
+    呼び出し内容からキャッシュキーを作成
+
+    Args:
+        model: モデル名
+        method: LLMService のメソッド名
+        messages: チャットメッセージ
+        params: その他のパラメータ（temperature, max_tokens など）
+
+    Returns:
+        SHA-256 の16進文字列
+    """
+    payload = json.dumps(
+        {'model': model, 'method': method, 'messages': messages, 'params': params},
+        sort_keys=True,
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite によるLLMレスポンスのキャッシュ"""
+
+    def __init__(self, path: str | Path = LLM_CACHE_PATH, max_bytes: int = int(LLM_CACHE_MAX_MB * 1024 * 1024)):
+        """
+        初期化
+
+        Args:
+            path: SQLite ファイルのパス
+            max_bytes: レスポンス本文の合計サイズの上限（0 で無制限）
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._lock = Lock()
+        self._counts: Dict[str, Dict[str, int]] = {}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    key TEXT PRIMARY KEY,
+                    method TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_last_used ON llm_responses(last_used_at)")
+            conn.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        # 複数のバッチプロセスが同じキャッシュを使う場合に備えて待機時間を長めにする
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _count(self, method: str, field: str) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(method, {'hits': 0, 'misses': 0})
+            counts[field] += 1
+
+    def get(self, key: str, method: str) -> Optional[str]:
+        """
+        キャッシュされたレスポンスを取得
+
+        Args:
+            key: cache_key で作成したキー
+            method: 集計用のメソッド名
+
+        Returns:
+            レスポンス本文（なければ None）
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT response FROM llm_responses WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                conn.execute("UPDATE llm_responses SET last_used_at = ? WHERE key = ?", (time.time(), key))
+                conn.commit()
+
+        self._count(method, 'hits' if row is not None else 'misses')
+        return row[0] if row is not None else None
+
+    def put(self, key: str, method: str, model: str, response: str) -> None:
+        """
+        レスポンスを保存（上限を超えたら古いものから削除）
+
+        Args:
+            key: cache_key で作成したキー
+            method: LLMService のメソッド名
+            model: モデル名
+            response: レスポンス本文
+        """
+        now = time.time()
+        size = len(response.encode('utf-8'))
+        with closing(self._connect()) as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_responses (key, method, model, response, size, created_at, last_used_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (key, method, model, response, size, now, now)
+            )
+            if self.max_bytes:
+                self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """合計サイズが上限以下になるまで、最後に使われた日時の古いものから削除"""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        for key, size in conn.execute("SELECT key, size FROM llm_responses ORDER BY last_used_at").fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        print(f"🗑️  LLMキャッシュを{evicted}件削除（上限 {self.max_bytes / 1024 / 1024:.0f}MB）")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        メソッドごとのヒット率と保存件数
+
+        Returns:
+            {'methods': {method: {'hits', 'misses', 'hit_rate', 'entries', 'bytes'}}, 'entries', 'bytes'}
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT method, COUNT(*), COALESCE(SUM(size), 0) FROM llm_responses GROUP BY method"
+            ).fetchall()
+        stored = {method: (entries, size) for method, entries, size in rows}
+
+        with self._lock:
+            counts = {method: dict(value) for method, value in self._counts.items()}
+
+        methods = {}
+        for method in sorted(set(stored) | set(counts)):
+            hits = counts.get(method, {}).get('hits', 0)
+            misses = counts.get(method, {}).get('misses', 0)
+            entries, size = stored.get(method, (0, 0))
+            methods[method] = {
+                'hits': hits,
+                'misses': misses,
+                'hit_rate': round(hits / (hits + misses), 3) if hits + misses else None,
+                'entries': entries,
+                'bytes': size,
+            }
+
+        return {
+            'methods': methods,
+            'entries': sum(entries for entries, _ in stored.values()),
+            'bytes': sum(size for _, size in stored.values()),
+        }
+
+    def report(self) -> list[str]:
+        """ログ出力用のヒット率（この実行で呼び出したメソッドのみ）"""
+        lines = ["🧾 LLMキャッシュ"]
+        for method, stat in self.stats()['methods'].items():
+            if stat['hits'] or stat['misses']:
+                lines.append(f"   {method}: ヒット {stat['hits']}件 / ミス {stat['misses']}件")
+        if len(lines) == 1:
+            lines.append("   呼び出しなし")
+        return lines
+
+
+# グローバルインスタンス（シングルトンパターン）
+_llm_cache_instance = None
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """LLMレスポンスキャッシュのインスタンスを取得（シングルトン）"""
+    global _llm_cache_instance
+    if _llm_cache_instance is None:
+        _llm_cache_instance = LLMResponseCache()
+    return _llm_cache_instance
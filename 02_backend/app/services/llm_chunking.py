@@ -0,0 +1,141 @@
+"""
+LLMに渡す本文のトークン数の計測と分割
+
+文字数ではなくトークン数で本文の長さを判定する（日本語と英語で1文字あたりのトークン数が大きく違うため）。
+tiktoken がインストールされていればモデルのトークナイザで数え、
+ない場合は文字の種類から概算する（ASCII は約4文字で1トークン、それ以外は1文字1トークン）。
+"""
+
+import math
+import re
+from functools import lru_cache
+from typing import List, Optional
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """モデルのトークナイザ（tiktoken 未インストールの場合は None）"""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(text: str, model: str = "gpt-4o") -> int:
+    """
+    テキストのトークン数
+
+    Args:
+        text: テキスト
+        model: モデル名（トークナイザの選択用）
+
+    Returns:
+        トークン数（tiktoken がない場合は概算）
+    """
+    if not text:
+        return 0
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = "gpt-4o") -> str:
+    """
+    max_tokens に収まるように末尾を切り詰める（切り詰めた場合は "..." を付ける）
+
+    Args:
+        text: テキスト
+        max_tokens: トークン数の上限
+        model: モデル名
+
+    Returns:
+        切り詰めたテキスト
+    """
+    if count_tokens(text, model) <= max_tokens:
+        return text
+
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        return encoding.decode(encoding.encode(text, disallowed_special=())[:max_tokens]) + "..."
+
+    # 概算: 収まる最長の先頭部分を二分探索
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if count_tokens(text[:middle], model) <= max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+    return text[:low] + "..."
+
+
+def split_into_chunks(
+    text: str,
+    max_tokens: int,
+    model: str = "gpt-4o",
+    max_chunks: Optional[int] = None
+) -> List[str]:
+    """
+    段落の区切りで max_tokens 以下のチャンクに分割
+
+    段落が max_tokens を超える場合は行、行も超える場合は文字数で分割する。
+
+    Args:
+        text: テキスト
+        max_tokens: 1チャンクのトークン数の上限
+        model: モデル名
+        max_chunks: チャンク数の上限（超える場合は1チャンクを大きくして必ず上限以下に収める）
+
+    Returns:
+        チャンクのリスト（全体が収まる場合は [text]）
+    """
+    total = count_tokens(text, model)
+    if total <= max_tokens:
+        return [text] if text else []
+    if max_chunks:
+        max_tokens = max(max_tokens, math.ceil(total / max_chunks))
+
+    while True:
+        chunks = _pack_chunks(text, max_tokens, model)
+        if not max_chunks or len(chunks) <= max_chunks:
+            return chunks
+        # 段落の境界で詰め切れずに上限を超えた場合は、超えた割合だけチャンクを大きくして詰め直す
+        max_tokens = math.ceil(max_tokens * len(chunks) / max_chunks)
+
+
+def _pack_chunks(text: str, max_tokens: int, model: str) -> List[str]:
+    """段落 → 行 → 文字数の順に区切り、max_tokens 以下のチャンクに詰める"""
+    pieces = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        if count_tokens(paragraph, model) <= max_tokens:
+            pieces.append(paragraph)
+            continue
+        for line in paragraph.split("\n"):
+            if count_tokens(line, model) <= max_tokens:
+                pieces.append(line)
+                continue
+            # 1行が長すぎる場合は文字数で分割
+            step = max(1, len(line) * max_tokens // count_tokens(line, model))
+            pieces.extend(line[start:start + step] for start in range(0, len(line), step))
+
+    chunks: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    for piece in pieces:
+        tokens = count_tokens(piece, model) + 1
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append("\n\n".join(current))
+            current, current_tokens = [], 0
+        current.append(piece)
+        current_tokens += tokens
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
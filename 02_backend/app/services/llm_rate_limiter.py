@@ -0,0 +1,222 @@
+"""
+OpenAI API 呼び出しのレート制限（リクエスト数/分・トークン数/分のトークンバケット）
+
+LLMService の全ての呼び出しがモデルごとのガバナーで枠を確保してから API を呼び出し、
+スレッド間（run_many・map-reduce）でレート上限を超えないようにする。
+設定で Redis を有効にすると、バケットを Redis に置いて複数プロセス
+（APIサーバーとバッチスクリプトなど）で共有する。
+
+- 呼び出し前に推定トークン数（入力 + max_tokens）を差し引き、残量が負なら回復するまで待つ
+- 呼び出し後に実際の使用量との差を戻す
+- 429 の Retry-After の間は全ての呼び出しを待たせる
+- 再試行の待機は指数バックオフ + ジッター（full jitter）
+"""
+
+import random
+import time
+from threading import Lock
+from typing import Any, Callable, Dict, Optional
+
+from app.config import (
+    LLM_RATE_LIMIT_RPM,
+    LLM_RATE_LIMIT_TPM,
+    LLM_RATE_LIMIT_REDIS,
+    LLM_BACKOFF_BASE_SECONDS,
+    LLM_BACKOFF_MAX_SECONDS,
+)
+
+
+def backoff_delay(
+    attempt: int,
+    base: float = LLM_BACKOFF_BASE_SECONDS,
+    cap: float = LLM_BACKOFF_MAX_SECONDS,
+    rand: Callable[[float, float], float] = random.uniform
+) -> float:
+    """
+    指数バックオフ + full jitter の待機秒数
+
+    Args:
+        attempt: 何回目の再試行か（0始まり）
+        base: 初回の上限秒数
+        cap: 上限秒数
+        rand: 乱数関数（テスト用）
+
+    Returns:
+        0 〜 min(cap, base * 2^attempt) の一様乱数
+    """
+    return rand(0, min(cap, base * (2 ** attempt)))
+
+
+class LLMRateGovernor:
+    """リクエスト数/分・トークン数/分のトークンバケット"""
+
+    STATE_FIELDS = ('requests', 'tokens', 'updated_at', 'blocked_until')
+
+    def __init__(
+        self,
+        name: str = "openai",
+        requests_per_minute: float = LLM_RATE_LIMIT_RPM,
+        tokens_per_minute: float = LLM_RATE_LIMIT_TPM,
+        redis_client: Any = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        初期化
+
+        Args:
+            name: ガバナー名（Redis のキーに使用）
+            requests_per_minute: 1分あたりのリクエスト数の上限（0 で無制限）
+            tokens_per_minute: 1分あたりのトークン数の上限（0 で無制限）
+            redis_client: 状態を共有する Redis クライアント（None の場合はプロセス内）
+            clock: 現在時刻（テスト用）
+            sleep: 待機関数（テスト用）
+        """
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.redis = redis_client
+        self.clock = clock
+        self.sleep = sleep
+
+        self._key = f"llm_ratelimit:{name}"
+        self._lock = Lock()
+        self._state = self._initial_state()
+
+    def _initial_state(self) -> Dict[str, float]:
+        return {
+            'requests': float(self.requests_per_minute),
+            'tokens': float(self.tokens_per_minute),
+            'updated_at': self.clock(),
+            'blocked_until': 0.0,
+        }
+
+    def _update_state(self, mutate: Callable[[Dict[str, float]], Any]) -> Any:
+        """
+        状態をアトミックに読み取り・更新する（AdaptiveRateLimiter と同じ方式）
+
+        Redis が有効な場合は WATCH/MULTI のトランザクションで更新し、
+        Redis エラー時はプロセス内の状態にフォールバックする
+        """
+        if self.redis is not None:
+            def transaction(pipe):
+                raw = pipe.hgetall(self._key)
+                state = self._initial_state()
+                for field in self.STATE_FIELDS:
+                    if field in raw:
+                        state[field] = float(raw[field])
+                result = mutate(state)
+                pipe.multi()
+                pipe.hset(self._key, mapping={field: repr(state[field]) for field in self.STATE_FIELDS})
+                pipe.expire(self._key, 3600)
+                return result
+
+            try:
+                return self.redis.transaction(transaction, self._key, value_from_callable=True)
+            except Exception as e:
+                print(f"⚠️  LLMレート制限のRedis共有に失敗、プロセス内で継続: {e}")
+                self.redis = None
+
+        with self._lock:
+            return mutate(self._state)
+
+    def _refill(self, state: Dict[str, float], now: float) -> None:
+        """経過時間分だけバケットを回復（上限は1分あたりの値）"""
+        elapsed = max(0.0, now - state['updated_at'])
+        state['requests'] = min(
+            float(self.requests_per_minute),
+            state['requests'] + elapsed * self.requests_per_minute / 60
+        )
+        state['tokens'] = min(
+            float(self.tokens_per_minute),
+            state['tokens'] + elapsed * self.tokens_per_minute / 60
+        )
+        state['updated_at'] = now
+
+    def acquire(self, tokens: int) -> float:
+        """
+        1リクエスト分の枠を確保（必要なら待機）
+
+        Args:
+            tokens: 推定トークン数（入力 + 最大出力）
+
+        Returns:
+            待機した秒数
+        """
+        now = self.clock()
+        # 1回で上限を超える呼び出しも、満タンになるまで待てば実行できるようにする
+        if self.tokens_per_minute:
+            tokens = min(tokens, self.tokens_per_minute)
+
+        def reserve(state):
+            self._refill(state, now)
+            waits = [state['blocked_until'] - now]
+            if self.requests_per_minute:
+                state['requests'] -= 1
+                waits.append(-state['requests'] * 60 / self.requests_per_minute)
+            if self.tokens_per_minute:
+                state['tokens'] -= tokens
+                waits.append(-state['tokens'] * 60 / self.tokens_per_minute)
+            return max(waits)
+
+        wait = self._update_state(reserve)
+        if wait > 0:
+            self.sleep(wait)
+            return wait
+        return 0.0
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: Optional[int]) -> None:
+        """
+        実際の使用トークン数との差をバケットに反映
+
+        Args:
+            estimated_tokens: acquire に渡した推定トークン数
+            actual_tokens: レスポンスの usage.total_tokens（不明な場合は None）
+        """
+        if actual_tokens is None or not self.tokens_per_minute:
+            return
+        difference = min(estimated_tokens, self.tokens_per_minute) - actual_tokens
+
+        def update(state):
+            self._refill(state, self.clock())
+            state['tokens'] = min(float(self.tokens_per_minute), state['tokens'] + difference)
+
+        self._update_state(update)
+
+    def record_rate_limited(self, retry_after: Optional[float]) -> None:
+        """
+        429 を記録し、Retry-After の間は全ての呼び出しを待たせる
+
+        Args:
+            retry_after: Retry-After ヘッダーの秒数（ない場合は None）
+        """
+        if not retry_after:
+            return
+        now = self.clock()
+
+        def update(state):
+            state['blocked_until'] = max(state['blocked_until'], now + retry_after)
+
+        self._update_state(update)
+        print(f"⏸️  {self.name} 429: {retry_after:.1f}秒間呼び出しを停止")
+
+    def snapshot(self) -> Dict[str, float]:
+        """現在の状態（ログ・確認用）"""
+        return dict(self._update_state(lambda state: dict(state)))
+
+
+# モデルごとのインスタンス（シングルトンパターン）
+_llm_rate_governors: Dict[str, LLMRateGovernor] = {}
+_llm_rate_governors_lock = Lock()
+
+
+def get_llm_rate_governor(model: str) -> LLMRateGovernor:
+    """モデルのレートガバナーを取得（OpenAI のレート上限はモデルごと）"""
+    with _llm_rate_governors_lock:
+        if model not in _llm_rate_governors:
+            redis_client = None
+            if LLM_RATE_LIMIT_REDIS:
+                from .cache_service import get_cache_service
+                redis_client = get_cache_service().redis
+            _llm_rate_governors[model] = LLMRateGovernor(name=f"openai:{model}", redis_client=redis_client)
+        return _llm_rate_governors[model]
@@ -7,31 +7,434 @@ OpenAI GPT-4oを使用してコンペティション情報を分析し、
 
 import os
 import json
-from typing import List, Dict, Optional, Any
-from openai import OpenAI
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import List, Dict, Optional, Any, Callable, Iterable, Iterator, Tuple
+from openai import OpenAI, APIConnectionError, InternalServerError, RateLimitError
 import time
 
-from app.config import OPENAI_API_KEY
+from app.config import (
+    OPENAI_API_KEY,
+    OPENAI_BASE_URL,
+    LLM_CACHE_ENABLED,
+    LLM_CHUNK_TOKENS,
+    LLM_COMBINED_ENRICHMENT,
+    LLM_MAP_REDUCE_ENABLED,
+    LLM_MAX_CHUNKS,
+    LLM_MAX_PARALLEL_CALLS,
+    LLM_RATE_LIMIT_MAX_RETRIES,
+    LLM_TELEMETRY_ENABLED,
+)
+from .llm_chunking import count_tokens, split_into_chunks, truncate_to_tokens
+from .llm_rate_limiter import backoff_delay, get_llm_rate_governor
+from .llm_telemetry import LLMTelemetry, get_llm_telemetry
+from .rate_limiter import parse_retry_after
+from .llm_cache import LLMResponseCache, cache_key, get_llm_cache
+from .llm_batch import BatchBackend, BatchDeferred, LLMBatch, OpenAIBatchBackend
+
+
+# streaming() の中で実行中の (sink, ストリーミングするメソッド名)。run_many のスレッドにも引き継ぐ
+_stream_sink: contextvars.ContextVar[Optional[Tuple[Callable[[str, Optional[str]], None], frozenset]]] = \
+    contextvars.ContextVar('llm_stream_sink', default=None)
+
+# prefetch_batch の収集中の LLMBatch。収集を実行しているスレッド（と run_many のスレッド）だけが参照する
+# （同じインスタンスを使う他のリクエストの呼び出しはバッチに回さない）
+_batch_collector: contextvars.ContextVar[Optional[LLMBatch]] = \
+    contextvars.ContextVar('llm_batch_collector', default=None)
+
+# 429・接続エラー・5xx。_create_completion が Retry-After・バックオフで再試行済みのため、
+# 各メソッドの再試行（検証エラー・JSONエラー用）では再試行せずに呼び出し元へ送る
+_TRANSIENT_API_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
 
 
 class LLMService:
     """LLMサービスクラス"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        response_cache: Optional[LLMResponseCache] = None,
+        use_cache: Optional[bool] = None,
+        telemetry: Optional[LLMTelemetry] = None,
+        base_url: Optional[str] = None
+    ):
         """
         初期化
 
         Args:
             api_key: OpenAI APIキー（省略時は環境変数から取得）
+            response_cache: レスポンスキャッシュ（None の場合はプロセス共有のキャッシュ）
+            use_cache: レスポンスキャッシュを使うか（None の場合は設定 LLM_CACHE_ENABLED に従う）
+            telemetry: 呼び出しの記録先（None の場合は設定 LLM_TELEMETRY_ENABLED に従ってプロセス共有の記録先）
+            base_url: OpenAI互換APIのベースURL（None の場合は設定 OPENAI_BASE_URL、未設定なら api.openai.com）
         """
         self.api_key = api_key or OPENAI_API_KEY
         if not self.api_key:
             raise ValueError("OpenAI APIキーが設定されていません")
 
-        self.client = OpenAI(api_key=self.api_key)
+        # 再試行は _create_completion でレートガバナーと合わせて行う（SDKの自動再試行は無効）
+        self.base_url = base_url or OPENAI_BASE_URL
+        self.client = OpenAI(api_key=self.api_key, base_url=self.base_url, max_retries=0)
         self.model = "gpt-4o"  # GPT-4o（高品質版）
         self.max_retries = 3
-        self.retry_delay = 2  # 秒
+        self.retry_delay = 2  # 秒（検証エラーなどの再試行の指数バックオフの初期値）
+        self.rate_limit_retries = LLM_RATE_LIMIT_MAX_RETRIES
+
+        use_cache = LLM_CACHE_ENABLED if use_cache is None else use_cache
+        self.cache = (response_cache or get_llm_cache()) if use_cache else None
+        self.telemetry = telemetry or (get_llm_telemetry() if LLM_TELEMETRY_ENABLED else None)
+        self.max_parallel_calls = LLM_MAX_PARALLEL_CALLS
+        self.map_reduce_enabled = LLM_MAP_REDUCE_ENABLED
+        self.chunk_tokens = LLM_CHUNK_TOKENS
+        self.max_chunks = LLM_MAX_CHUNKS
+
+    def prefetch_batch(
+        self,
+        items: List[Any],
+        compute: Callable[[Any], Any],
+        backend: Optional[BatchBackend] = None,
+        max_rounds: int = 3,
+        **run_options
+    ) -> Dict[str, int]:
+        """
+        各アイテムの処理が行うLLM呼び出しをバッチAPIでまとめて実行し、レスポンスキャッシュに保存
+
+        compute(item) を実行してキャッシュにない呼び出しを集め、バッチで取得する。
+        前の呼び出しの結果を使う呼び出し（評価指標 → タグなど）は次の回で集めるため、
+        最大 max_rounds 回繰り返す。実行後に通常どおり compute(item) を呼ぶと、
+        全ての呼び出しがキャッシュから返る（バッチで失敗した呼び出しだけ同期APIで実行される）。
+
+        compute はLLM呼び出しの前にDB書き込みなどの副作用を行わないこと
+
+        Args:
+            items: 処理するアイテム
+            compute: 1アイテム分のLLM処理（返り値は使わない）
+            backend: バッチの送信先（None の場合は OpenAI Batch API）
+            max_rounds: 収集・送信を繰り返す最大回数
+            **run_options: LLMBatch.run に渡す引数（poll_interval, timeout など）
+
+        Returns:
+            {'rounds', 'requests', 'responses'}
+
+        Raises:
+            ValueError: レスポンスキャッシュが無効な場合
+        """
+        if self.cache is None:
+            raise ValueError("バッチモードにはLLMレスポンスキャッシュ（LLM_CACHE_ENABLED）が必要です")
+        backend = backend or (
+            OpenAIBatchBackend(self.api_key, base_url=self.base_url)
+            if self.base_url else OpenAIBatchBackend(self.api_key)
+        )
+
+        summary = {'rounds': 0, 'requests': 0, 'responses': 0}
+        for round_num in range(1, max_rounds + 1):
+            batch = LLMBatch()
+            token = _batch_collector.set(batch)
+            try:
+                for item in items:
+                    try:
+                        compute(item)
+                    except BatchDeferred:
+                        pass
+                    except Exception as e:
+                        print(f"⚠️  バッチ収集中のエラー: {e}")
+            finally:
+                _batch_collector.reset(token)
+
+            if not batch:
+                break
+
+            print(f"📦 バッチ{round_num}回目: {len(batch)}件のリクエスト")
+            responses = batch.run(backend, **run_options)
+            for key, response_text in responses.items():
+                request = batch.requests[key]
+                self.cache.put(key, request['method'], request['model'], response_text)
+
+            summary['rounds'] = round_num
+            summary['requests'] += len(batch)
+            summary['responses'] += len(responses)
+
+        return summary
+
+    def run_many(self, calls: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+        """
+        互いに依存しない呼び出しを並列に実行
+
+        1件分の要約・和訳・技術抽出などをスレッドで同時に呼び出し、
+        全体の待ち時間を最も遅い1回分にする
+
+        Args:
+            calls: {名前: 引数なしの呼び出し}（例: {"summary": lambda: llm.generate_summary(...)}）
+
+        Returns:
+            {名前: 返り値}
+
+        Raises:
+            呼び出しの例外（全呼び出しの終了後、calls の順で最初のもの）
+        """
+        if len(calls) <= 1:
+            return {name: call() for name, call in calls.items()}
+
+        # 呼び出しごとにプールを作る（run_many の入れ子でもワーカーの枯渇で止まらない）
+        with ThreadPoolExecutor(
+            max_workers=min(len(calls), self.max_parallel_calls),
+            thread_name_prefix="llm"
+        ) as pool:
+            # 呼び出し元のコンテキスト（streaming の出力先など）を各スレッドに引き継ぐ
+            futures = {name: pool.submit(contextvars.copy_context().run, call) for name, call in calls.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+    @contextmanager
+    def streaming(self, sink: Callable[[str, Optional[str]], None], methods: Iterable[str]) -> Iterator[None]:
+        """
+        この中（run_many の並列実行を含む）の methods の呼び出しをストリーミングで実行する
+
+        生成されたトークンを sink(method, delta) で逐次渡す。再試行で出力をやり直す場合は
+        sink(method, None) を渡す。キャッシュから返る場合は全文を1回で渡す。
+        メソッドの返り値（検証・整形後の全文）は通常どおり
+
+        Args:
+            sink: トークンの受け取り先（呼び出しを実行したスレッドから呼ばれる）
+            methods: ストリーミングするメソッド名（例: 'translate_and_organize_discussion'）
+        """
+        token = _stream_sink.set((sink, frozenset(methods)))
+        try:
+            yield
+        finally:
+            _stream_sink.reset(token)
+
+    # 本文のトークン予算（超える場合は map-reduce で全体を要約・和訳はチャンクごと、無効なら切り詰め）
+    CONTENT_TOKEN_BUDGETS = {
+        'summarize_discussion': 1500,
+        'generate_structured_discussion_summary': 2500,
+        'translate_and_organize_discussion': 2500,
+        'extract_solution_techniques': 1500,
+        'generate_structured_solution_summary': 2000,
+        'summarize_notebook': 3000,
+    }
+
+    def _fit_content(self, method: str, content: str, title: str = "", model: str = "gpt-4o-mini") -> str:
+        """
+        本文をメソッドのトークン予算に収める
+
+        予算以内ならそのまま返す。超える場合は map-reduce が有効ならチャンクごとの要点
+        （condense_chunk、予算をチャンク数で等分した長さ）をつなげたものを返し、本来のプロンプトで統合させる。
+        無効な場合は予算で切り詰める
+
+        Args:
+            method: 呼び出し元のメソッド名（CONTENT_TOKEN_BUDGETS のキー）
+            content: 本文
+            title: タイトル（要点抽出の文脈用）
+            model: モデル名（トークン数の計測用）
+
+        Returns:
+            予算内の本文
+        """
+        budget = self.CONTENT_TOKEN_BUDGETS[method]
+        if count_tokens(content, model) <= budget:
+            return content
+        if not self.map_reduce_enabled:
+            return truncate_to_tokens(content, budget, model)
+
+        chunks = split_into_chunks(content, self.chunk_tokens, model, max_chunks=self.max_chunks)
+        # 見出し「[パート i/n]」・区切りの改行・切り詰め時の "..." の分を除いて予算を等分する
+        # （つなげた要点が必ず予算に収まり、末尾のパートが切り捨てられない）
+        overhead = count_tokens(f"[パート {len(chunks)}/{len(chunks)}]\n...\n\n", model)
+        notes_budget = max(1, budget // len(chunks) - overhead)
+        print(f"   📚 長い本文を{len(chunks)}チャンクに分けて要点を抽出: {title or method}")
+
+        notes = self.run_many({
+            str(index): (lambda index=index, chunk=chunk: self.condense_chunk(
+                chunk, title=title, part=index + 1, total=len(chunks), max_tokens=notes_budget
+            ))
+            for index, chunk in enumerate(chunks)
+        })
+        merged = "\n\n".join(
+            f"[パート {index + 1}/{len(chunks)}]\n{notes[str(index)]}"
+            for index in range(len(chunks)) if notes[str(index)]
+        )
+        if count_tokens(merged, model) > budget:
+            # 要点が上限を超えて返った場合（トークン数の概算のずれなど）は、要点をもう一度まとめる
+            merged = self.condense_chunk(merged, title=title, max_tokens=budget - overhead)
+        return merged
+
+    def condense_chunk(self, chunk: str, title: str = "", part: int = 1, total: int = 1, max_tokens: int = 500) -> str:
+        """
+        長い本文の一部から要点を抽出（map-reduce の map）
+
+        Args:
+            chunk: 本文の一部
+            title: 本文のタイトル
+            part: 何番目のチャンクか（1始まり）
+            total: チャンクの総数
+            max_tokens: 出力トークン数の上限
+
+        Returns:
+            要点のメモ（失敗した場合はチャンクを出力トークン数で切り詰めたもの）
+        """
+        prompt = f"""以下は長い文書「{title}」の一部（{part}/{total}）です。
+後で文書全体を要約するために、この部分の要点をメモにしてください。
+
+【本文（{part}/{total}）】
+{chunk}
+
+【要件】
+- 手法、モデル、パラメータ・設定値、数値・スコア、結論、試して失敗したことを省略しない
+- コードは処理内容と重要な関数名・パラメータを残す
+- 挨拶や重複した説明は省く
+- 原文の言語のまま、箇条書きで簡潔に
+- 前置きは不要、メモのみを出力"""
+
+        for attempt in range(self.max_retries):
+            try:
+                response_text = self._create_completion(
+                    'condense_chunk',
+                    model="gpt-4o-mini",
+                    messages=[
+                        {"role": "system", "content": "あなたは長い技術文書から要点を漏れなく抽出する専門家です。"},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.2,
+                    max_tokens=max_tokens,
+                    refresh=attempt > 0
+                )
+                return response_text.strip()
+
+            except _TRANSIENT_API_ERRORS:
+                raise
+            except Exception as e:
+                if attempt < self.max_retries - 1:
+                    print(f"要点抽出エラー（リトライ {attempt + 1}/{self.max_retries}）: {e}")
+                    time.sleep(backoff_delay(attempt, base=self.retry_delay))
+                else:
+                    print(f"要点抽出エラー（最終試行失敗）: {e}")
+                    return truncate_to_tokens(chunk, max_tokens)
+
+        return ""
+
+    def _create_completion(self, method: str, model: str, messages: list, refresh: bool = False, **params) -> str:
+        """
+        Chat Completions API を呼び出してレスポンス本文を返す（全メソッド共通）
+
+        モデル・メソッド・メッセージ・パラメータが同じ呼び出しはキャッシュから返す。
+        API 呼び出しはモデルごとのレートガバナーで枠を確保してから行い、
+        429・接続エラー・5xx は Retry-After または指数バックオフ + ジッターで再試行する。
+        各呼び出しのトークン数・レイテンシ・再試行回数・キャッシュヒットをテレメトリに記録する
+
+        Args:
+            method: 呼び出し元のメソッド名（キャッシュキー・集計用）
+            model: モデル名
+            messages: チャットメッセージ
+            refresh: キャッシュを読まずにAPIを呼び出す（検証エラー後の再試行用。結果は上書き保存）
+            **params: temperature, max_tokens, response_format など
+
+        Returns:
+            レスポンス本文
+        """
+        start = time.perf_counter()
+        key = cache_key(model, method, messages, params) if self.cache else None
+        stream = _stream_sink.get()
+        sink = stream[0] if stream and method in stream[1] else None
+        if sink and refresh:
+            sink(method, None)
+
+        if self.cache and not refresh:
+            cached = self.cache.get(key, method)
+            if cached is not None:
+                if sink:
+                    sink(method, cached)
+                self._record_call(method, model, start, cache_hit=True)
+                return cached
+
+        batch = _batch_collector.get()
+        if batch is not None:
+            # バッチの収集中: APIを呼び出さずにリクエストを記録して処理を中断
+            batch.add(key, method, model, messages, params)
+            raise BatchDeferred(method)
+
+        governor = get_llm_rate_governor(model)
+        prompt_tokens = count_tokens("\n".join(str(message.get("content", "")) for message in messages), model)
+        estimated_tokens = prompt_tokens + params.get("max_tokens", 1000)
+
+        retries = 0
+        try:
+            for attempt in range(self.rate_limit_retries + 1):
+                governor.acquire(estimated_tokens)
+                try:
+                    if sink:
+                        if attempt:
+                            sink(method, None)
+                        response_text = self._stream_response(method, model, messages, params, sink)
+                        # ストリーミングでは usage が返らないため概算
+                        completion_tokens = count_tokens(response_text, model)
+                    else:
+                        response = self.client.chat.completions.create(model=model, messages=messages, **params)
+                        response_text = response.choices[0].message.content
+                        usage = getattr(response, 'usage', None)
+                        if usage is not None:
+                            prompt_tokens = usage.prompt_tokens
+                            completion_tokens = usage.completion_tokens
+                        else:
+                            completion_tokens = count_tokens(response_text or "", model)
+                    break
+                except _TRANSIENT_API_ERRORS as e:
+                    # クォータ不足は待っても回復しない
+                    if attempt >= self.rate_limit_retries or getattr(e, 'code', None) == 'insufficient_quota':
+                        raise
+                    retries = attempt + 1
+                    retry_after = None
+                    if getattr(e, 'response', None) is not None:
+                        retry_after = parse_retry_after(e.response.headers.get('retry-after'))
+                    if isinstance(e, RateLimitError) and retry_after:
+                        # 他のスレッド・プロセスも含めて次の acquire で待たせる
+                        governor.record_rate_limited(retry_after)
+                        delay = 0.0
+                    else:
+                        delay = backoff_delay(attempt)
+                    print(f"   ⏳ OpenAI {type(e).__name__}（{method}）: 再試行 {attempt + 1}/{self.rate_limit_retries}")
+                    if delay:
+                        time.sleep(delay)
+        except Exception as e:
+            self._record_call(method, model, start, retries=retries, streamed=bool(sink), error=type(e).__name__)
+            raise
+
+        governor.record_usage(estimated_tokens, prompt_tokens + completion_tokens)
+        self._record_call(
+            method, model, start,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            retries=retries,
+            streamed=bool(sink)
+        )
+
+        if self.cache and response_text:
+            self.cache.put(key, method, model, response_text)
+        return response_text
+
+    def _record_call(self, method: str, model: str, start: float, **fields) -> None:
+        """テレメトリに1呼び出しを記録（fields は LLMTelemetry.record の引数）"""
+        if self.telemetry is not None:
+            self.telemetry.record(model, method, latency=time.perf_counter() - start, **fields)
+
+    def _stream_response(
+        self,
+        method: str,
+        model: str,
+        messages: list,
+        params: Dict[str, Any],
+        sink: Callable[[str, Optional[str]], None]
+    ) -> str:
+        """stream=True で呼び出し、トークンを sink に渡しながら全文を組み立てる"""
+        parts = []
+        for chunk in self.client.chat.completions.create(model=model, messages=messages, stream=True, **params):
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                parts.append(delta)
+                sink(method, delta)
+        return "".join(parts)
 
     def generate(self, prompt: str, temperature: float = 0.3) -> str:
         """
@@ -46,21 +449,25 @@ class LLMService:
         """
         for attempt in range(self.max_retries):
             try:
-                response = self.client.chat.completions.create(
+                response_text = self._create_completion(
+                    'generate',
                     model=self.model,
                     messages=[
                         {"role": "system", "content": "あなたは優秀なデータサイエンティストです。与えられた情報を正確に抽出・整理してください。"},
                         {"role": "user", "content": prompt}
                     ],
                     temperature=temperature,
-                    max_tokens=2000
+                    max_tokens=2000,
+                    refresh=attempt > 0
                 )
-                return response.choices[0].message.content.strip()
+                return response_text.strip()
 
+            except _TRANSIENT_API_ERRORS:
+                raise
             except Exception as e:
                 if attempt < self.max_retries - 1:
                     print(f"   ⚠️ LLMエラー (リトライ {attempt + 1}/{self.max_retries}): {e}")
-                    time.sleep(self.retry_delay)
+                    time.sleep(backoff_delay(attempt, base=self.retry_delay))
                 else:
                     raise
 
@@ -108,17 +515,19 @@ class LLMService:
 
         for attempt in range(self.max_retries):
             try:
-                response = self.client.chat.completions.create(
+                response_text = self._create_completion(
+                    'extract_evaluation_metric',
                     model=self.model,
                     messages=[
                         {"role": "system", "content": "あなたはKaggleコンペティションの分析専門家です。"},
                         {"role": "user", "content": prompt}
                     ],
                     temperature=0.1,  # 一貫性を重視
-                    max_tokens=100
+                    max_tokens=100,
+                    refresh=attempt > 0
                 )
 
-                metric = response.choices[0].message.content.strip()
+                metric = response_text.strip()
 
                 # 前置きを除去（「評価指標は」「指標:」など）
                 metric = metric.replace("評価指標は", "").replace("指標:", "").replace("評価指標:", "").strip()
@@ -129,10 +538,12 @@ class LLMService:
 
                 return metric
 
+            except _TRANSIENT_API_ERRORS:
+                raise
             except Exception as e:
                 if attempt < self.max_retries - 1:
                     print(f"評価指標抽出エラー（リトライ {attempt + 1}/{self.max_retries}）: {e}")
-                    time.sleep(self.retry_delay)
+                    time.sleep(backoff_delay(attempt, base=self.retry_delay))
                 else:
                     print(f"評価指標抽出エラー（最終試行失敗）: {e}")
                     return ""
@@ -180,17 +591,19 @@ class LLMService:
 
         for attempt in range(self.max_retries):
             try:
-                response = self.client.chat.completions.create(
+                response_text = self._create_completion(
+                    'generate_metric_description',
                     model=self.model,
                     messages=[
                         {"role": "system", "content": "あなたはKaggleコンペティションの分析専門家です。"},
                         {"role": "user", "content": prompt}
                     ],
                     temperature=0.3,
-                    max_tokens=300
+                    max_tokens=300,
+                    refresh=attempt > 0
                 )
 
-                description_text = response.choices[0].message.content.strip()
+                description_text = response_text.strip()
 
                 # 150文字以内に制限
                 if len(description_text) > 200:
@@ -198,10 +611,12 @@ class LLMService:
 
                 return description_text
 
+            except _TRANSIENT_API_ERRORS:
+                raise
             except Exception as e:
                 if attempt < self.max_retries - 1:
                     print(f"指標説明生成エラー（リトライ {attempt + 1}/{self.max_retries}）: {e}")
-                    time.sleep(self.retry_delay)
+                    time.sleep(backoff_delay(attempt, base=self.retry_delay))
                 else:
                     print(f"指標説明生成エラー（最終試行失敗）: {e}")
                     return ""
@@ -272,7 +687,8 @@ class LLMService:
 
         for attempt in range(self.max_retries):
             try:
-                response = self.client.chat.completions.create(
+                response_text = self._create_completion(
+                    'extract_dataset_info',
                     model=self.model,
                     messages=[
                         {"role": "system", "content": "あなたはKaggleコンペティションのデータ分析専門家です。JSON形式で回答してください。"},
@@ -280,10 +696,11 @@ class LLMService:
                     ],
                     temperature=0.2,
                     max_tokens=1500,
-                    response_format={"type": "json_object"}
+                    response_format={"type": "json_object"},
+                    refresh=attempt > 0
                 )
 
-                result_text = response.choices[0].message.content.strip()
+                result_text = response_text.strip()
                 result = json.loads(result_text)
 
                 # 結果の検証とデフォルト値設定
@@ -303,7 +720,7 @@ class LLMService:
             except json.JSONDecodeError as e:
                 if attempt < self.max_retries - 1:
                     print(f"JSON解析エラー（リトライ {attempt + 1}/{self.max_retries}）: {e}")
-                    time.sleep(self.retry_delay)
+                    time.sleep(backoff_delay(attempt, base=self.retry_delay))
                 else:
                     print(f"JSON解析エラー（最終試行失敗）: {e}")
                     return {
@@ -312,10 +729,12 @@ class LLMService:
                         "description": "",
                         "features": []
                     }
+            except _TRANSIENT_API_ERRORS:
+                raise
             except Exception as e:
                 if attempt < self.max_retries - 1:
                     print(f"データセット情報抽出エラー（リトライ {attempt + 1}/{self.max_retries}）: {e}")
-                    time.sleep(self.retry_delay)
+                    time.sleep(backoff_delay(attempt, base=self.retry_delay))
                 else:
                     print(f"データセット情報抽出エラー（最終試行失敗）: {e}")
                     return {
@@ -400,7 +819,8 @@ JSON形式のみを出力してください。前置きや説明は不要です
 
         for attempt in range(self.max_retries):
             try:
-                response = self.client.chat.completions.create(
+                response_text = self._create_completion(
+                    'generate_summary',
                     model=self.model,
                     messages=[
                         {"role": "system", "content": "あなたはKaggleコンペティションの分析専門家です。JSON形式で回答してください。"},
@@ -408,10 +828,11 @@ JSON形式のみを出力してください。前置きや説明は不要です
                     ],
                     temperature=0.3,
                     max_tokens=1000,
-                    response_format={"type": "json_object"}
+                    response_format={"type": "json_object"},
+                    refresh=attempt > 0
                 )
 
-                summary_json = response.choices[0].message.content.strip()
+                summary_json = response_text.strip()
 
                 # JSONの検証
                 try:
@@ -430,19 +851,35 @@ JSON形式のみを出力してください。前置きや説明は不要です
                 except (json.JSONDecodeError, ValueError) as e:
                     if attempt < self.max_retries - 1:
                         print(f"JSON検証エラー（リトライ {attempt + 1}/{self.max_retries}）: {e}")
-                        time.sleep(self.retry_delay)
+                        time.sleep(backoff_delay(attempt, base=self.retry_delay))
                         continue
                     else:
                         return ""
 
+            except _TRANSIENT_API_ERRORS:
+                raise
             except Exception as e:
                 if attempt < self.max_retries - 1:
                     print(f"要約生成エラー（リトライ {attempt + 1}/{self.max_retries}）: {e}")
-                    time.sleep(self.retry_delay)
+                    time.sleep(backoff_delay(attempt, base=self.retry_delay))
                 else:
                     print(f"要約生成エラー（最終試行失敗）: {e}")
                     return ""
 
+    # タグのマスタが渡されない場合の既定（generate_tags・generate_enrichment 共通、model_typeは除外）
+    DEFAULT_AVAILABLE_TAGS: Dict[str, List[str]] = {
+        "task_type": ["分類（二値）", "分類（多クラス）", "回帰", "ランキング", "物体検出", "セグメンテーション", "生成", "クラスタリング"],
+        "competition_feature": ["不均衡データ", "欠損値多い", "外れ値対策必要", "大規模データ", "小規模データ", "リーク対策必要", "時系列考慮", "ドメイン知識重要", "データ品質課題"],
+        "domain": ["医療", "金融", "Eコマース", "自然言語処理", "コンピュータビジョン", "音声認識", "推薦システム", "時系列予測", "その他"]
+    }
+
+    @classmethod
+    def _tag_master(cls, available_tags: Optional[Dict[str, List[str]]]) -> Dict[str, List[str]]:
+        """タグ生成に使うマスタ（model_typeを除外。渡されない場合は DEFAULT_AVAILABLE_TAGS）"""
+        if available_tags:
+            return {k: v for k, v in available_tags.items() if k != 'model_type'}
+        return cls.DEFAULT_AVAILABLE_TAGS
+
     def generate_tags(
         self,
         description: str,
@@ -473,18 +910,8 @@ JSON形式のみを出力してください。前置きや説明は不要です
                 "domain": ""
             }
 
-        # 利用可能なタグのリストを作成
-        if available_tags:
-            # model_typeを除外
-            filtered_tags = {k: v for k, v in available_tags.items() if k != 'model_type'}
-            tag_info = json.dumps(filtered_tags, ensure_ascii=False, indent=2)
-        else:
-            # デフォルトのタグリスト（model_typeは除外）
-            tag_info = json.dumps({
-                "task_type": ["分類（二値）", "分類（多クラス）", "回帰", "ランキング", "物体検出", "セグメンテーション", "生成", "クラスタリング"],
-                "competition_feature": ["不均衡データ", "欠損値多い", "外れ値対策必要", "大規模データ", "小規模データ", "リーク対策必要", "時系列考慮", "ドメイン知識重要", "データ品質課題"],
-                "domain": ["医療", "金融", "Eコマース", "自然言語処理", "コンピュータビジョン", "音声認識", "推薦システム", "時系列予測", "その他"]
-            }, ensure_ascii=False, indent=2)
+        # 利用可能なタグのリストを作成（model_typeは除外）
+        tag_info = json.dumps(self._tag_master(available_tags), ensure_ascii=False, indent=2)
 
         prompt = f"""あなたはKaggleコンペティションの分析専門家です。
 以下のコンペティション情報を分析し、適切なタグを選択してください。
@@ -535,7 +962,8 @@ JSON形式のみを出力してください。前置きや説明は不要です
 
         for attempt in range(self.max_retries):
             try:
-                response = self.client.chat.completions.create(
+                response_text = self._create_completion(
+                    'generate_tags',
                     model=self.model,
                     messages=[
                         {"role": "system", "content": "あなたはKaggleコンペティションの分析専門家です。JSON形式で回答してください。"},
@@ -543,10 +971,11 @@ JSON形式のみを出力してください。前置きや説明は不要です
                     ],
                     temperature=0.2,  # より一貫性のある分類のため低めに設定
                     max_tokens=500,
-                    response_format={"type": "json_object"}  # JSON形式を強制
+                    response_format={"type": "json_object"},  # JSON形式を強制
+                    refresh=attempt > 0
                 )
 
-                result_text = response.choices[0].message.content.strip()
+                result_text = response_text.strip()
                 result = json.loads(result_text)
 
                 # 結果の検証
@@ -562,7 +991,7 @@ JSON形式のみを出力してください。前置きや説明は不要です
             except json.JSONDecodeError as e:
                 if attempt < self.max_retries - 1:
                     print(f"JSON解析エラー（リトライ {attempt + 1}/{self.max_retries}）: {e}")
-                    time.sleep(self.retry_delay)
+                    time.sleep(backoff_delay(attempt, base=self.retry_delay))
                 else:
                     print(f"JSON解析エラー（最終試行失敗）: {e}")
                     return {
@@ -570,10 +999,12 @@ JSON形式のみを出力してください。前置きや説明は不要です
                         "tags": [],
                         "domain": ""
                     }
+            except _TRANSIENT_API_ERRORS:
+                raise
             except Exception as e:
                 if attempt < self.max_retries - 1:
                     print(f"タグ生成エラー（リトライ {attempt + 1}/{self.max_retries}）: {e}")
-                    time.sleep(self.retry_delay)
+                    time.sleep(backoff_delay(attempt, base=self.retry_delay))
                 else:
                     print(f"タグ生成エラー（最終試行失敗）: {e}")
                     return {
@@ -582,61 +1013,380 @@ JSON形式のみを出力してください。前置きや説明は不要です
                         "domain": ""
                     }
 
+    # generate_enrichment で生成するフィールドの JSON Schema（Structured Outputs の strict モード）
+    ENRICHMENT_SCHEMAS: Dict[str, Dict[str, Any]] = {
+        "summary": {
+            "type": "object",
+            "properties": {
+                "overview": {"type": "string"},
+                "objective": {"type": "string"},
+                "data": {"type": "string"},
+                "evaluation": {
+                    "type": "object",
+                    "properties": {
+                        "metric": {"type": "string"},
+                        "explanation": {"type": "string"},
+                        "why_important": {"type": "string"},
+                    },
+                    "required": ["metric", "explanation", "why_important"],
+                    "additionalProperties": False,
+                },
+                "business_value": {"type": "string"},
+                "key_challenges": {"type": "array", "items": {"type": "string"}},
+            },
+            "required": ["overview", "objective", "data", "evaluation", "business_value", "key_challenges"],
+            "additionalProperties": False,
+        },
+        "metric": {"type": "string"},
+        "metric_description": {"type": "string"},
+        "tags": {
+            "type": "object",
+            "properties": {
+                "data_types": {"type": "array", "items": {"type": "string"}},
+                "tags": {"type": "array", "items": {"type": "string"}},
+                "domain": {"type": "string"},
+            },
+            "required": ["data_types", "tags", "domain"],
+            "additionalProperties": False,
+        },
+        "dataset_info": {
+            "type": "object",
+            "properties": {
+                "files": {"type": "array", "items": {"type": "string"}},
+                "total_size": {"type": "string"},
+                "description": {"type": "string"},
+                "features": {"type": "array", "items": {"type": "string"}},
+                "columns": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {"name": {"type": "string"}, "description": {"type": "string"}},
+                        "required": ["name", "description"],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["files", "total_size", "description", "features", "columns"],
+            "additionalProperties": False,
+        },
+    }
+
+    # 各フィールドの指示（個別メソッドのプロンプトの要件を要約したもの）
+    ENRICHMENT_INSTRUCTIONS = {
+        "summary": """- summary: 構造化された日本語要約
+  - overview: コンペの概要を1-2文で簡潔に（50-100文字）
+  - objective: 何を予測/分類/生成するか（30-50文字）
+  - data: 使用するデータの種類（30-50文字）
+  - evaluation.metric: 評価指標の正式名称（例：AUC, RMSE, F1-Score等）
+  - evaluation.explanation: 評価指標の計算方法と意味を初心者にもわかりやすく（80-120文字）
+  - evaluation.why_important: なぜこの評価指標がこのコンペに適しているか、ビジネス的な意義（60-100文字）
+  - business_value: ビジネス上の価値や目的（50-80文字）
+  - key_challenges: 技術的な課題や特徴を3-5個""",
+        "metric": """- metric: 評価指標の名前のみを簡潔に日本語で（例: F1スコア, AUC-ROC, 二乗平均平方根誤差（RMSE））
+  - 説明文に明示的に記載されている場合のみ抽出し、記載がない・不明確な場合は空文字列。推測はしない
+  - 30文字以内""",
+        "metric_description": """- metric_description: 評価指標の説明を100-150文字程度の日本語で
+  - 指標の意味、何を測定するか、なぜこのコンペでこの指標が使われるかを含める
+  - 専門用語は分かりやすく説明。前置きや見出しは不要
+  - 評価指標が不明な場合は空文字列""",
+        "tags": """- tags: 利用可能なタグから選択
+  - data_types: データの種類（1-2個程度。説明文に"image", "text", "time-series", "tabular"等が明記されている場合のみ）
+  - tags: 合計3-5個程度。task_type（何を予測するか）を必ず1-2個選び、competition_feature は明記されている場合のみ
+    - 「分類」: "classify", "classification", "identify", "recognize" がある場合（"detect behaviors" なども分類）
+    - 「回帰」: "predict" + 連続値（価格、スコア等）がある場合
+    - 「物体検出」: "object detection", "bounding box", "localization" がある場合のみ
+    - 「セグメンテーション」: "segment", "segmentation", "pixel-level" がある場合のみ
+  - domain: 説明文のキーワードから明確な場合のみ、最も関連性の高いドメイン1つ
+  - 推測は一切禁止。確信が持てない場合は選択しない（空配列・空文字列を恐れない）
+  - 必ず利用可能なタグリストから選択""",
+        "dataset_info": """- dataset_info: Dataタブのテキストから抽出したデータセット情報
+  - files: 主要なデータファイル名（最大10個）
+  - total_size: データセット全体のサイズ（明記されている場合のみ）
+  - description: データの内容を日本語で（150-200文字程度）
+  - features: 主要な特徴量やカラム名（簡潔な名前のみ、最大15個）
+  - columns: 重要なカラムの name（英語のまま）と description（日本語で30-50文字程度）（最大20個）
+  - テキストに明記されている情報のみ抽出し、不明な項目は空文字列または空配列""",
+    }
+
+    def generate_enrichment(
+        self,
+        description: str,
+        title: str = "",
+        fields: Optional[List[str]] = None,
+        metric: str = "",
+        data_text: str = "",
+        available_tags: Optional[Dict[str, List[str]]] = None
+    ) -> Dict[str, Any]:
+        """
+        コンペの充実化に必要なフィールドを1回の構造化出力（JSON Schema）でまとめて生成
+
+        説明文を1回だけ送るため、フィールドごとに呼び出すより入力トークンが少ない。
+        検証に失敗したフィールドは結果に含めない（呼び出し元で個別のメソッドにフォールバックする）
+
+        Args:
+            description: コンペの説明文
+            title: コンペのタイトル
+            fields: 生成するフィールド（ENRICHMENT_SCHEMAS のキー。None の場合は全て）
+            metric: 既知の評価指標（評価指標の説明・タグの生成に使用）
+            data_text: Data タブのテキスト（dataset_info を生成する場合）
+            available_tags: 利用可能なタグのマスタ（カテゴリ別）
+
+        Returns:
+            {フィールド名: 値}（検証に成功したもののみ。値の形式は個別のメソッドの返り値と同じ）
+        """
+        fields = [field for field in (fields or self.ENRICHMENT_SCHEMAS) if field in self.ENRICHMENT_SCHEMAS]
+        if not data_text and "dataset_info" in fields:
+            fields.remove("dataset_info")
+        if not fields or not description:
+            return {}
+
+        sections = [f"【タイトル】\n{title}", f"【説明文】\n{description}"]
+        if metric:
+            sections.append(f"【評価指標】\n{metric}")
+        tag_master = self._tag_master(available_tags)
+        if "tags" in fields:
+            sections.append(f"【利用可能なタグ】\n{json.dumps(tag_master, ensure_ascii=False, indent=2)}")
+        if "dataset_info" in fields:
+            sections.append(f"【Data タブのテキスト】\n{data_text}")
+
+        instructions = "\n".join(self.ENRICHMENT_INSTRUCTIONS[field] for field in fields)
+        prompt = f"""あなたはKaggleコンペティションの分析専門家です。
+以下のコンペティション情報を分析し、指定されたフィールドをJSON形式で出力してください。
+
+{chr(10).join(sections)}
+
+【フィールド】
+{instructions}
+
+【要件】
+- 各フィールドは日本語で記述（ファイル名・カラム名・指標名は英語のまま可）
+- 説明文に明記されている情報のみを使い、推測はしない"""
+
+        schema = {
+            "type": "object",
+            "properties": {field: self.ENRICHMENT_SCHEMAS[field] for field in fields},
+            "required": fields,
+            "additionalProperties": False,
+        }
+
+        for attempt in range(self.max_retries):
+            try:
+                response_text = self._create_completion(
+                    'generate_enrichment',
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": "あなたはKaggleコンペティションの分析専門家です。JSON形式で回答してください。"},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.2,
+                    max_tokens=3000,
+                    response_format={
+                        "type": "json_schema",
+                        "json_schema": {"name": "competition_enrichment", "strict": True, "schema": schema},
+                    },
+                    refresh=attempt > 0
+                )
+                result = json.loads(response_text)
+                if not isinstance(result, dict):
+                    raise ValueError("JSONオブジェクトではありません")
+                break
+
+            except _TRANSIENT_API_ERRORS:
+                raise
+            except Exception as e:
+                if attempt < self.max_retries - 1:
+                    print(f"一括充実化エラー（リトライ {attempt + 1}/{self.max_retries}）: {e}")
+                    time.sleep(backoff_delay(attempt, base=self.retry_delay))
+                else:
+                    print(f"一括充実化エラー（最終試行失敗）: {e}")
+                    return {}
+
+        # フィールドごとに検証し、失敗したものは個別の呼び出しに任せる
+        enrichment = {}
+        for field in fields:
+            try:
+                enrichment[field] = self._validate_enrichment_field(field, result.get(field), tag_master)
+            except ValueError as e:
+                print(f"   ⚠️ 一括充実化の {field} が不正: {e}")
+
+        # 評価指標が見つからなければ説明も空にする（個別のメソッドと同じ）
+        if enrichment.get("metric") == "" and "metric_description" in enrichment:
+            enrichment["metric_description"] = ""
+        return enrichment
+
+    @staticmethod
+    def _validate_enrichment_field(field: str, value: Any, tag_master: Optional[Dict[str, List[str]]] = None) -> Any:
+        """
+        generate_enrichment のフィールドを検証し、個別のメソッドの返り値と同じ形式にする
+
+        tags はマスタ（tag_master）にないタグ・ドメインを除く
+
+        Raises:
+            ValueError: 形式が不正な場合
+        """
+        if field == "summary":
+            required_fields = ["overview", "objective", "data", "evaluation", "business_value", "key_challenges"]
+            if not isinstance(value, dict) or not all(key in value for key in required_fields):
+                raise ValueError("必須フィールドが不足しています")
+            if not isinstance(value["evaluation"], dict) or not all(
+                key in value["evaluation"] for key in ("metric", "explanation", "why_important")
+            ):
+                raise ValueError("evaluationフィールドの構造が不正です")
+            return json.dumps(value, ensure_ascii=False)
+
+        if field == "metric":
+            if not isinstance(value, str):
+                raise ValueError("文字列ではありません")
+            metric = value.replace("評価指標は", "").replace("指標:", "").replace("評価指標:", "").strip()
+            if len(metric) > 30:
+                raise ValueError("30文字を超えています")
+            return metric
+
+        if field == "metric_description":
+            if not isinstance(value, str):
+                raise ValueError("文字列ではありません")
+            value = value.strip()
+            return value[:197] + "..." if len(value) > 200 else value
+
+        if field == "tags":
+            if not isinstance(value, dict):
+                raise ValueError("オブジェクトではありません")
+            tags = {
+                "data_types": value["data_types"] if isinstance(value.get("data_types"), list) else [],
+                "tags": value["tags"] if isinstance(value.get("tags"), list) else [],
+                "domain": value["domain"] if isinstance(value.get("domain"), str) else "",
+            }
+            if tag_master:
+                known = {tag for names in tag_master.values() for tag in names}
+                tags["tags"] = [tag for tag in tags["tags"] if tag in known]
+                if "data_type" in tag_master:
+                    tags["data_types"] = [tag for tag in tags["data_types"] if tag in tag_master["data_type"]]
+                if "domain" in tag_master and tags["domain"] not in tag_master["domain"]:
+                    tags["domain"] = ""
+            return tags
+
+        if field == "dataset_info":
+            if not isinstance(value, dict) or not isinstance(value.get("files"), list):
+                raise ValueError("files がありません")
+            return {
+                "files": value["files"],
+                "total_size": value["total_size"] if isinstance(value.get("total_size"), str) else "",
+                "description": value["description"] if isinstance(value.get("description"), str) else "",
+                "features": value["features"] if isinstance(value.get("features"), list) else [],
+                "columns": value["columns"] if isinstance(value.get("columns"), list) else [],
+            }
+
+        raise ValueError(f"未知のフィールド: {field}")
+
     def enrich_competition(
         self,
         competition: Dict,
         available_tags: Optional[Dict[str, List[str]]] = None,
-        data_tab_text: Optional[str] = None
+        data_tab_text: Optional[str] = None,
+        combined: Optional[bool] = None
     ) -> Dict:
         """
         コンペティション情報を充実化（要約、タグ、評価指標、データセット情報の生成）
 
+        combined の場合は不足しているフィールドを generate_enrichment の1回の呼び出しで生成し、
+        検証に失敗したフィールドだけ個別のメソッドで生成する
+
         Args:
             competition: コンペティション情報の辞書
             available_tags: 利用可能なタグのマスタ
             data_tab_text: Dataタブのテキスト（データセット情報抽出用）
+            combined: 1回の構造化出力でまとめて生成する（None の場合は設定 LLM_COMBINED_ENRICHMENT に従う）
 
         Returns:
             充実化されたコンペティション情報
         """
-        # 要約生成
-        if not competition.get("summary") and competition.get("description"):
-            print(f"要約生成中: {competition.get('title', 'Unknown')}")
-            summary = self.generate_summary(
-                description=competition.get("description", ""),
-                title=competition.get("title", "")
-            )
-            competition["summary"] = summary
-
-        # 評価指標抽出
-        if not competition.get("metric") and competition.get("description"):
-            print(f"評価指標抽出中: {competition.get('title', 'Unknown')}")
-            metric = self.extract_evaluation_metric(
-                description=competition.get("description", ""),
-                title=competition.get("title", "")
-            )
-            competition["metric"] = metric
-
-        # 評価指標の説明生成
-        if competition.get("metric") and not competition.get("metric_description") and competition.get("description"):
-            print(f"評価指標説明生成中: {competition.get('title', 'Unknown')}")
-            metric_description = self.generate_metric_description(
-                metric=competition.get("metric", ""),
-                description=competition.get("description", ""),
-                title=competition.get("title", "")
+        title = competition.get("title", "")
+        description = competition.get("description", "")
+        label = competition.get('title', 'Unknown')
+        combined = LLM_COMBINED_ENRICHMENT if combined is None else combined
+
+        # 一括生成: 不足しているフィールドが2つ以上あれば1回の呼び出しにまとめる
+        done = set()
+        if combined and description:
+            fields = []
+            if not competition.get("summary"):
+                fields.append("summary")
+            if not competition.get("metric"):
+                fields.append("metric")
+            if not competition.get("metric_description"):
+                fields.append("metric_description")
+            if not competition.get("tags") or not competition.get("data_types"):
+                fields.append("tags")
+            if data_tab_text and not competition.get("dataset_info"):
+                fields.append("dataset_info")
+
+            if len(fields) >= 2:
+                print(f"一括充実化中: {label}（{', '.join(fields)}）")
+                results = self.generate_enrichment(
+                    description=description,
+                    title=title,
+                    fields=fields,
+                    metric=competition.get("metric", ""),
+                    data_text=data_tab_text or "",
+                    available_tags=available_tags
+                )
+                # 評価指標を個別に再抽出する場合は、その指標で説明を作り直す
+                if "metric" in fields and "metric" not in results:
+                    results.pop("metric_description", None)
+                self._apply_enrichment(competition, results)
+                done = set(results)
+
+        # 1段目: 互いに依存しない呼び出し（要約・評価指標・データセット情報）を並列に実行
+        calls = {}
+        if not competition.get("summary") and description and "summary" not in done:
+            print(f"要約生成中: {label}")
+            calls["summary"] = lambda: self.generate_summary(description=description, title=title)
+
+        if not competition.get("metric") and description and "metric" not in done:
+            print(f"評価指標抽出中: {label}")
+            calls["metric"] = lambda: self.extract_evaluation_metric(description=description, title=title)
+
+        if data_tab_text and not competition.get("dataset_info") and "dataset_info" not in done:
+            print(f"データセット情報抽出中: {label}")
+            calls["dataset_info"] = lambda: self.extract_dataset_info(data_text=data_tab_text, title=title)
+
+        self._apply_enrichment(competition, self.run_many(calls))
+
+        # 2段目: 評価指標を使う呼び出し（評価指標の説明・タグ）を並列に実行
+        metric = competition.get("metric", "")
+        calls = {}
+        if metric and not competition.get("metric_description") and description and "metric_description" not in done:
+            print(f"評価指標説明生成中: {label}")
+            calls["metric_description"] = lambda: self.generate_metric_description(
+                metric=metric,
+                description=description,
+                title=title
             )
-            competition["metric_description"] = metric_description
-
-        # タグ生成
-        if (not competition.get("tags") or not competition.get("data_types")) and competition.get("description"):
-            print(f"タグ生成中: {competition.get('title', 'Unknown')}")
-            tag_result = self.generate_tags(
-                description=competition.get("description", ""),
-                title=competition.get("title", ""),
-                metric=competition.get("metric", ""),
+
+        if (not competition.get("tags") or not competition.get("data_types")) and description and "tags" not in done:
+            print(f"タグ生成中: {label}")
+            calls["tags"] = lambda: self.generate_tags(
+                description=description,
+                title=title,
+                metric=metric,
                 available_tags=available_tags
             )
 
+        self._apply_enrichment(competition, self.run_many(calls))
+
+        return competition
+
+    @staticmethod
+    def _apply_enrichment(competition: Dict, results: Dict[str, Any]) -> None:
+        """生成結果（フィールド名: 個別のメソッドの返り値）をコンペ情報に反映"""
+        for field in ("summary", "metric", "metric_description"):
+            if field in results:
+                competition[field] = results[field]
+        if results.get("dataset_info"):
+            competition["dataset_info"] = json.dumps(results["dataset_info"], ensure_ascii=False)
+
+        if "tags" in results:
+            tag_result = results["tags"]
             if not competition.get("data_types"):
                 competition["data_types"] = tag_result.get("data_types", [])
             if not competition.get("tags"):
@@ -644,18 +1394,6 @@ JSON形式のみを出力してください。前置きや説明は不要です
             if not competition.get("domain"):
                 competition["domain"] = tag_result.get("domain", "")
 
-        # データセット情報抽出
-        if data_tab_text and not competition.get("dataset_info"):
-            print(f"データセット情報抽出中: {competition.get('title', 'Unknown')}")
-            dataset_info = self.extract_dataset_info(
-                data_text=data_tab_text,
-                title=competition.get("title", "")
-            )
-            if dataset_info:
-                competition["dataset_info"] = json.dumps(dataset_info, ensure_ascii=False)
-
-        return competition
-
     def summarize_discussion(self, content: str, title: str = "") -> str:
         """
         ディスカッションの内容を要約
@@ -670,10 +1408,8 @@ JSON形式のみを出力してください。前置きや説明は不要です
         if not content:
             return ""
 
-        # 長すぎる場合は最初の部分のみ使用（トークン制限対策）
-        max_content_length = 4000
-        if len(content) > max_content_length:
-            content = content[:max_content_length] + "..."
+        # トークン予算を超える場合はチャンクごとに要点を抽出してから統合する
+        content = self._fit_content('summarize_discussion', content, title)
 
         prompt = f"""あなたはKaggleディスカッションの要約専門家です。
 以下のディスカッションを読み、重要なポイントを簡潔に要約してください。
@@ -700,17 +1436,19 @@ JSON形式のみを出力してください。前置きや説明は不要です
 
         for attempt in range(self.max_retries):
             try:
-                response = self.client.chat.completions.create(
+                response_text = self._create_completion(
+                    'summarize_discussion',
                     model="gpt-4o-mini",  # コスト削減のためminiを使用
                     messages=[
                         {"role": "system", "content": "あなたはKaggleディスカッションの要約専門家です。"},
                         {"role": "user", "content": prompt}
                     ],
                     temperature=0.3,
-                    max_tokens=400
+                    max_tokens=400,
+                    refresh=attempt > 0
                 )
 
-                summary = response.choices[0].message.content.strip()
+                summary = response_text.strip()
 
                 # 250文字以内に制限
                 if len(summary) > 250:
@@ -718,10 +1456,12 @@ JSON形式のみを出力してください。前置きや説明は不要です
 
                 return summary
 
+            except _TRANSIENT_API_ERRORS:
+                raise
             except Exception as e:
                 if attempt < self.max_retries - 1:
                     print(f"ディスカッション要約エラー（リトライ {attempt + 1}/{self.max_retries}）: {e}")
-                    time.sleep(self.retry_delay)
+                    time.sleep(backoff_delay(attempt, base=self.retry_delay))
                 else:
                     print(f"ディスカッション要約エラー（最終試行失敗）: {e}")
                     return ""
@@ -756,10 +1496,8 @@ JSON形式のみを出力してください。前置きや説明は不要です
         if not content:
             return "{}"
 
-        # 長すぎる場合は最初の部分のみ使用
-        max_content_length = 6000
-        if len(content) > max_content_length:
-            content = content[:max_content_length] + "..."
+        # トークン予算を超える場合はチャンクごとに要点を抽出してから統合する
+        content = self._fit_content('generate_structured_discussion_summary', content, title)
 
         prompt = f"""あなたはKaggleディスカッションの学習支援専門家です。
 以下のディスカッションを読み、初心者の学習に役立つ詳細で構造化された要約を作成してください。
@@ -842,7 +1580,8 @@ JSON形式のみを出力してください。前置きや説明は不要です
         for attempt in range(self.max_retries):
             try:
                 # ディスカッション詳細の要約にはgpt-4oを使用
-                response = self.client.chat.completions.create(
+                response_text = self._create_completion(
+                    'generate_structured_discussion_summary',
                     model="gpt-4o-mini",  # コスト削減のためminiを使用
                     messages=[
                         {"role": "system", "content": "あなたはKaggleディスカッションの学習支援専門家です。JSON形式で回答してください。"},
@@ -850,10 +1589,11 @@ JSON形式のみを出力してください。前置きや説明は不要です
                     ],
                     temperature=0.3,
                     max_tokens=2000,
-                    response_format={"type": "json_object"}
+                    response_format={"type": "json_object"},
+                    refresh=attempt > 0
                 )
 
-                result_text = response.choices[0].message.content.strip()
+                result_text = response_text.strip()
 
                 # JSON検証
                 try:
@@ -884,15 +1624,17 @@ JSON形式のみを出力してください。前置きや説明は不要です
                 except json.JSONDecodeError:
                     if attempt < self.max_retries - 1:
                         print(f"JSON解析エラー（リトライ {attempt + 1}/{self.max_retries}）")
-                        time.sleep(self.retry_delay)
+                        time.sleep(backoff_delay(attempt, base=self.retry_delay))
                         continue
                     else:
                         return "{}"
 
+            except _TRANSIENT_API_ERRORS:
+                raise
             except Exception as e:
                 if attempt < self.max_retries - 1:
                     print(f"構造化ディスカッション要約生成エラー（リトライ {attempt + 1}/{self.max_retries}）: {e}")
-                    time.sleep(self.retry_delay)
+                    time.sleep(backoff_delay(attempt, base=self.retry_delay))
                 else:
                     print(f"構造化ディスカッション要約生成エラー（最終試行失敗）: {e}")
                     return "{}"
@@ -903,6 +1645,9 @@ JSON形式のみを出力してください。前置きや説明は不要です
         """
         ディスカッションの原文を構造化して整理（情報を失わずに詳細に）
 
+        トークン予算を超える本文は、map-reduce が有効ならチャンクごとに和訳・整理してつなげる
+        （和訳は要約しないため、要点の抽出は行わない）。無効な場合は予算で切り詰める
+
         Args:
             content: ディスカッションの本文（英語）
 
@@ -912,14 +1657,75 @@ JSON形式のみを出力してください。前置きや説明は不要です
         if not content:
             return ""
 
-        # 長すぎる場合は最初の部分のみ使用
-        max_content_length = 6000
-        if len(content) > max_content_length:
-            content = content[:max_content_length] + "..."
+        method = 'translate_and_organize_discussion'
+        model = "gpt-4o-mini"
+        budget = self.CONTENT_TOKEN_BUDGETS[method]
+        if count_tokens(content, model) <= budget:
+            return self._translate_discussion_part(content)
+        if not self.map_reduce_enabled:
+            return self._translate_discussion_part(truncate_to_tokens(content, budget, model))
+
+        chunks = split_into_chunks(content, budget, model, max_chunks=self.max_chunks)
+        print(f"   📚 長い本文を{len(chunks)}チャンクに分けて和訳・整理")
+        stream = _stream_sink.get()
+        if stream and method in stream[1]:
+            # ストリーミング中は原文の順に出力するため、チャンクを順に和訳する
+            parts = self._translate_parts_streaming(chunks, stream[0])
+        else:
+            translated = self.run_many({
+                str(index): (lambda index=index, chunk=chunk: self._translate_discussion_part(
+                    chunk, part=index + 1, total=len(chunks)
+                ))
+                for index, chunk in enumerate(chunks)
+            })
+            parts = [translated[str(index)] for index in range(len(chunks))]
+        return "\n\n".join(part for part in parts if part)
+
+    def _translate_parts_streaming(self, chunks: List[str], sink: Callable[[str, Optional[str]], None]) -> List[str]:
+        """
+        チャンクを順に和訳し、全体を1つのストリームとして sink に渡す
+
+        チャンクの再試行でやり直し（sink(method, None)）になった場合は、
+        完了したチャンクの和訳を送り直してから続ける
+        """
+        method = 'translate_and_organize_discussion'
+        parts: List[str] = []
+
+        def part_sink(name: str, delta: Optional[str]) -> None:
+            sink(name, delta)
+            if delta is None and parts:
+                sink(name, "\n\n".join(parts) + "\n\n")
+
+        with self.streaming(part_sink, [method]):
+            for index, chunk in enumerate(chunks):
+                if parts:
+                    sink(method, "\n\n")
+                part = self._translate_discussion_part(chunk, part=index + 1, total=len(chunks))
+                if part:
+                    parts.append(part)
+        return parts
+
+    def _translate_discussion_part(self, content: str, part: int = 1, total: int = 1) -> str:
+        """
+        ディスカッションの本文（長い場合はその一部）を和訳・整理
+
+        Args:
+            content: 本文（トークン予算以内）
+            part: 何番目のチャンクか（1始まり）
+            total: チャンクの総数（1 の場合は本文全体）
+
+        Returns:
+            構造化・整理されたテキスト（失敗した場合は空文字列）
+        """
+        part_note = ""
+        if total > 1:
+            part_note = f"""
+※ これは長いディスカッションを分割した一部（{part}/{total}）です。この部分の内容だけを、要約せずに整理してください。
+"""
 
         prompt = f"""あなたはKaggleディスカッションの構造化・整理専門家です。
 以下の英語のディスカッションを読み、実装の詳細を失わずに構造化して整理してください。
-
+{part_note}
 【原文】
 {content}
 
@@ -1017,23 +1823,27 @@ JSON形式のみを出力してください。前置きや説明は不要です
         for attempt in range(self.max_retries):
             try:
                 # ディスカッション詳細の和訳・整理にはgpt-4oを使用
-                response = self.client.chat.completions.create(
+                response_text = self._create_completion(
+                    'translate_and_organize_discussion',
                     model="gpt-4o-mini",  # コスト削減のためminiを使用
                     messages=[
                         {"role": "system", "content": "あなたはKaggleディスカッションの構造化・整理専門家です。情報を失わずに詳細に整理してください。"},
                         {"role": "user", "content": prompt}
                     ],
                     temperature=0.3,
-                    max_tokens=4000  # 詳細な出力のためトークン数を増やす
+                    max_tokens=4000,  # 詳細な出力のためトークン数を増やす
+                    refresh=attempt > 0
                 )
 
-                organized_text = response.choices[0].message.content.strip()
+                organized_text = response_text.strip()
                 return organized_text
 
+            except _TRANSIENT_API_ERRORS:
+                raise
             except Exception as e:
                 if attempt < self.max_retries - 1:
                     print(f"構造化エラー（リトライ {attempt + 1}/{self.max_retries}）: {e}")
-                    time.sleep(self.retry_delay)
+                    time.sleep(backoff_delay(attempt, base=self.retry_delay))
                 else:
                     print(f"構造化エラー（最終試行失敗）: {e}")
                     return ""
@@ -1055,10 +1865,8 @@ JSON形式のみを出力してください。前置きや説明は不要です
         if not content:
             return "[]"
 
-        # 長すぎる場合は最初の部分のみ使用（トークン制限対策）
-        max_content_length = 4000
-        if len(content) > max_content_length:
-            content = content[:max_content_length] + "..."
+        # トークン予算を超える場合はチャンクごとに要点を抽出してから統合する
+        content = self._fit_content('extract_solution_techniques', content, title)
 
         prompt = f"""あなたはKaggle解法の技術分析専門家です。
 以下の解法を読み、使用されている技術・手法を抽出してください。
@@ -1100,7 +1908,8 @@ JSON形式のみを出力してください。前置きや説明は不要です
 
         for attempt in range(self.max_retries):
             try:
-                response = self.client.chat.completions.create(
+                response_text = self._create_completion(
+                    'extract_solution_techniques',
                     model="gpt-4o-mini",  # コスト削減のためminiを使用
                     messages=[
                         {"role": "system", "content": "あなたはKaggle解法の技術分析専門家です。JSON形式で回答してください。"},
@@ -1108,10 +1917,11 @@ JSON形式のみを出力してください。前置きや説明は不要です
                     ],
                     temperature=0.2,
                     max_tokens=300,
-                    response_format={"type": "json_object"}
+                    response_format={"type": "json_object"},
+                    refresh=attempt > 0
                 )
 
-                result_text = response.choices[0].message.content.strip()
+                result_text = response_text.strip()
 
                 # JSON配列が直接返される場合と、{"techniques": [...]}の形式の場合に対応
                 try:
@@ -1136,15 +1946,17 @@ JSON形式のみを出力してください。前置きや説明は不要です
                 except json.JSONDecodeError:
                     if attempt < self.max_retries - 1:
                         print(f"JSON解析エラー（リトライ {attempt + 1}/{self.max_retries}）")
-                        time.sleep(self.retry_delay)
+                        time.sleep(backoff_delay(attempt, base=self.retry_delay))
                         continue
                     else:
                         return "[]"
 
+            except _TRANSIENT_API_ERRORS:
+                raise
             except Exception as e:
                 if attempt < self.max_retries - 1:
                     print(f"技術抽出エラー（リトライ {attempt + 1}/{self.max_retries}）: {e}")
-                    time.sleep(self.retry_delay)
+                    time.sleep(backoff_delay(attempt, base=self.retry_delay))
                 else:
                     print(f"技術抽出エラー（最終試行失敗）: {e}")
                     return "[]"
@@ -1172,10 +1984,8 @@ JSON形式のみを出力してください。前置きや説明は不要です
         if not content:
             return "{}"
 
-        # 長すぎる場合は最初の部分のみ使用
-        max_content_length = 5000
-        if len(content) > max_content_length:
-            content = content[:max_content_length] + "..."
+        # トークン予算を超える場合はチャンクごとに要点を抽出してから統合する
+        content = self._fit_content('generate_structured_solution_summary', content, title)
 
         prompt = f"""あなたはKaggle解法の分析専門家です。
 以下の解法を読み、構造化された要約を作成してください。
@@ -1235,7 +2045,8 @@ JSON形式のみを出力してください。前置きや説明は不要です
 
         for attempt in range(self.max_retries):
             try:
-                response = self.client.chat.completions.create(
+                response_text = self._create_completion(
+                    'generate_structured_solution_summary',
                     model="gpt-4o-mini",  # コスト削減のためminiを使用
                     messages=[
                         {"role": "system", "content": "あなたはKaggle解法の分析専門家です。JSON形式で回答してください。"},
@@ -1243,10 +2054,11 @@ JSON形式のみを出力してください。前置きや説明は不要です
                     ],
                     temperature=0.3,
                     max_tokens=1200,
-                    response_format={"type": "json_object"}
+                    response_format={"type": "json_object"},
+                    refresh=attempt > 0
                 )
 
-                result_text = response.choices[0].message.content.strip()
+                result_text = response_text.strip()
 
                 # JSON検証
                 try:
@@ -1269,15 +2081,17 @@ JSON形式のみを出力してください。前置きや説明は不要です
                 except json.JSONDecodeError:
                     if attempt < self.max_retries - 1:
                         print(f"JSON解析エラー（リトライ {attempt + 1}/{self.max_retries}）")
-                        time.sleep(self.retry_delay)
+                        time.sleep(backoff_delay(attempt, base=self.retry_delay))
                         continue
                     else:
                         return "{}"
 
+            except _TRANSIENT_API_ERRORS:
+                raise
             except Exception as e:
                 if attempt < self.max_retries - 1:
                     print(f"構造化要約生成エラー（リトライ {attempt + 1}/{self.max_retries}）: {e}")
-                    time.sleep(self.retry_delay)
+                    time.sleep(backoff_delay(attempt, base=self.retry_delay))
                 else:
                     print(f"構造化要約生成エラー（最終試行失敗）: {e}")
                     return "{}"
@@ -1330,10 +2144,8 @@ JSON形式のみを出力してください。前置きや説明は不要です
         if not content:
             return "{}"
         
-        # 長すぎる場合は制限
-        max_content_length = 8000
-        if len(content) > max_content_length:
-            content = content[:max_content_length] + "..."
+        # トークン予算を超える場合はチャンクごとに要点を抽出してから統合する
+        content = self._fit_content('summarize_notebook', content, title)
         
         prompt = f"""あなたはKaggleノートブックの概要分析専門家です。
 以下のノートブックを読み、「何のために」「何をしているか」「インプット・アウトプット」「処理フロー」を明確に要約してください。
@@ -1513,7 +2325,8 @@ JSON形式のみを出力してください。前置きや説明は不要です
 
         for attempt in range(self.max_retries):
             try:
-                response = self.client.chat.completions.create(
+                response_text = self._create_completion(
+                    'summarize_notebook',
                     model="gpt-4o-mini",  # コスト削減のためminiを使用
                     messages=[
                         {"role": "system", "content": "あなたはKaggleノートブックの概要分析専門家です。JSON形式で回答してください。"},
@@ -1521,10 +2334,11 @@ JSON形式のみを出力してください。前置きや説明は不要です
                     ],
                     temperature=0.3,
                     max_tokens=1500,  # 用語説明が増えるのでトークン数を増やす
-                    response_format={"type": "json_object"}
+                    response_format={"type": "json_object"},
+                    refresh=attempt > 0
                 )
 
-                result_text = response.choices[0].message.content.strip()
+                result_text = response_text.strip()
 
                 # JSON検証
                 try:
@@ -1553,15 +2367,17 @@ JSON形式のみを出力してください。前置きや説明は不要です
                 except json.JSONDecodeError:
                     if attempt < self.max_retries - 1:
                         print(f"JSON解析エラー（リトライ {attempt + 1}/{self.max_retries}）")
-                        time.sleep(self.retry_delay)
+                        time.sleep(backoff_delay(attempt, base=self.retry_delay))
                         continue
                     else:
                         return "{}"
 
+            except _TRANSIENT_API_ERRORS:
+                raise
             except Exception as e:
                 if attempt < self.max_retries - 1:
                     print(f"ノートブック要約生成エラー（リトライ {attempt + 1}/{self.max_retries}）: {e}")
-                    time.sleep(self.retry_delay)
+                    time.sleep(backoff_delay(attempt, base=self.retry_delay))
                 else:
                     print(f"ノートブック要約生成エラー（最終試行失敗）: {e}")
                     return "{}"
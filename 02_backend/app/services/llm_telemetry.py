@@ -0,0 +1,184 @@
+"""
+LLM呼び出しのテレメトリ（トークン数・レイテンシ・再試行・キャッシュヒット）
+
+LLMService._create_completion の1呼び出しごとに1行を SQLite に記録し、
+日・メソッドごとのトークン合計とレイテンシの p50/p95 を集計する
+（/api/admin/llm-stats と 04_scripts/llm_stats_report.py から参照）。
+"""
+
+import math
+import sqlite3
+import time
+from contextlib import closing
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.config import LLM_TELEMETRY_PATH
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """
+    最近傍法のパーセンタイル
+
+    Args:
+        values: 値のリスト
+        q: 0〜100
+
+    Returns:
+        パーセンタイル値（空の場合は None）
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class LLMTelemetry:
+    """SQLite によるLLM呼び出しの記録"""
+
+    def __init__(self, path: str | Path = LLM_TELEMETRY_PATH):
+        """
+        初期化
+
+        Args:
+            path: SQLite ファイルのパス
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_calls (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    created_at REAL NOT NULL,
+                    day TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    method TEXT NOT NULL,
+                    prompt_tokens INTEGER NOT NULL,
+                    completion_tokens INTEGER NOT NULL,
+                    latency_ms INTEGER NOT NULL,
+                    retries INTEGER NOT NULL,
+                    cache_hit INTEGER NOT NULL,
+                    streamed INTEGER NOT NULL,
+                    error TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_calls_day_method ON llm_calls(day, method)")
+            conn.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def record(
+        self,
+        model: str,
+        method: str,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        latency: float = 0.0,
+        retries: int = 0,
+        cache_hit: bool = False,
+        streamed: bool = False,
+        error: Optional[str] = None
+    ) -> None:
+        """
+        1呼び出しを記録（記録の失敗でLLM処理を止めない）
+
+        Args:
+            model: モデル名
+            method: LLMService のメソッド名
+            prompt_tokens: 入力トークン数（キャッシュヒットは 0）
+            completion_tokens: 出力トークン数
+            latency: 呼び出しにかかった秒数（レート制限の待機・再試行を含む）
+            retries: 429・接続エラーなどで再試行した回数
+            cache_hit: レスポンスキャッシュから返したか
+            streamed: ストリーミングで呼び出したか
+            error: 失敗した場合の例外名
+        """
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute(
+                    """
+                    INSERT INTO llm_calls (
+                        created_at, day, model, method, prompt_tokens, completion_tokens,
+                        latency_ms, retries, cache_hit, streamed, error
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        now, datetime.fromtimestamp(now).strftime('%Y-%m-%d'), model, method,
+                        prompt_tokens, completion_tokens, int(latency * 1000), retries,
+                        int(cache_hit), int(streamed), error
+                    )
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"⚠️  LLMテレメトリの記録に失敗: {e}")
+
+    def stats(self, days: int = 7, method: Optional[str] = None) -> Dict[str, Any]:
+        """
+        日・メソッドごとの集計
+
+        Args:
+            days: 今日を含む直近の日数
+            method: メソッド名で絞り込む
+
+        Returns:
+            {'days': [{'day', 'method', 'calls', 'cache_hits', 'errors', 'retries',
+                       'prompt_tokens', 'completion_tokens', 'p50_ms', 'p95_ms'}],
+             'methods': {method: 期間全体の同じ項目}}
+            レイテンシはキャッシュヒットを除いた API 呼び出しのみ
+        """
+        since = (datetime.now() - timedelta(days=days - 1)).strftime('%Y-%m-%d')
+        query = """
+            SELECT day, method, prompt_tokens, completion_tokens, latency_ms, retries, cache_hit, error
+            FROM llm_calls WHERE day >= ?
+        """
+        params: list = [since]
+        if method:
+            query += " AND method = ?"
+            params.append(method)
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        by_day: Dict[tuple, List[tuple]] = {}
+        by_method: Dict[str, List[tuple]] = {}
+        for row in rows:
+            by_day.setdefault((row[0], row[1]), []).append(row)
+            by_method.setdefault(row[1], []).append(row)
+
+        return {
+            'days': [
+                {'day': day, 'method': name, **self._aggregate(group)}
+                for (day, name), group in sorted(by_day.items())
+            ],
+            'methods': {name: self._aggregate(group) for name, group in sorted(by_method.items())},
+        }
+
+    @staticmethod
+    def _aggregate(rows: List[tuple]) -> Dict[str, Any]:
+        latencies = [row[4] for row in rows if not row[6] and not row[7]]
+        return {
+            'calls': len(rows),
+            'cache_hits': sum(row[6] for row in rows),
+            'errors': sum(1 for row in rows if row[7]),
+            'retries': sum(row[5] for row in rows),
+            'prompt_tokens': sum(row[2] for row in rows),
+            'completion_tokens': sum(row[3] for row in rows),
+            'p50_ms': percentile(latencies, 50),
+            'p95_ms': percentile(latencies, 95),
+        }
+
+
+# グローバルインスタンス（シングルトンパターン）
+_llm_telemetry_instance = None
+
+
+def get_llm_telemetry() -> LLMTelemetry:
+    """LLMテレメトリのインスタンスを取得（シングルトン）"""
+    global _llm_telemetry_instance
+    if _llm_telemetry_instance is None:
+        _llm_telemetry_instance = LLMTelemetry()
+    return _llm_telemetry_instance
@@ -0,0 +1,260 @@
+"""
+kaggle.com へのリクエストの適応的レート制限とサーキットブレーカー
+
+ScraperService（Playwright のページ遷移）と KaggleClient（Kaggle API 呼び出し）が
+同じリミッターを共有し、プロセス全体で Kaggle へのリクエスト間隔を揃える。
+設定で Redis を有効にすると、状態を Redis に置いて複数プロセス
+（APIサーバーとバッチスクリプトなど）で共有する。
+
+- AIMD: 成功するたびにリクエストレートを少しずつ上げ（加算）、
+  429 / 5xx / 遅いレスポンスでは半分に下げる（乗算）
+- Retry-After ヘッダーがあればその時刻まで次のリクエストを待たせる
+- 連続して失敗した場合はサーキットを開き、一定時間は即座に CircuitOpenError を返す。
+  時間経過後は1つの呼び出しだけに試行を許可し（他の呼び出しは試行の結果が出るまで待つ）、
+  成功すれば閉じ、失敗すれば再び開く
+"""
+
+import time
+from threading import Lock
+from typing import Any, Callable, Dict, Optional
+
+from app.config import (
+    KAGGLE_RATE_LIMIT_RPS,
+    KAGGLE_RATE_LIMIT_MIN_RPS,
+    KAGGLE_RATE_LIMIT_MAX_RPS,
+    KAGGLE_SLOW_RESPONSE_SECONDS,
+    KAGGLE_CIRCUIT_FAILURE_THRESHOLD,
+    KAGGLE_CIRCUIT_COOLDOWN_SECONDS,
+    KAGGLE_RATE_LIMIT_REDIS,
+)
+
+
+class CircuitOpenError(Exception):
+    """サーキットが開いている（Kaggleへのリクエストを一時停止中）"""
+
+    def __init__(self, retry_after: float):
+        """
+        Args:
+            retry_after: サーキットが半開になるまでの秒数
+        """
+        self.retry_after = retry_after
+        super().__init__(f"Kaggle circuit breaker is open (retry after {retry_after:.0f}s)")
+
+
+class AdaptiveRateLimiter:
+    """AIMD レート制限 + サーキットブレーカー"""
+
+    STATE_FIELDS = ('rate', 'next_slot', 'failures', 'open_until', 'probe_until')
+
+    def __init__(
+        self,
+        name: str = "kaggle",
+        initial_rate: float = KAGGLE_RATE_LIMIT_RPS,
+        min_rate: float = KAGGLE_RATE_LIMIT_MIN_RPS,
+        max_rate: float = KAGGLE_RATE_LIMIT_MAX_RPS,
+        increase_step: float = 0.05,
+        decrease_factor: float = 0.5,
+        slow_threshold: float = KAGGLE_SLOW_RESPONSE_SECONDS,
+        failure_threshold: int = KAGGLE_CIRCUIT_FAILURE_THRESHOLD,
+        cooldown_seconds: float = KAGGLE_CIRCUIT_COOLDOWN_SECONDS,
+        probe_timeout: float = 120.0,
+        probe_poll_seconds: float = 0.5,
+        redis_client: Any = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        初期化
+
+        Args:
+            name: リミッター名（Redis のキーに使用）
+            initial_rate: 初期レート（リクエスト/秒）
+            min_rate: 下限レート
+            max_rate: 上限レート
+            increase_step: 成功時のレート加算量
+            decrease_factor: 失敗・低速時のレート乗数
+            slow_threshold: これ以上かかったレスポンスは低速とみなす（秒）
+            failure_threshold: サーキットを開く連続失敗回数
+            cooldown_seconds: サーキットを開いておく秒数
+            probe_timeout: 半開の試行の結果を待つ上限（秒、超えたら次の呼び出しが試行する）
+            probe_poll_seconds: 試行の結果を待つ間の確認間隔（秒）
+            redis_client: 状態を共有する Redis クライアント（None の場合はプロセス内）
+            clock: 現在時刻（テスト用）
+            sleep: 待機関数（テスト用）
+        """
+        self.name = name
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.slow_threshold = slow_threshold
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.probe_timeout = probe_timeout
+        self.probe_poll_seconds = probe_poll_seconds
+        self.redis = redis_client
+        self.clock = clock
+        self.sleep = sleep
+
+        self._key = f"ratelimit:{name}"
+        self._lock = Lock()
+        self._state = self._initial_state()
+
+    def _initial_state(self) -> Dict[str, float]:
+        return {'rate': self.initial_rate, 'next_slot': 0.0, 'failures': 0, 'open_until': 0.0, 'probe_until': 0.0}
+
+    def _update_state(self, mutate: Callable[[Dict[str, float]], Any]) -> Any:
+        """
+        状態をアトミックに読み取り・更新する
+
+        Redis が有効な場合は WATCH/MULTI のトランザクションで更新し、
+        Redis エラー時はプロセス内の状態にフォールバックする
+
+        Args:
+            mutate: 状態の辞書を受け取って更新し、結果を返す関数
+
+        Returns:
+            mutate の返り値
+        """
+        if self.redis is not None:
+            def transaction(pipe):
+                raw = pipe.hgetall(self._key)
+                state = self._initial_state()
+                for field in self.STATE_FIELDS:
+                    if field in raw:
+                        state[field] = float(raw[field])
+                result = mutate(state)
+                pipe.multi()
+                pipe.hset(self._key, mapping={field: repr(state[field]) for field in self.STATE_FIELDS})
+                pipe.expire(self._key, 86400)
+                return result
+
+            try:
+                return self.redis.transaction(transaction, self._key, value_from_callable=True)
+            except Exception as e:
+                print(f"⚠️  レート制限のRedis共有に失敗、プロセス内で継続: {e}")
+                self.redis = None
+
+        with self._lock:
+            return mutate(self._state)
+
+    def acquire(self) -> None:
+        """
+        リクエスト枠を確保（必要なら待機）
+
+        半開の試行中は、試行の結果（record）が出るまで待ってから枠を確保する
+
+        Raises:
+            CircuitOpenError: サーキットが開いている場合（試行の失敗で再び開いた場合を含む）
+        """
+        def reserve(state, now):
+            if state['open_until'] > now:
+                return 'open', state['open_until']
+            if state['probe_until'] > now:
+                return 'probing', state['probe_until']
+            if state['open_until'] or state['probe_until']:
+                # 半開（または試行が結果を返さないまま期限切れ）: この呼び出しだけが試行し、次の失敗で再び開く
+                state['open_until'] = 0.0
+                state['failures'] = self.failure_threshold - 1
+                state['probe_until'] = now + self.probe_timeout
+
+            slot = max(now, state['next_slot'])
+            state['next_slot'] = slot + 1.0 / state['rate']
+            return 'slot', slot
+
+        while True:
+            now = self.clock()
+            outcome, until = self._update_state(lambda state: reserve(state, now))
+            if outcome == 'open':
+                raise CircuitOpenError(until - now)
+            if outcome == 'slot':
+                break
+            # 別の呼び出しが半開の試行中
+            self.sleep(min(self.probe_poll_seconds, until - now))
+
+        wait = until - now
+        if wait > 0:
+            self.sleep(wait)
+
+    def record(self, status: Optional[int], elapsed: float, retry_after: Optional[float] = None) -> None:
+        """
+        レスポンス結果を記録してレートとサーキットを更新
+
+        Args:
+            status: HTTPステータス（タイムアウト・接続エラーの場合はNone）
+            elapsed: レスポンスまでの秒数
+            retry_after: Retry-After ヘッダーの秒数
+        """
+        failure = status is None or status == 429 or status >= 500
+        slow = not failure and elapsed >= self.slow_threshold
+        now = self.clock()
+
+        def update(state):
+            previous_rate = state['rate']
+            opened = False
+
+            if failure or slow:
+                state['rate'] = max(self.min_rate, state['rate'] * self.decrease_factor)
+            else:
+                state['rate'] = min(self.max_rate, state['rate'] + self.increase_step)
+
+            if failure:
+                state['failures'] += 1
+                if state['failures'] >= self.failure_threshold and state['open_until'] <= now:
+                    state['open_until'] = now + self.cooldown_seconds
+                    opened = True
+            else:
+                state['failures'] = 0
+
+            if retry_after:
+                state['next_slot'] = max(state['next_slot'], now + retry_after)
+
+            # 半開の試行の結果が出たので、待っている呼び出しを再開させる
+            state['probe_until'] = 0.0
+
+            return previous_rate, state['rate'], opened
+
+        previous_rate, rate, opened = self._update_state(update)
+
+        if rate < previous_rate:
+            reason = f"HTTP {status}" if status else ("低速レスポンス" if slow else "接続エラー")
+            print(f"⏬ {self.name} レート低下 ({reason}): {previous_rate:.2f} → {rate:.2f} req/s")
+        if opened:
+            print(f"🚫 {self.name} サーキットオープン: {self.cooldown_seconds:.0f}秒間リクエストを停止")
+
+    def snapshot(self) -> Dict[str, float]:
+        """現在の状態（ログ・確認用）"""
+        return dict(self._update_state(lambda state: dict(state)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After ヘッダーを秒数に変換（HTTP日付形式は非対応）
+
+    Args:
+        value: ヘッダー値
+
+    Returns:
+        秒数（解釈できない場合はNone）
+    """
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+# グローバルインスタンス（シングルトンパターン）
+_kaggle_rate_limiter_instance = None
+
+
+def get_kaggle_rate_limiter() -> AdaptiveRateLimiter:
+    """kaggle.com 用レートリミッターのインスタンスを取得（シングルトン）"""
+    global _kaggle_rate_limiter_instance
+    if _kaggle_rate_limiter_instance is None:
+        redis_client = None
+        if KAGGLE_RATE_LIMIT_REDIS:
+            from .cache_service import get_cache_service
+            redis_client = get_cache_service().redis
+        _kaggle_rate_limiter_instance = AdaptiveRateLimiter(redis_client=redis_client)
+    return _kaggle_rate_limiter_instance
@@ -0,0 +1,212 @@
+"""
+スクレイピングタスクのキュー（Redis リスト）
+
+APIサーバーやバッチスクリプトがタスクを登録し、1つ以上のワーカープロセス
+（python -m app.batch.scrape_worker）が取り出して実行する。
+ワーカーは別コア・別ノードで起動でき、同じ Redis を参照すれば負荷が分散される。
+
+キー:
+- scrape:queue                 待機中のタスク（LPUSH で登録、ワーカーが右端から取り出す = FIFO）
+- scrape:processing:<worker>   ワーカーが実行中のタスク（BRPOPLPUSH で原子的に移動）
+- scrape:pending               登録済みタスクのキー（同じタスクの重複登録を防ぐ）
+- scrape:failed                最大試行回数を超えて失敗したタスク
+- scrape:worker:<worker>       ワーカーの生存確認（TTL付き）
+- scrape:stats                 完了・失敗数
+
+ワーカーが異常終了した場合、生存確認が期限切れになった時点で
+他のワーカーが処理中リストのタスクをキューに戻す
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import SCRAPE_QUEUE_MAX_ATTEMPTS, SCRAPE_WORKER_HEARTBEAT_TTL_SECONDS
+
+
+QUEUE_KEY = "scrape:queue"
+PROCESSING_KEY_PREFIX = "scrape:processing:"
+PENDING_KEY = "scrape:pending"
+FAILED_KEY = "scrape:failed"
+WORKER_KEY_PREFIX = "scrape:worker:"
+STATS_KEY = "scrape:stats"
+
+# タスク種別と必須パラメータ
+TASK_TYPES = {
+    'competition_details': ('comp_id',),
+    'tab_content': ('comp_id', 'tab'),
+    'discussions': ('comp_id',),
+    'notebooks': ('comp_id',),
+    'discussion_detail': ('url',),
+}
+
+
+def task_key(task: Dict[str, Any]) -> str:
+    """重複判定用のタスクキー（種別とパラメータ。試行回数などのメタ情報は除く）"""
+    params = {k: v for k, v in task.items() if k not in ('attempts', 'enqueued_at', 'last_error')}
+    return json.dumps(params, sort_keys=True, ensure_ascii=False)
+
+
+class ScrapeQueue:
+    """Redis リストによるスクレイピングタスクのキュー"""
+
+    def __init__(
+        self,
+        redis_client: Any,
+        max_attempts: int = SCRAPE_QUEUE_MAX_ATTEMPTS,
+        heartbeat_ttl: int = SCRAPE_WORKER_HEARTBEAT_TTL_SECONDS
+    ):
+        """
+        初期化
+
+        Args:
+            redis_client: Redis クライアント（decode_responses=True）
+            max_attempts: 失敗時の最大試行回数
+            heartbeat_ttl: ワーカーの生存確認の有効期間（秒）
+        """
+        if redis_client is None:
+            raise RuntimeError("Scrape queue requires Redis")
+        self.redis = redis_client
+        self.max_attempts = max_attempts
+        self.heartbeat_ttl = heartbeat_ttl
+
+    def enqueue(self, task_type: str, **params) -> bool:
+        """
+        タスクを登録
+
+        Args:
+            task_type: TASK_TYPES のキー
+            **params: タスクのパラメータ
+
+        Returns:
+            登録したか（同じタスクが待機中・実行中の場合は False）
+
+        Raises:
+            ValueError: 未知のタスク種別・必須パラメータ不足
+        """
+        if task_type not in TASK_TYPES:
+            raise ValueError(f"Unknown task type: {task_type} (available: {list(TASK_TYPES)})")
+        missing = [name for name in TASK_TYPES[task_type] if not params.get(name)]
+        if missing:
+            raise ValueError(f"Missing parameters for {task_type}: {missing}")
+
+        task = {'type': task_type, **params}
+        if not self.redis.sadd(PENDING_KEY, task_key(task)):
+            return False
+
+        task.update(attempts=0, enqueued_at=datetime.now().isoformat())
+        self.redis.lpush(QUEUE_KEY, json.dumps(task, ensure_ascii=False))
+        return True
+
+    def reserve(self, worker_id: str, timeout: int = 5) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        タスクを取り出してワーカーの処理中リストに移す
+
+        Args:
+            worker_id: ワーカーID
+            timeout: キューが空の場合に待つ秒数
+
+        Returns:
+            (元のJSON文字列, タスク)。キューが空の場合は None
+        """
+        raw = self.redis.brpoplpush(QUEUE_KEY, PROCESSING_KEY_PREFIX + worker_id, timeout)
+        if raw is None:
+            return None
+        return raw, json.loads(raw)
+
+    def complete(self, worker_id: str, raw: str) -> None:
+        """タスクの完了を記録"""
+        self.redis.lrem(PROCESSING_KEY_PREFIX + worker_id, 1, raw)
+        self.redis.srem(PENDING_KEY, task_key(json.loads(raw)))
+        self.redis.hincrby(STATS_KEY, 'completed', 1)
+
+    def fail(self, worker_id: str, raw: str, error: str, count_attempt: bool = True) -> bool:
+        """
+        タスクの失敗を記録（最大試行回数までキューに戻す）
+
+        Args:
+            worker_id: ワーカーID
+            raw: reserve で取得したJSON文字列
+            error: エラー内容
+            count_attempt: 試行回数に数えるか（サーキットオープンなど一時停止の場合は False）
+
+        Returns:
+            再試行するか（False の場合は失敗リストに移動）
+        """
+        task = json.loads(raw)
+        if count_attempt:
+            task['attempts'] = task.get('attempts', 0) + 1
+        task['last_error'] = error[:500]
+        retry = task['attempts'] < self.max_attempts
+
+        pipe = self.redis.pipeline()
+        pipe.lrem(PROCESSING_KEY_PREFIX + worker_id, 1, raw)
+        if retry:
+            # 右端（次に取り出される側）ではなく左端に戻し、他のタスクを先に処理する
+            pipe.lpush(QUEUE_KEY, json.dumps(task, ensure_ascii=False))
+        else:
+            pipe.srem(PENDING_KEY, task_key(task))
+            pipe.lpush(FAILED_KEY, json.dumps(task, ensure_ascii=False))
+            pipe.hincrby(STATS_KEY, 'failed', 1)
+        pipe.execute()
+        return retry
+
+    def heartbeat(self, worker_id: str) -> None:
+        """ワーカーの生存を記録"""
+        self.redis.setex(WORKER_KEY_PREFIX + worker_id, self.heartbeat_ttl, datetime.now().isoformat())
+
+    def unregister(self, worker_id: str) -> None:
+        """ワーカーの正常終了（処理中のタスクはキューに戻す）"""
+        self._requeue_processing(worker_id)
+        self.redis.delete(WORKER_KEY_PREFIX + worker_id)
+
+    def recover_orphans(self) -> int:
+        """
+        生存確認が切れたワーカーの処理中タスクをキューに戻す
+
+        Returns:
+            キューに戻したタスク数
+        """
+        recovered = 0
+        for key in self.redis.scan_iter(match=PROCESSING_KEY_PREFIX + '*'):
+            worker_id = key[len(PROCESSING_KEY_PREFIX):]
+            if not self.redis.exists(WORKER_KEY_PREFIX + worker_id):
+                recovered += self._requeue_processing(worker_id)
+        return recovered
+
+    def _requeue_processing(self, worker_id: str) -> int:
+        """ワーカーの処理中リストのタスクをすべてキューに戻す"""
+        moved = 0
+        # 取り出しと逆順（左端）から戻すことで、元の順序で再実行される
+        while self.redis.rpoplpush(PROCESSING_KEY_PREFIX + worker_id, QUEUE_KEY) is not None:
+            moved += 1
+        return moved
+
+    def stats(self) -> Dict[str, int]:
+        """キューの状態"""
+        workers = list(self.redis.scan_iter(match=WORKER_KEY_PREFIX + '*'))
+        processing = sum(
+            self.redis.llen(key) for key in self.redis.scan_iter(match=PROCESSING_KEY_PREFIX + '*')
+        )
+        counts = self.redis.hgetall(STATS_KEY)
+        return {
+            'queued': self.redis.llen(QUEUE_KEY),
+            'processing': processing,
+            'failed': self.redis.llen(FAILED_KEY),
+            'workers': len(workers),
+            'completed_total': int(counts.get('completed', 0)),
+            'failed_total': int(counts.get('failed', 0)),
+        }
+
+
+# グローバルインスタンス（シングルトンパターン）
+_scrape_queue_instance = None
+
+
+def get_scrape_queue() -> ScrapeQueue:
+    """スクレイピングキューのインスタンスを取得（シングルトン、キャッシュと同じRedisを使用）"""
+    global _scrape_queue_instance
+    if _scrape_queue_instance is None:
+        from .cache_service import get_cache_service
+        _scrape_queue_instance = ScrapeQueue(get_cache_service().redis)
+    return _scrape_queue_instance
@@ -5,35 +5,609 @@ Kaggle APIでは取得できない詳細情報をWebスクレイピングで取
 Playwright を使用して JavaScript レンダリング後のコンテンツを取得
 """
 
-from playwright.sync_api import sync_playwright, Page, Browser
-from bs4 import BeautifulSoup
-from typing import Optional, Dict, Any
+from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext, Playwright
+from playwright.async_api import async_playwright
+from typing import Optional, Dict, Any, Union, Callable, Awaitable, Iterator
 from datetime import datetime
+from pathlib import Path
+from contextlib import contextmanager, AsyncExitStack
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
 import time
 
+from app.config import (
+    SCRAPER_JSON_CAPTURE,
+    SCRAPER_FIXTURE_MODE,
+    SCRAPER_FIXTURE_DIR,
+    SCRAPER_PROFILE_DIR,
+    SCRAPER_HTTP_FIRST,
+    SCRAPER_LIST_CONCURRENCY,
+    SCRAPER_NEGATIVE_CACHE_TTL_HOURS,
+    SCRAPER_SNAPSHOT_ARCHIVE,
+    SCRAPER_SNAPSHOT_DIR,
+    SCRAPER_CLEAN_CONTENT,
+    SCRAPER_CONTENT_MAX_COMMENTS,
+)
 from .cache_service import get_cache_service
+from .fixture_store import FixtureStore
+from .snapshot_archive import SnapshotArchive, dump_json_payloads
+from .html_parser import parse_html
+from .content_cleaner import clean_page_text, extract_main_content, inner_text
+from .author_tier_cache import AuthorTierCache, get_author_tier_cache
+from .rate_limiter import AdaptiveRateLimiter, CircuitOpenError, get_kaggle_rate_limiter, parse_retry_after
+from .http_fetcher import HttpFetcher, get_http_fetcher, get_fetch_stats
+from .browser_worker import BrowserLease, BrowserWorker
+from .discussion import is_listing_item_changed
+from .kaggle_json import (
+    is_kaggle_api_response,
+    extract_discussion_items,
+    extract_notebook_items,
+    extract_competition_items,
+    normalize_tier,
+)
+
+
+# ブラウザプロファイル内に書き出す storage state（Cookie・localStorage）
+STORAGE_STATE_FILE = "storage_state.json"
+
+# scrape_competition_bundle で取得できるタブ（タブ名 → コンペURLからのパス）
+BUNDLE_TABS = {
+    'overview': '',
+    'data': 'data',
+    'evaluation': 'overview/evaluation',
+    'discussion': 'discussion?sort=votes',
+    'writeups': 'discussion?sort=votes&tab=writeups',
+    # 差分同期用（新しい投稿・コメントがあったスレッドが先頭）
+    'discussion_recent': 'discussion?sort=recent-comments',
+    'writeups_recent': 'discussion?sort=recent-comments&tab=writeups',
+}
+
+# 一覧アイテム（'items'）も返すバンドルのタブ
+LISTING_TABS = ('discussion', 'writeups', 'discussion_recent', 'writeups_recent')
+
+# まずHTTPで取得を試すページ種別（必要な内容がなければ Playwright にフォールバック）
+STATIC_PAGE_TYPES = ('competitions_list', 'discussion_detail')
+
+# HTTPで取得した詳細ページ本文の最低文字数（これ未満はJSレンダリング前のシェルとみなす）
+MIN_STATIC_CONTENT_CHARS = 500
+
+# HTTP取得で 404 だった場合に _fetch_static が返す値（Playwright を起動せずに not_found とする）
+STATIC_NOT_FOUND = object()
+
+
+class BrowserSession:
+    """
+    ブラウザコンテキストを Browser と同じ new_page() / close() で扱うためのラッパー
+
+    永続プロファイルの場合は close 時に storage state を書き出し、
+    プロファイル使用中に別ブラウザで起動した場合はそのブラウザも閉じる
+    """
+
+    def __init__(
+        self,
+        context: BrowserContext,
+        browser: Optional[Browser] = None,
+        storage_state_path: Optional[Path] = None
+    ):
+        self.context = context
+        self.browser = browser
+        self.storage_state_path = storage_state_path
+
+    def new_page(self) -> Page:
+        return self.context.new_page()
+
+    def close(self) -> None:
+        if self.storage_state_path:
+            try:
+                self.context.storage_state(path=str(self.storage_state_path))
+            except Exception as e:
+                print(f"⚠️  storage state の保存に失敗: {e}")
+        self.context.close()
+        if self.browser:
+            self.browser.close()
 
 
 class ScraperService:
     """Kaggle コンペティションページのスクレイピング（Playwright使用）"""
 
-    def __init__(self, cache_ttl_days: int = 1, headless: bool = True):
+    def __init__(
+        self,
+        cache_ttl_days: int = 1,
+        headless: bool = True,
+        json_capture: Optional[bool] = None,
+        fixture_mode: Optional[str] = None,
+        fixture_dir: Optional[str] = None,
+        profile_dir: Optional[str] = None,
+        author_tiers: Optional[AuthorTierCache] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        http_first: Optional[bool] = None,
+        http_fetcher: Optional[HttpFetcher] = None,
+        snapshot_archive: Optional[bool] = None,
+        snapshot_dir: Optional[str] = None,
+        clean_content: Optional[bool] = None,
+        content_max_comments: Optional[int] = None
+    ):
         """
         初期化
 
         Args:
             cache_ttl_days: キャッシュ有効期限（日数）デフォルト1日
             headless: ヘッドレスモードで実行するか
+            json_capture: Kaggle内部APIのJSONレスポンスから一覧を解析するか
+                          （None の場合は設定 SCRAPER_JSON_CAPTURE に従う）
+            fixture_mode: "record"（取得内容をフィクスチャに保存）/ "replay"（フィクスチャで応答）
+                          （None の場合は設定 SCRAPER_FIXTURE_MODE に従う）
+            fixture_dir: フィクスチャの保存先（None の場合は設定 SCRAPER_FIXTURE_DIR）
+            profile_dir: ブラウザプロファイル（Cookie・ストレージ・HTTPディスクキャッシュ）の保存先
+                         （None の場合は設定 SCRAPER_PROFILE_DIR、空文字列で毎回新規プロファイル）
+            author_tiers: 投稿者の称号キャッシュ（None の場合は authors テーブル）
+            rate_limiter: kaggle.com へのページ遷移に使うレートリミッター
+                          （None の場合はプロセス共有のリミッター）
+            http_first: STATIC_PAGE_TYPES のページをまずHTTPで取得するか
+                        （None の場合は設定 SCRAPER_HTTP_FIRST に従う。フィクスチャモードでは無効）
+            http_fetcher: HTTP取得に使うクライアント（None の場合はプロセス共有のクライアント）
+            snapshot_archive: 取得したページのHTML/JSONをアーカイブするか
+                              （None の場合は設定 SCRAPER_SNAPSHOT_ARCHIVE に従う。replay モードでは無効）
+            snapshot_dir: アーカイブの保存先（None の場合は設定 SCRAPER_SNAPSHOT_DIR）
+            clean_content: ディスカッション詳細の本文をクリーニングするか
+                           （None の場合は設定 SCRAPER_CLEAN_CONTENT に従う）
+            content_max_comments: クリーニング後の本文に含めるコメント数
+                                  （None の場合は設定 SCRAPER_CONTENT_MAX_COMMENTS）
         """
         self.cache_service = get_cache_service()
         self.cache_ttl_days = cache_ttl_days
+        self.negative_cache_ttl_seconds = int(SCRAPER_NEGATIVE_CACHE_TTL_HOURS * 3600)
         self.base_url = "https://www.kaggle.com/competitions"
         self.headless = headless
+        self.json_capture = SCRAPER_JSON_CAPTURE if json_capture is None else json_capture
+        self.author_tiers = author_tiers or get_author_tier_cache()
+        self.rate_limiter = rate_limiter or get_kaggle_rate_limiter()
+
+        self.fixture_mode = SCRAPER_FIXTURE_MODE if fixture_mode is None else fixture_mode
+        if self.fixture_mode not in (None, 'record', 'replay'):
+            raise ValueError(f"Unknown fixture mode: {self.fixture_mode}")
+        self.fixture_store = FixtureStore(fixture_dir or SCRAPER_FIXTURE_DIR) if self.fixture_mode else None
+        # record モードのページごとの記録（{'url', 'status', 'responses'}。ページを閉じると削除）
+        self._fixture_recordings: Dict[Page, Dict[str, Any]] = {}
+
+        profile_dir = SCRAPER_PROFILE_DIR if profile_dir is None else profile_dir
+        self.profile_dir = Path(profile_dir) if profile_dir else None
+
+        # フィクスチャはブラウザで記録・再生するため、HTTP取得は使わない
+        http_first = SCRAPER_HTTP_FIRST if http_first is None else http_first
+        self.http_first = http_first and not self.fixture_mode
+        self.http_fetcher = http_fetcher or (get_http_fetcher() if self.http_first else None)
+        self.fetch_stats = get_fetch_stats()
+
+        snapshot_archive = SCRAPER_SNAPSHOT_ARCHIVE if snapshot_archive is None else snapshot_archive
+        self.snapshot_archive = (
+            SnapshotArchive(snapshot_dir or SCRAPER_SNAPSHOT_DIR)
+            if snapshot_archive and self.fixture_mode != 'replay' else None
+        )
+
+        self.clean_content = SCRAPER_CLEAN_CONTENT if clean_content is None else clean_content
+        self.content_max_comments = (
+            SCRAPER_CONTENT_MAX_COMMENTS if content_max_comments is None else content_max_comments
+        )
+
+        self._worker: Optional[BrowserWorker] = None  # browser_worker() の実行中のみ
+
+    @contextmanager
+    def browser_worker(self, max_pages: Optional[int] = None, max_rss_mb: Optional[float] = None):
+        """
+        バッチ処理用: ブロック内のスクレイピング呼び出しで1つのブラウザを使い回す
+
+        ページ数・プロセスツリーのRSSが上限を超えると呼び出しの合間にブラウザを
+        リサイクルし、終了時にメモリプロファイルを出力する
+
+            with scraper.browser_worker():
+                for comp_id in comp_ids:
+                    scraper.get_tab_content(comp_id)
+
+        Args:
+            max_pages: 1つのブラウザで処理するページ数の上限（None の場合は設定 SCRAPER_BROWSER_MAX_PAGES）
+            max_rss_mb: RSS上限（MB、None の場合は設定 SCRAPER_BROWSER_MAX_RSS_MB）
+
+        Yields:
+            BrowserWorker
+        """
+        options = {}
+        if max_pages is not None:
+            options['max_pages'] = max_pages
+        if max_rss_mb is not None:
+            options['max_rss_mb'] = max_rss_mb
+
+        worker = BrowserWorker(self._start_browser, **options)
+        worker.start()
+        self._worker = worker
+        try:
+            yield worker
+        finally:
+            self._worker = None
+            worker.stop()
+            for line in worker.profile.report():
+                print(line)
+
+    @contextmanager
+    def _playwright(self):
+        """
+        Playwright インスタンスを取得（sync_playwright() の代わりに使う）
+
+        ワーカー実行中はワーカーの Playwright を返し、終了時に閉じ忘れたページの片付けと
+        リサイクル判定を行う
+        """
+        if self._worker is None:
+            with sync_playwright() as p:
+                yield p
+            return
+
+        worker = self._worker
+        worker.enter()
+        try:
+            yield worker.playwright
+        finally:
+            worker.exit()
+
+    def _launch_browser(self, p: Playwright) -> Union[Browser, BrowserSession, BrowserLease]:
+        """
+        ブラウザを起動（ワーカー実行中はワーカーのブラウザを貸し出す）
+
+        Args:
+            p: self._playwright() のインスタンス
+
+        Returns:
+            Browser / BrowserSession / BrowserLease（いずれも new_page() / close() を持つ）
+        """
+        if self._worker is not None:
+            return self._worker.lease()
+        return self._start_browser(p)
+
+    def _start_browser(self, p: Playwright) -> Union[Browser, BrowserSession]:
+        """
+        ブラウザを起動
+
+        プロファイルが設定されている場合は永続コンテキストで起動し、Cookie・
+        localStorage・HTTPディスクキャッシュ（JSバンドル等）を次回以降の起動で再利用する。
+        プロファイルが他のブラウザで使用中の場合は、前回保存した storage state だけを
+        読み込んだ一時コンテキストで起動する。
+
+        返り値は new_page() / close() を持つ（呼び出し側は Browser と同じように扱う）
+
+        Args:
+            p: sync_playwright() のインスタンス
+
+        Returns:
+            Browser または BrowserSession
+        """
+        if not self.profile_dir:
+            return p.chromium.launch(headless=self.headless)
+
+        storage_state_path = self.profile_dir / STORAGE_STATE_FILE
+        try:
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            context = p.chromium.launch_persistent_context(str(self.profile_dir), headless=self.headless)
+            return BrowserSession(context, storage_state_path=storage_state_path)
+        except Exception as e:
+            print(f"⚠️  ブラウザプロファイルを使用できないため一時プロファイルで起動: {e}")
+            browser = p.chromium.launch(headless=self.headless)
+            context = browser.new_context(
+                storage_state=str(storage_state_path) if storage_state_path.exists() else None
+            )
+            return BrowserSession(context, browser=browser)
+
+    def _new_page(self, browser: Union[Browser, BrowserSession, BrowserLease]) -> Page:
+        """
+        新しいページを作成（フィクスチャの記録・再生を設定）
+
+        replay モードでは全リクエストをルーティングし、ドキュメントは
+        フィクスチャのHTMLで応答、それ以外（JS/CSS/画像/XHR）は遮断する。
+        HTMLはレンダリング後の内容なので、JSを実行しなくても同じDOMになる
+
+        Args:
+            browser: Playwrightのブラウザ
+
+        Returns:
+            ページオブジェクト
+        """
+        page = browser.new_page()
+
+        if self.fixture_mode == 'replay':
+            page.route('**/*', self._fulfill_from_fixture)
+        elif self.fixture_mode == 'record':
+            recording = {'url': None, 'status': 200, 'responses': []}
+            self._fixture_recordings[page] = recording
+            page.on('response', lambda response: self._record_response(response, recording['responses']))
+            page.on('close', lambda _: self._fixture_recordings.pop(page, None))
+
+        return page
+
+    def _fetch_static(self, page_type: str, url: str, extract: Callable[[str], Any]) -> Optional[Any]:
+        """
+        Playwright を使わずHTTPでページを取得して解析
+
+        Args:
+            page_type: ページ種別（STATIC_PAGE_TYPES 以外は常に None を返す）
+            url: 取得するURL
+            extract: HTMLから必要な内容を取り出す関数（内容がなければ None）
+
+        Returns:
+            extract の返り値（HTTP無効・取得失敗・必要な内容がない場合は None、404 の場合は STATIC_NOT_FOUND）
+        """
+        if not self.http_first or page_type not in STATIC_PAGE_TYPES:
+            return None
+
+        start = time.monotonic()
+        value = None
+        response = self.http_fetcher.fetch(url)
+        if response is not None and response.status_code == 404:
+            self.fetch_stats.record(page_type, 'http', True, time.monotonic() - start)
+            return STATIC_NOT_FOUND
+        if response is not None and response.status_code == 200:
+            try:
+                value = extract(response.text)
+            except Exception as e:
+                print(f"⚠️  HTTP取得ページの解析エラー ({page_type}): {e}")
+
+        self.fetch_stats.record(page_type, 'http', bool(value), time.monotonic() - start)
+        return value
+
+    @staticmethod
+    def _extract_site_content(html: str) -> Optional[str]:
+        """
+        HTMLから #site-content の本文を inner_text と同じ行区切りで取り出す（JSレンダリング前のシェルの場合は None）
+
+        Args:
+            html: ページのHTML
+
+        Returns:
+            本文テキスト
+        """
+        content = parse_html(html).select_one('#site-content')
+        if content is None:
+            return None
+        text = inner_text(content)
+        return text if len(text) >= MIN_STATIC_CONTENT_CHARS else None
+
+    def _clean_content(self, url: str, html: str, page_text: str) -> str:
+        """
+        LLM・キャッシュに渡す本文を取り出す（クリーニング無効時は page_text のまま）
+
+        Args:
+            url: ページのURL
+            html: ページのHTML
+            page_text: #site-content のテキスト
+
+        Returns:
+            本文テキスト（HTMLから取り出せない場合はUIラベルの行を除いた page_text）
+        """
+        if not self.clean_content:
+            return page_text
+        try:
+            content = extract_main_content(html, url, max_comments=self.content_max_comments)
+        except Exception as e:
+            print(f"⚠️  本文のクリーニングに失敗: {e}")
+            content = None
+        return content or clean_page_text(page_text)
+
+    def _archive_page(
+        self,
+        url: str,
+        page_type: str,
+        comp_id: Optional[str] = None,
+        page: Optional[Page] = None,
+        html: Optional[str] = None,
+        json_payloads: Optional[list] = None
+    ) -> None:
+        """
+        取得したページをアーカイブに保存（アーカイブ無効時は何もしない）
+
+        Args:
+            url: ページのURL
+            page_type: ページ種別（'discussion_listing' / 'notebook_listing' / 'discussion_detail' / 'competition_tab'）
+            comp_id: コンペティションID
+            page: HTMLを取り出すページ（html を渡さない場合）
+            html: HTML
+            json_payloads: キャプチャしたKaggle内部APIのJSON
+        """
+        if self.snapshot_archive is None:
+            return
+
+        try:
+            if html is None and page is not None:
+                html = page.content()
+            if html:
+                self.snapshot_archive.save(url, html, page_type, content_type='html', comp_id=comp_id)
+            if json_payloads:
+                self.snapshot_archive.save(
+                    url, dump_json_payloads(json_payloads), page_type, content_type='json', comp_id=comp_id
+                )
+        except Exception as e:
+            print(f"⚠️  アーカイブ保存エラー ({url}): {e}")
+
+    def _fixture_response(self, request) -> Optional[Dict[str, Any]]:
+        """
+        replay モードでリクエストに返す内容
+
+        Args:
+            request: Playwrightのリクエスト
+
+        Returns:
+            route.fulfill の引数（None の場合は遮断）
+        """
+        if request.resource_type != 'document':
+            return None
+
+        fixture = self.fixture_store.load(request.url)
+        if fixture is None:
+            print(f"⚠️  フィクスチャ未記録: {request.url}")
+            return {'status': 404, 'content_type': 'text/plain', 'body': 'fixture not recorded'}
+
+        return {
+            'status': fixture['status'],
+            'content_type': 'text/html; charset=utf-8',
+            'body': fixture['html'],
+        }
+
+    def _fulfill_from_fixture(self, route) -> None:
+        """replay モードのルーティングハンドラ"""
+        response = self._fixture_response(route.request)
+        if response is None:
+            route.abort()
+        else:
+            route.fulfill(**response)
+
+    def _record_response(self, response, recorded: list) -> None:
+        """record モードでKaggle内部APIのJSONを recorded（ページごとの記録）に追加する"""
+        try:
+            content_type = response.headers.get('content-type')
+            if not is_kaggle_api_response(response.url, content_type):
+                return
+            recorded.append({
+                'url': response.url,
+                'status': response.status,
+                'content_type': content_type,
+                'body': response.json(),
+            })
+        except Exception:
+            pass
+
+    def _goto(self, page: Page, url: str, json_payloads: Optional[list] = None, **kwargs):
+        """
+        ページ遷移（フィクスチャの記録・再生に対応）
+
+        kaggle.com への遷移はレートリミッターで間隔を調整し、ステータスと
+        応答時間を記録する（サーキットが開いている場合は CircuitOpenError）。
+        record モードでは遷移直後のHTMLと受信したJSONをフィクスチャに保存する
+        （描画後のDOMは呼び出し側が描画の待機後に _save_fixture で上書き保存する）。
+        replay モードでは記録済みJSONを json_payloads に流し込む
+        （遷移後の XHR は発生しないため、JSONキャプチャはこれで代替する）
+
+        Args:
+            page: Playwrightのページオブジェクト
+            url: 遷移先URL
+            json_payloads: _attach_json_capture が返したリスト
+            **kwargs: page.goto に渡す引数
+
+        Returns:
+            page.goto のレスポンス
+        """
+        recording = self._fixture_recordings.get(page)
+        if recording is not None:
+            recording['responses'].clear()
+
+        if self.fixture_mode == 'replay':
+            response = page.goto(url, **kwargs)
+        else:
+            self.rate_limiter.acquire()
+            start = time.monotonic()
+            try:
+                response = page.goto(url, **kwargs)
+            except Exception:
+                # タイムアウト・接続エラー
+                self.rate_limiter.record(None, time.monotonic() - start)
+                raise
+            self.rate_limiter.record(
+                response.status if response else 200,
+                time.monotonic() - start,
+                retry_after=parse_retry_after(response.headers.get('retry-after')) if response else None
+            )
+
+        if recording is not None:
+            # 404 などで描画を待たずに終わるページも記録されるよう、遷移直後の状態を保存しておく
+            recording['url'] = url
+            recording['status'] = response.status if response else 200
+            self._save_fixture(page)
+        elif self.fixture_mode == 'replay' and json_payloads is not None and self.json_capture:
+            fixture = self.fixture_store.load(url)
+            if fixture:
+                json_payloads.extend(r['body'] for r in fixture['responses'])
+
+        return response
+
+    def _save_fixture(self, page: Page) -> None:
+        """
+        record モードで、ページの現在のHTMLと遷移後に受信したJSONをフィクスチャに保存する
+
+        描画の待機・スクロールの後に呼び、replay でパースするDOMと同じ状態を記録する
+        （record モード以外・_goto 前のページでは何もしない）
+
+        Args:
+            page: _new_page で作成したページ
+        """
+        recording = self._fixture_recordings.get(page)
+        if recording is None or recording['url'] is None:
+            return
+        self.fixture_store.save(
+            recording['url'],
+            page.content(),
+            status=recording['status'],
+            responses=list(recording['responses'])
+        )
+
+    def _wait_for_render(self, page: Page, timeout_ms: int = 2000) -> None:
+        """JavaScriptレンダリングを待機（replay モードではHTMLが描画済みなので待たない）"""
+        if self.fixture_mode == 'replay':
+            return
+        page.wait_for_timeout(timeout_ms)
+
+    def _attach_json_capture(self, page: Page) -> list:
+        """
+        ページのネットワークレスポンスを監視し、Kaggle内部APIのJSONを収集する
+
+        json_capture が無効な場合は何も登録せず、常に空のリストを返す
+
+        Args:
+            page: Playwrightのページオブジェクト
+
+        Returns:
+            キャプチャしたJSONが追加されていくリスト（呼び出し側でクリアして使い回す）
+        """
+        payloads = []
+        if not self.json_capture:
+            return payloads
+
+        def on_response(response):
+            try:
+                if not is_kaggle_api_response(response.url, response.headers.get('content-type')):
+                    return
+                payloads.append(response.json())
+            except Exception:
+                # ボディ取得前に遷移した場合などは無視する
+                pass
+
+        page.on('response', on_response)
+        return payloads
+
+    def _cached_failure(self, cache_key: str, recheck: bool) -> Optional[Dict[str, Any]]:
+        """
+        ネガティブキャッシュ（404・内容なしの記録）を確認
+
+        Args:
+            cache_key: スクレイピングキャッシュのキー
+            recheck: 記録を無視して再確認する
+
+        Returns:
+            取得失敗の記録（再確認する場合・記録がない場合は None）
+        """
+        if recheck:
+            return None
+        failure = self.cache_service.get_negative(cache_key)
+        if failure:
+            print(f"⏭️  取得失敗のキャッシュ: {cache_key} ({failure['reason']}、{failure['failed_at']})")
+        return failure
+
+    def _record_failure(self, cache_key: str, reason: str) -> None:
+        """404（'not_found'）・内容なし（'empty'）をネガティブキャッシュに記録"""
+        self.cache_service.set_negative(cache_key, reason, self.negative_cache_ttl_seconds)
 
     def get_competition_details(
         self,
         comp_id: str,
-        force_refresh: bool = False
+        force_refresh: bool = False,
+        recheck_missing: bool = False
     ) -> Optional[Dict[str, Any]]:
         """
         コンペティションの詳細情報を取得
@@ -41,6 +615,7 @@ class ScraperService:
         Args:
             comp_id: コンペティション ID
             force_refresh: キャッシュを無視して再取得
+            recheck_missing: 取得失敗のキャッシュ（404・内容なし）を無視して再確認
 
         Returns:
             詳細情報の辞書（取得失敗時は None）
@@ -50,6 +625,8 @@ class ScraperService:
             cached_data = self.cache_service.get_scraped_data(comp_id)
             if cached_data:
                 return cached_data
+        if self._cached_failure(comp_id, force_refresh or recheck_missing):
+            return None
 
         # スクレイピング実行
         print(f"🌐 スクレイピング開始: {comp_id}")
@@ -69,6 +646,8 @@ class ScraperService:
                 print(f"⚠️  スクレイピング失敗: {comp_id}")
                 return None
 
+        except CircuitOpenError:
+            raise
         except Exception as e:
             print(f"❌ スクレイピングエラー ({comp_id}): {e}")
             return None
@@ -86,29 +665,37 @@ class ScraperService:
         url = f"{self.base_url}/{comp_id}"
 
         try:
-            with sync_playwright() as p:
+            with self._playwright() as p:
                 # ブラウザ起動
-                browser = p.chromium.launch(headless=self.headless)
-                page = browser.new_page()
+                browser = self._launch_browser(p)
+                page = self._new_page(browser)
 
                 # ページに移動（タイムアウト30秒）
-                response = page.goto(url, wait_until='networkidle', timeout=30000)
+                response = self._goto(page, url, wait_until='networkidle', timeout=30000)
 
                 # 404チェック
                 if response and response.status == 404:
                     print(f"❌ コンペティションが見つかりません: {comp_id}")
                     browser.close()
+                    self._record_failure(comp_id, 'not_found')
                     return None
 
                 # JavaScriptレンダリング完了を待機
                 page.wait_for_load_state('networkidle')
-                time.sleep(2)  # 追加の安全待機
+                self._wait_for_render(page)  # 追加の安全待機
+                self._save_fixture(page)
 
                 # ページの主要コンテンツ領域のテキストを取得
                 # より簡潔なアプローチ: HTMLパースせずにテキスト直接取得
                 page_text = page.inner_text('#site-content')
+                self._archive_page(url, 'competition_tab', comp_id, page=page)
                 browser.close()
 
+                if not page_text.strip():
+                    print(f"❌ コンテンツがありません: {comp_id}")
+                    self._record_failure(comp_id, 'empty')
+                    return None
+
                 # 結果を返す（LLMで処理するための全テキスト）
                 result = {
                     'comp_id': comp_id,
@@ -120,6 +707,8 @@ class ScraperService:
                 print(f"✅ スクレイピング成功: {comp_id} ({len(page_text)} 文字)")
                 return result
 
+        except CircuitOpenError:
+            raise
         except Exception as e:
             print(f"❌ スクレイピングエラー ({comp_id}): {e}")
             return None
@@ -129,7 +718,8 @@ class ScraperService:
         self,
         comp_id: str,
         tab: str = "",
-        force_refresh: bool = False
+        force_refresh: bool = False,
+        recheck_missing: bool = False
     ) -> Optional[Dict[str, Any]]:
         """
         指定したタブのコンテンツを取得
@@ -139,6 +729,7 @@ class ScraperService:
             tab: タブ名（'data', 'discussion', 'code', 'leaderboard'）
                  空文字列の場合は Overview タブ
             force_refresh: キャッシュを無視して再取得
+            recheck_missing: 取得失敗のキャッシュ（404・内容なし）を無視して再確認
 
         Returns:
             タブコンテンツの辞書（取得失敗時は None）
@@ -151,6 +742,8 @@ class ScraperService:
             cached_data = self.cache_service.get_scraped_data(cache_key)
             if cached_data:
                 return cached_data
+        if self._cached_failure(cache_key, force_refresh or recheck_missing):
+            return None
 
         # スクレイピング実行
         print(f"🌐 スクレイピング開始: {comp_id}/{tab or 'overview'}")
@@ -159,28 +752,36 @@ class ScraperService:
             # URL構築
             url = f"{self.base_url}/{comp_id}/{tab}" if tab else f"{self.base_url}/{comp_id}"
 
-            with sync_playwright() as p:
+            with self._playwright() as p:
                 # ブラウザ起動
-                browser = p.chromium.launch(headless=self.headless)
-                page = browser.new_page()
+                browser = self._launch_browser(p)
+                page = self._new_page(browser)
 
                 # ページに移動
-                response = page.goto(url, wait_until='networkidle', timeout=30000)
+                response = self._goto(page, url, wait_until='networkidle', timeout=30000)
 
                 # 404チェック
                 if response and response.status == 404:
                     print(f"❌ ページが見つかりません: {comp_id}/{tab or 'overview'}")
                     browser.close()
+                    self._record_failure(cache_key, 'not_found')
                     return None
 
                 # JavaScriptレンダリング完了を待機
                 page.wait_for_load_state('networkidle')
-                time.sleep(2)  # 追加の安全待機
+                self._wait_for_render(page)  # 追加の安全待機
+                self._save_fixture(page)
 
                 # ページのテキストを取得
                 page_text = page.inner_text('#site-content')
+                self._archive_page(url, 'competition_tab', comp_id, page=page)
                 browser.close()
 
+                if not page_text.strip():
+                    print(f"❌ コンテンツがありません: {comp_id}/{tab or 'overview'}")
+                    self._record_failure(cache_key, 'empty')
+                    return None
+
                 # 結果を作成
                 result = {
                     'comp_id': comp_id,
@@ -200,6 +801,8 @@ class ScraperService:
                 print(f"✅ スクレイピング成功: {comp_id}/{tab or 'overview'} ({len(page_text)} 文字)")
                 return result
 
+        except CircuitOpenError:
+            raise
         except Exception as e:
             print(f"❌ スクレイピングエラー ({comp_id}/{tab or 'overview'}): {e}")
             return None
@@ -295,6 +898,36 @@ class ScraperService:
 
         return None
 
+    def _resolve_author_tier(self, item, author: str, idx: int) -> tuple[Optional[str], Optional[str]]:
+        """
+        投稿者の称号と称号色を取得
+
+        有効期間内に判定済みの投稿者は称号キャッシュから返し、
+        アイテム内のテキスト・SVG探索を省略する
+
+        Args:
+            item: ディスカッションアイテムのlocator
+            author: 投稿者名
+            idx: ログ表示用の番号
+
+        Returns:
+            (称号, 称号色)
+        """
+        known = self.author_tiers.get(author)
+        if known:
+            return known.tier, known.tier_color
+
+        author_tier = self._get_author_tier_from_item(item, author)
+        if author_tier:
+            print(f"    [{idx}] {author}: {author_tier}")
+
+        tier_color = self._get_tier_color_from_item(item)
+        if tier_color:
+            print(f"    [{idx}] Tier color: {tier_color}")
+
+        self.author_tiers.remember(author, author_tier, tier_color)
+        return author_tier, tier_color
+
     def _get_author_tier(self, page: Page, author_link_locator) -> Optional[str]:
         """
         投稿者にホバーして称号（tier）を取得
@@ -362,22 +995,79 @@ class ScraperService:
 
         return None
 
+    @staticmethod
+    def _clean_listing_title(raw_title: str, author: Optional[str]) -> str:
+        """
+        一覧アイテムのリンクテキストからタイトルを取り出す
+
+        パターン: "[Title][Author] · Last comment..." or "[Title][Author]"
+
+        Args:
+            raw_title: リンクのテキスト
+            author: 投稿者名
+
+        Returns:
+            タイトル
+        """
+        title = raw_title
+
+        # " · Last comment..." 以降を削除
+        if ' · Last comment' in title:
+            title = title.split(' · Last comment')[0]
+
+        # 末尾の作者名を削除（作者名が取得できている場合）
+        if author and title.endswith(author):
+            title = title[:-len(author)].strip()
+
+        return title.strip()
+
+    def _has_listing_changes(
+        self,
+        page_items: list[Dict[str, Any]],
+        known_items: Dict[str, Dict[str, Any]]
+    ) -> bool:
+        """
+        1ページ分のアイテムに新規・変化ありのものが含まれるか
+
+        Args:
+            page_items: そのページで取得したアイテム
+            known_items: 既存行の索引 {url: 比較用フィールド}
+
+        Returns:
+            bool: 1件でも新規・変化ありならTrue
+        """
+        return any(
+            is_listing_item_changed(item, known_items.get(item['url']))
+            for item in page_items
+        )
+
     def get_discussions(
         self,
         comp_id: str,
         max_pages: int = 1,
-        force_refresh: bool = False
+        force_refresh: bool = False,
+        known_items: Optional[Dict[str, Dict[str, Any]]] = None
     ) -> Optional[list[Dict[str, Any]]]:
         """
         コンペティションのディスカッション一覧を取得（Discussions + Writeups の両方）
 
-        Kaggleは自動的に投票数順にソートされているため、
-        1ページ目を取得すれば最も重要なディスカッションが得られる
+        全件取得は投票数順のため、1ページ目を取得すれば最も重要なディスカッションが得られる
+
+        両タブの1ページ目は scrape_competition_bundle で並列に取得し、2ページ目以降は
+        1つのブラウザでタブごとに順に取得する（1ページ目を取得できなかったタブは1ページ目から）。
+        browser_worker の実行中は、メモリ上限・リサイクルを効かせるため全ページをワーカーのブラウザで順に取得する
+
+        known_items を渡すと差分同期モードになり、一覧を新しいコメント順（sort=recent-comments）で
+        取得して、新規・変化ありのアイテムが1件もないページに到達した時点でそのタブのページ送りを
+        打ち切る（静かなコンペは両タブの1ページ目の並列取得だけで済む）。投票数順では投票0の
+        新規スレッドが最後のページに並ぶため、先頭ページで打ち切ると新規投稿を見落とす。
+        差分同期の1ページ目はバンドルのキャッシュを使わない
 
         Args:
             comp_id: コンペティション ID
             max_pages: 取得する最大ページ数（デフォルト1ページ）
             force_refresh: キャッシュを無視して再取得
+            known_items: 差分同期用の既存行索引 {url: 比較用フィールド}
 
         Returns:
             ディスカッション情報のリスト（Discussions + Writeups）
@@ -392,174 +1082,243 @@ class ScraperService:
                 print(f"✓ キャッシュから取得: {comp_id} discussions")
                 return cached_data.get('discussions', cached_data)
 
-        base_url = f"{self.base_url}/{comp_id}/discussion?sort=votes"
+        # 差分同期は新しいコメント順、全件取得は投票数順
+        incremental = known_items is not None
+        suffix = '_recent' if incremental else ''
 
-        # Discussions タブと Writeups タブの両方を取得
+        # Discussions タブと Writeups タブの両方を取得（種別, バンドルのタブ, URL）
         tabs = [
-            ('discussion', base_url),
-            ('writeup', f"{base_url}&tab=writeups")
+            (tab_type, bundle_tab, f"{self.base_url}/{comp_id}/{BUNDLE_TABS[bundle_tab]}")
+            for tab_type, bundle_tab in (('discussion', f"discussion{suffix}"), ('writeup', f"writeups{suffix}"))
         ]
 
         try:
-            with sync_playwright() as p:
-                browser: Browser = p.chromium.launch(headless=self.headless)
-                page: Page = browser.new_page()
+            all_discussions = []
+            seen_urls = set()  # 重複チェック用
+
+            # 1ページ目は両タブを並列に取得（browser_worker 実行中はワーカーのブラウザで順に取得）
+            first_pages = {}
+            if self._worker is None:
+                first_pages = self.scrape_competition_bundle(
+                    comp_id, tabs=[bundle_tab for _, bundle_tab, _ in tabs], force_refresh=force_refresh or incremental
+                )
 
-                all_discussions = []
-                seen_urls = set()  # 重複チェック用
+            # 2ページ目以降（1ページ目を取得できなかったタブは1ページ目から）は順に取得
+            remaining = []
+            for tab_type, bundle_tab, tab_url in tabs:
+                first_page = first_pages.get(bundle_tab)
+                if first_page is None:
+                    remaining.append((tab_type, tab_url, 1))
+                    continue
+
+                page_start = len(all_discussions)
+                for item in first_page['items']:
+                    if item['url'] in seen_urls:
+                        continue
+                    seen_urls.add(item['url'])
+                    all_discussions.append(item)
+                    self.author_tiers.remember(item['author'], item['author_tier'], item['tier_color'])
+                print(f"📋 {tab_type.upper()} ページ1: {len(first_page['items'])}件のディスカッションを取得")
+
+                if not first_page['items'] or max_pages == 1:
+                    continue
+                # 差分同期: 新規・変化なしのページで打ち切り
+                if incremental and not self._has_listing_changes(all_discussions[page_start:], known_items):
+                    print("  ページ1: 新規・変更なし、以降のページをスキップ")
+                    continue
+                remaining.append((tab_type, tab_url, 2))
+
+            if remaining:
+                self._page_discussion_tabs(comp_id, remaining, max_pages, known_items, all_discussions, seen_urls)
+
+            print(f"\n取得完了: {len(all_discussions)}件 ({self.author_tiers.stats_line()})")
+
+            # 投票数でソート（Kaggleのページと同じ順序を維持）
+            sorted_discussions = sorted(all_discussions, key=lambda x: x['vote_count'], reverse=True)
+
+            # キャッシュに保存（差分同期の結果は一部のページのみなので保存しない）
+            if sorted_discussions and not incremental:
+                result = {
+                    'comp_id': comp_id,
+                    'max_pages': max_pages,
+                    'scraped_at': datetime.now().isoformat(),
+                    'discussions': sorted_discussions
+                }
+                self.cache_service.set_scraped_data(
+                    cache_key,
+                    result,
+                    ttl_days=self.cache_ttl_days
+                )
 
-                # 各タブをスクレイピング
-                for tab_type, tab_url in tabs:
-                    print(f"\n📋 {tab_type.upper()} タブをスクレイピング中...")
+            print(f"✓ {len(sorted_discussions)}件のディスカッションを保存しました")
+            return sorted_discussions
 
-                    for page_num in range(1, max_pages + 1):
-                        page_url = f"{tab_url}&page={page_num}" if page_num > 1 else tab_url
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            print(f"✗ スクレイピング失敗 ({comp_id} discussions): {e}")
+            import traceback
+            traceback.print_exc()
+            return None
 
-                        page.goto(page_url, wait_until="networkidle", timeout=30000)
-                        page.wait_for_timeout(2000)
+    def _page_discussion_tabs(
+        self,
+        comp_id: str,
+        tabs: list[tuple[str, str, int]],
+        max_pages: int,
+        known_items: Optional[Dict[str, Dict[str, Any]]],
+        all_discussions: list[Dict[str, Any]],
+        seen_urls: set
+    ) -> None:
+        """
+        ディスカッション一覧のページを1つのブラウザで順に取得（all_discussions に追加）
 
-                        # Playwrightのlocator APIを使用
-                        discussion_items = page.locator('li.MuiListItem-root').all()
+        Args:
+            comp_id: コンペティション ID
+            tabs: [(種別, タブのURL, 開始ページ)]
+            max_pages: 取得する最大ページ数
+            known_items: 差分同期用の既存行索引（None の場合は全ページ取得）
+            all_discussions: 取得したアイテムの追加先
+            seen_urls: 追加済みのURL（重複チェック用）
+        """
+        with self._playwright() as p:
+            browser = self._launch_browser(p)
+            page: Page = self._new_page(browser)
+            json_payloads = self._attach_json_capture(page)
+
+            for tab_type, tab_url, first_page_num in tabs:
+                print(f"\n📋 {tab_type.upper()} タブをスクレイピング中...")
+
+                for page_num in range(first_page_num, max_pages + 1):
+                    page_url = f"{tab_url}&page={page_num}" if page_num > 1 else tab_url
+
+                    json_payloads.clear()
+                    self._goto(page, page_url, wait_until="networkidle", timeout=30000, json_payloads=json_payloads)
+                    page_start = len(all_discussions)
+
+                    # JSONキャプチャ: 取得できればDOM解析とツールチップ待機を省略
+                    json_items = extract_discussion_items(json_payloads)
+                    if json_items:
+                        self._archive_page(page_url, 'discussion_listing', comp_id, json_payloads=json_payloads)
+                        print(f"  ページ{page_num}: JSONから{len(json_items)}件のディスカッションを取得")
+                        for json_item in json_items:
+                            # ピン留めは除外、URL重複はスキップ（DOM解析と同じ扱い）
+                            if json_item['is_pinned'] or json_item['url'] in seen_urls:
+                                continue
+                            seen_urls.add(json_item['url'])
+                            all_discussions.append(json_item)
+                            self.author_tiers.remember(json_item['author'], json_item['author_tier'], json_item['tier_color'])
 
-                        if not discussion_items:
-                            print(f"  ページ{page_num}: ディスカッションが見つかりません")
+                        # 差分同期: 新規・変化なしのページで打ち切り
+                        if known_items is not None and not self._has_listing_changes(all_discussions[page_start:], known_items):
+                            print(f"  ページ{page_num}: 新規・変更なし、以降のページをスキップ")
                             break
+                        continue
 
-                        print(f"  ページ{page_num}: {len(discussion_items)}件のディスカッションを処理中...")
+                    self._wait_for_render(page)
+                    self._save_fixture(page)
+                    self._archive_page(page_url, 'discussion_listing', comp_id, page=page)
 
-                        for idx, item in enumerate(discussion_items, 1):
-                            try:
-                                # タイトルとURL（/discussion/ または /writeups/ の両方に対応）
-                                title_link = item.locator('a[href*="/competitions/"]').first
-                                if title_link.count() == 0:
-                                    continue
+                    # Playwrightのlocator APIを使用
+                    discussion_items = page.locator('li.MuiListItem-root').all()
 
-                                raw_title = title_link.text_content(timeout=3000).strip()
-                                href = title_link.get_attribute('href')
-                                discussion_url = f"https://www.kaggle.com{href}" if href.startswith('/') else href
+                    if not discussion_items:
+                        print(f"  ページ{page_num}: ディスカッションが見つかりません")
+                        break
 
-                                # URLから category を判定
-                                category = 'writeup' if '/writeups/' in discussion_url else 'discussion'
+                    print(f"  ページ{page_num}: {len(discussion_items)}件のディスカッションを処理中...")
 
-                                # 投稿者情報
-                                author = None
-                                author_tier = None
-                                tier_color = None
-                                # プロフィールリンクを探す（aria-labelに's profileを含むもの）
-                                author_links = item.locator('a[aria-label*="profile"]').all()
+                    for idx, item in enumerate(discussion_items, 1):
+                        try:
+                            # タイトルとURL（/discussion/ または /writeups/ の両方に対応）
+                            title_link = item.locator('a[href*="/competitions/"]').first
+                            if title_link.count() == 0:
+                                continue
 
-                                for author_link in author_links:
-                                    link_href = author_link.get_attribute('href')
-                                    aria_label = author_link.get_attribute('aria-label')
+                            raw_title = title_link.text_content(timeout=3000).strip()
+                            href = title_link.get_attribute('href')
+                            discussion_url = f"https://www.kaggle.com{href}" if href.startswith('/') else href
 
-                                    if aria_label and "'s profile" in aria_label:
-                                        author = aria_label.split("'s profile")[0]
-                                        print(f"    [{idx}] Author: {author}")
+                            # URLから category を判定
+                            category = 'writeup' if '/writeups/' in discussion_url else 'discussion'
 
-                                        # 称号を取得（新しい方法：ディスカッションアイテム内を探す）
-                                        author_tier = self._get_author_tier_from_item(item, author)
-                                        if author_tier:
-                                            print(f"    [{idx}] {author}: {author_tier}")
+                            # 投稿者情報
+                            author = None
+                            author_tier = None
+                            tier_color = None
+                            # プロフィールリンクを探す（aria-labelに's profileを含むもの）
+                            author_links = item.locator('a[aria-label*="profile"]').all()
+
+                            for author_link in author_links:
+                                link_href = author_link.get_attribute('href')
+                                aria_label = author_link.get_attribute('aria-label')
 
-                                        # 称号色を取得
-                                        tier_color = self._get_tier_color_from_item(item)
-                                        if tier_color:
-                                            print(f"    [{idx}] Tier color: {tier_color}")
+                                if aria_label and "'s profile" in aria_label:
+                                    author = aria_label.split("'s profile")[0]
+                                    print(f"    [{idx}] Author: {author}")
+
+                                    # 称号・称号色を取得（既知の投稿者はキャッシュから）
+                                    author_tier, tier_color = self._resolve_author_tier(item, author, idx)
+                                    break
+
+                            # 投票数
+                            vote_count = 0
+                            vote_locator = item.locator('span[aria-label*="vote"]').first
+                            if vote_locator.count() > 0:
+                                vote_label = vote_locator.get_attribute('aria-label')
+                                if vote_label:
+                                    try:
+                                        vote_count = int(vote_label.split()[0])
+                                    except (ValueError, IndexError):
+                                        pass
+
+                            # コメント数
+                            comment_count = 0
+                            comment_locators = item.locator('span').all()
+                            for comment_loc in comment_locators:
+                                text = comment_loc.text_content()
+                                if text and 'comment' in text.lower():
+                                    try:
+                                        comment_count = int(text.split()[0])
                                         break
+                                    except (ValueError, IndexError):
+                                        pass
 
-                                # 投票数
-                                vote_count = 0
-                                vote_locator = item.locator('span[aria-label*="vote"]').first
-                                if vote_locator.count() > 0:
-                                    vote_label = vote_locator.get_attribute('aria-label')
-                                    if vote_label:
-                                        try:
-                                            vote_count = int(vote_label.split()[0])
-                                        except (ValueError, IndexError):
-                                            pass
-
-                                # コメント数
-                                comment_count = 0
-                                comment_locators = item.locator('span').all()
-                                for comment_loc in comment_locators:
-                                    text = comment_loc.text_content()
-                                    if text and 'comment' in text.lower():
-                                        try:
-                                            comment_count = int(text.split()[0])
-                                            break
-                                        except (ValueError, IndexError):
-                                            pass
-
-                                # ピン留めチェック - ピン留めは除外
-                                is_pinned = item.locator('text=push_pin').count() > 0
-                                if is_pinned:
-                                    continue  # Pinned topicsはスキップ（ユーザー要望）
-
-                                # タイトルのクリーニング
-                                # パターン: "[Title][Author] · Last comment..." or "[Title][Author]"
-                                title = raw_title
-
-                                # " · Last comment..." 以降を削除
-                                if ' · Last comment' in title:
-                                    title = title.split(' · Last comment')[0]
-
-                                # 末尾の作者名を削除（作者名が取得できている場合）
-                                if author and title.endswith(author):
-                                    title = title[:-len(author)].strip()
-
-                                # その他のクリーニング（念のため）
-                                title = title.strip()
-
-                                # 重複チェック: URLが既に追加済みの場合はスキップ
-                                if discussion_url in seen_urls:
-                                    continue
-
-                                seen_urls.add(discussion_url)
-                                all_discussions.append({
-                                    'title': title,
-                                    'url': discussion_url,
-                                    'author': author,
-                                    'author_tier': author_tier,
-                                    'tier_color': tier_color,
-                                    'vote_count': vote_count,
-                                    'comment_count': comment_count,
-                                    'category': category,  # URLから判定した category を設定
-                                    'is_pinned': False,  # ピン留めは除外しているので常にFalse
-                                })
-
-                            except Exception as e:
-                                print(f"    ディスカッションアイテム解析エラー [{idx}]: {e}")
-                                continue
+                            # ピン留めチェック - ピン留めは除外
+                            is_pinned = item.locator('text=push_pin').count() > 0
+                            if is_pinned:
+                                continue  # Pinned topicsはスキップ（ユーザー要望）
 
-                browser.close()
+                            # タイトルのクリーニング
+                            title = self._clean_listing_title(raw_title, author)
 
-                print(f"\n取得完了: {len(all_discussions)}件")
+                            # 重複チェック: URLが既に追加済みの場合はスキップ
+                            if discussion_url in seen_urls:
+                                continue
 
-                # 投票数でソート（Kaggleのページと同じ順序を維持）
-                sorted_discussions = sorted(all_discussions, key=lambda x: x['vote_count'], reverse=True)
+                            seen_urls.add(discussion_url)
+                            all_discussions.append({
+                                'title': title,
+                                'url': discussion_url,
+                                'author': author,
+                                'author_tier': author_tier,
+                                'tier_color': tier_color,
+                                'vote_count': vote_count,
+                                'comment_count': comment_count,
+                                'category': category,  # URLから判定した category を設定
+                                'is_pinned': False,  # ピン留めは除外しているので常にFalse
+                            })
 
-                # キャッシュに保存
-                if sorted_discussions:
-                    result = {
-                        'comp_id': comp_id,
-                        'max_pages': max_pages,
-                        'scraped_at': datetime.now().isoformat(),
-                        'discussions': sorted_discussions
-                    }
-                    self.cache_service.set_scraped_data(
-                        cache_key,
-                        result,
-                        ttl_days=self.cache_ttl_days
-                    )
+                        except Exception as e:
+                            print(f"    ディスカッションアイテム解析エラー [{idx}]: {e}")
+                            continue
 
-                print(f"✓ {len(sorted_discussions)}件のディスカッションを保存しました")
-                return sorted_discussions
+                    # 差分同期: 新規・変化なしのページで打ち切り
+                    if known_items is not None and not self._has_listing_changes(all_discussions[page_start:], known_items):
+                        print(f"  ページ{page_num}: 新規・変更なし、以降のページをスキップ")
+                        break
 
-        except Exception as e:
-            print(f"✗ スクレイピング失敗 ({comp_id} discussions): {e}")
-            import traceback
-            traceback.print_exc()
-            return None
+            browser.close()
 
     def get_notebooks(
         self,
@@ -591,9 +1350,10 @@ class ScraperService:
         base_url = f"{self.base_url}/{comp_id}/code?sortBy=voteCount"
 
         try:
-            with sync_playwright() as p:
-                browser: Browser = p.chromium.launch(headless=self.headless)
-                page: Page = browser.new_page()
+            with self._playwright() as p:
+                browser = self._launch_browser(p)
+                page: Page = self._new_page(browser)
+                json_payloads = self._attach_json_capture(page)
 
                 all_notebooks = []
                 seen_urls = set()  # 重複チェック用
@@ -603,8 +1363,24 @@ class ScraperService:
                 for page_num in range(1, max_pages + 1):
                     page_url = f"{base_url}&page={page_num}" if page_num > 1 else base_url
 
-                    page.goto(page_url, wait_until="networkidle", timeout=30000)
-                    page.wait_for_timeout(2000)
+                    json_payloads.clear()
+                    self._goto(page, page_url, wait_until="networkidle", timeout=30000, json_payloads=json_payloads)
+
+                    # JSONキャプチャ: 取得できればDOM解析を省略
+                    json_items = extract_notebook_items(json_payloads)
+                    if json_items:
+                        self._archive_page(page_url, 'notebook_listing', comp_id, json_payloads=json_payloads)
+                        print(f"  ページ{page_num}: JSONから{len(json_items)}件のノートブックを取得")
+                        for json_item in json_items:
+                            if json_item['url'] in seen_urls:
+                                continue
+                            seen_urls.add(json_item['url'])
+                            all_notebooks.append(json_item)
+                        continue
+
+                    self._wait_for_render(page)
+                    self._save_fixture(page)
+                    self._archive_page(page_url, 'notebook_listing', comp_id, page=page)
 
                     # ノートブックアイテムを探す（実際のHTML構造に合わせる）
                     # 'km-listitem--large' クラスを持つdiv要素
@@ -739,6 +1515,8 @@ class ScraperService:
                 print(f"✓ {len(sorted_notebooks)}件のノートブックを保存しました")
                 return sorted_notebooks
 
+        except CircuitOpenError:
+            raise
         except Exception as e:
             print(f"✗ スクレイピング失敗 ({comp_id} notebooks): {e}")
             import traceback
@@ -748,7 +1526,8 @@ class ScraperService:
     def get_discussion_detail(
         self,
         discussion_url: str,
-        force_refresh: bool = False
+        force_refresh: bool = False,
+        recheck_missing: bool = False
     ) -> Optional[Dict[str, Any]]:
         """
         個別ディスカッションの詳細を取得
@@ -756,6 +1535,7 @@ class ScraperService:
         Args:
             discussion_url: ディスカッションのURL
             force_refresh: キャッシュを無視して再取得
+            recheck_missing: 取得失敗のキャッシュ（404・本文なし）を無視して再確認
 
         Returns:
             ディスカッション詳細の辞書（取得失敗時は None）
@@ -770,49 +1550,80 @@ class ScraperService:
             if cached_data:
                 print(f"✓ キャッシュから取得: {discussion_id}")
                 return cached_data
+        if self._cached_failure(cache_key, force_refresh or recheck_missing):
+            return None
 
         print(f"🌐 ディスカッション詳細スクレイピング: {discussion_id}")
 
         try:
-            with sync_playwright() as p:
-                browser: Browser = p.chromium.launch(headless=self.headless)
-                page: Page = browser.new_page()
-
-                # ページに移動
-                response = page.goto(discussion_url, wait_until="networkidle", timeout=30000)
-
-                # 404チェック
-                if response and response.status == 404:
-                    print(f"❌ ディスカッションが見つかりません: {discussion_url}")
-                    browser.close()
-                    return None
-
-                # JavaScriptレンダリング完了を待機
-                page.wait_for_load_state('networkidle')
-                time.sleep(2)
+            # まずHTTPで取得し、本文がなければ Playwright でレンダリング
+            def extract(html: str) -> Optional[str]:
+                content = self._extract_site_content(html)
+                if content:
+                    self._archive_page(discussion_url, 'discussion_detail', html=html)
+                    content = self._clean_content(discussion_url, html, content)
+                return content
+
+            content_text = self._fetch_static('discussion_detail', discussion_url, extract)
+            if content_text is STATIC_NOT_FOUND:
+                print(f"❌ ディスカッションが見つかりません: {discussion_url}")
+                self._record_failure(cache_key, 'not_found')
+                return None
 
-                # メインコンテンツを取得
-                content_text = page.inner_text('#site-content')
-                browser.close()
+            if content_text is None:
+                start = time.monotonic()
+                with self._playwright() as p:
+                    browser = self._launch_browser(p)
+                    page: Page = self._new_page(browser)
 
-                # 結果を作成
-                result = {
-                    'discussion_id': discussion_id,
-                    'url': discussion_url,
-                    'scraped_at': datetime.now().isoformat(),
-                    'content': content_text,
-                }
+                    # ページに移動
+                    response = self._goto(page, discussion_url, wait_until="networkidle", timeout=30000)
 
-                # キャッシュに保存
-                self.cache_service.set_scraped_data(
-                    cache_key,
-                    result,
-                    ttl_days=self.cache_ttl_days
-                )
+                    # 404チェック
+                    if response and response.status == 404:
+                        print(f"❌ ディスカッションが見つかりません: {discussion_url}")
+                        browser.close()
+                        self._record_failure(cache_key, 'not_found')
+                        return None
+
+                    # JavaScriptレンダリング完了を待機
+                    page.wait_for_load_state('networkidle')
+                    self._wait_for_render(page)  # 追加の安全待機
+                    self._save_fixture(page)
+
+                    # メインコンテンツを取得
+                    content_text = page.inner_text('#site-content')
+                    if content_text.strip():
+                        content_text = self._clean_content(discussion_url, page.content(), content_text)
+                    self._archive_page(discussion_url, 'discussion_detail', page=page)
+                    browser.close()
+                self.fetch_stats.record('discussion_detail', 'playwright', bool(content_text), time.monotonic() - start)
 
-                print(f"✓ 取得完了: {discussion_id} ({len(content_text)} 文字)")
-                return result
+            if not content_text.strip():
+                print(f"❌ 本文がありません: {discussion_url}")
+                self._record_failure(cache_key, 'empty')
+                return None
 
+            # 結果を作成
+            result = {
+                'discussion_id': discussion_id,
+                'url': discussion_url,
+                'scraped_at': datetime.now().isoformat(),
+                'content': content_text,
+            }
+
+            # キャッシュに保存
+            self.cache_service.set_scraped_data(
+                cache_key,
+                result,
+                ttl_days=self.cache_ttl_days
+            )
+
+            print(f"✓ 取得完了: {discussion_id} ({len(content_text)} 文字)")
+            return result
+
+        except CircuitOpenError:
+            raise
         except Exception as e:
             print(f"✗ ディスカッション詳細スクレイピング失敗 ({discussion_id}): {e}")
             import traceback
@@ -850,23 +1661,24 @@ class ScraperService:
         print(f"スクレイピング: {url}")
 
         try:
-            with sync_playwright() as p:
-                browser: Browser = p.chromium.launch(headless=self.headless)
-                page: Page = browser.new_page()
+            with self._playwright() as p:
+                browser = self._launch_browser(p)
+                page: Page = self._new_page(browser)
 
                 all_writeups = []
 
                 for page_num in range(1, max_pages + 1):
                     page_url = f"{url}?page={page_num}" if page_num > 1 else url
 
-                    response = page.goto(page_url, wait_until="networkidle", timeout=30000)
+                    response = self._goto(page, page_url, wait_until="networkidle", timeout=30000)
 
                     # 404チェック（Writeupsページがない場合）
                     if response and response.status == 404:
                         print(f"  Writeupsページが見つかりません（コンペが古い可能性）")
                         break
 
-                    page.wait_for_timeout(2000)
+                    self._wait_for_render(page)
+                    self._save_fixture(page)
 
                     # Playwrightのlocator APIを使用（Discussionsと同じ構造）
                     writeup_items = page.locator('li.MuiListItem-root').all()
@@ -900,15 +1712,8 @@ class ScraperService:
                                     author = aria_label.split("'s profile")[0]
                                     print(f"    [{idx}] Author: {author}")
 
-                                    # 称号を取得
-                                    author_tier = self._get_author_tier_from_item(item, author)
-                                    if author_tier:
-                                        print(f"    [{idx}] {author}: {author_tier}")
-
-                                    # 称号色を取得
-                                    tier_color = self._get_tier_color_from_item(item)
-                                    if tier_color:
-                                        print(f"    [{idx}] Tier color: {tier_color}")
+                                    # 称号・称号色を取得（既知の投稿者はキャッシュから）
+                                    author_tier, tier_color = self._resolve_author_tier(item, author, idx)
                                     break
 
                             # 投票数
@@ -935,12 +1740,7 @@ class ScraperService:
                                         pass
 
                             # タイトルのクリーニング
-                            title = raw_title
-                            if ' · Last comment' in title:
-                                title = title.split(' · Last comment')[0]
-                            if author and title.endswith(author):
-                                title = title[:-len(author)].strip()
-                            title = title.strip()
+                            title = self._clean_listing_title(raw_title, author)
 
                             all_writeups.append({
                                 'title': title,
@@ -960,7 +1760,7 @@ class ScraperService:
 
                 browser.close()
 
-                print(f"\n取得完了: {len(all_writeups)}件")
+                print(f"\n取得完了: {len(all_writeups)}件 ({self.author_tiers.stats_line()})")
 
                 # 投票数でソート
                 sorted_writeups = sorted(all_writeups, key=lambda x: x['vote_count'], reverse=True)
@@ -982,6 +1782,8 @@ class ScraperService:
                 print(f"✓ {len(sorted_writeups)}件のWriteupsを保存しました")
                 return sorted_writeups
 
+        except CircuitOpenError:
+            raise
         except Exception as e:
             print(f"✗ Writeupsスクレイピング失敗 ({comp_id}): {e}")
             import traceback
@@ -991,7 +1793,8 @@ class ScraperService:
     def scrape_competition_metadata(
         self,
         comp_id: str,
-        force_refresh: bool = False
+        force_refresh: bool = False,
+        recheck_missing: bool = False
     ) -> Optional[Dict[str, Any]]:
         """
         コンペページから構造化メタデータを取得
@@ -999,6 +1802,7 @@ class ScraperService:
         Args:
             comp_id: コンペティションID
             force_refresh: キャッシュを無視して再取得
+            recheck_missing: 取得失敗のキャッシュ（404・内容なし）を無視して再確認
 
         Returns:
             メタデータ辞書（id, title, description, start_date, end_date, status, metric）
@@ -1011,40 +1815,50 @@ class ScraperService:
             cached_data = self.cache_service.get_scraped_data(cache_key)
             if cached_data:
                 return cached_data
+        if self._cached_failure(cache_key, force_refresh or recheck_missing):
+            return None
 
         url = f"{self.base_url}/{comp_id}"
         print(f"🌐 メタデータ取得: {comp_id}")
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=self.headless)
-                page = browser.new_page()
+            with self._playwright() as p:
+                browser = self._launch_browser(p)
+                page = self._new_page(browser)
 
                 # ページに移動
-                response = page.goto(url, wait_until='networkidle', timeout=30000)
+                response = self._goto(page, url, wait_until='networkidle', timeout=30000)
 
                 # 404チェック
                 if response and response.status == 404:
                     print(f"❌ コンペが見つかりません: {comp_id}")
                     browser.close()
+                    self._record_failure(cache_key, 'not_found')
                     return None
 
                 page.wait_for_load_state('networkidle')
-                time.sleep(2)
+                self._wait_for_render(page)  # 追加の安全待機
+                self._save_fixture(page)
 
                 # HTMLを取得してパース
                 html = page.content()
-                soup = BeautifulSoup(html, 'html.parser')
+                soup = parse_html(html)
 
                 # 1. タイトル
                 title = None
-                h1 = soup.find('h1')
+                h1 = soup.select_one('h1')
                 if h1:
                     title = h1.get_text().strip()
 
+                if not title:
+                    print(f"❌ コンペのタイトルがありません: {comp_id}")
+                    browser.close()
+                    self._record_failure(cache_key, 'empty')
+                    return None
+
                 # 2. 説明文（最初の段落）
                 description = None
-                p_tags = soup.find_all('p')
+                p_tags = soup.select('p')
                 for p in p_tags:
                     text = p.get_text().strip()
                     if len(text) > 50:  # 十分な長さの段落を探す
@@ -1115,29 +1929,312 @@ class ScraperService:
                 print(f"✓ {comp_id}: {title}")
                 return result
 
+        except CircuitOpenError:
+            raise
         except Exception as e:
             print(f"❌ メタデータ取得エラー ({comp_id}): {e}")
             import traceback
             traceback.print_exc()
             return None
 
+    def _parse_competition_list_html(self, html: str, include_details: bool) -> list:
+        """
+        コンペ一覧ページのHTMLからコンペを抽出
+
+        Args:
+            html: ページのHTML
+            include_details: タイトル・概要も含めて返すか
+
+        Returns:
+            include_details=False: コンペIDのリスト
+            include_details=True: 詳細情報を含む辞書のリスト
+        """
+        soup = parse_html(html)
+
+        if not include_details:
+            # IDのみ取得（従来の方法）
+            page_comps = set()
+            for link in soup.select('a[href^="/competitions/"]'):
+                href = link['href']
+                comp_id = href.replace('/competitions/', '').split('/')[0].split('?')[0]
+                if comp_id:
+                    page_comps.add(comp_id)
+            return sorted(page_comps)
+
+        # 詳細情報付きで取得
+        # コンペカードを探す（各コンペは特定のdiv構造内にある）
+        comp_cards = soup.select('div[class*="sc-kSaXSp"]')
+
+        page_comps_detailed = []
+        for card in comp_cards:
+            # タイトル（最初のdivまたはspan）
+            title_elem = card.select_one('div[class*="sc-kCuUfV"]')
+            if not title_elem:
+                title_elem = card.select_one('span[class*="sc-kCuUfV"]')
+
+            title = title_elem.get_text().strip() if title_elem else None
+
+            # 概要（説明文のspan）
+            desc_spans = card.select('span[class*="sc-eqNDNG"][class*="sc-fYRIQK"]')
+            description = None
+            for span in desc_spans:
+                text = span.get_text().strip()
+                # "Featured · Code Competition" のような行は除外
+                if text and '·' not in text and len(text) > 20:
+                    description = text
+                    break
+
+            # コンペIDをリンクから取得
+            # （祖先方向はCSSセレクタで辿れないため find_parents で探す）
+            link = next(
+                (a for a in card.find_parents('a') if '/competitions/' in a.get('href', '')),
+                None
+            )
+            if not link:
+                # カード内のリンクを探す
+                link = card.select_one('a[href*="/competitions/"]')
+
+            if link:
+                href = link.get('href', '')
+                comp_id = href.replace('/competitions/', '').split('/')[0].split('?')[0]
+
+                if comp_id and title:
+                    page_comps_detailed.append({
+                        'id': comp_id,
+                        'title': title,
+                        'description': description or '',
+                        'url': f"https://www.kaggle.com/competitions/{comp_id}"
+                    })
+
+        return page_comps_detailed
+
+    async def _fetch_competition_list_page_async(
+        self,
+        context_factory: Callable[[], Awaitable[Any]],
+        url: str,
+        include_details: bool
+    ) -> list:
+        """
+        コンペ一覧の1ページを Playwright（async API）で取得
+
+        JSONキャプチャで取得できればHTML解析を省略し、HTMLの場合も固定の待機ではなく
+        コンペへのリンクが表示された時点で解析する
+
+        Args:
+            context_factory: 共有のブラウザコンテキストを返す関数（初回呼び出し時に起動）
+            url: 一覧ページのURL
+            include_details: タイトル・概要も含めて返すか
+
+        Returns:
+            _parse_competition_list_html と同じ形式のリスト
+        """
+        context = await context_factory()
+        page, api_responses = await self._new_page_async(context)
+        start = time.monotonic()
+        try:
+            response = await self._goto_async(page, url, api_responses, wait_until='networkidle', timeout=60000)
+
+            json_comps = extract_competition_items(api_responses)
+            if json_comps:
+                self.fetch_stats.record('competitions_list', 'playwright', True, time.monotonic() - start)
+                if include_details:
+                    return [{k: v for k, v in comp.items() if k != 'deadline'} for comp in json_comps]
+                return [comp['id'] for comp in json_comps]
+
+            if self.fixture_mode != 'replay':
+                try:
+                    await page.wait_for_selector('a[href^="/competitions/"]', timeout=5000)
+                except Exception:
+                    pass  # リンクがないページ（一覧の終わり）
+                # 遅延読み込みのカードを表示
+                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                await page.wait_for_timeout(300)
+                await self._save_fixture_async(page, url, response, api_responses)
+
+            page_comps = self._parse_competition_list_html(await page.content(), include_details)
+            self.fetch_stats.record('competitions_list', 'playwright', bool(page_comps), time.monotonic() - start)
+            return page_comps
+        finally:
+            await page.close()
+
+    async def _crawl_competitions_list_async(
+        self,
+        page_url: Callable[[int], str],
+        max_pages: int,
+        include_details: bool,
+        known_ids: Optional[set],
+        concurrency: int,
+        emit: Callable[[int, list], None],
+        cancelled: threading.Event
+    ) -> None:
+        """
+        コンペ一覧を並列に取得し、ページごとに emit を呼ぶ
+
+        1ページ目で取得方法（HTTP / Playwright）を決め、2ページ目以降は concurrency 件ずつ並列に取得する。
+        空のページ、または known_ids に含まれるコンペだけのページで一覧の終わりとみなし、
+        それより後のページは取得を始めず、取得中のものは結果を捨てる
+        """
+        def parse(html: str) -> list:
+            return self._parse_competition_list_html(html, include_details)
+
+        stack = AsyncExitStack()
+        context_lock = asyncio.Lock()
+        shared = {'context': None}
+
+        async def get_context():
+            # Playwright はHTTPで取得できなかった場合だけ起動する
+            async with context_lock:
+                if shared['context'] is None:
+                    p = await stack.enter_async_context(async_playwright())
+                    context, close = await self._launch_context_async(p)
+                    stack.push_async_callback(close)
+                    shared['context'] = context
+                return shared['context']
+
+        state = {'next_page': 2, 'stop_after': max_pages, 'use_http': self.http_first}
+
+        async def fetch_page(page_num: int) -> list:
+            url = page_url(page_num)
+            if state['use_http']:
+                page_comps = await asyncio.to_thread(self._fetch_static, 'competitions_list', url, parse)
+                if page_comps is not None and (page_comps or page_num > 1):
+                    return page_comps
+                if page_num == 1:
+                    # HTTPで一覧が取得できない（JSレンダリングが必要）: 以降は Playwright で取得
+                    state['use_http'] = False
+            return await self._fetch_competition_list_page_async(get_context, url, include_details)
+
+        def handle(page_num: int, page_comps: list) -> None:
+            if page_num > state['stop_after'] or cancelled.is_set():
+                return  # 一覧の終わりより後のページ
+
+            ids = [comp['id'] if include_details else comp for comp in page_comps]
+            if not ids:
+                state['stop_after'] = page_num - 1
+                print(f"   ページ {page_num} でデータなし、終了")
+                return
+
+            emit(page_num, page_comps)
+            if known_ids is not None and all(comp_id in known_ids for comp_id in ids):
+                state['stop_after'] = page_num
+                print(f"   ページ {page_num} は既知のコンペのみ、終了")
+
+        async def worker():
+            while not cancelled.is_set() and state['next_page'] <= state['stop_after']:
+                page_num = state['next_page']
+                state['next_page'] += 1
+                try:
+                    page_comps = await fetch_page(page_num)
+                except CircuitOpenError:
+                    raise
+                except Exception as e:
+                    print(f"   ⚠️ ページ {page_num} のスクレイピングエラー: {e}")
+                    state['stop_after'] = min(state['stop_after'], page_num - 1)
+                    return
+                handle(page_num, page_comps)
+
+        async with stack:
+            if max_pages < 1:
+                return
+            # 1ページ目: 取得方法の判定と、既知のコンペだけなら即終了
+            try:
+                handle(1, await fetch_page(1))
+            except CircuitOpenError:
+                raise
+            except Exception as e:
+                print(f"   ⚠️ ページ 1 のスクレイピングエラー: {e}")
+                return
+
+            await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+
+    def iter_competitions_list(
+        self,
+        max_pages: int = 10,
+        prestige_filter: str = "medals",
+        participation_filter: str = "open",
+        include_details: bool = False,
+        known_ids: Optional[set] = None,
+        concurrency: int = SCRAPER_LIST_CONCURRENCY
+    ) -> Iterator[tuple[int, list]]:
+        """
+        コンペ一覧をページごとに取得（取得できたページから順次返す）
+
+        ページは並列に取得するため、ページ番号順とは限らない。
+        known_ids を指定すると、既知のコンペだけのページで取得を打ち切る
+        （新しいコンペは一覧の先頭に追加されるため、差分取得は数ページで終わる）。
+        キャッシュは使用しない
+
+        Args:
+            max_pages: 取得する最大ページ数
+            prestige_filter: prestigeフィルター
+            participation_filter: participationフィルター
+            include_details: タイトル・概要も含めて返すか
+            known_ids: 取得済みのコンペID（None の場合は max_pages または空のページまで取得）
+            concurrency: 並列に取得するページ数
+
+        Yields:
+            (ページ番号, _parse_competition_list_html と同じ形式のリスト)
+
+        Raises:
+            CircuitOpenError: kaggle.com へのリクエストが停止中の場合
+        """
+        def page_url(page_num: int) -> str:
+            return f"{self.base_url}?prestigeFilter={prestige_filter}&participationFilter={participation_filter}&page={page_num}"
+
+        results: queue.Queue = queue.Queue()
+        cancelled = threading.Event()
+        done = object()
+
+        def run():
+            try:
+                asyncio.run(self._crawl_competitions_list_async(
+                    page_url, max_pages, include_details, known_ids, concurrency,
+                    lambda page_num, page_comps: results.put((page_num, page_comps)),
+                    cancelled
+                ))
+            except BaseException as e:
+                results.put(e)
+            finally:
+                results.put(done)
+
+        # 呼び出し元がイベントループ内でも使えるよう、クロールは別スレッドで実行する
+        thread = threading.Thread(target=run, name='competition-list-crawl', daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = results.get()
+                if item is done:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            cancelled.set()
+            thread.join()
+
     def scrape_competitions_list(
         self,
         max_pages: int = 10,
         prestige_filter: str = "medals",
         participation_filter: str = "open",
         force_refresh: bool = False,
-        include_details: bool = False
+        include_details: bool = False,
+        known_ids: Optional[set] = None,
+        concurrency: int = SCRAPER_LIST_CONCURRENCY
     ) -> list[str] | list[Dict[str, Any]]:
         """
         Kaggleコンペ一覧ページからコンペIDのリストを取得
 
+        ページは iter_competitions_list で並列に取得する
+
         Args:
             max_pages: 取得する最大ページ数
             prestige_filter: prestigeフィルター（"medals", "all"など）
             participation_filter: participationフィルター（"open", "all"など）
             force_refresh: キャッシュを無視して再取得
             include_details: タイトル・概要も含めて返すか
+            known_ids: 取得済みのコンペID（指定すると既知のコンペだけのページで打ち切る。キャッシュは使用しない）
+            concurrency: 並列に取得するページ数
 
         Returns:
             include_details=False: コンペIDのリスト
@@ -1148,8 +2245,9 @@ class ScraperService:
         if include_details:
             cache_key += ':details'
 
-        # キャッシュチェック
-        if not force_refresh:
+        # キャッシュチェック（差分取得の結果は一覧の一部のためキャッシュしない）
+        use_cache = known_ids is None
+        if use_cache and not force_refresh:
             cached_data = self.cache_service.get_scraped_data(cache_key)
             if cached_data:
                 if include_details:
@@ -1163,120 +2261,37 @@ class ScraperService:
 
         print(f"📍 コンペ一覧をスクレイピング中 (最大{max_pages}ページ)...")
 
-        # include_detailsによって初期値を変える
+        # include_detailsによって初期値を変える（どちらもIDで重複を除く）
         if include_details:
-            all_comp_ids = []  # リスト
+            all_comp_ids = {}  # ID → 詳細情報（ページをまたいで最初に取得したもの）
         else:
             all_comp_ids = set()  # セット
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=self.headless)
-                page = browser.new_page()
-
-                for page_num in range(1, max_pages + 1):
-                    # URL構築
-                    url = f"{self.base_url}?prestigeFilter={prestige_filter}&participationFilter={participation_filter}&page={page_num}"
-
-                    try:
-                        page.goto(url, wait_until='networkidle', timeout=60000)
-                        time.sleep(2)
-
-                        # スクロールしてコンテンツをロード
-                        for i in range(3):
-                            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                            time.sleep(0.3)
-
-                        # HTMLを取得してパース
-                        html = page.content()
-                        soup = BeautifulSoup(html, 'html.parser')
-
-                        if include_details:
-                            # 詳細情報付きで取得
-                            # コンペカードを探す（各コンペは特定のdiv構造内にある）
-                            comp_cards = soup.find_all('div', class_=lambda x: x and 'sc-kSaXSp' in str(x))
-
-                            page_comps_detailed = []
-                            for card in comp_cards:
-                                # タイトル（最初のdivまたはspan）
-                                title_elem = card.find('div', class_=lambda x: x and 'sc-kCuUfV' in str(x))
-                                if not title_elem:
-                                    title_elem = card.find('span', class_=lambda x: x and 'sc-kCuUfV' in str(x))
-
-                                title = title_elem.get_text().strip() if title_elem else None
-
-                                # 概要（説明文のspan）
-                                desc_spans = card.find_all('span', class_=lambda x: x and 'sc-eqNDNG' in str(x) and 'sc-fYRIQK' in str(x))
-                                description = None
-                                for span in desc_spans:
-                                    text = span.get_text().strip()
-                                    # "Featured · Code Competition" のような行は除外
-                                    if text and '·' not in text and len(text) > 20:
-                                        description = text
-                                        break
-
-                                # コンペIDをリンクから取得
-                                link = card.find_parent('a', href=lambda x: x and '/competitions/' in str(x))
-                                if not link:
-                                    # カード内のリンクを探す
-                                    link = card.find('a', href=lambda x: x and '/competitions/' in str(x))
-
-                                if link:
-                                    href = link.get('href', '')
-                                    comp_id = href.replace('/competitions/', '').split('/')[0].split('?')[0]
-
-                                    if comp_id and title:
-                                        page_comps_detailed.append({
-                                            'id': comp_id,
-                                            'title': title,
-                                            'description': description or '',
-                                            'url': f"https://www.kaggle.com/competitions/{comp_id}"
-                                        })
-
-                            all_comp_ids.extend(page_comps_detailed)
-                            print(f"   ページ {page_num:2d}: {len(page_comps_detailed):2d}件 (合計: {len(all_comp_ids)}件)")
-
-                            if len(page_comps_detailed) == 0:
-                                print(f"   ページ {page_num} でデータなし、終了")
-                                break
-                        else:
-                            # IDのみ取得（従来の方法）
-                            comp_links = soup.find_all('a', href=lambda x: x and x.startswith('/competitions/') and x != '/competitions')
-                            page_comps = set()
-                            for link in comp_links:
-                                href = link['href']
-                                comp_id = href.replace('/competitions/', '').split('/')[0].split('?')[0]
-                                if comp_id:
-                                    page_comps.add(comp_id)
-
-                            all_comp_ids.update(page_comps)
-                            print(f"   ページ {page_num:2d}: {len(page_comps):2d}件 (合計: {len(all_comp_ids)}件)")
-
-                            if len(page_comps) == 0:
-                                print(f"   ページ {page_num} でデータなし、終了")
-                                break
-
-                    except Exception as e:
-                        print(f"   ⚠️ ページ {page_num} のスクレイピングエラー: {e}")
-                        break
+            start = time.perf_counter()
+            for page_num, page_comps in self.iter_competitions_list(
+                max_pages=max_pages,
+                prestige_filter=prestige_filter,
+                participation_filter=participation_filter,
+                include_details=include_details,
+                known_ids=known_ids,
+                concurrency=concurrency
+            ):
+                if include_details:
+                    for comp in page_comps:
+                        all_comp_ids.setdefault(comp['id'], comp)
+                else:
+                    all_comp_ids.update(page_comps)
+                print(f"   ページ {page_num:2d}: {len(page_comps):2d}件 (合計: {len(all_comp_ids)}件)")
 
-                browser.close()
+            print(f"📊 {self.fetch_stats.stats_line('competitions_list')} / 一覧取得 {time.perf_counter() - start:.1f}秒")
 
             if include_details:
-                # 詳細情報付きリスト
-                # 重複を除去（IDでユニーク化）
-                seen_ids = set()
-                unique_comps = []
-                for comp in all_comp_ids:
-                    if comp['id'] not in seen_ids:
-                        seen_ids.add(comp['id'])
-                        unique_comps.append(comp)
-
-                # IDでソート
-                unique_comps.sort(key=lambda x: x['id'])
+                # 詳細情報付きリスト（IDでソート）
+                unique_comps = sorted(all_comp_ids.values(), key=lambda x: x['id'])
 
                 # キャッシュに保存
-                if unique_comps:
+                if use_cache and unique_comps:
                     result = {
                         'competitions': unique_comps,
                         'scraped_at': datetime.now().isoformat(),
@@ -1297,7 +2312,7 @@ class ScraperService:
                 comp_ids_list = sorted(list(all_comp_ids))
 
                 # キャッシュに保存
-                if comp_ids_list:
+                if use_cache and comp_ids_list:
                     result = {
                         'competition_ids': comp_ids_list,
                         'scraped_at': datetime.now().isoformat(),
@@ -1314,12 +2329,485 @@ class ScraperService:
                 print(f"\n✅ 合計 {len(comp_ids_list)}件のコンペIDを取得しました")
                 return comp_ids_list
 
+        except CircuitOpenError:
+            raise
         except Exception as e:
             print(f"❌ コンペ一覧スクレイピングエラー: {e}")
             import traceback
             traceback.print_exc()
             return []
 
+    @staticmethod
+    def _static_author_tier(item) -> tuple[Optional[str], Optional[str]]:
+        """
+        静的HTMLのディスカッションアイテムから称号と称号色を探す
+
+        _get_author_tier_from_item / _get_tier_color_from_item と同じく、
+        アイテムのテキスト → バッジ・SVGの属性の順に称号を探し、
+        2つ以上の circle を持つ SVG の2番目の stroke を称号色とする
+
+        Args:
+            item: ディスカッションアイテムの要素
+
+        Returns:
+            (称号, 称号色)
+        """
+        texts = [item.get_text(' ')]
+        for badge in item.select('img[alt*="tier"], [aria-label*="tier"], [title*="Grandmaster"], [title*="Master"], svg'):
+            texts.append(' '.join(badge.get(attr) or '' for attr in ('alt', 'aria-label', 'title')))
+        author_tier = next((tier for tier in map(normalize_tier, texts) if tier), None)
+
+        tier_color = None
+        for svg in item.select('svg'):
+            circles = svg.select('circle')
+            if len(circles) >= 2:
+                match = re.search(r'stroke:\s*(rgb\([^)]+\))', circles[1].get('style') or '')
+                if match:
+                    tier_color = match.group(1)
+                    break
+
+        return author_tier, tier_color
+
+    def _parse_discussion_listing_html(self, html: str, category: str) -> list[Dict[str, Any]]:
+        """
+        ディスカッション/Writeups 一覧のHTMLからアイテムを抽出（ブラウザ操作なし）
+
+        get_discussions の DOM 解析と同じセレクタを静的HTMLに適用する。
+        称号は称号キャッシュになければアイテム内のテキスト・バッジ・SVGから判定して保存する
+        （_resolve_author_tier と同じ判定）
+
+        Args:
+            html: レンダリング後のHTML
+            category: 'discussion' または 'writeup'（URLから判定できない場合）
+
+        Returns:
+            ディスカッション情報のリスト（ピン留めは除外）
+        """
+        soup = parse_html(html)
+        items = []
+        seen_urls = set()
+
+        for item in soup.select('li.MuiListItem-root'):
+            title_link = item.select_one('a[href*="/competitions/"]')
+            if not title_link or not title_link.get('href'):
+                continue
+
+            # ピン留めは除外（get_discussions と同じ扱い）
+            if 'push_pin' in item.get_text():
+                continue
+
+            href = title_link['href']
+            url = f"https://www.kaggle.com{href}" if href.startswith('/') else href
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+
+            author = None
+            for author_link in item.select('a[aria-label*="profile"]'):
+                aria_label = author_link.get('aria-label', '')
+                if "'s profile" in aria_label:
+                    author = aria_label.split("'s profile")[0]
+                    break
+
+            vote_count = 0
+            vote_span = item.select_one('span[aria-label*="vote"]')
+            if vote_span:
+                try:
+                    vote_count = int(vote_span['aria-label'].split()[0])
+                except (ValueError, IndexError):
+                    pass
+
+            comment_count = 0
+            for span in item.select('span'):
+                text = span.get_text()
+                if 'comment' in text.lower():
+                    try:
+                        comment_count = int(text.split()[0])
+                        break
+                    except (ValueError, IndexError):
+                        pass
+
+            known = self.author_tiers.get(author) if author else None
+            if known:
+                author_tier, tier_color = known.tier, known.tier_color
+            elif author:
+                author_tier, tier_color = self._static_author_tier(item)
+                self.author_tiers.remember(author, author_tier, tier_color)
+            else:
+                author_tier, tier_color = None, None
+
+            items.append({
+                'title': self._clean_listing_title(title_link.get_text().strip(), author),
+                'url': url,
+                'author': author,
+                'author_tier': author_tier,
+                'tier_color': tier_color,
+                'vote_count': vote_count,
+                'comment_count': comment_count,
+                'category': 'writeup' if '/writeups/' in url else category,
+                'is_pinned': False,
+            })
+
+        return items
+
+    def _parse_notebook_listing_html(self, html: str) -> list[Dict[str, Any]]:
+        """
+        ノートブック一覧（Codeタブ）のHTMLからアイテムを抽出（ブラウザ操作なし）
+
+        get_notebooks の DOM 解析と同じセレクタを静的HTMLに適用する。
+        称号は称号キャッシュにある投稿者のみ設定する
+
+        Args:
+            html: レンダリング後のHTML
+
+        Returns:
+            ノートブック情報のリスト
+        """
+        soup = parse_html(html)
+        items = []
+        seen_urls = set()
+
+        for item in soup.select('div.km-listitem--large'):
+            title_link = item.select_one('a[aria-label][role="link"]')
+            comment_link = item.select_one('a[href*="/comments"]')
+            if not title_link or not comment_link or not comment_link.get('href'):
+                continue
+
+            # /code/username/notebook-name/comments → /code/username/notebook-name
+            notebook_url = comment_link['href'].replace('/comments', '')
+            notebook_url = f"https://www.kaggle.com{notebook_url}" if notebook_url.startswith('/') else notebook_url
+            if notebook_url in seen_urls:
+                continue
+            seen_urls.add(notebook_url)
+
+            author = None
+            for author_link in item.select('a[aria-label*="profile"]'):
+                aria_label = author_link.get('aria-label', '')
+                if "'s profile" in aria_label:
+                    author = aria_label.split("'s profile")[0]
+                    break
+
+            vote_count = 0
+            vote_span = item.select_one('span[aria-label*="vote"]')
+            if vote_span:
+                try:
+                    vote_count = int(vote_span['aria-label'].split()[0])
+                except (ValueError, IndexError):
+                    pass
+
+            comment_count = 0
+            comment_text = comment_link.get_text()
+            if 'comment' in comment_text.lower():
+                try:
+                    comment_count = int(comment_text.split()[0])
+                except (ValueError, IndexError):
+                    pass
+
+            known = self.author_tiers.get(author)
+            items.append({
+                'title': title_link['aria-label'],
+                'url': notebook_url,
+                'author': author,
+                'author_tier': known.tier if known else None,
+                'tier_color': known.tier_color if known else None,
+                'vote_count': vote_count,
+                'comment_count': comment_count,
+                'type': 'notebook',
+            })
+
+        return items
+
+    async def _launch_context_async(self, p) -> tuple[Any, Callable[[], Awaitable[None]]]:
+        """
+        async API でブラウザコンテキストを起動（_launch_browser と同じプロファイル再利用）
+
+        Returns:
+            (コンテキスト, 終了処理)
+        """
+        if self.profile_dir:
+            storage_state_path = self.profile_dir / STORAGE_STATE_FILE
+            try:
+                self.profile_dir.mkdir(parents=True, exist_ok=True)
+                context = await p.chromium.launch_persistent_context(str(self.profile_dir), headless=self.headless)
+
+                async def close_persistent():
+                    try:
+                        await context.storage_state(path=str(storage_state_path))
+                    except Exception as e:
+                        print(f"⚠️  storage state の保存に失敗: {e}")
+                    await context.close()
+
+                return context, close_persistent
+            except Exception as e:
+                print(f"⚠️  ブラウザプロファイルを使用できないため一時プロファイルで起動: {e}")
+                storage_state = str(storage_state_path) if storage_state_path.exists() else None
+        else:
+            storage_state = None
+
+        browser = await p.chromium.launch(headless=self.headless)
+        context = await browser.new_context(storage_state=storage_state)
+        return context, browser.close
+
+    async def _new_page_async(self, context) -> tuple[Any, list]:
+        """
+        async API で新しいページを作成（_new_page と同じフィクスチャの記録・再生を設定）
+
+        Args:
+            context: ブラウザコンテキスト
+
+        Returns:
+            (ページ, Kaggle内部APIのJSONレスポンスを受け取るリスト)
+        """
+        page = await context.new_page()
+
+        # Kaggle内部APIのJSON（JSONキャプチャ・フィクスチャ記録用。ページごとに分ける）
+        api_responses = []
+
+        async def on_response(response):
+            try:
+                content_type = response.headers.get('content-type')
+                if is_kaggle_api_response(response.url, content_type):
+                    api_responses.append({
+                        'url': response.url,
+                        'status': response.status,
+                        'content_type': content_type,
+                        'body': await response.json(),
+                    })
+            except Exception:
+                pass
+
+        if self.fixture_mode == 'replay':
+            async def fulfill(route):
+                fixture_response = self._fixture_response(route.request)
+                if fixture_response is None:
+                    await route.abort()
+                else:
+                    await route.fulfill(**fixture_response)
+
+            await page.route('**/*', fulfill)
+        else:
+            page.on('response', on_response)
+
+        return page, api_responses
+
+    async def _goto_async(self, page, url: str, api_responses: list, **kwargs):
+        """
+        async API でページ遷移（_goto と同じレート制限・フィクスチャ処理。
+        描画後のDOMは呼び出し側が _save_fixture_async で上書き保存する）
+
+        Args:
+            page: _new_page_async で作成したページ
+            url: 遷移先URL
+            api_responses: _new_page_async が返したリスト（replay モードではフィクスチャのJSONを追加）
+            **kwargs: page.goto に渡す引数
+
+        Returns:
+            page.goto のレスポンス
+        """
+        if self.fixture_mode == 'replay':
+            response = await page.goto(url, **kwargs)
+            fixture = self.fixture_store.load(url)
+            if fixture:
+                api_responses.extend(fixture['responses'])
+            return response
+
+        # レート制限（待機はスレッドで行い、他のページの読み込みを止めない）
+        await asyncio.to_thread(self.rate_limiter.acquire)
+        start = time.monotonic()
+        try:
+            response = await page.goto(url, **kwargs)
+        except Exception:
+            self.rate_limiter.record(None, time.monotonic() - start)
+            raise
+        self.rate_limiter.record(
+            response.status if response else 200,
+            time.monotonic() - start,
+            retry_after=parse_retry_after(response.headers.get('retry-after')) if response else None
+        )
+
+        # 404 などで描画を待たずに終わるページも記録されるよう、遷移直後の状態を保存しておく
+        await self._save_fixture_async(page, url, response, api_responses)
+        return response
+
+    async def _save_fixture_async(self, page, url: str, response, api_responses: list) -> None:
+        """
+        record モードで、ページの現在のHTMLと受信したJSONをフィクスチャに保存する（_save_fixture の async 版）
+
+        描画の待機・スクロールの後に呼ぶ（record モード以外では何もしない）
+
+        Args:
+            page: _new_page_async で作成したページ
+            url: _goto_async で遷移したURL
+            response: _goto_async のレスポンス
+            api_responses: _new_page_async が返したリスト
+        """
+        if self.fixture_mode != 'record':
+            return
+        self.fixture_store.save(
+            url,
+            await page.content(),
+            status=response.status if response else 200,
+            responses=list(api_responses)
+        )
+
+    async def _scrape_bundle_tab(self, context, comp_id: str, tab: str) -> Optional[Dict[str, Any]]:
+        """
+        バンドルの1タブを取得（async API）
+
+        Args:
+            context: ブラウザコンテキスト
+            comp_id: コンペティション ID
+            tab: BUNDLE_TABS のキー
+
+        Returns:
+            タブコンテンツの辞書（取得失敗時は None）
+        """
+        url = f"{self.base_url}/{comp_id}/{BUNDLE_TABS[tab]}" if BUNDLE_TABS[tab] else f"{self.base_url}/{comp_id}"
+        page, api_responses = await self._new_page_async(context)
+
+        try:
+            response = await self._goto_async(page, url, api_responses, wait_until='networkidle', timeout=30000)
+
+            if response and response.status == 404:
+                print(f"❌ ページが見つかりません: {comp_id}/{tab}")
+                return None
+
+            if self.fixture_mode != 'replay':
+                await page.wait_for_timeout(2000)  # JavaScriptレンダリングの追加待機
+                await self._save_fixture_async(page, url, response, api_responses)
+
+            result = {
+                'comp_id': comp_id,
+                'tab': tab,
+                'url': url,
+                'scraped_at': datetime.now().isoformat(),
+                'full_text': await page.inner_text('#site-content'),
+            }
+
+            # ディスカッション系のタブは一覧アイテムも返す（アーカイブは get_discussions と同じく
+            # JSONから取得できればJSON、できなければHTML）
+            if tab in LISTING_TABS:
+                items = []
+                if self.json_capture:
+                    json_payloads = [r['body'] for r in api_responses]
+                    items = [item for item in extract_discussion_items(json_payloads) if not item['is_pinned']]
+                    if items:
+                        self._archive_page(url, 'discussion_listing', comp_id, json_payloads=json_payloads)
+                if not items:
+                    html = await page.content()
+                    self._archive_page(url, 'discussion_listing', comp_id, html=html)
+                    items = self._parse_discussion_listing_html(html, 'writeup' if tab.startswith('writeups') else 'discussion')
+                result['items'] = items
+            else:
+                self._archive_page(url, 'competition_tab', comp_id, html=await page.content())
+
+            print(f"✅ スクレイピング成功: {comp_id}/{tab} ({len(result['full_text'])} 文字)")
+            return result
+
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            print(f"❌ スクレイピングエラー ({comp_id}/{tab}): {e}")
+            return None
+        finally:
+            await page.close()
+
+    async def _scrape_bundle_async(self, comp_id: str, tabs: list[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """複数タブを1つのコンテキスト内で並列に取得"""
+        async with async_playwright() as p:
+            context, close = await self._launch_context_async(p)
+            try:
+                results = await asyncio.gather(*(self._scrape_bundle_tab(context, comp_id, tab) for tab in tabs))
+            finally:
+                await close()
+
+        return dict(zip(tabs, results))
+
+    @staticmethod
+    def _run_async(coroutine: Awaitable[Any]) -> Any:
+        """
+        同期関数からコルーチンを実行
+
+        イベントループの実行中（sync Playwright の起動中を含む）は asyncio.run を使えないため、
+        別スレッドで実行して結果を待つ
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='scraper-async') as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+
+    def scrape_competition_bundle(
+        self,
+        comp_id: str,
+        tabs: Optional[list[str]] = None,
+        force_refresh: bool = False
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        コンペティションの複数タブをまとめて取得
+
+        1つのブラウザコンテキストで各タブのページを並列に開くため、
+        全タブの取得がおよそ1ページ分の読み込み時間で終わる。
+        複数タブを読む呼び出し元（enrich_competitions.py の overview + data、
+        get_discussions の1ページ目の Discussions + Writeups）で使う。
+        1タブだけの取得（データタブのみの fetch_dataset_info など）は get_tab_content を使う
+        （HTTP優先取得・取得失敗のキャッシュが効くため）。
+        各タブの結果は get_tab_content と同じ形式（ディスカッション系のタブは
+        一覧アイテム 'items' を追加）で、タブごとにキャッシュする。
+
+        同期関数から呼び出すこと（イベントループの実行中は別スレッドで async API を実行する）。
+        browser_worker のブラウザは使わずに別のブラウザを起動するため、
+        ワーカー実行中の get_discussions はこのメソッドを使わない
+
+        Args:
+            comp_id: コンペティション ID
+            tabs: 取得するタブ（BUNDLE_TABS のキー。None の場合は差分同期用を除く全タブ）
+            force_refresh: キャッシュを無視して再取得
+
+        Returns:
+            {tab: タブコンテンツの辞書（取得失敗時は None）}
+
+        Raises:
+            ValueError: 未知のタブが指定された場合
+        """
+        tabs = list(tabs or [tab for tab in BUNDLE_TABS if not tab.endswith('_recent')])
+        unknown = [tab for tab in tabs if tab not in BUNDLE_TABS]
+        if unknown:
+            raise ValueError(f"Unknown tabs: {unknown} (available: {list(BUNDLE_TABS)})")
+
+        def cache_key(tab):
+            path = BUNDLE_TABS[tab]
+            return f"{comp_id}:{path}" if path else comp_id
+
+        results = {}
+        pending = []
+        for tab in tabs:
+            cached_data = None if force_refresh else self.cache_service.get_scraped_data(cache_key(tab))
+            # get_tab_content が保存したディスカッション系のタブには一覧アイテムがない
+            if cached_data and (tab not in LISTING_TABS or 'items' in cached_data):
+                results[tab] = cached_data
+            else:
+                pending.append(tab)
+
+        if pending:
+            print(f"🌐 スクレイピング開始: {comp_id} ({', '.join(pending)} を並列取得)")
+            start = time.perf_counter()
+            scraped = self._run_async(self._scrape_bundle_async(comp_id, pending))
+            print(f"✓ {len(pending)}タブ取得完了: {time.perf_counter() - start:.1f}秒")
+
+            for tab, result in scraped.items():
+                results[tab] = result
+                if result:
+                    self.cache_service.set_scraped_data(
+                        cache_key(tab),
+                        result,
+                        ttl_days=self.cache_ttl_days
+                    )
+
+        return {tab: results.get(tab) for tab in tabs}
+
     def scrape_multiple(
         self,
         comp_ids: list[str],
@@ -0,0 +1,194 @@
+"""
+取得したページの生データアーカイブ
+
+スクレイピングで取得したページのHTML（レンダリング後）とKaggle内部APIのJSONを
+圧縮して保存する。セレクタが壊れた場合や新しい項目（コメント数・称号色など）を
+追加した場合に、Kaggle に再アクセスせずアーカイブから再解析できる
+（python -m app.batch.reparse）。
+
+- 本文は SHA-256 をキーにした gzip ファイル（objects/ab/abcdef....gz）。同じ内容は1回だけ保存する
+- URL・取得日時・ページ種別・コンペIDは SQLite の索引（index.db）に記録する
+
+フィクスチャ（fixture_store.py）がテスト用にURLごとの最新1件を置き換えるのに対し、
+アーカイブは取得のたびに履歴を追記する
+"""
+
+import gzip
+import hashlib
+import json
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+
+class SnapshotArchive:
+    """コンテンツアドレス方式のページアーカイブ"""
+
+    def __init__(self, root_dir: str | Path):
+        """
+        初期化
+
+        Args:
+            root_dir: アーカイブの保存先ディレクトリ
+        """
+        self.root_dir = Path(root_dir)
+        self.objects_dir = self.root_dir / "objects"
+        self.index_path = self.root_dir / "index.db"
+
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS snapshots (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    url TEXT NOT NULL,
+                    page_type TEXT NOT NULL,
+                    comp_id TEXT,
+                    content_type TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    fetched_at TEXT NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_snapshots_url ON snapshots(url, fetched_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_snapshots_comp ON snapshots(page_type, comp_id)")
+            conn.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        # 複数のワーカープロセスが同じアーカイブに書き込む場合に備えて待機時間を長めにする
+        conn = sqlite3.connect(self.index_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _object_path(self, content_hash: str) -> Path:
+        return self.objects_dir / content_hash[:2] / f"{content_hash}.gz"
+
+    def save(
+        self,
+        url: str,
+        content: str,
+        page_type: str,
+        content_type: str = "html",
+        comp_id: Optional[str] = None,
+        fetched_at: Optional[datetime] = None
+    ) -> str:
+        """
+        ページを保存
+
+        Args:
+            url: ページのURL
+            content: HTML または JSON 文字列
+            page_type: ページ種別（'discussion_listing' など）
+            content_type: "html" または "json"
+            comp_id: コンペティションID
+            fetched_at: 取得日時（None の場合は現在時刻）
+
+        Returns:
+            本文のハッシュ
+        """
+        data = content.encode('utf-8')
+        content_hash = hashlib.sha256(data).hexdigest()
+
+        path = self._object_path(content_hash)
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            tmp_path.write_bytes(gzip.compress(data))
+            tmp_path.replace(path)
+
+        with closing(self._connect()) as conn:
+            conn.execute(
+                """
+                INSERT INTO snapshots (url, page_type, comp_id, content_type, content_hash, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (url, page_type, comp_id, content_type, content_hash, (fetched_at or datetime.now()).isoformat())
+            )
+            conn.commit()
+
+        return content_hash
+
+    def read(self, content_hash: str) -> str:
+        """ハッシュから本文を読み込む"""
+        return gzip.decompress(self._object_path(content_hash).read_bytes()).decode('utf-8')
+
+    def latest(self, url: str, content_type: str = "html", before: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """
+        URLの最新スナップショットを取得
+
+        Args:
+            url: ページのURL
+            content_type: "html" または "json"
+            before: この日時より前に取得したものに限る
+
+        Returns:
+            スナップショット（'content' に本文を含む）。なければ None
+        """
+        query = "SELECT * FROM snapshots WHERE url = ? AND content_type = ?"
+        params: list = [url, content_type]
+        if before:
+            query += " AND fetched_at < ?"
+            params.append(before.isoformat())
+        query += " ORDER BY fetched_at DESC, id DESC LIMIT 1"
+
+        with closing(self._connect()) as conn:
+            row = conn.execute(query, params).fetchone()
+        if row is None:
+            return None
+        return {**dict(row), 'content': self.read(row['content_hash'])}
+
+    def iter_latest(self, page_type: str, comp_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        ページ種別のURL・本文形式ごとの最新スナップショットを列挙
+
+        Args:
+            page_type: ページ種別
+            comp_id: コンペティションID（None の場合は全コンペ）
+
+        Yields:
+            スナップショット（'content' に本文を含む、コンペID・URL順）
+        """
+        query = """
+            SELECT * FROM snapshots s
+            WHERE page_type = ? AND id = (
+                SELECT id FROM snapshots
+                WHERE url = s.url AND content_type = s.content_type
+                ORDER BY fetched_at DESC, id DESC LIMIT 1
+            )
+        """
+        params: list = [page_type]
+        if comp_id:
+            query += " AND comp_id = ?"
+            params.append(comp_id)
+        query += " ORDER BY comp_id, url, content_type"
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(query, params).fetchall()
+        for row in rows:
+            yield {**dict(row), 'content': self.read(row['content_hash'])}
+
+    def comp_ids(self, page_type: str) -> list[str]:
+        """ページ種別のスナップショットがあるコンペIDの一覧"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT comp_id FROM snapshots WHERE page_type = ? AND comp_id IS NOT NULL ORDER BY comp_id",
+                (page_type,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def stats(self) -> Dict[str, Any]:
+        """スナップショット数・本文数・ディスク使用量"""
+        with closing(self._connect()) as conn:
+            snapshots, objects = conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT content_hash) FROM snapshots"
+            ).fetchone()
+        return {
+            'snapshots': snapshots,
+            'objects': objects,
+            'bytes': sum(path.stat().st_size for path in self.objects_dir.glob('*/*.gz')),
+        }
+
+
+def dump_json_payloads(payloads: list) -> str:
+    """キャプチャしたJSONレスポンスをアーカイブ用の文字列に変換"""
+    return json.dumps(payloads, ensure_ascii=False)
@@ -176,11 +176,13 @@ class SolutionService:
                 if detail and detail.get('content'):
                     content = detail['content']
 
-                    # 要約生成
-                    summary = llm_service.summarize_discussion(content, sol_data['title'])
-
-                    # 技術抽出
-                    techniques_json = llm_service.extract_solution_techniques(content, sol_data['title'])
+                    # 要約生成と技術抽出（互いに依存しないため並列に実行）
+                    results = llm_service.run_many({
+                        "summary": lambda: llm_service.summarize_discussion(content, sol_data['title']),
+                        "techniques": lambda: llm_service.extract_solution_techniques(content, sol_data['title']),
+                    })
+                    summary = results["summary"]
+                    techniques_json = results["techniques"]
 
                     # データベース更新（contentは保存しない）
                     saved_solution.summary = summary
@@ -336,6 +338,18 @@ class SolutionService:
             return True, None
         return False, None
 
+    def get_listing_index(self, competition_id: str) -> Dict[str, Dict[str, Any]]:
+        """
+        差分同期用の既存解法索引を取得
+
+        Args:
+            competition_id: コンペティションID
+
+        Returns:
+            dict: {url: 既存行の比較用フィールド}
+        """
+        return self.repository.get_listing_index(competition_id)
+
     def _check_existing(self, competition_id: str, url: str) -> bool:
         """
         URLで既存解法をチェック
@@ -4,6 +4,9 @@ pytest フィクスチャ定義
 全テストで共通利用するフィクスチャを定義
 """
 
+import threading
+from types import SimpleNamespace
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -14,3 +17,212 @@ def client():
     from app.main import app
 
     return TestClient(app)
+
+
+class InMemoryRedis:
+    """
+    テスト用の Redis 代替（decode_responses=True 相当、単一プロセス内のみ）
+
+    スクレイピングキュー・ワーカー・キャッシュが使うコマンドだけを実装している
+    """
+
+    def __init__(self):
+        self.data = {}
+
+    # リスト
+    def lpush(self, key, *values):
+        items = self.data.setdefault(key, [])
+        for value in values:
+            items.insert(0, value)
+        return len(items)
+
+    def rpoplpush(self, source, destination):
+        items = self.data.get(source)
+        if not items:
+            return None
+        value = items.pop()
+        self.lpush(destination, value)
+        return value
+
+    def brpoplpush(self, source, destination, timeout=0):
+        return self.rpoplpush(source, destination)
+
+    def lrem(self, key, count, value):
+        items = self.data.get(key, [])
+        removed = 0
+        while value in items and (count == 0 or removed < count):
+            items.remove(value)
+            removed += 1
+        return removed
+
+    def llen(self, key):
+        return len(self.data.get(key, []))
+
+    def lrange(self, key, start, end):
+        items = self.data.get(key, [])
+        return items[start:] if end == -1 else items[start:end + 1]
+
+    # セット・ハッシュ
+    def sadd(self, key, *values):
+        members = self.data.setdefault(key, set())
+        added = len(set(values) - members)
+        members.update(values)
+        return added
+
+    def srem(self, key, *values):
+        members = self.data.get(key, set())
+        removed = len(members & set(values))
+        members.difference_update(values)
+        return removed
+
+    def hincrby(self, key, field, amount=1):
+        fields = self.data.setdefault(key, {})
+        fields[field] = str(int(fields.get(field, 0)) + amount)
+        return int(fields[field])
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def hset(self, key, mapping):
+        self.data.setdefault(key, {}).update({field: str(value) for field, value in mapping.items()})
+        return len(mapping)
+
+    def expire(self, key, ttl):
+        return int(key in self.data)
+
+    # キー
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+        return True
+
+    def exists(self, key):
+        return int(bool(self.data.get(key)))
+
+    def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def scan_iter(self, match='*'):
+        import fnmatch
+        return [key for key in list(self.data) if fnmatch.fnmatch(key, match) and self.data[key]]
+
+    def pipeline(self):
+        return _InMemoryPipeline(self)
+
+    def transaction(self, func, *watches, value_from_callable=False):
+        pipe = _InMemoryTransaction(self)
+        result = func(pipe)
+        results = pipe.execute()
+        return result if value_from_callable else results
+
+
+class _InMemoryPipeline:
+    """InMemoryRedis のパイプライン（execute でまとめて実行）"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+        return queue
+
+    def execute(self):
+        results = [getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+        self.commands = []
+        return results
+
+
+class _InMemoryTransaction(_InMemoryPipeline):
+    """transaction のパイプライン（multi までは即時実行、以降はまとめて実行）"""
+
+    def __init__(self, redis):
+        super().__init__(redis)
+        self.buffering = False
+
+    def multi(self):
+        self.buffering = True
+
+    def __getattr__(self, name):
+        if not self.buffering:
+            return getattr(self.redis, name)
+        return super().__getattr__(name)
+
+
+@pytest.fixture(autouse=True)
+def no_llm_telemetry(monkeypatch):
+    """LLM呼び出しのテレメトリを記録しない（テストごとに記録先を渡す場合を除く）"""
+    from app.services import llm_service
+
+    monkeypatch.setattr(llm_service, "LLM_TELEMETRY_ENABLED", False)
+
+
+@pytest.fixture(autouse=True)
+def unlimited_llm_rate(monkeypatch):
+    """LLM のレート制限を無効化（フェイクのクライアントへの呼び出しで待機しないように）"""
+    from app.services import llm_service
+    from app.services.llm_rate_limiter import LLMRateGovernor
+
+    monkeypatch.setattr(
+        llm_service, "get_llm_rate_governor",
+        lambda model: LLMRateGovernor(requests_per_minute=0, tokens_per_minute=0)
+    )
+
+
+@pytest.fixture
+def fake_redis():
+    """ローカルの Redis 代替"""
+    return InMemoryRedis()
+
+
+class FakeCompletions:
+    """
+    OpenAI クライアントの chat.completions の代替
+
+    responses の応答を順に返す（例外なら送出）。respond を渡した場合は respond(kwargs) の応答を返す。
+    stream=True なら応答を chunk_size 文字ずつのチャンクで返す。呼び出しの引数は calls に記録する
+    """
+
+    def __init__(self, responses=(), respond=None, usage=None, chunk_size=3):
+        self.responses = list(responses)
+        self.respond = respond
+        self.usage = usage
+        self.chunk_size = chunk_size
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def create(self, **kwargs):
+        with self._lock:
+            self.calls.append(kwargs)
+            outcome = self.respond(kwargs) if self.respond else self.responses.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        if kwargs.get("stream"):
+            return iter([
+                SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=outcome[i:i + self.chunk_size]))])
+                for i in range(0, len(outcome), self.chunk_size)
+            ] + [SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=None))])])
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=outcome))], usage=self.usage)
+
+
+@pytest.fixture
+def make_llm_service():
+    """
+    FakeCompletions を使う LLMService を作る関数
+
+    make_llm_service(responses, cache=None, telemetry=None, **FakeCompletions の引数)。
+    cache を渡さない場合はレスポンスキャッシュを使わない
+    """
+    from app.services.llm_service import LLMService
+
+    def make(responses=(), cache=None, telemetry=None, **fake_options):
+        service = LLMService(api_key="test-key", response_cache=cache, use_cache=cache is not None, telemetry=telemetry)
+        service.client = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions(responses, **fake_options)))
+        service.retry_delay = 0
+        return service
+
+    return make
@@ -0,0 +1,91 @@
+"""
+投稿者の称号キャッシュのテスト
+"""
+import pytest
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from app.database import Database
+from app.models.author import Author
+from app.repositories.author import AuthorRepository
+from app.services.author_tier_cache import AuthorTierCache
+
+
+@pytest.fixture
+def author_db():
+    """authorsテーブルを持つテスト用DB"""
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = f.name
+
+    db = Database(db_path)
+    with db.get_connection() as conn:
+        conn.execute("""
+            CREATE TABLE authors (
+                name TEXT PRIMARY KEY,
+                tier TEXT,
+                tier_color TEXT,
+                updated_at TEXT NOT NULL
+            )
+        """)
+        conn.commit()
+
+    yield db
+
+    Path(db_path).unlink(missing_ok=True)
+
+
+class TestAuthorRepository:
+    """AuthorRepositoryのテスト"""
+
+    def test_upsert_and_get(self, author_db):
+        """同じ名前は上書きされる"""
+        repo = AuthorRepository(author_db)
+        repo.upsert(Author(name="Alice", tier="Master", tier_color="rgb(241, 95, 0)"))
+        repo.upsert(Author(name="Alice", tier="Grandmaster", tier_color="rgb(235, 204, 41)"))
+
+        author = repo.get_by_name("Alice")
+        assert author.tier == "Grandmaster"
+        assert isinstance(author.updated_at, datetime)
+        assert list(repo.get_all().keys()) == ["Alice"]
+
+
+class TestAuthorTierCache:
+    """AuthorTierCacheのテスト"""
+
+    def test_remember_then_hit(self, author_db):
+        """判定結果を保存すると、次のインスタンス（次回実行）でもヒットする"""
+        AuthorTierCache(AuthorRepository(author_db)).remember("Alice", "Expert", "rgb(149, 98, 143)")
+
+        cache = AuthorTierCache(AuthorRepository(author_db))
+        author = cache.get("Alice")
+
+        assert author.tier == "Expert"
+        assert cache.get("Bob") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_expired_entry_is_miss(self, author_db):
+        """有効期間を過ぎた投稿者は再判定対象"""
+        repo = AuthorRepository(author_db)
+        repo.upsert(Author(name="Alice", tier="Expert"))
+        with author_db.get_connection() as conn:
+            old = (datetime.now() - timedelta(days=31)).isoformat()
+            conn.execute("UPDATE authors SET updated_at = ?", (old,))
+            conn.commit()
+
+        assert AuthorTierCache(repo, max_age_days=30).get("Alice") is None
+
+    def test_unknown_tier_is_not_stored(self, author_db):
+        """称号も色も判定できなかった場合は保存しない"""
+        cache = AuthorTierCache(AuthorRepository(author_db))
+        cache.remember("Alice", None, None)
+
+        assert AuthorRepository(author_db).get_by_name("Alice") is None
+
+    def test_missing_table_disables_cache(self, tmp_path):
+        """authorsテーブルがない場合はキャッシュなしで動作する"""
+        cache = AuthorTierCache(AuthorRepository(Database(tmp_path / "empty.db")))
+        cache.remember("Alice", "Expert", None)
+
+        assert cache.get("Alice") is None
+        assert cache.enabled is False
@@ -0,0 +1,55 @@
+"""
+ブラウザプロファイル再利用（BrowserSession）のテスト
+"""
+from app.services.scraper_service import BrowserSession, ScraperService
+
+
+class FakeContext:
+    def __init__(self):
+        self.saved_to = None
+        self.closed = False
+
+    def new_page(self):
+        return "page"
+
+    def storage_state(self, path):
+        self.saved_to = path
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class TestBrowserSession:
+    """BrowserSessionのテスト"""
+
+    def test_persistent_session_saves_storage_state(self, tmp_path):
+        """永続プロファイルは close 時に storage state を書き出す"""
+        context = FakeContext()
+        session = BrowserSession(context, storage_state_path=tmp_path / "storage_state.json")
+
+        assert session.new_page() == "page"
+        session.close()
+
+        assert context.saved_to == str(tmp_path / "storage_state.json")
+        assert context.closed
+
+    def test_fallback_session_closes_browser(self):
+        """一時コンテキストは storage state を上書きせず、ブラウザごと閉じる"""
+        context = FakeContext()
+        browser = FakeBrowser()
+        BrowserSession(context, browser=browser).close()
+
+        assert context.saved_to is None
+        assert context.closed and browser.closed
+
+    def test_profile_can_be_disabled(self):
+        """空文字列でプロファイルなし（毎回新規）"""
+        assert ScraperService(profile_dir="").profile_dir is None
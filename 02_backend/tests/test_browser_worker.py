@@ -0,0 +1,151 @@
+"""
+メモリ上限付きブラウザワーカーのテスト
+"""
+from app.services.browser_worker import BrowserWorker, MemoryProfile, process_tree_rss_mb
+
+
+class FakePage:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.closed = False
+        self.pages = []
+
+    def new_page(self):
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+    def close(self):
+        self.closed = True
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.stopped = False
+
+    def stop(self):
+        self.stopped = True
+
+
+def make_worker(rss_values=None, **options):
+    """起動したブラウザを browsers に記録するワーカー"""
+    browsers = []
+    rss = iter(rss_values) if rss_values else None
+
+    def launch(playwright):
+        browsers.append(FakeBrowser())
+        return browsers[-1]
+
+    worker = BrowserWorker(
+        launch,
+        start_playwright=FakePlaywright,
+        rss_reader=(lambda: next(rss)) if rss else (lambda: None),
+        **options
+    )
+    return worker, browsers
+
+
+def scrape(worker, pages=1, close=True):
+    """ScraperService のメソッド1回分（_playwright → _launch_browser → close）"""
+    worker.enter()
+    try:
+        lease = worker.lease()
+        for _ in range(pages):
+            lease.new_page()
+        if close:
+            lease.close()
+    finally:
+        worker.exit()
+
+
+class TestBrowserWorker:
+    """BrowserWorkerのテスト"""
+
+    def test_reuses_browser_and_closes_pages(self):
+        """呼び出しごとにブラウザは終了せず、開いたページだけ閉じる"""
+        worker, browsers = make_worker(max_pages=0, max_rss_mb=0)
+        worker.start()
+
+        scrape(worker, pages=2)
+        scrape(worker, pages=1, close=False)  # 例外などで close されなかった場合も片付ける
+
+        assert len(browsers) == 1
+        assert not browsers[0].closed
+        assert all(page.closed for page in browsers[0].pages)
+        assert worker.pages_served == 3
+
+    def test_recycles_at_page_limit(self):
+        """ページ数上限を超えたら呼び出しの合間にリサイクル"""
+        worker, browsers = make_worker(max_pages=3, max_rss_mb=0)
+        worker.start()
+
+        scrape(worker, pages=2)
+        scrape(worker, pages=2)
+        scrape(worker, pages=1)
+        worker.stop()
+
+        assert len(browsers) == 2
+        assert browsers[0].closed
+        assert [g['pages'] for g in worker.profile.generations] == [4, 1]
+        assert [g['reason'] for g in worker.profile.generations] == ['pages', 'end']
+
+    def test_recycles_at_memory_limit(self):
+        """RSS上限を超えたらリサイクル"""
+        # start, exit判定(超過), stop, 再start, stop
+        worker, browsers = make_worker(rss_values=[300, 1200, 1200, 320, 330], max_pages=0, max_rss_mb=1000)
+        worker.start()
+
+        scrape(worker)
+        worker.stop()
+
+        assert len(browsers) == 2
+        assert worker.profile.peak_mb == 1200
+        assert worker.profile.generations[0]['reason'] == 'memory'
+
+    def test_no_recycle_inside_nested_call(self):
+        """入れ子の呼び出しの途中ではリサイクルしない"""
+        worker, browsers = make_worker(max_pages=1, max_rss_mb=0)
+        worker.start()
+
+        worker.enter()
+        scrape(worker, pages=2)
+        assert len(browsers) == 1
+        worker.exit()
+
+        assert len(browsers) == 2
+
+
+class TestMemoryProfile:
+    """MemoryProfileのテスト"""
+
+    def test_leak_suspected_when_baseline_keeps_growing(self):
+        """リサイクル後のベースラインが増え続けるとリークの兆候"""
+        profile = MemoryProfile()
+        for baseline in (300, 340, 380):
+            profile.start_generation(baseline)
+            profile.end_generation(baseline + 500, 100, 'pages')
+
+        assert profile.leak_suspected()
+        assert any("リーク" in line for line in profile.report())
+
+    def test_no_leak_when_baseline_returns(self):
+        """ブラウザの再起動でメモリが戻るならリークではない"""
+        profile = MemoryProfile()
+        for baseline in (300, 310, 305):
+            profile.start_generation(baseline)
+            profile.end_generation(baseline + 500, 100, 'pages')
+
+        assert not profile.leak_suspected()
+
+    def test_process_tree_rss(self):
+        """自プロセスのRSSを計測できる（Linux / psutil）"""
+        rss = process_tree_rss_mb()
+
+        assert rss is None or rss > 0
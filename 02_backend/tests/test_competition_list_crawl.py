@@ -0,0 +1,102 @@
+"""
+コンペ一覧の並列取得（ScraperService.iter_competitions_list）のテスト
+"""
+import threading
+
+import httpx
+
+from app.services.http_fetcher import HttpFetcher
+from app.services.rate_limiter import AdaptiveRateLimiter
+from app.services.scraper_service import ScraperService
+
+
+def page_html(page_num, count=3):
+    links = "".join(f'<a href="/competitions/comp-{page_num}-{i}">Comp</a>' for i in range(count))
+    return f"<html><body>{links}</body></html>"
+
+
+def make_scraper(last_page):
+    """last_page まではコンペがあり、それ以降は空の一覧を返す ScraperService"""
+    requested = []
+    lock = threading.Lock()
+
+    def handler(request):
+        page_num = int(request.url.params['page'])
+        with lock:
+            requested.append(page_num)
+        return httpx.Response(200, text=page_html(page_num) if page_num <= last_page else "<html></html>")
+
+    limiter = AdaptiveRateLimiter(initial_rate=1000.0)
+    fetcher = HttpFetcher(rate_limiter=limiter, transport=httpx.MockTransport(handler))
+    return ScraperService(profile_dir="", http_first=True, http_fetcher=fetcher), requested
+
+
+class TestIterCompetitionsList:
+    """ページ単位の並列取得と打ち切りのテスト"""
+
+    def test_stops_at_empty_page(self):
+        """空のページで一覧の終わりとみなし、それより前のページだけを返す"""
+        scraper, requested = make_scraper(last_page=5)
+
+        pages = dict(scraper.iter_competitions_list(max_pages=20, concurrency=3))
+
+        assert sorted(pages) == [1, 2, 3, 4, 5]
+        assert pages[2] == ['comp-2-0', 'comp-2-1', 'comp-2-2']
+        # 終わりの後に取得を始めるのは並列数の範囲まで
+        assert max(requested) <= 6 + 3
+
+    def test_stops_at_known_page(self):
+        """既知のコンペだけのページで打ち切る"""
+        scraper, requested = make_scraper(last_page=20)
+        known_ids = {f"comp-{page}-{i}" for page in range(2, 21) for i in range(3)}
+
+        pages = list(scraper.iter_competitions_list(max_pages=20, known_ids=known_ids, concurrency=1))
+
+        assert [page_num for page_num, _ in pages] == [1, 2]
+        assert requested == [1, 2]
+
+    def test_known_first_page_fetches_once(self):
+        """1ページ目が既知のコンペだけなら他のページは取得しない"""
+        scraper, requested = make_scraper(last_page=20)
+        known_ids = {f"comp-1-{i}" for i in range(3)}
+
+        pages = list(scraper.iter_competitions_list(max_pages=20, known_ids=known_ids, concurrency=4))
+
+        assert [page_num for page_num, _ in pages] == [1]
+        assert requested == [1]
+
+    def test_streams_pages(self):
+        """取得できたページから順次返し、途中で止めると以降の取得も止まる"""
+        scraper, requested = make_scraper(last_page=100)
+
+        crawl = scraper.iter_competitions_list(max_pages=100, concurrency=2)
+        first_page, first_comps = next(crawl)
+        crawl.close()
+
+        assert first_page == 1
+        assert len(first_comps) == 3
+        assert len(requested) < 100
+
+    def test_scrape_competitions_list_with_known_ids(self):
+        """scrape_competitions_list も差分取得で打ち切り、新しいIDを含む全IDを返す"""
+        scraper, requested = make_scraper(last_page=20)
+        known_ids = {f"comp-{page}-{i}" for page in range(2, 21) for i in range(3)}
+
+        comp_ids = scraper.scrape_competitions_list(max_pages=20, known_ids=known_ids, concurrency=1)
+
+        assert comp_ids == sorted(f"comp-{page}-{i}" for page in (1, 2) for i in range(3))
+        assert requested == [1, 2]
+
+    def test_details_dedupe_across_pages(self, monkeypatch):
+        """include_details=True でもページをまたいで同じコンペはIDで1件にまとめる"""
+        scraper, _ = make_scraper(last_page=0)
+        featured = {'id': "titanic", 'title': "Titanic", 'description': "", 'url': "https://www.kaggle.com/competitions/titanic"}
+        pages = [
+            (1, [featured, {**featured, 'id': "house-prices", 'title': "House Prices"}]),
+            (2, [featured]),
+        ]
+        monkeypatch.setattr(scraper, 'iter_competitions_list', lambda **kwargs: iter(pages))
+
+        comps = scraper.scrape_competitions_list(max_pages=2, include_details=True, known_ids=set())
+
+        assert [comp['id'] for comp in comps] == ["house-prices", "titanic"]
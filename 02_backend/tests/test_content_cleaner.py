@@ -0,0 +1,104 @@
+"""
+LLMに渡す前の本文クリーニングのテスト
+"""
+from app.services.content_cleaner import clean_page_text, extract_main_content, inner_text
+from app.services.html_parser import parse_html
+from app.services.scraper_service import ScraperService
+
+
+DISCUSSION_URL = "https://www.kaggle.com/competitions/test-comp/discussion/123456"
+
+DISCUSSION_HTML = """
+<html><body>
+<nav><a href="/competitions">Competitions</a><a href="/datasets">Datasets</a></nav>
+<div id="site-content">
+  <div><h1>1st Place Solution</h1><button>Follow</button></div>
+  <div>
+    <span>arrow_drop_up</span><span>42</span>
+    <div class="markdown-converter__text--rendered"><p>We trained LightGBM on 5 folds.</p><p>CV 0.912</p></div>
+  </div>
+  <div role="toolbar"><button>Share</button><button>Reply</button></div>
+  <h2>Comments (3)</h2>
+  <div class="markdown-converter__text--rendered"><p>Congrats!</p></div>
+  <div class="markdown-converter__text--rendered"><p>Which features mattered?</p></div>
+  <div class="markdown-converter__text--rendered"><p>Thanks for sharing.</p></div>
+  <aside><h3>Related Topics</h3><a href="/d/1">How to start</a></aside>
+</div>
+</body></html>
+"""
+
+
+class TestExtractMainContent:
+    """extract_main_content のテスト"""
+
+    def test_post_and_top_comments(self):
+        """タイトル・投稿本文・先頭から max_comments 件のコメントだけを残す"""
+        text = extract_main_content(DISCUSSION_HTML, DISCUSSION_URL, max_comments=2)
+
+        assert text == (
+            "1st Place Solution\n\n"
+            "We trained LightGBM on 5 folds.\nCV 0.912\n\n"
+            "[コメント 1]\nCongrats!\n\n"
+            "[コメント 2]\nWhich features mattered?"
+        )
+
+    def test_without_comments(self):
+        """max_comments=0 なら投稿本文のみ"""
+        text = extract_main_content(DISCUSSION_HTML, DISCUSSION_URL, max_comments=0)
+
+        assert "Congrats!" not in text
+        assert text.endswith("CV 0.912")
+
+    def test_other_pages_strip_chrome(self):
+        """ディスカッション以外はUI要素とラベルの行を除いた全文"""
+        text = extract_main_content(DISCUSSION_HTML, "https://www.kaggle.com/code/user/notebook")
+
+        assert "We trained LightGBM on 5 folds." in text
+        assert "Thanks for sharing." in text
+        for chrome in ("Follow", "Share", "arrow_drop_up", "42", "Related Topics", "How to start"):
+            assert chrome not in text.splitlines()
+
+    def test_missing_site_content(self):
+        """#site-content がなければ None"""
+        assert extract_main_content("<html><body><p>shell</p></body></html>", DISCUSSION_URL) is None
+
+    def test_clean_page_text(self):
+        """inner_text のUIラベルだけの行を除く"""
+        text = "Title\nmore_vert\n12\nReply\n\n\n\nBody text with 12 numbers\nSort by\nHotness"
+
+        assert clean_page_text(text) == "Title\n\nBody text with 12 numbers"
+
+    def test_inner_text(self):
+        """インライン要素は同じ行、ブロック要素・<br> で改行（inner_text と同じ行区切り）"""
+        html = (
+            '<div id="site-content"><h1>1st\n  Place</h1>'
+            '<p>Top <b>12</b> features, see <a href="/d/1">this</a>.<br>CV 0.912</p>'
+            '<script>var x = 1;</script><!-- hidden --><pre>a = 1\nb = 2</pre>'
+            '<div><span>more_vert</span></div></div>'
+        )
+
+        text = inner_text(parse_html(html).select_one('#site-content'))
+
+        assert text == "1st Place\nTop 12 features, see this.\nCV 0.912\na = 1\nb = 2\nmore_vert"
+        assert clean_page_text(text) == "1st Place\nTop 12 features, see this.\nCV 0.912\na = 1\nb = 2"
+
+
+class TestScraperCleaning:
+    """ScraperService の本文クリーニングのテスト"""
+
+    def test_clean_content(self):
+        """有効なら抽出した本文、無効なら #site-content のテキストのまま"""
+        page_text = "1st Place Solution\nFollow\nWe trained LightGBM on 5 folds."
+
+        cleaned = ScraperService(profile_dir="", clean_content=True, content_max_comments=1)
+        raw = ScraperService(profile_dir="", clean_content=False)
+
+        assert "[コメント 2]" not in cleaned._clean_content(DISCUSSION_URL, DISCUSSION_HTML, page_text)
+        assert "Congrats!" in cleaned._clean_content(DISCUSSION_URL, DISCUSSION_HTML, page_text)
+        assert raw._clean_content(DISCUSSION_URL, DISCUSSION_HTML, page_text) == page_text
+
+    def test_falls_back_to_page_text(self):
+        """HTMLから取り出せなければ page_text からUIラベルの行を除く"""
+        scraper = ScraperService(profile_dir="", clean_content=True)
+
+        assert scraper._clean_content(DISCUSSION_URL, "", "Body\nReply\n3") == "Body"
@@ -0,0 +1,53 @@
+"""
+本文の正規化ハッシュのテスト
+"""
+from app.services.content_fingerprint import (
+    ContentFingerprintStats,
+    compute_content_hash,
+    normalize_content,
+)
+
+
+class TestComputeContentHash:
+    """正規化ハッシュのテスト"""
+
+    def test_ignores_whitespace_and_relative_time(self):
+        """空白の揺れと相対日時の違いは同じハッシュ"""
+        first = "1st Place Solution\nPosted 3 days ago\n\nWe used  LightGBM."
+        second = "1st Place Solution Posted a month ago\nWe used LightGBM.  "
+
+        assert compute_content_hash(first) == compute_content_hash(second)
+
+    def test_ignores_ui_label_lines(self):
+        """投票数・UIラベルの行の有無（取得経路・クリーニングの違い）は同じハッシュ"""
+        raw = "1st Place Solution\narrow_drop_up\n42\nWe used LightGBM.\nReply\nShare"
+        cleaned = "1st Place Solution\n\nWe used LightGBM."
+
+        assert compute_content_hash(raw) == compute_content_hash(cleaned)
+        assert compute_content_hash(raw) == compute_content_hash(raw.replace("42", "57"))
+
+    def test_detects_content_change(self):
+        """本文が変われば別のハッシュ"""
+        assert compute_content_hash("We used LightGBM.") != compute_content_hash("We used XGBoost.")
+
+    def test_normalize_content(self):
+        """相対日時を除去して空白をまとめる"""
+        assert normalize_content("Alice · 2 hours ago\n\nHello") == "Alice · Hello"
+        assert normalize_content(None) == ""
+
+
+class TestContentFingerprintStats:
+    """ヒット率集計のテスト"""
+
+    def test_summary(self):
+        """種別ごとにヒット率を計算"""
+        stats = ContentFingerprintStats()
+        stats.record('discussion', True)
+        stats.record('discussion', True)
+        stats.record('discussion', False)
+        stats.record('solution', False)
+
+        summary = stats.summary()
+
+        assert summary['discussion'] == {'hits': 2, 'misses': 1, 'hit_rate': 0.667}
+        assert summary['solution'] == {'hits': 0, 'misses': 1, 'hit_rate': 0.0}
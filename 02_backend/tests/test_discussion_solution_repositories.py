@@ -12,6 +12,7 @@ from app.repositories.solution import SolutionRepository
 from app.models.competition import Competition
 from app.models.discussion import Discussion
 from app.models.solution import Solution
+from app.services.discussion import DiscussionService, is_listing_item_changed
 
 
 @pytest.fixture
@@ -64,6 +65,7 @@ def test_db():
                 is_pinned BOOLEAN DEFAULT 0,
                 content TEXT,
                 summary TEXT,
+                content_hash TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (competition_id) REFERENCES competitions(id)
@@ -86,6 +88,7 @@ def test_db():
                 content TEXT,
                 summary TEXT,
                 techniques TEXT,
+                content_hash TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (competition_id) REFERENCES competitions(id)
@@ -443,3 +446,63 @@ class TestSolutionRepository:
         assert updated.id == created.id
         assert updated.vote_count == 100
         assert updated.summary == "AI generated summary"
+
+
+class TestDiscussionIncrementalSync:
+    """ディスカッション差分同期のテスト"""
+
+    def _item(self, num, vote_count=10, comment_count=5, **extra):
+        return {
+            'title': f"Discussion {num}",
+            'url': f"https://kaggle.com/c/test-comp/discussion/{num}",
+            'author': "test-user",
+            'vote_count': vote_count,
+            'comment_count': comment_count,
+            'category': 'discussion',
+            **extra,
+        }
+
+    def test_get_listing_index(self, test_db):
+        """URLをキーとした既存行の索引を取得"""
+        service = DiscussionService(DiscussionRepository(test_db))
+        service.sync_discussions("test-comp", [self._item(1)])
+
+        index = service.get_listing_index("test-comp")
+
+        assert list(index.keys()) == ["https://kaggle.com/c/test-comp/discussion/1"]
+        assert index["https://kaggle.com/c/test-comp/discussion/1"]['vote_count'] == 10
+        assert service.get_listing_index("other-comp") == {}
+
+    def test_sync_writes_only_changed_rows(self, test_db):
+        """変化した行のみ書き込み、既存の要約は保持する"""
+        repo = DiscussionRepository(test_db)
+        service = DiscussionService(repo)
+
+        first = service.sync_discussions("test-comp", [self._item(1), self._item(2)])
+        assert first == {"saved": 2, "updated": 0, "unchanged": 0, "total": 2}
+
+        # 要約を付与
+        disc_id = service.get_listing_index("test-comp")["https://kaggle.com/c/test-comp/discussion/1"]['id']
+        discussion = repo.get_by_id(disc_id)
+        discussion.summary = "summary"
+        repo.update(discussion)
+
+        second = service.sync_discussions(
+            "test-comp",
+            [self._item(1, vote_count=11), self._item(2), self._item(3)]
+        )
+        assert second == {"saved": 1, "updated": 1, "unchanged": 1, "total": 2}
+
+        updated = repo.get_by_id(disc_id)
+        assert updated.vote_count == 11
+        assert updated.summary == "summary"
+
+    def test_is_listing_item_changed(self):
+        """URL・件数・Kaggle側更新日時で変化を判定"""
+        known = {'id': 1, 'vote_count': 10, 'comment_count': 5, 'updated_at': "2024-05-01T00:00:00"}
+
+        assert is_listing_item_changed(self._item(1), None) is True
+        assert is_listing_item_changed(self._item(1), known) is False
+        assert is_listing_item_changed(self._item(1, comment_count=6), known) is True
+        assert is_listing_item_changed(self._item(1, updated_at="2024-04-30T00:00:00"), known) is False
+        assert is_listing_item_changed(self._item(1, updated_at="2024-06-01T00:00:00Z"), known) is True
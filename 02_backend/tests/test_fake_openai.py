@@ -0,0 +1,132 @@
+"""
+OpenAI互換の代替サーバー（FakeOpenAI）のテスト
+"""
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from openai import OpenAI
+
+from app.services import llm_service as llm_service_module
+from app.services.fake_openai import FakeOpenAI, detect_family, value_from_schema
+from app.services.llm_service import LLMService
+
+
+DESCRIPTION = "Predict the sale price of each house. Submissions are evaluated on RMSE."
+
+
+def connect(fake):
+    """FakeOpenAI のアプリに HTTP で接続する LLMService"""
+    service = LLMService(api_key="fake-key", use_cache=False)
+    service.client = OpenAI(
+        api_key="fake-key",
+        base_url="http://fake-openai/v1",
+        http_client=TestClient(fake.create_app(), base_url="http://fake-openai"),
+        max_retries=0
+    )
+    service.retry_delay = 0
+    return service
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(llm_service_module, "backoff_delay", lambda attempt, **kwargs: 0)
+
+
+class TestDetectFamily:
+    """プロンプトの種類の判定のテスト"""
+
+    @pytest.mark.parametrize("method, call", [
+        ("extract_evaluation_metric", lambda s: s.extract_evaluation_metric(DESCRIPTION, "House Prices")),
+        ("generate_metric_description", lambda s: s.generate_metric_description("RMSE", DESCRIPTION, "House Prices")),
+        ("extract_dataset_info", lambda s: s.extract_dataset_info("train.csv 1MB", "House Prices")),
+        ("generate_summary", lambda s: s.generate_summary(DESCRIPTION, "House Prices", "RMSE")),
+        ("generate_tags", lambda s: s.generate_tags(DESCRIPTION, "House Prices", "RMSE", {"task_type": ["回帰"]})),
+        ("summarize_discussion", lambda s: s.summarize_discussion("We used LightGBM.", "Tips")),
+        ("generate_structured_discussion_summary",
+         lambda s: s.generate_structured_discussion_summary("We used LightGBM.", "Tips")),
+        ("translate_and_organize_discussion", lambda s: s.translate_and_organize_discussion("We used LightGBM.")),
+        ("extract_solution_techniques", lambda s: s.extract_solution_techniques("We used LightGBM.", "1st")),
+        ("generate_structured_solution_summary",
+         lambda s: s.generate_structured_solution_summary("We used LightGBM.", "1st")),
+        ("summarize_notebook", lambda s: s.summarize_notebook("import lightgbm", "Baseline")),
+        ("condense_chunk", lambda s: s.condense_chunk("We used LightGBM.", "1st")),
+        ("generate_enrichment", lambda s: s.generate_enrichment(DESCRIPTION, "House Prices", ["summary", "metric"])),
+    ])
+    def test_each_method(self, method, call, make_llm_service):
+        """LLMService の各メソッドのリクエストをそのメソッドと判定する"""
+        service = make_llm_service(respond=lambda request: "{}")
+
+        call(service)
+
+        request = service.client.chat.completions.calls[0]
+        assert detect_family(request["messages"], request.get("response_format")) == method
+
+    def test_value_from_schema(self):
+        """スキーマの必須プロパティ・配列・入れ子をすべて満たす"""
+        value = value_from_schema(LLMService.ENRICHMENT_SCHEMAS["dataset_info"])
+
+        assert set(value) == {"files", "total_size", "description", "features", "columns"}
+        assert value["columns"][0] == {"name": "nameのダミー", "description": "descriptionのダミー"}
+
+
+class TestFakeServer:
+    """LLMService から HTTP で呼び出すテスト"""
+
+    def test_base_url(self):
+        """base_url を指定すると OpenAI互換サーバーに接続する"""
+        service = LLMService(api_key="fake-key", use_cache=False, base_url="http://127.0.0.1:8100/v1")
+
+        assert str(service.client.base_url).startswith("http://127.0.0.1:8100/v1")
+
+    def test_enrichment_passes_validation(self):
+        """一括充実化のレスポンスが全フィールドの検証を通る"""
+        service = connect(FakeOpenAI())
+
+        enrichment = service.generate_enrichment(
+            DESCRIPTION, "House Prices", data_text="train.csv", available_tags={"task_type": ["回帰"]}
+        )
+
+        assert set(enrichment) == {"summary", "metric", "metric_description", "tags", "dataset_info"}
+        assert json.loads(enrichment["summary"])["evaluation"]["metric"]
+
+    def test_summaries_have_expected_fields(self):
+        """要約系メソッドのJSONに各メソッドの必須フィールドがある"""
+        service = connect(FakeOpenAI())
+
+        notebook = json.loads(service.summarize_notebook("import lightgbm", "Baseline"))
+        solution = json.loads(service.generate_structured_solution_summary("We used LightGBM.", "1st"))
+
+        assert notebook["useful_for"] and notebook["models_used"]
+        assert solution["techniques"][0]["english"]
+
+    def test_rate_limits_are_retried(self):
+        """429 は再試行し、最終的に成功する"""
+        fake = FakeOpenAI(rate_limit_rate=0.5, retry_after=0, seed=1)
+        service = connect(fake)
+
+        metrics = [service.extract_evaluation_metric(DESCRIPTION, f"Comp {i}") for i in range(10)]
+
+        stats = fake.stats()["extract_evaluation_metric"]
+        assert metrics == ["二乗平均平方根誤差（RMSE）"] * 10
+        assert stats["rate_limited"] > 0
+        assert stats["requests"] == 10 + stats["rate_limited"]
+
+    def test_malformed_output_falls_back(self):
+        """不正なJSONは検証エラーとして再試行し、最終的に既定値を返す"""
+        fake = FakeOpenAI(malformed_rate=1.0)
+        service = connect(fake)
+
+        assert service.generate_structured_solution_summary("We used LightGBM.", "1st") == "{}"
+        assert fake.stats()["generate_structured_solution_summary"]["malformed"] == service.max_retries
+
+    def test_streaming(self):
+        """stream=True では chat.completion.chunk を逐次返す"""
+        service = connect(FakeOpenAI())
+        received = []
+
+        with service.streaming(lambda method, delta: received.append(delta), ["translate_and_organize_discussion"]):
+            text = service.translate_and_organize_discussion("We used LightGBM.")
+
+        assert len(received) > 1
+        assert "".join(received) == text
@@ -0,0 +1,154 @@
+"""
+スクレイピング用フィクスチャストアのテスト
+"""
+from app.services.fixture_store import FixtureStore
+from app.services.rate_limiter import AdaptiveRateLimiter
+from app.services.scraper_service import ScraperService
+
+
+API_URL = "https://www.kaggle.com/api/i/discussions.DiscussionsService/GetTopicListByForumId"
+PAGE_URL = "https://www.kaggle.com/competitions/test-comp/discussion?sort=votes"
+
+
+class FakeResponse:
+    def __init__(self, status=200):
+        self.status = status
+        self.headers = {}
+
+
+class FakePage:
+    """goto / content / on だけを持つページのスタブ"""
+
+    def __init__(self, html="<html><body>recorded</body></html>"):
+        self.html = html
+        self.visited = []
+        self.handlers = {}
+
+    def goto(self, url, **kwargs):
+        self.visited.append(url)
+        return FakeResponse()
+
+    def content(self):
+        return self.html
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def route(self, pattern, handler):
+        pass
+
+
+class FakeBrowser:
+    def __init__(self, page):
+        self.page = page
+
+    def new_page(self):
+        return self.page
+
+
+class FakeApiResponse:
+    """Kaggle内部APIのJSONレスポンス"""
+
+    url = API_URL
+    status = 200
+    headers = {'content-type': 'application/json'}
+
+    def json(self):
+        return {'topics': [1]}
+
+
+def make_recorder(tmp_path):
+    """record モードの ScraperService（レート制限の待機は時計を進めるだけ）"""
+    clock = {'now': 1000.0}
+    limiter = AdaptiveRateLimiter(
+        clock=lambda: clock['now'], sleep=lambda seconds: clock.update(now=clock['now'] + seconds)
+    )
+    return ScraperService(fixture_mode='record', fixture_dir=tmp_path, rate_limiter=limiter)
+
+
+class TestFixtureStore:
+    """保存・読み込みのテスト"""
+
+    def test_roundtrip(self, tmp_path):
+        """保存した HTML と JSON がそのまま読める"""
+        store = FixtureStore(tmp_path)
+        responses = [{'url': API_URL, 'status': 200, 'content_type': 'application/json', 'body': {'topics': []}}]
+
+        store.save(PAGE_URL, "<html>日本語</html>", responses=responses)
+        fixture = store.load(PAGE_URL)
+
+        assert fixture['url'] == PAGE_URL
+        assert fixture['status'] == 200
+        assert fixture['html'] == "<html>日本語</html>"
+        assert fixture['responses'] == responses
+        assert store.urls() == [PAGE_URL]
+
+    def test_fragment_is_ignored(self, tmp_path):
+        """URLのフラグメント違いは同じフィクスチャ"""
+        store = FixtureStore(tmp_path)
+        store.save(PAGE_URL, "<html></html>")
+
+        assert store.has(f"{PAGE_URL}#comment-1")
+
+    def test_missing(self, tmp_path):
+        """未記録のURLはNone"""
+        store = FixtureStore(tmp_path)
+        assert store.load(PAGE_URL) is None
+        assert store.urls() == []
+
+
+class TestScraperFixtureMode:
+    """ScraperService の記録・再生のテスト"""
+
+    def test_record_then_replay_json(self, tmp_path):
+        """記録したJSONが replay 時に json_payloads へ流し込まれる"""
+        recorder = make_recorder(tmp_path)
+        page = recorder._new_page(FakeBrowser(FakePage()))
+        original_goto = page.goto
+
+        def goto_with_xhr(url, **kwargs):
+            response = original_goto(url, **kwargs)
+            page.handlers['response'](FakeApiResponse())
+            return response
+
+        page.goto = goto_with_xhr
+        recorder._goto(page, PAGE_URL)
+
+        player = ScraperService(json_capture=True, fixture_mode='replay', fixture_dir=tmp_path)
+        payloads = []
+        player._goto(FakePage(), PAGE_URL, json_payloads=payloads)
+
+        assert player.fixture_store.load(PAGE_URL)['html'] == "<html><body>recorded</body></html>"
+        assert payloads == [{'topics': [1]}]
+
+    def test_fixture_is_saved_after_render(self, tmp_path):
+        """描画後に _save_fixture を呼ぶと、描画後のHTMLと遷移後に受信したJSONで上書きする"""
+        recorder = make_recorder(tmp_path)
+        page = recorder._new_page(FakeBrowser(FakePage(html="<html><body>shell</body></html>")))
+
+        recorder._goto(page, PAGE_URL)
+        assert recorder.fixture_store.load(PAGE_URL)['html'] == "<html><body>shell</body></html>"
+
+        page.html = "<html><body>rendered</body></html>"
+        page.handlers['response'](FakeApiResponse())
+        recorder._save_fixture(page)
+
+        fixture = recorder.fixture_store.load(PAGE_URL)
+        assert fixture['html'] == "<html><body>rendered</body></html>"
+        assert [response['body'] for response in fixture['responses']] == [{'topics': [1]}]
+
+    def test_recordings_are_per_page(self, tmp_path):
+        """ページごとに記録し、別のページが受信したJSONは混ざらない"""
+        recorder = make_recorder(tmp_path)
+        first = recorder._new_page(FakeBrowser(FakePage()))
+        second = recorder._new_page(FakeBrowser(FakePage()))
+        other_url = PAGE_URL + "&page=2"
+
+        recorder._goto(first, PAGE_URL)
+        recorder._goto(second, other_url)
+        second.handlers['response'](FakeApiResponse())
+        recorder._save_fixture(first)
+        recorder._save_fixture(second)
+
+        assert recorder.fixture_store.load(PAGE_URL)['responses'] == []
+        assert len(recorder.fixture_store.load(other_url)['responses']) == 1
@@ -0,0 +1,44 @@
+"""
+HTML解析バックエンドのテスト
+"""
+import pytest
+
+from app.services.html_parser import available_backends, get_default_backend, parse_html
+
+
+LIST_HTML = """
+<html><body>
+  <a href="/competitions">All</a>
+  <a href="/competitions/titanic">
+    <div class="sc-abc sc-kSaXSp">
+      <div class="sc-kCuUfV x">Titanic</div>
+      <span class="sc-eqNDNG sc-fYRIQK">Featured · Code Competition</span>
+      <span class="sc-eqNDNG sc-fYRIQK">Predict survival on the Titanic</span>
+    </div>
+  </a>
+</body></html>
+"""
+
+
+class TestHtmlParser:
+    """パーサー切り替えとCSSセレクタのテスト"""
+
+    def test_default_backend_is_available(self):
+        """html.parser は常に利用可能で、既定値は利用可能なものから選ばれる"""
+        assert 'html.parser' in available_backends()
+        assert get_default_backend() in available_backends()
+
+    @pytest.mark.parametrize('backend', available_backends())
+    def test_css_selectors_match_lambda_results(self, backend):
+        """CSSセレクタが従来の lambda マッチャーと同じ要素を返す"""
+        soup = parse_html(LIST_HTML, backend)
+
+        cards = soup.select('div[class*="sc-kSaXSp"]')
+        assert cards == soup.find_all('div', class_=lambda x: x and 'sc-kSaXSp' in str(x))
+        assert cards[0].select_one('div[class*="sc-kCuUfV"]').get_text() == "Titanic"
+
+        desc = cards[0].select('span[class*="sc-eqNDNG"][class*="sc-fYRIQK"]')
+        assert [s.get_text() for s in desc][1] == "Predict survival on the Titanic"
+
+        links = soup.select('a[href^="/competitions/"]')
+        assert [a['href'] for a in links] == ["/competitions/titanic"]
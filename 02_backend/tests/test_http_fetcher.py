@@ -0,0 +1,129 @@
+"""
+軽量HTTP取得（HttpFetcher）とPlaywrightフォールバック判定のテスト
+"""
+import httpx
+
+from app.services.http_fetcher import FetchStats, HttpFetcher
+from app.services.rate_limiter import AdaptiveRateLimiter
+from app.services.scraper_service import MIN_STATIC_CONTENT_CHARS, STATIC_NOT_FOUND, ScraperService
+
+
+LIST_HTML = """
+<html><body>
+  <a href="/competitions/titanic">Titanic</a>
+  <a href="/competitions/titanic/overview">Titanic</a>
+  <a href="/competitions/house-prices?tab=data">House Prices</a>
+</body></html>
+"""
+
+SHELL_HTML = '<html><body><div id="site-content"></div><script src="/app.js"></script></body></html>'
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def make_fetcher(pages, statuses=None):
+    """URLパス → HTML の辞書で応答する HttpFetcher"""
+    def handler(request):
+        status = (statuses or {}).get(request.url.path, 200)
+        return httpx.Response(status, text=pages.get(request.url.path, ""))
+
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(initial_rate=1.0, clock=clock.time, sleep=clock.sleep)
+    return HttpFetcher(rate_limiter=limiter, transport=httpx.MockTransport(handler))
+
+
+class TestHttpFetcher:
+    """HttpFetcherのテスト"""
+
+    def test_fetch_records_to_rate_limiter(self):
+        """取得結果はレートリミッターに記録される"""
+        fetcher = make_fetcher({"/competitions": LIST_HTML}, statuses={"/competitions": 429})
+
+        response = fetcher.fetch("https://www.kaggle.com/competitions")
+
+        assert response.status_code == 429
+        assert fetcher.rate_limiter.snapshot()['rate'] < 1.0
+
+
+class TestFetchStats:
+    """取得方法ごとの集計のテスト"""
+
+    def test_summary(self):
+        """ページ種別・取得方法ごとに成功率と平均レイテンシを計算"""
+        stats = FetchStats()
+        stats.record('competitions_list', 'http', True, 0.2)
+        stats.record('competitions_list', 'http', False, 0.4)
+        stats.record('competitions_list', 'playwright', True, 3.0)
+
+        summary = stats.summary()['competitions_list']
+
+        assert summary['http'] == {'attempts': 2, 'successes': 1, 'success_rate': 0.5, 'avg_seconds': 0.3}
+        assert summary['playwright']['success_rate'] == 1.0
+
+
+class TestStaticFetch:
+    """ScraperService の HTTP 優先取得のテスト"""
+
+    def test_competition_list_from_http(self):
+        """一覧ページのHTMLにリンクがあればHTTPの結果を使う"""
+        scraper = ScraperService(profile_dir="", http_first=True, http_fetcher=make_fetcher({"/competitions": LIST_HTML}))
+
+        comps = scraper._fetch_static(
+            'competitions_list',
+            "https://www.kaggle.com/competitions?page=1",
+            lambda html: scraper._parse_competition_list_html(html, include_details=False)
+        )
+
+        assert comps == ['house-prices', 'titanic']
+
+    def test_shell_page_falls_back(self):
+        """JSレンダリング前のシェルは None（Playwright にフォールバック）"""
+        scraper = ScraperService(profile_dir="", http_first=True, http_fetcher=make_fetcher({"/d/1": SHELL_HTML}))
+
+        assert scraper._fetch_static('discussion_detail', "https://www.kaggle.com/d/1", scraper._extract_site_content) is None
+
+    def test_rendered_detail_from_http(self):
+        """本文が十分にあればHTTPの結果を使う"""
+        body = "We used LightGBM. " * (MIN_STATIC_CONTENT_CHARS // 10)
+        html = f'<html><body><div id="site-content"><p>{body}</p></div></body></html>'
+        scraper = ScraperService(profile_dir="", http_first=True, http_fetcher=make_fetcher({"/d/2": html}))
+
+        content = scraper._fetch_static('discussion_detail', "https://www.kaggle.com/d/2", scraper._extract_site_content)
+
+        assert content.startswith("We used LightGBM.")
+
+    def test_rendered_detail_matches_inner_text(self):
+        """インライン要素で改行せず、Playwright の inner_text と同じ行区切りで取り出す"""
+        body = "<p>We used <b>LightGBM</b> with <span>12</span> folds.</p>" * (MIN_STATIC_CONTENT_CHARS // 30)
+        html = f'<html><body><div id="site-content">{body}</div></body></html>'
+        scraper = ScraperService(profile_dir="", http_first=True, http_fetcher=make_fetcher({"/d/3": html}))
+
+        content = scraper._fetch_static('discussion_detail', "https://www.kaggle.com/d/3", scraper._extract_site_content)
+
+        assert content.splitlines()[0] == "We used LightGBM with 12 folds."
+
+    def test_not_found(self):
+        """404 は STATIC_NOT_FOUND（Playwright にフォールバックしない）"""
+        scraper = ScraperService(
+            profile_dir="", http_first=True, http_fetcher=make_fetcher({}, statuses={"/d/4": 404})
+        )
+
+        result = scraper._fetch_static('discussion_detail', "https://www.kaggle.com/d/4", scraper._extract_site_content)
+
+        assert result is STATIC_NOT_FOUND
+
+    def test_disabled_in_fixture_mode(self, tmp_path):
+        """フィクスチャモードではHTTP取得を使わない"""
+        scraper = ScraperService(profile_dir="", fixture_mode='replay', fixture_dir=str(tmp_path), http_first=True)
+
+        assert not scraper.http_first
+        assert scraper._fetch_static('competitions_list', "https://www.kaggle.com/competitions", str) is None
@@ -0,0 +1,160 @@
+"""
+Kaggle 内部 JSON API レスポンス解析のテスト
+"""
+from app.services.kaggle_json import (
+    is_kaggle_api_response,
+    normalize_tier,
+    extract_discussion_items,
+    extract_notebook_items,
+    extract_competition_items,
+)
+
+
+DISCUSSION_PAYLOAD = {
+    "topics": [
+        {
+            "id": 1,
+            "title": "1st Place Solution",
+            "topicUrl": "/competitions/test-comp/writeups/team-a-1st-place",
+            "votes": 120,
+            "commentCount": 15,
+            "isSticky": False,
+            "postDate": "2024-05-01T10:00:00Z",
+            "lastCommentPostDate": "2024-05-03T12:00:00Z",
+            "authorUser": {
+                "displayName": "Alice",
+                "url": "/alice",
+                "tier": "GRANDMASTER",
+            },
+        },
+        {
+            "id": 2,
+            "title": "Welcome!",
+            "topicUrl": "/competitions/test-comp/discussion/2",
+            "votes": 5,
+            "commentCount": 1,
+            "isSticky": True,
+            "authorUser": {"displayName": "Host", "tier": "staff"},
+        },
+    ]
+}
+
+
+class TestIsKaggleApiResponse:
+    """キャプチャ対象判定のテスト"""
+
+    def test_api_json_response(self):
+        """内部APIのJSONは対象"""
+        url = "https://www.kaggle.com/api/i/discussions.DiscussionsService/GetTopicListByForumId"
+        assert is_kaggle_api_response(url, "application/json; charset=utf-8") is True
+
+    def test_non_api_or_non_json(self):
+        """内部API以外、JSON以外は対象外"""
+        assert is_kaggle_api_response("https://www.kaggle.com/static/app.js", "application/json") is False
+        assert is_kaggle_api_response("https://www.kaggle.com/api/i/foo", "text/html") is False
+        assert is_kaggle_api_response("https://www.kaggle.com/api/i/foo", None) is False
+
+
+class TestNormalizeTier:
+    """称号正規化のテスト"""
+
+    def test_variants(self):
+        """表記揺れを吸収し、GrandmasterをMasterと誤判定しない"""
+        assert normalize_tier("GRANDMASTER") == "Grandmaster"
+        assert normalize_tier("PERFORMANCE_TIER_MASTER") == "Master"
+        assert normalize_tier("expert") == "Expert"
+        assert normalize_tier("staff") is None
+        assert normalize_tier(3) is None
+
+
+class TestExtractDiscussionItems:
+    """ディスカッション一覧抽出のテスト"""
+
+    def test_extract_fields(self):
+        """投票数・称号・日時をJSONから取得"""
+        items = extract_discussion_items([DISCUSSION_PAYLOAD])
+
+        assert len(items) == 2
+        writeup = items[0]
+        assert writeup['title'] == "1st Place Solution"
+        assert writeup['url'] == "https://www.kaggle.com/competitions/test-comp/writeups/team-a-1st-place"
+        assert writeup['category'] == 'writeup'
+        assert writeup['author'] == "Alice"
+        assert writeup['author_tier'] == "Grandmaster"
+        assert writeup['tier_color'] is not None
+        assert writeup['vote_count'] == 120
+        assert writeup['comment_count'] == 15
+        assert writeup['is_pinned'] is False
+        assert writeup['updated_at'] == "2024-05-03T12:00:00Z"
+
+        pinned = items[1]
+        assert pinned['category'] == 'discussion'
+        assert pinned['is_pinned'] is True
+        assert pinned['author_tier'] is None
+
+    def test_deduplicate_across_payloads(self):
+        """同じトピックが複数レスポンスに含まれても1件にする"""
+        items = extract_discussion_items([DISCUSSION_PAYLOAD, DISCUSSION_PAYLOAD])
+        assert len(items) == 2
+
+    def test_unrelated_payload(self):
+        """ディスカッション以外のJSONからは何も抽出しない"""
+        assert extract_discussion_items([{"user": {"title": "x", "url": "/alice"}}]) == []
+
+
+class TestExtractNotebookAndCompetitionItems:
+    """ノートブック・コンペ一覧抽出のテスト"""
+
+    def test_extract_notebooks(self):
+        """ノートブックURLからコメントパスを除去"""
+        payload = {"kernels": [{
+            "title": "EDA",
+            "scriptUrl": "/code/bob/eda/comments",
+            "totalVotes": "42",
+            "totalComments": 3,
+            "author": {"displayName": "Bob", "tier": "EXPERT"},
+        }]}
+
+        items = extract_notebook_items([payload])
+
+        assert items == [{
+            'title': "EDA",
+            'url': "https://www.kaggle.com/code/bob/eda",
+            'author': "Bob",
+            'author_tier': "Expert",
+            'tier_color': items[0]['tier_color'],
+            'vote_count': 42,
+            'comment_count': 3,
+            'type': 'notebook',
+            'updated_at': None,
+        }]
+
+    def test_extract_competitions(self):
+        """コンペIDとタイトル・概要を取得"""
+        payload = {"competitions": [
+            {"competitionName": "titanic", "title": "Titanic", "briefDescription": "Predict survival"},
+            {"competitionName": "titanic", "title": "Titanic"},
+        ]}
+
+        items = extract_competition_items([payload])
+
+        assert len(items) == 1
+        assert items[0]['id'] == "titanic"
+        assert items[0]['description'] == "Predict survival"
+        assert items[0]['url'] == "https://www.kaggle.com/competitions/titanic"
+
+    def test_extract_competitions_requires_competition_shape(self):
+        """slug と title だけの辞書（データセット・ユーザーなど）はコンペとみなさない"""
+        payload = {
+            "competitions": [
+                {"slug": "house-prices", "title": "House Prices", "deadline": "2030-01-01T00:00:00Z"},
+                {"url": "/competitions/spaceship-titanic", "title": "Spaceship Titanic"},
+            ],
+            "datasets": [{"slug": "titanic-extended", "title": "Titanic Extended", "url": "/datasets/alice/titanic"}],
+            "user": {"slug": "alice", "title": "Kaggle Grandmaster"},
+            "tabs": [{"url": "/competitions/titanic/data", "title": "Data"}],
+        }
+
+        items = extract_competition_items([payload])
+
+        assert sorted(item['id'] for item in items) == ["house-prices", "spaceship-titanic"]
@@ -0,0 +1,188 @@
+"""
+バッチAPIモード（LLMBatch・LLMService.prefetch_batch）のテスト
+"""
+import json
+import threading
+
+import httpx
+import pytest
+
+from app.services.llm_batch import BatchBackend, LLMBatch, LocalBatchBackend, OpenAIBatchBackend, parse_batch_results
+from app.services.llm_cache import LLMResponseCache
+from app.services.llm_service import LLMService
+
+
+def echo(body):
+    """最後のメッセージに echo: を付けて返す"""
+    return "echo:" + body["messages"][-1]["content"]
+
+
+@pytest.fixture
+def service(tmp_path, make_llm_service):
+    """同期APIの応答は "sync"（バッチで取得済みなら呼ばれない）"""
+    return make_llm_service(respond=lambda request: "sync", cache=LLMResponseCache(tmp_path / "llm_cache.db"))
+
+
+def prefetch(service, tmp_path, items, compute, respond=echo):
+    backend = LocalBatchBackend(respond)
+    result = service.prefetch_batch(items, compute, backend=backend, batch_dir=tmp_path / "batches")
+    return result, backend
+
+
+class TestLLMBatch:
+    """入力ファイルと結果の解析のテスト"""
+
+    def test_write_jsonl(self, tmp_path):
+        """Batch API の入力形式で書き出し、同じキーは1行にまとめる"""
+        batch = LLMBatch()
+        messages = [{"role": "user", "content": "hello"}]
+        batch.add("key1", "generate", "gpt-4o", messages, {"temperature": 0.3})
+        batch.add("key1", "generate", "gpt-4o", messages, {"temperature": 0.3})
+
+        lines = batch.write(tmp_path / "batch.jsonl").read_text(encoding="utf-8").splitlines()
+
+        assert len(lines) == 1
+        assert json.loads(lines[0]) == {
+            "custom_id": "key1",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {"model": "gpt-4o", "messages": messages, "temperature": 0.3},
+        }
+
+    def test_parse_results_with_errors(self):
+        """成功行はレスポンス本文、エラー行・HTTPエラーはエラー内容として返す"""
+        text = "\n".join([
+            json.dumps({"custom_id": "ok", "response": {
+                "status_code": 200, "body": {"choices": [{"message": {"content": "回答"}}]}
+            }}),
+            json.dumps({"custom_id": "http", "response": {
+                "status_code": 429, "body": {"error": {"message": "rate limited"}}
+            }}),
+            json.dumps({"custom_id": "failed", "response": None, "error": {"message": "expired"}}),
+        ])
+
+        responses, errors = parse_batch_results(text)
+
+        assert responses == {"ok": "回答"}
+        assert errors == {"http": "rate limited", "failed": "expired"}
+
+
+class TestPrefetchBatch:
+    """prefetch_batch の後の通常の処理がキャッシュから返ることのテスト"""
+
+    def test_prefetched_calls_skip_sync_api(self, service, tmp_path):
+        """バッチで取得した呼び出しは同期APIを呼ばない"""
+        prompts = ["a", "b", "c"]
+
+        result, backend = prefetch(service, tmp_path, prompts, service.generate)
+
+        assert result == {"rounds": 1, "requests": 3, "responses": 3}
+        assert [service.generate(prompt) for prompt in prompts] == ["echo:a", "echo:b", "echo:c"]
+        assert service.client.chat.completions.calls == []
+
+    def test_dependent_calls_use_next_round(self, service, tmp_path):
+        """前の結果を使う呼び出しは次の回のバッチで取得する"""
+        def compute(prompt):
+            return service.generate(service.generate(prompt))
+
+        result, backend = prefetch(service, tmp_path, ["a", "b"], compute)
+
+        assert result["rounds"] == 2
+        assert len(backend.submitted) == 4
+        assert compute("a") == "echo:echo:a"
+        assert service.client.chat.completions.calls == []
+
+    def test_failed_requests_fall_back_to_sync(self, service, tmp_path):
+        """バッチで失敗した呼び出しだけ同期APIで実行する"""
+        def respond(body):
+            if body["messages"][-1]["content"] == "bad":
+                raise RuntimeError("invalid request")
+            return echo(body)
+
+        result, _ = prefetch(service, tmp_path, ["ok", "bad"], service.generate, respond=respond)
+
+        assert result["responses"] == 1
+        assert service.generate("ok") == "echo:ok"
+        assert service.generate("bad") == "sync"
+        assert len(service.client.chat.completions.calls) == 1
+
+    def test_other_threads_are_not_collected(self, service, tmp_path):
+        """収集中でも、同じインスタンスを使う他のスレッドの呼び出しは同期APIで実行する"""
+        other = {}
+
+        def compute(prompt):
+            thread = threading.Thread(target=lambda: other.update(result=service.generate("other")))
+            thread.start()
+            thread.join()
+            return service.generate(prompt)
+
+        result, _ = prefetch(service, tmp_path, ["a"], compute)
+
+        assert result["requests"] == 1
+        assert other["result"] == "sync"
+
+    def test_backend_is_abstract(self):
+        """BatchBackend のメソッドを実装しない送信先は作れない"""
+        class Incomplete(BatchBackend):
+            def submit(self, input_path):
+                return "batch-1"
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+    def test_requires_response_cache(self, tmp_path):
+        """キャッシュがない場合は結果を反映できないためエラー"""
+        service = LLMService(api_key="test-key", use_cache=False)
+
+        with pytest.raises(ValueError):
+            prefetch(service, tmp_path, ["a"], service.generate)
+
+
+class TestOpenAIBatchBackend:
+    """OpenAI Batch API のリクエストのテスト"""
+
+    def test_submit_retrieve_download(self, tmp_path):
+        """ファイルのアップロード → バッチ作成 → 状態確認 → 結果の取得"""
+        requests = []
+        output = json.dumps({"custom_id": "k", "response": {
+            "status_code": 200, "body": {"choices": [{"message": {"content": "回答"}}]}
+        }})
+
+        def handler(request):
+            requests.append((request.method, request.url.path))
+            if request.url.path == "/v1/files":
+                return httpx.Response(200, json={"id": "file-in"})
+            if request.url.path == "/v1/batches":
+                assert json.loads(request.content)["input_file_id"] == "file-in"
+                return httpx.Response(200, json={"id": "batch-1"})
+            if request.url.path == "/v1/batches/batch-1":
+                return httpx.Response(200, json={
+                    "status": "completed",
+                    "request_counts": {"completed": 1, "failed": 0, "total": 1},
+                    "output_file_id": "file-out",
+                    "error_file_id": None,
+                })
+            if request.url.path == "/v1/files/file-out/content":
+                return httpx.Response(200, text=output)
+            return httpx.Response(404)
+
+        batch = LLMBatch()
+        batch.add("k", "generate", "gpt-4o", [{"role": "user", "content": "q"}], {})
+        backend = OpenAIBatchBackend("test-key", transport=httpx.MockTransport(handler))
+
+        responses = batch.run(backend, batch_dir=tmp_path, sleep=lambda seconds: None)
+
+        assert responses == {"k": "回答"}
+        assert requests[:2] == [("POST", "/v1/files"), ("POST", "/v1/batches")]
+
+    def test_timeout(self, tmp_path):
+        """timeout までに終了しなければ TimeoutError"""
+        class PendingBackend(LocalBatchBackend):
+            def retrieve(self, batch_id):
+                return {"status": "in_progress", "completed": 0, "failed": 0, "total": 1}
+
+        batch = LLMBatch()
+        batch.add("k", "generate", "gpt-4o", [{"role": "user", "content": "q"}], {})
+
+        with pytest.raises(TimeoutError):
+            batch.run(PendingBackend(echo), batch_dir=tmp_path, poll_interval=10, timeout=30, sleep=lambda s: None)
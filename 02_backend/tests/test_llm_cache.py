@@ -0,0 +1,80 @@
+"""
+LLMレスポンスキャッシュ（LLMResponseCache）と LLMService の呼び出しのテスト
+"""
+from app.services.llm_cache import LLMResponseCache, cache_key
+
+
+def cache_at(tmp_path):
+    return LLMResponseCache(tmp_path / "llm_cache.db")
+
+
+class TestLLMResponseCache:
+    """キャッシュ本体のテスト"""
+
+    def test_key_depends_on_all_inputs(self):
+        """モデル・メソッド・メッセージ・パラメータのいずれかが違えば別のキー"""
+        messages = [{"role": "user", "content": "hello"}]
+        base = cache_key("gpt-4o", "generate", messages, {"temperature": 0.3})
+
+        assert base == cache_key("gpt-4o", "generate", messages, {"temperature": 0.3})
+        assert base != cache_key("gpt-4o-mini", "generate", messages, {"temperature": 0.3})
+        assert base != cache_key("gpt-4o", "generate_tags", messages, {"temperature": 0.3})
+        assert base != cache_key("gpt-4o", "generate", messages, {"temperature": 0.2})
+
+    def test_eviction_removes_least_recently_used(self, tmp_path):
+        """上限を超えたら最後に使われた日時の古いものから削除する"""
+        cache = LLMResponseCache(tmp_path / "cache.db", max_bytes=250)
+        cache.put("a", "generate", "gpt-4o", "x" * 100)
+        cache.put("b", "generate", "gpt-4o", "y" * 100)
+        cache.get("a", "generate")  # a を最近使ったことにする
+
+        cache.put("c", "generate", "gpt-4o", "z" * 100)
+
+        assert cache.get("a", "generate") is not None
+        assert cache.get("b", "generate") is None
+        assert cache.get("c", "generate") is not None
+
+    def test_stats_per_method(self, tmp_path):
+        """メソッドごとにヒット・ミス数を集計する"""
+        cache = LLMResponseCache(tmp_path / "cache.db")
+        cache.put("k", "generate_summary", "gpt-4o", "{}")
+        cache.get("k", "generate_summary")
+        cache.get("missing", "generate_tags")
+
+        methods = cache.stats()['methods']
+
+        assert methods['generate_summary']['hits'] == 1
+        assert methods['generate_summary']['entries'] == 1
+        assert methods['generate_tags'] == {'hits': 0, 'misses': 1, 'hit_rate': 0.0, 'entries': 0, 'bytes': 0}
+
+
+class TestLLMServiceCache:
+    """LLMService の呼び出しがキャッシュを通ることのテスト"""
+
+    def test_rerun_uses_cache(self, tmp_path, make_llm_service):
+        """同じ入力の2回目の呼び出しはAPIを呼び出さない"""
+        service = make_llm_service(["F1スコア"], cache=cache_at(tmp_path))
+
+        assert service.extract_evaluation_metric("Submissions are evaluated on F1.", "Titanic") == "F1スコア"
+        assert service.extract_evaluation_metric("Submissions are evaluated on F1.", "Titanic") == "F1スコア"
+        assert len(service.client.chat.completions.calls) == 1
+
+    def test_cache_survives_restart(self, tmp_path, make_llm_service):
+        """別のインスタンス（再実行）でも同じファイルのキャッシュを使う"""
+        make_llm_service(["回答"], cache=cache_at(tmp_path)).generate("質問")
+        service = make_llm_service([], cache=cache_at(tmp_path))
+
+        assert service.generate("質問") == "回答"
+
+    def test_invalid_cached_response_is_refreshed(self, tmp_path, make_llm_service):
+        """検証エラーの再試行ではキャッシュを読まずにAPIを呼び出す"""
+        valid = {"data_types": ["画像"], "tags": [], "domain": "医療"}
+        service = make_llm_service(
+            ["not json", '{"data_types": ["画像"], "tags": [], "domain": "医療"}'], cache=cache_at(tmp_path)
+        )
+
+        assert service.generate_tags("Classify chest X-ray images.", "X-ray") == valid
+        assert len(service.client.chat.completions.calls) == 2
+
+        rerun = make_llm_service([], cache=cache_at(tmp_path))
+        assert rerun.generate_tags("Classify chest X-ray images.", "X-ray") == valid
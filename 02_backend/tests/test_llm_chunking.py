@@ -0,0 +1,145 @@
+"""
+本文のトークン予算と map-reduce 要約（llm_chunking・LLMService._fit_content）のテスト
+"""
+from app.services.llm_chunking import count_tokens, split_into_chunks, truncate_to_tokens
+from app.services.llm_service import LLMService
+
+
+def echo(request):
+    """要点抽出には "note:<チャンクの末尾>"、和訳には "translated:<本文の末尾>"、それ以外は "summary" を返す"""
+    prompt = request["messages"][-1]["content"]
+    if "要点をメモに" in prompt:
+        body = prompt.split("】\n", 1)[1].split("\n\n【要件】", 1)[0]
+        return "note:" + body.split()[-1]
+    if "構造化して整理" in prompt:
+        body = prompt.split("【原文】\n", 1)[1].split("\n\n【タスク】", 1)[0]
+        return "translated:" + body.split()[-1]
+    return "summary"
+
+
+def long_writeup(paragraphs=40):
+    return "\n\n".join(
+        f"Step {i}: we trained LightGBM with learning_rate=0.0{i % 9 + 1} and got CV 0.8{i:02d}. marker{i}"
+        for i in range(paragraphs)
+    )
+
+
+class TestChunking:
+    """トークン数の計測・切り詰め・分割のテスト"""
+
+    def test_japanese_counts_more_tokens_than_english_per_char(self):
+        """同じ文字数でも日本語の方がトークン数が多い"""
+        assert count_tokens("あ" * 100) > count_tokens("a" * 100)
+        assert count_tokens("") == 0
+
+    def test_truncate_to_tokens(self):
+        """予算以内はそのまま、超える場合は予算内に切り詰める"""
+        text = long_writeup()
+
+        assert truncate_to_tokens("short", 100) == "short"
+        truncated = truncate_to_tokens(text, 50)
+        assert truncated.endswith("...")
+        assert count_tokens(truncated[:-3]) <= 50
+
+    def test_split_covers_whole_text(self):
+        """全ての段落がいずれかのチャンクに含まれ、各チャンクは上限以下"""
+        text = long_writeup()
+
+        chunks = split_into_chunks(text, 100)
+
+        assert len(chunks) > 1
+        assert all(count_tokens(chunk) <= 100 for chunk in chunks)
+        assert "marker0" in chunks[0] and "marker39" in chunks[-1]
+
+    def test_max_chunks_enlarges_chunks(self):
+        """チャンク数が上限を超える場合はチャンクを大きくする"""
+        text = long_writeup()
+
+        assert len(split_into_chunks(text, 50)) > 4
+        chunks = split_into_chunks(text, 50, max_chunks=4)
+        assert 1 < len(chunks) <= 4
+        assert "marker0" in chunks[0] and "marker39" in chunks[-1]
+
+    def test_long_line_is_split(self):
+        """段落・行の区切りがない長いテキストも分割する"""
+        chunks = split_into_chunks("x" * 2000, 100)
+
+        assert len(chunks) > 1
+        assert "".join(chunk.replace("\n", "") for chunk in chunks) == "x" * 2000
+
+
+class TestMapReduce:
+    """LLMService の長い本文の扱いのテスト"""
+
+    def test_short_content_single_call(self, make_llm_service):
+        """予算以内の本文はそのまま1回の呼び出しで要約する"""
+        service = make_llm_service(respond=echo)
+
+        assert service.summarize_discussion("A short post about CV.", "CV") == "summary"
+        assert len(service.client.chat.completions.calls) == 1
+
+    def test_long_content_is_covered_in_full(self, make_llm_service):
+        """予算を超える本文はチャンクごとに要点を抽出し、末尾まで要約に含める"""
+        service = make_llm_service(respond=echo)
+        service.chunk_tokens = 1000
+
+        service.summarize_discussion(long_writeup(200), "1st place solution")
+
+        calls = service.client.chat.completions.calls
+        map_calls = [call for call in calls if "要点をメモに" in call["messages"][-1]["content"]]
+        assert len(map_calls) == len(calls) - 1 > 1
+        final_prompt = calls[-1]["messages"][-1]["content"]
+        assert "note:marker199" in final_prompt
+        assert f"[パート {len(map_calls)}/{len(map_calls)}]" in final_prompt
+
+    def test_chunk_count_is_bounded(self, make_llm_service):
+        """チャンク数は max_chunks 以下に抑える（待ち時間の上限）"""
+        service = make_llm_service(respond=echo)
+        service.chunk_tokens = 50
+        service.max_chunks = 3
+
+        service.summarize_discussion(long_writeup(200), "1st place solution")
+
+        assert len(service.client.chat.completions.calls) <= 3 + 1
+
+    def test_notes_fit_budget(self, make_llm_service):
+        """要点が出力上限いっぱいでも、つなげた要点は予算に収まり全パートを含む"""
+        def verbose(request):
+            note = echo(request)
+            if note.startswith("note:"):
+                # 出力上限（max_tokens）いっぱいの要点
+                max_tokens = request["max_tokens"]
+                note = truncate_to_tokens(note + " detail" * max_tokens, max_tokens, request["model"]).removesuffix("...")
+            return note
+
+        service = make_llm_service(respond=verbose)
+        service.chunk_tokens = 1000
+
+        notes = service._fit_content('summarize_discussion', long_writeup(200), "1st place solution")
+
+        assert count_tokens(notes, "gpt-4o-mini") <= LLMService.CONTENT_TOKEN_BUDGETS['summarize_discussion']
+        assert "note:marker199" in notes
+        assert "[パート 1/" in notes
+
+    def test_translation_is_per_chunk(self, make_llm_service):
+        """和訳は要点を抽出せず、チャンクごとに和訳して原文の順につなげる"""
+        service = make_llm_service(respond=echo)
+
+        text = service.translate_and_organize_discussion(long_writeup(200))
+
+        calls = service.client.chat.completions.calls
+        assert not [call for call in calls if "要点をメモに" in call["messages"][-1]["content"]]
+        parts = text.split("\n\n")
+        assert len(parts) == len(calls) > 1
+        assert parts[-1] == "translated:marker199"
+
+    def test_disabled_truncates_by_tokens(self, make_llm_service):
+        """map-reduce が無効の場合はトークン予算で切り詰める"""
+        service = make_llm_service(respond=echo)
+        service.map_reduce_enabled = False
+
+        service.summarize_discussion(long_writeup(400), "1st place solution")
+
+        calls = service.client.chat.completions.calls
+        assert len(calls) == 1
+        assert "marker399" not in calls[0]["messages"][-1]["content"]
@@ -0,0 +1,119 @@
+"""
+コンペの一括充実化（LLMService.generate_enrichment）のテスト
+"""
+import json
+
+
+SUMMARY = {
+    "overview": "信用リスクを予測するコンペ",
+    "objective": "債務不履行の予測",
+    "data": "テーブルデータ",
+    "evaluation": {"metric": "AUC", "explanation": "説明", "why_important": "理由"},
+    "business_value": "与信審査の改善",
+    "key_challenges": ["不均衡データ"],
+}
+
+ENRICHMENT = {
+    "summary": SUMMARY,
+    "metric": "AUC",
+    "metric_description": "AUCは分類の順位付けの性能を測る指標です。",
+    "tags": {"data_types": ["テーブルデータ"], "tags": ["分類（二値）"], "domain": "金融"},
+    "dataset_info": {
+        "files": ["train.csv"], "total_size": "1 GB", "description": "顧客データ",
+        "features": ["age"], "columns": [{"name": "age", "description": "年齢"}],
+    },
+}
+
+
+def competition():
+    return {"title": "Credit", "description": "Predict default. Submissions are evaluated on AUC."}
+
+
+class TestCombinedEnrichment:
+    """enrich_competition(combined=True) のテスト"""
+
+    def test_single_call_fills_all_fields(self, make_llm_service):
+        """全フィールドを1回の呼び出しで生成する"""
+        service = make_llm_service([json.dumps(ENRICHMENT, ensure_ascii=False)])
+
+        result = service.enrich_competition(competition(), data_tab_text="train.csv", combined=True)
+
+        calls = service.client.chat.completions.calls
+        assert len(calls) == 1
+        schema = calls[0]["response_format"]["json_schema"]["schema"]
+        assert schema["required"] == ["summary", "metric", "metric_description", "tags", "dataset_info"]
+        assert json.loads(result["summary"]) == SUMMARY
+        assert result["metric"] == "AUC"
+        assert result["domain"] == "金融"
+        assert json.loads(result["dataset_info"])["files"] == ["train.csv"]
+
+    def test_tags_are_limited_to_master(self, make_llm_service):
+        """マスタが渡されなければ既定のマスタを使い、マスタにないタグ・ドメインは除く"""
+        invented = dict(ENRICHMENT, tags={"data_types": [], "tags": ["分類（二値）", "GBDT"], "domain": "保険"})
+        service = make_llm_service([json.dumps(invented, ensure_ascii=False)])
+
+        result = service.enrich_competition(competition(), data_tab_text="train.csv", combined=True)
+
+        prompt = service.client.chat.completions.calls[0]["messages"][1]["content"]
+        assert "コンピュータビジョン" in prompt
+        assert result["tags"] == ["分類（二値）"]
+        assert result["domain"] == ""
+
+    def test_invalid_field_falls_back(self, make_llm_service):
+        """検証に失敗したフィールドだけ個別のメソッドで生成する"""
+        broken = dict(ENRICHMENT, summary={"overview": "不足"})
+        service = make_llm_service([
+            json.dumps(broken, ensure_ascii=False),
+            json.dumps(SUMMARY, ensure_ascii=False),
+        ])
+
+        result = service.enrich_competition(competition(), data_tab_text="train.csv", combined=True)
+
+        calls = service.client.chat.completions.calls
+        assert len(calls) == 2
+        assert "【タスク】" in calls[1]["messages"][1]["content"]  # generate_summary のプロンプト
+        assert json.loads(result["summary"]) == SUMMARY
+        assert result["tags"] == ["分類（二値）"]
+
+    def test_missing_metric_regenerates_description(self, make_llm_service):
+        """評価指標を個別に抽出し直す場合は、説明もその指標で生成し直す"""
+        broken = dict(ENRICHMENT, metric="x" * 50)
+        service = make_llm_service([
+            json.dumps(broken, ensure_ascii=False),
+            "RMSE",
+            "RMSEは誤差の大きさを測る指標です。",
+        ])
+
+        result = service.enrich_competition(competition(), combined=True)
+
+        assert result["metric"] == "RMSE"
+        assert result["metric_description"] == "RMSEは誤差の大きさを測る指標です。"
+        assert len(service.client.chat.completions.calls) == 3
+
+    def test_metric_not_found_clears_description(self, make_llm_service):
+        """評価指標が見つからなければ説明も空にする"""
+        enrichment = {key: value for key, value in ENRICHMENT.items() if key != "dataset_info"}
+        enrichment["metric"] = ""
+        service = make_llm_service([json.dumps(enrichment, ensure_ascii=False)])
+
+        result = service.enrich_competition(competition(), combined=True)
+
+        assert result["metric"] == ""
+        assert result["metric_description"] == ""
+        assert len(service.client.chat.completions.calls) == 1
+
+    def test_single_missing_field_uses_individual_call(self, make_llm_service):
+        """不足しているフィールドが1つならまとめずに個別のメソッドを呼ぶ"""
+        comp = dict(
+            competition(),
+            summary=json.dumps(SUMMARY), metric="AUC", metric_description="説明",
+            tags=["分類（二値）"], data_types=[]
+        )
+        service = make_llm_service(['{"data_types": ["テーブルデータ"], "tags": [], "domain": "金融"}'])
+
+        result = service.enrich_competition(comp, combined=True)
+
+        calls = service.client.chat.completions.calls
+        assert len(calls) == 1
+        assert calls[0]["response_format"] == {"type": "json_object"}
+        assert result["data_types"] == ["テーブルデータ"]
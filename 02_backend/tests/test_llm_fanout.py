@@ -0,0 +1,77 @@
+"""
+LLMService.run_many（独立した呼び出しの並列実行）のテスト
+"""
+import threading
+
+import pytest
+
+from app.services.llm_service import LLMService
+
+
+@pytest.fixture
+def service():
+    return LLMService(api_key="test-key", use_cache=False)
+
+
+class TestRunMany:
+    """run_many のテスト"""
+
+    def test_calls_run_concurrently(self, service):
+        """全呼び出しが同時に実行される（逐次実行ならバリアで待ち続ける）"""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def call(value):
+            barrier.wait()
+            return value
+
+        results = service.run_many({name: (lambda name=name: call(name)) for name in ("a", "b", "c")})
+
+        assert results == {"a": "a", "b": "b", "c": "c"}
+
+    def test_single_call_runs_inline(self, service):
+        """呼び出しが1つならスレッドを使わない"""
+        results = service.run_many({"only": threading.current_thread})
+
+        assert results["only"] is threading.current_thread()
+
+    def test_exception_is_raised(self, service):
+        """例外は全呼び出しの終了後に送出される"""
+        finished = []
+
+        def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            service.run_many({"fail": fail, "ok": lambda: finished.append(True)})
+        assert finished == [True]
+
+
+class TestEnrichCompetition:
+    """enrich_competition の並列化のテスト"""
+
+    def test_metric_dependent_calls_use_extracted_metric(self, service, monkeypatch):
+        """評価指標の説明・タグは抽出した評価指標を使って2段目で実行する"""
+        calls = []
+        monkeypatch.setattr(service, "generate_summary", lambda **kw: calls.append("summary") or "要約")
+        monkeypatch.setattr(service, "extract_evaluation_metric", lambda **kw: calls.append("metric") or "AUC")
+        monkeypatch.setattr(service, "extract_dataset_info", lambda **kw: calls.append("dataset") or {"files": ["train.csv"]})
+        monkeypatch.setattr(
+            service, "generate_metric_description",
+            lambda **kw: calls.append(("metric_description", kw["metric"])) or "説明"
+        )
+        monkeypatch.setattr(
+            service, "generate_tags",
+            lambda **kw: calls.append(("tags", kw["metric"])) or {"data_types": ["テーブルデータ"], "tags": [], "domain": "金融"}
+        )
+
+        result = service.enrich_competition(
+            {"title": "Credit", "description": "Predict default."},
+            data_tab_text="train.csv",
+            combined=False
+        )
+
+        assert set(calls[:3]) == {"summary", "metric", "dataset"}
+        assert set(calls[3:]) == {("metric_description", "AUC"), ("tags", "AUC")}
+        assert result["metric_description"] == "説明"
+        assert result["domain"] == "金融"
+        assert result["dataset_info"] == '{"files": ["train.csv"]}'
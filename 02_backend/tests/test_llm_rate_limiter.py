@@ -0,0 +1,168 @@
+"""
+OpenAI API のレートガバナー（LLMRateGovernor）と LLMService の再試行のテスト
+"""
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from openai import APIConnectionError, RateLimitError
+
+from app.services import llm_service as llm_service_module
+from app.services.llm_rate_limiter import LLMRateGovernor, backoff_delay
+
+
+class FakeClock:
+    """sleep で進む時計"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def make_governor(clock, **kwargs):
+    params = dict(requests_per_minute=0, tokens_per_minute=0, clock=clock.time, sleep=clock.sleep)
+    params.update(kwargs)
+    return LLMRateGovernor(**params)
+
+
+def rate_limit_error(retry_after=None, code=None):
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    headers = {"retry-after": retry_after} if retry_after else {}
+    response = httpx.Response(429, headers=headers, request=request)
+    return RateLimitError("rate limited", response=response, body={"code": code} if code else None)
+
+
+class TestLLMRateGovernor:
+    """トークンバケットのテスト"""
+
+    def test_requests_per_minute(self):
+        """60 RPM なら満タンの60件は待たず、61件目は1秒待つ"""
+        clock = FakeClock()
+        governor = make_governor(clock, requests_per_minute=60)
+
+        for _ in range(60):
+            governor.acquire(0)
+        assert clock.slept == []
+
+        governor.acquire(0)
+        assert clock.slept == [pytest.approx(1.0)]
+
+    def test_tokens_per_minute(self):
+        """トークンが足りない分だけ回復を待つ"""
+        clock = FakeClock()
+        governor = make_governor(clock, tokens_per_minute=600)  # 10 トークン/秒
+
+        governor.acquire(600)
+        governor.acquire(300)
+
+        assert clock.slept == [pytest.approx(30.0)]
+
+    def test_unused_tokens_are_returned(self):
+        """推定より使用量が少なければ差を戻す"""
+        clock = FakeClock()
+        governor = make_governor(clock, tokens_per_minute=600)
+
+        governor.acquire(600)
+        governor.record_usage(600, 100)
+        governor.acquire(500)
+
+        assert clock.slept == []
+
+    def test_retry_after_blocks_all_calls(self):
+        """429 の Retry-After の間は次の呼び出しを待たせる"""
+        clock = FakeClock()
+        governor = make_governor(clock, requests_per_minute=600)
+
+        governor.record_rate_limited(7.0)
+        governor.acquire(0)
+
+        assert clock.slept == [pytest.approx(7.0)]
+
+    def test_shared_through_redis(self, fake_redis):
+        """Redis を共有するガバナー（別プロセス相当）は同じバケットを使う"""
+        clock = FakeClock()
+        first = make_governor(clock, requests_per_minute=2, redis_client=fake_redis)
+        second = make_governor(clock, requests_per_minute=2, redis_client=fake_redis)
+
+        first.acquire(0)
+        first.acquire(0)
+        second.acquire(0)
+
+        assert clock.slept == [pytest.approx(30.0)]
+
+    def test_backoff_delay_is_capped(self):
+        """待機の上限は base * 2^attempt（cap まで）"""
+        upper = lambda low, high: high  # noqa: E731
+
+        assert backoff_delay(0, base=1, cap=60, rand=upper) == 1
+        assert backoff_delay(3, base=1, cap=60, rand=upper) == 8
+        assert backoff_delay(10, base=1, cap=60, rand=upper) == 60
+        assert 0 <= backoff_delay(2, base=1, cap=60) <= 4
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def governor(clock, monkeypatch):
+    governor = make_governor(clock, requests_per_minute=600, tokens_per_minute=100000)
+    monkeypatch.setattr(llm_service_module, "get_llm_rate_governor", lambda model: governor)
+    monkeypatch.setattr(llm_service_module, "backoff_delay", lambda attempt, **kwargs: 0)
+    return governor
+
+
+class TestCreateCompletionRetry:
+    """_create_completion の再試行のテスト"""
+
+    def test_retry_after_is_honoured(self, governor, clock, make_llm_service):
+        """429 の Retry-After だけ待ってから再試行する"""
+        service = make_llm_service([rate_limit_error(retry_after="3"), "回答"])
+
+        assert service.generate("質問") == "回答"
+        assert len(service.client.chat.completions.calls) == 2
+        assert clock.slept == [pytest.approx(3.0)]
+
+    def test_connection_errors_are_retried(self, governor, make_llm_service):
+        """接続エラーはバックオフして再試行する"""
+        request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+        service = make_llm_service([APIConnectionError(request=request), APIConnectionError(request=request), "回答"])
+
+        assert service.generate("質問") == "回答"
+        assert len(service.client.chat.completions.calls) == 3
+
+    def test_insufficient_quota_is_not_retried(self, governor, make_llm_service):
+        """クォータ不足は再試行しない"""
+        service = make_llm_service([rate_limit_error(code="insufficient_quota")])
+        service.max_retries = 1
+
+        with pytest.raises(RateLimitError):
+            service.generate("質問")
+        assert len(service.client.chat.completions.calls) == 1
+
+    def test_methods_do_not_retry_api_errors_again(self, governor, make_llm_service):
+        """再試行を使い切った 429 はメソッドの再試行（検証エラー用）で繰り返さずに送出する"""
+        service = make_llm_service([rate_limit_error(), rate_limit_error(), "回答"])
+        service.rate_limit_retries = 1
+
+        with pytest.raises(RateLimitError):
+            service.extract_evaluation_metric("Evaluated on AUC.", "Credit")
+        assert len(service.client.chat.completions.calls) == 2
+
+    def test_usage_is_recorded(self, governor, make_llm_service):
+        """推定トークン数と実際の使用量の差を戻す"""
+        usage = SimpleNamespace(prompt_tokens=4, completion_tokens=6, total_tokens=10)
+        service = make_llm_service(["回答"], usage=usage)
+
+        service.generate("質問")
+
+        # generate の max_tokens=2000 を差し引いた後、使用量 10 との差が戻る
+        assert governor.snapshot()['tokens'] == pytest.approx(100000 - 10)
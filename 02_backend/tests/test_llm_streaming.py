@@ -0,0 +1,149 @@
+"""
+LLM出力のストリーミング（LLMService.streaming・SSEエンドポイント）のテスト
+"""
+import json
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.routers import competitions
+from app.services.llm_cache import LLMResponseCache
+
+
+TRANSLATION = "構造化された和訳です"
+
+
+def translation(request):
+    return TRANSLATION
+
+
+def parse_events(body):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestStreaming:
+    """LLMService.streaming のテスト"""
+
+    def test_tokens_are_passed_to_sink(self, tmp_path, make_llm_service):
+        """対象のメソッドはトークンを逐次渡し、返り値と保存内容は全文"""
+        service = make_llm_service(respond=translation, cache=LLMResponseCache(tmp_path / "llm_cache.db"))
+        received = []
+
+        with service.streaming(lambda method, delta: received.append((method, delta)), ["generate"]):
+            result = service.generate("質問")
+
+        assert result == "構造化された和訳です"
+        assert [delta for _, delta in received] == ["構造化", "された", "和訳で", "す"]
+        assert service.client.chat.completions.calls[0].get("stream") is True
+        rerun = make_llm_service(respond=lambda request: "", cache=LLMResponseCache(tmp_path / "llm_cache.db"))
+        assert rerun.generate("質問") == "構造化された和訳です"
+
+    def test_cached_response_is_sent_at_once(self, tmp_path, make_llm_service):
+        """キャッシュから返る場合は全文を1回で渡す"""
+        service = make_llm_service(respond=translation, cache=LLMResponseCache(tmp_path / "llm_cache.db"))
+        service.generate("質問")
+        received = []
+
+        with service.streaming(lambda method, delta: received.append(delta), ["generate"]):
+            service.generate("質問")
+
+        assert received == ["構造化された和訳です"]
+        assert len(service.client.chat.completions.calls) == 1
+
+    def test_streaming_reaches_run_many_threads(self, make_llm_service):
+        """run_many の並列実行でも対象のメソッドだけストリーミングする"""
+        service = make_llm_service(respond=translation)
+        received = []
+
+        with service.streaming(lambda method, delta: received.append(method), ["generate"]):
+            service.run_many({
+                "streamed": lambda: service.generate("質問"),
+                "plain": lambda: service.extract_evaluation_metric("Evaluated on AUC.", "Credit"),
+            })
+
+        assert set(received) == {"generate"}
+        streams = sorted(call.get("stream", False) for call in service.client.chat.completions.calls)
+        assert streams == [False, True]
+
+    def test_long_translation_streams_parts_in_order(self, make_llm_service):
+        """長い本文のチャンクごとの和訳は順に1つのストリームとして渡し、全文が返り値と一致する"""
+        service = make_llm_service(respond=translation)
+        service.max_chunks = 3
+        received = []
+        content = "\n\n".join(f"Paragraph {i}: we trained LightGBM with 5 folds." for i in range(600))
+
+        with service.streaming(lambda method, delta: received.append(delta), ["translate_and_organize_discussion"]):
+            text = service.translate_and_organize_discussion(content)
+
+        assert text == "\n\n".join(["構造化された和訳です"] * 3)
+        assert "".join(received) == text
+
+
+@pytest.fixture
+def stream_app(monkeypatch, make_llm_service):
+    """_stream_llm_job を返すだけのアプリ"""
+    service = make_llm_service(respond=translation)
+    monkeypatch.setattr("app.services.llm_service.get_llm_service", lambda: service)
+    saved = {}
+
+    def finish(results):
+        saved.update(results)
+        return {"success": True, "translation": results["translation"]}
+
+    def failing_finish(results):
+        raise HTTPException(status_code=500, detail="Failed to generate summary")
+
+    app = FastAPI()
+
+    def job(fail, not_found):
+        if not_found:
+            raise HTTPException(status_code=404, detail="Discussion not found")
+        return {"translation": lambda: service.generate("原文")}, failing_finish if fail else finish
+
+    @app.post("/stream")
+    def stream(fail: bool = False, not_found: bool = False):
+        return competitions._stream_llm_job(lambda: job(fail, not_found), {"generate": "translation"})
+
+    return TestClient(app), saved
+
+
+class TestStreamEndpoint:
+    """SSE レスポンスのテスト"""
+
+    def test_events(self, stream_app):
+        """start → delta… → done（finish の結果）の順に送り、結果を保存する"""
+        client, saved = stream_app
+
+        response = client.post("/stream")
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = parse_events(response.text)
+        assert events[0] == ("start", {"fields": ["translation"]})
+        deltas = [data["text"] for event, data in events if event == "delta"]
+        assert "".join(deltas) == "構造化された和訳です"
+        assert events[-1] == ("done", {"success": True, "translation": "構造化された和訳です"})
+        assert saved["translation"] == "構造化された和訳です"
+
+    def test_error_event(self, stream_app):
+        """保存処理の HTTPException は error イベントで返す"""
+        client, _ = stream_app
+
+        events = parse_events(client.post("/stream?fail=true").text)
+
+        assert events[-1] == ("error", {"status_code": 500, "detail": "Failed to generate summary"})
+
+    def test_job_error_after_start(self, stream_app):
+        """準備（スクレイピングなど）の HTTPException も start の後に error イベントで返す"""
+        client, _ = stream_app
+
+        response = client.post("/stream?not_found=true")
+
+        assert response.status_code == 200
+        events = parse_events(response.text)
+        assert events[0][0] == "start"
+        assert events[-1] == ("error", {"status_code": 404, "detail": "Discussion not found"})
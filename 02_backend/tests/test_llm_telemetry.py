@@ -0,0 +1,104 @@
+"""
+LLM呼び出しのテレメトリ（LLMTelemetry・/api/admin/llm-stats）のテスト
+"""
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from openai import APIConnectionError
+
+from app.services import llm_service as llm_service_module
+from app.services.llm_cache import LLMResponseCache
+from app.services.llm_telemetry import LLMTelemetry, percentile
+
+
+@pytest.fixture
+def telemetry(tmp_path):
+    return LLMTelemetry(tmp_path / "telemetry.db")
+
+
+@pytest.fixture
+def make_service(make_llm_service, tmp_path, telemetry):
+    """テレメトリを記録する LLMService（応答の usage は 120 + 30 トークン）"""
+    usage = SimpleNamespace(prompt_tokens=120, completion_tokens=30, total_tokens=150)
+    cache = LLMResponseCache(tmp_path / "llm_cache.db")
+    return lambda outcomes: make_llm_service(outcomes, cache=cache, telemetry=telemetry, usage=usage)
+
+
+class TestLLMTelemetry:
+    """記録と集計のテスト"""
+
+    def test_percentile(self):
+        """最近傍法のパーセンタイル"""
+        values = list(range(1, 101))
+
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile([], 50) is None
+
+    def test_stats_per_day_and_method(self, telemetry):
+        """メソッドごとにトークン数を合計し、レイテンシはキャッシュヒットを除いて集計する"""
+        for seconds in (1.0, 2.0, 3.0, 10.0):
+            telemetry.record("gpt-4o-mini", "summarize_notebook", 1000, 200, latency=seconds)
+        telemetry.record("gpt-4o-mini", "summarize_notebook", latency=0.001, cache_hit=True)
+        telemetry.record("gpt-4o", "generate_tags", 300, 50, latency=0.5, retries=2)
+
+        stats = telemetry.stats(days=1)
+
+        notebook = stats['methods']['summarize_notebook']
+        assert notebook['calls'] == 5
+        assert notebook['cache_hits'] == 1
+        assert notebook['prompt_tokens'] == 4000
+        assert notebook['p50_ms'] == 2000
+        assert notebook['p95_ms'] == 10000
+        assert stats['methods']['generate_tags']['retries'] == 2
+        assert [row['method'] for row in stats['days']] == ['generate_tags', 'summarize_notebook']
+        assert telemetry.stats(days=1, method='generate_tags')['methods'].keys() == {'generate_tags'}
+
+
+class TestLLMServiceTelemetry:
+    """LLMService の呼び出しごとの記録のテスト"""
+
+    def test_api_call_and_cache_hit(self, telemetry, make_service):
+        """API 呼び出しは usage のトークン数、キャッシュヒットは 0 トークンで記録する"""
+        service = make_service(["回答"])
+
+        service.generate("質問")
+        service.generate("質問")
+
+        generate = telemetry.stats(days=1)['methods']['generate']
+        assert generate['calls'] == 2
+        assert generate['cache_hits'] == 1
+        assert generate['prompt_tokens'] == 120
+        assert generate['completion_tokens'] == 30
+
+    def test_retries_and_errors(self, telemetry, monkeypatch, make_service):
+        """再試行回数と、最終的に失敗した呼び出しを記録する"""
+        monkeypatch.setattr(llm_service_module, "backoff_delay", lambda attempt, **kwargs: 0)
+        request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+        service = make_service([APIConnectionError(request=request), "回答"])
+
+        service.generate("質問")
+        service.rate_limit_retries = 0
+        service.max_retries = 1
+        service.client.chat.completions.responses = [APIConnectionError(request=request)]
+        with pytest.raises(APIConnectionError):
+            service.generate("別の質問")
+
+        generate = telemetry.stats(days=1)['methods']['generate']
+        assert generate['retries'] == 1
+        assert generate['errors'] == 1
+
+
+class TestLLMStatsEndpoint:
+    """/api/admin/llm-stats のテスト"""
+
+    def test_returns_stats(self, client, telemetry, monkeypatch):
+        """テレメトリの集計をそのまま返す"""
+        telemetry.record("gpt-4o", "generate_summary", 800, 400, latency=4.0)
+        monkeypatch.setattr("app.services.llm_telemetry.get_llm_telemetry", lambda: telemetry)
+
+        response = client.get("/api/admin/llm-stats", params={"days": 1})
+
+        assert response.status_code == 200
+        assert response.json()['methods']['generate_summary']['p95_ms'] == 4000
@@ -0,0 +1,87 @@
+"""
+取得失敗のネガティブキャッシュのテスト
+"""
+import pytest
+
+from app.services.cache_service import CacheService
+from app.services.scraper_service import STATIC_NOT_FOUND, ScraperService
+
+
+@pytest.fixture
+def cache(fake_redis):
+    service = CacheService.__new__(CacheService)
+    service.redis = fake_redis
+    return service
+
+
+@pytest.fixture
+def scraper(cache):
+    scraper = ScraperService(profile_dir="", http_first=False)
+    scraper.cache_service = cache
+    return scraper
+
+
+class TestCacheServiceNegative:
+    """CacheService のネガティブキャッシュのテスト"""
+
+    def test_set_and_get(self, cache):
+        """失敗理由と日時を記録する"""
+        cache.set_negative("titanic", "not_found", ttl_seconds=3600)
+
+        failure = cache.get_negative("titanic")
+
+        assert failure['reason'] == "not_found"
+        assert failure['failed_at']
+
+    def test_scraped_data_replaces_failure(self, cache):
+        """取得できた結果を保存すると失敗の記録は消える"""
+        cache.set_negative("titanic", "empty", ttl_seconds=3600)
+
+        cache.set_scraped_data("titanic", {'full_text': "Titanic"})
+
+        assert cache.get_negative("titanic") is None
+
+    def test_disabled_ttl(self, cache):
+        """TTLが0なら記録しない"""
+        assert not cache.set_negative("titanic", "not_found", ttl_seconds=0)
+        assert cache.get_negative("titanic") is None
+
+
+class TestScraperNegativeCache:
+    """ScraperService の取得失敗キャッシュのテスト"""
+
+    def test_cached_failure_skips_scraping(self, scraper, monkeypatch):
+        """記録された失敗はブラウザを起動せずに返す"""
+        scraper._record_failure("gone-competition", "not_found")
+        monkeypatch.setattr(scraper, '_scrape_competition', lambda comp_id: pytest.fail("scraped"))
+
+        assert scraper.get_competition_details("gone-competition") is None
+
+    def test_recheck_missing(self, scraper, monkeypatch):
+        """recheck_missing で再確認し、取得できれば失敗の記録を置き換える"""
+        scraper._record_failure("revived", "empty")
+        monkeypatch.setattr(scraper, '_scrape_competition', lambda comp_id: {'comp_id': comp_id, 'full_text': "Back"})
+
+        result = scraper.get_competition_details("revived", recheck_missing=True)
+
+        assert result['full_text'] == "Back"
+        assert scraper.cache_service.get_negative("revived") is None
+        assert scraper.get_competition_details("revived")['full_text'] == "Back"
+
+    def test_http_not_found_is_recorded(self, cache, monkeypatch):
+        """HTTP取得で 404 のディスカッションはブラウザを起動せずに not_found を記録する"""
+        scraper = ScraperService(profile_dir="", http_first=True)
+        scraper.cache_service = cache
+        monkeypatch.setattr(scraper, '_fetch_static', lambda page_type, url, extract: STATIC_NOT_FOUND)
+        monkeypatch.setattr(scraper, '_playwright', lambda: pytest.fail("browser launched"))
+
+        assert scraper.get_discussion_detail("https://www.kaggle.com/competitions/titanic/discussion/42") is None
+        assert scraper._cached_failure("discussion:42", recheck=False)['reason'] == "not_found"
+
+    def test_failure_keys_are_per_page(self, scraper):
+        """タブ・メタデータの失敗は別のキーで記録する"""
+        scraper._record_failure("titanic:data", "not_found")
+
+        assert scraper._cached_failure("titanic:data", recheck=False)['reason'] == "not_found"
+        assert scraper._cached_failure("titanic", recheck=False) is None
+        assert scraper._cached_failure("titanic:data", recheck=True) is None
@@ -0,0 +1,167 @@
+"""
+kaggle.com 用レートリミッターのテスト
+"""
+import pytest
+
+from app.services.rate_limiter import AdaptiveRateLimiter, CircuitOpenError, parse_retry_after
+
+
+class FakeClock:
+    """sleep で進む時計"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def make_limiter(clock, **kwargs):
+    params = dict(
+        initial_rate=1.0, min_rate=0.1, max_rate=2.0, increase_step=0.5,
+        slow_threshold=10.0, failure_threshold=3, cooldown_seconds=60.0,
+        clock=clock.time, sleep=clock.sleep,
+    )
+    params.update(kwargs)
+    return AdaptiveRateLimiter(**params)
+
+
+class TestAdaptiveRateLimiter:
+    """AIMD とサーキットブレーカーのテスト"""
+
+    def test_requests_are_spaced_by_rate(self):
+        """1 req/s なら2回目は1秒待つ"""
+        clock = FakeClock()
+        limiter = make_limiter(clock)
+
+        limiter.acquire()
+        limiter.acquire()
+
+        assert clock.slept == [1.0]
+
+    def test_additive_increase_and_multiplicative_decrease(self):
+        """成功で加算、429 と低速レスポンスで半減"""
+        clock = FakeClock()
+        limiter = make_limiter(clock)
+
+        limiter.record(200, 1.0)
+        assert limiter.snapshot()['rate'] == 1.5
+
+        limiter.record(429, 1.0)
+        assert limiter.snapshot()['rate'] == 0.75
+
+        limiter.record(200, 30.0)
+        assert limiter.snapshot()['rate'] == 0.375
+
+    def test_retry_after_delays_next_request(self):
+        """Retry-After の秒数だけ次のリクエストを待たせる"""
+        clock = FakeClock()
+        limiter = make_limiter(clock)
+
+        limiter.record(429, 0.5, retry_after=30)
+        limiter.acquire()
+
+        assert clock.slept == [30.0]
+
+    def test_circuit_opens_and_half_opens(self):
+        """連続失敗でオープン、クールダウン後は1回試行し、失敗すれば再オープン"""
+        clock = FakeClock()
+        limiter = make_limiter(clock)
+
+        for _ in range(3):
+            limiter.record(503, 1.0)
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            limiter.acquire()
+        assert exc_info.value.retry_after == 60.0
+
+        clock.now += 61
+        limiter.acquire()  # 半開: 試行を許可
+        limiter.record(None, 1.0)
+
+        with pytest.raises(CircuitOpenError):
+            limiter.acquire()
+
+    def open_and_probe(self, clock, limiter):
+        """サーキットを開き、クールダウン後に1つ目の呼び出しで試行を始める"""
+        for _ in range(3):
+            limiter.record(503, 1.0)
+        clock.now += 61
+        limiter.acquire()
+
+    def test_half_open_lets_one_probe_through(self):
+        """半開の試行中の呼び出しは、試行が成功するまで待ってから進む"""
+        clock = FakeClock()
+        limiter = make_limiter(clock, probe_poll_seconds=0.5)
+        self.open_and_probe(clock, limiter)
+
+        def sleep(seconds):
+            clock.sleep(seconds)
+            if len(clock.slept) == 2:
+                limiter.record(200, 1.0)  # 試行が成功
+        limiter.sleep = sleep
+
+        limiter.acquire()
+
+        assert clock.slept[:2] == [0.5, 0.5]
+        assert limiter.snapshot()['probe_until'] == 0.0
+
+    def test_waiters_fail_when_probe_fails(self):
+        """試行が失敗すれば待っている呼び出しも CircuitOpenError"""
+        clock = FakeClock()
+        limiter = make_limiter(clock)
+        self.open_and_probe(clock, limiter)
+
+        def sleep(seconds):
+            clock.sleep(seconds)
+            limiter.record(None, 1.0)  # 試行が失敗
+        limiter.sleep = sleep
+
+        with pytest.raises(CircuitOpenError):
+            limiter.acquire()
+
+    def test_stale_probe_is_taken_over(self):
+        """試行が結果を返さないまま期限切れになれば、次の呼び出しが試行する"""
+        clock = FakeClock()
+        limiter = make_limiter(clock, probe_timeout=5.0, probe_poll_seconds=1.0)
+        self.open_and_probe(clock, limiter)
+
+        limiter.acquire()
+
+        # 1061秒に始めた試行が1066秒に期限切れ → 次の試行は1071秒まで
+        assert clock.slept[:5] == [1.0] * 5
+        assert limiter.snapshot()['probe_until'] == 1071.0
+
+    def test_success_resets_failures(self):
+        """成功すれば連続失敗数はリセット"""
+        clock = FakeClock()
+        limiter = make_limiter(clock)
+
+        limiter.record(500, 1.0)
+        limiter.record(500, 1.0)
+        limiter.record(200, 1.0)
+        limiter.record(500, 1.0)
+
+        assert limiter.snapshot()['failures'] == 1
+        limiter.acquire()
+
+    def test_not_found_is_not_a_failure(self):
+        """404 はレートを下げない"""
+        clock = FakeClock()
+        limiter = make_limiter(clock)
+
+        limiter.record(404, 1.0)
+
+        assert limiter.snapshot()['rate'] == 1.5
+
+
+def test_parse_retry_after():
+    """秒数以外は None"""
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") is None
@@ -67,6 +67,7 @@ def test_db():
                 is_pinned BOOLEAN DEFAULT 0,
                 content TEXT,
                 summary TEXT,
+                content_hash TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (competition_id) REFERENCES competitions(id)
@@ -89,6 +90,7 @@ def test_db():
                 content TEXT,
                 summary TEXT,
                 techniques TEXT,
+                content_hash TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (competition_id) REFERENCES competitions(id)
@@ -0,0 +1,118 @@
+"""
+スクレイピングキューとワーカーのテスト（Redis はローカルの代替を使用）
+"""
+import pytest
+
+from app.batch.scrape_worker import ScrapeWorker
+from app.services.rate_limiter import CircuitOpenError
+from app.services.scrape_queue import FAILED_KEY, PROCESSING_KEY_PREFIX, QUEUE_KEY, ScrapeQueue
+
+
+class FakeScraper:
+    def __init__(self, fail_times=0, error=None):
+        self.calls = []
+        self.fail_times = fail_times
+        self.error = error
+
+    def get_tab_content(self, comp_id, tab, force_refresh=False):
+        self.calls.append((comp_id, tab))
+        if self.fail_times:
+            self.fail_times -= 1
+            raise self.error or RuntimeError("boom")
+        return {'full_text': f"{comp_id}/{tab}"}
+
+
+def make_worker(fake_redis, scraper, worker_id="w1"):
+    queue = ScrapeQueue(fake_redis, max_attempts=2)
+    return queue, ScrapeWorker(queue, scraper=scraper, worker_id=worker_id, sleep=lambda seconds: None)
+
+
+class TestScrapeQueue:
+    """ScrapeQueueのテスト"""
+
+    def test_enqueue_deduplicates(self, fake_redis):
+        """同じタスクは待機中・実行中の間は重複登録しない"""
+        queue = ScrapeQueue(fake_redis)
+
+        assert queue.enqueue('tab_content', comp_id='titanic', tab='data')
+        assert not queue.enqueue('tab_content', comp_id='titanic', tab='data')
+        assert queue.enqueue('tab_content', comp_id='titanic', tab='rules')
+        assert queue.stats()['queued'] == 2
+
+    def test_enqueue_validates(self, fake_redis):
+        """未知の種別・必須パラメータ不足はエラー"""
+        queue = ScrapeQueue(fake_redis)
+
+        with pytest.raises(ValueError):
+            queue.enqueue('leaderboard', comp_id='titanic')
+        with pytest.raises(ValueError):
+            queue.enqueue('tab_content', comp_id='titanic')
+
+    def test_recover_orphans(self, fake_redis):
+        """生存確認が切れたワーカーの処理中タスクはキューに戻す"""
+        queue = ScrapeQueue(fake_redis)
+        queue.enqueue('competition_details', comp_id='titanic')
+        queue.heartbeat('crashed')
+        queue.reserve('crashed')
+        fake_redis.delete('scrape:worker:crashed')  # TTL切れ
+
+        assert queue.recover_orphans() == 1
+        assert fake_redis.llen(QUEUE_KEY) == 1
+        assert fake_redis.llen(PROCESSING_KEY_PREFIX + 'crashed') == 0
+
+
+class TestScrapeWorker:
+    """ScrapeWorkerのテスト"""
+
+    def test_runs_tasks_in_order(self, fake_redis):
+        """登録順に実行し、キューが空になったら終了"""
+        scraper = FakeScraper()
+        queue, worker = make_worker(fake_redis, scraper)
+        queue.enqueue('tab_content', comp_id='titanic', tab='data')
+        queue.enqueue('tab_content', comp_id='house-prices', tab='data')
+
+        worker.run(until_empty=True)
+
+        assert scraper.calls == [('titanic', 'data'), ('house-prices', 'data')]
+        assert queue.stats() == {
+            'queued': 0, 'processing': 0, 'failed': 0, 'workers': 0,
+            'completed_total': 2, 'failed_total': 0,
+        }
+
+    def test_retries_then_moves_to_failed(self, fake_redis):
+        """失敗したタスクは最大試行回数まで再試行し、その後は失敗リストへ"""
+        scraper = FakeScraper(fail_times=5)
+        queue, worker = make_worker(fake_redis, scraper)
+        queue.enqueue('tab_content', comp_id='titanic', tab='data')
+
+        worker.run(until_empty=True)
+
+        assert len(scraper.calls) == 2
+        assert fake_redis.llen(FAILED_KEY) == 1
+        # 失敗リストに移ったタスクは再登録できる
+        assert queue.enqueue('tab_content', comp_id='titanic', tab='data')
+
+    def test_circuit_open_does_not_count_attempt(self, fake_redis):
+        """サーキットオープンは試行回数に数えずにキューに戻す"""
+        scraper = FakeScraper(fail_times=3, error=CircuitOpenError(30))
+        queue, worker = make_worker(fake_redis, scraper)
+        queue.enqueue('tab_content', comp_id='titanic', tab='data')
+
+        worker.run(until_empty=True)
+
+        assert len(scraper.calls) == 4
+        assert queue.stats()['completed_total'] == 1
+
+    def test_stop_finishes_current_task(self, fake_redis):
+        """停止要求後は次のタスクを取り出さない"""
+        scraper = FakeScraper()
+        queue, worker = make_worker(fake_redis, scraper)
+        queue.enqueue('tab_content', comp_id='titanic', tab='data')
+        queue.enqueue('tab_content', comp_id='house-prices', tab='data')
+
+        worker.run(max_tasks=1)
+        worker.stop()
+        worker.run(until_empty=True)
+
+        assert scraper.calls == [('titanic', 'data')]
+        assert queue.stats()['queued'] == 1
@@ -0,0 +1,260 @@
+"""
+複数タブの一括スクレイピング（scrape_competition_bundle）のテスト
+"""
+import asyncio
+
+import pytest
+
+from app.services import scraper_service as scraper_module
+from app.services.browser_worker import BrowserWorker
+from app.services.cache_service import CacheService
+from app.services.scraper_service import BUNDLE_TABS, ScraperService
+
+
+LISTING_HTML = """
+<div id="site-content"><ul>
+  <li class="MuiListItem-root">
+    <span class="material-icons">push_pin</span>
+    <a href="/competitions/titanic/discussion/1">Welcome to the competition</a>
+  </li>
+  <li class="MuiListItem-root">
+    <a href="/competitions/titanic/discussion/2">1st Place SolutionAlice · 3 days ago</a>
+    <a aria-label="Alice's profile" href="/alice"></a>
+    <span aria-label="42 votes">42</span>
+    <a href="/competitions/titanic/discussion/2#comments"><span>7 comments</span></a>
+  </li>
+  <li class="MuiListItem-root">
+    <a href="/competitions/titanic/writeups/bob-2nd">2nd Place</a>
+    <a aria-label="Bob's profile" href="/bob"></a>
+  </li>
+</ul></div>
+"""
+
+
+class FakeBrowser:
+    def new_page(self):
+        raise AssertionError("unexpected page")
+
+    def close(self):
+        pass
+
+
+class FakePlaywright:
+    def stop(self):
+        pass
+
+
+class FakeAuthor:
+    tier = "GRANDMASTER"
+    tier_color = "gold"
+
+
+class FakeAuthorTiers:
+    def __init__(self):
+        self.remembered = {}
+
+    def get(self, name):
+        return FakeAuthor() if name == "Alice" else None
+
+    def remember(self, name, tier, tier_color):
+        if tier or tier_color:
+            self.remembered[name] = (tier, tier_color)
+
+    def stats_line(self):
+        return ""
+
+
+class TestScrapeCompetitionBundle:
+    """scrape_competition_bundleのテスト"""
+
+    def test_unknown_tab_raises(self):
+        """未知のタブはブラウザを起動せずにエラー"""
+        scraper = ScraperService(profile_dir="")
+
+        with pytest.raises(ValueError):
+            scraper.scrape_competition_bundle("titanic", tabs=["overview", "leaderboard"])
+
+    def test_bundle_tabs_cover_tab_content(self):
+        """get_tab_content と同じパス（キャッシュキーを共有）"""
+        assert BUNDLE_TABS['overview'] == ''
+        assert BUNDLE_TABS['data'] == 'data'
+        assert BUNDLE_TABS['evaluation'] == 'overview/evaluation'
+
+    def test_cached_tab_content_without_items(self, fake_redis, monkeypatch):
+        """get_tab_content のキャッシュ（一覧アイテムなし）はディスカッション系のタブでは使わない"""
+        cache = CacheService.__new__(CacheService)
+        cache.redis = fake_redis
+        scraper = ScraperService(profile_dir="")
+        scraper.cache_service = cache
+        cache.set_scraped_data("titanic:data", {'full_text': "train.csv"})
+        cache.set_scraped_data("titanic:discussion?sort=votes", {'full_text': "Discussions"})
+        scraped = []
+
+        async def scrape(comp_id, tabs):
+            scraped.extend(tabs)
+            return {tab: {'full_text': tab, 'items': []} for tab in tabs}
+        monkeypatch.setattr(scraper, '_scrape_bundle_async', scrape)
+
+        bundle = scraper.scrape_competition_bundle("titanic", tabs=['data', 'discussion'])
+
+        assert scraped == ['discussion']
+        assert bundle['data']['full_text'] == "train.csv"
+        assert bundle['discussion']['items'] == []
+
+    def test_inside_running_event_loop(self, monkeypatch):
+        """イベントループの実行中（sync Playwright の起動中など）でも別スレッドで取得する"""
+        scraper = ScraperService(profile_dir="")
+        monkeypatch.setattr(scraper.cache_service, 'get_scraped_data', lambda key: None)
+        monkeypatch.setattr(scraper.cache_service, 'set_scraped_data', lambda key, value, ttl_days=None: True)
+
+        async def scrape(comp_id, tabs):
+            return {tab: {'full_text': tab} for tab in tabs}
+        monkeypatch.setattr(scraper, '_scrape_bundle_async', scrape)
+
+        async def caller():
+            return scraper.scrape_competition_bundle("titanic", tabs=['data'])
+
+        assert asyncio.run(caller())['data'] == {'full_text': 'data'}
+
+    def test_parse_discussion_listing_html(self):
+        """静的HTMLから一覧アイテムを抽出（ピン留めは除外）"""
+        scraper = ScraperService(profile_dir="", author_tiers=FakeAuthorTiers())
+
+        items = scraper._parse_discussion_listing_html(LISTING_HTML, 'discussion')
+
+        assert [item['url'] for item in items] == [
+            "https://www.kaggle.com/competitions/titanic/discussion/2",
+            "https://www.kaggle.com/competitions/titanic/writeups/bob-2nd",
+        ]
+        first, second = items
+        assert first['author'] == "Alice"
+        assert first['vote_count'] == 42
+        assert first['comment_count'] == 7
+        assert first['author_tier'] == "GRANDMASTER"
+        assert first['category'] == 'discussion'
+        assert second['author_tier'] is None
+        assert second['category'] == 'writeup'
+
+    def test_listing_detects_uncached_tiers(self):
+        """称号キャッシュにない投稿者はアイテム内のSVGから称号・称号色を判定して保存する"""
+        html = """
+        <ul><li class="MuiListItem-root">
+          <a href="/competitions/titanic/discussion/3">Feature ideas</a>
+          <a aria-label="Carol's profile" href="/carol">
+            <svg aria-label="Competitions Master"><circle style="stroke: #eee"></circle>
+            <circle style="stroke: rgb(241, 95, 0)"></circle></svg>
+          </a>
+        </li></ul>
+        """
+        tiers = FakeAuthorTiers()
+        scraper = ScraperService(profile_dir="", author_tiers=tiers)
+
+        item, = scraper._parse_discussion_listing_html(html, 'discussion')
+
+        assert (item['author_tier'], item['tier_color']) == ("Master", "rgb(241, 95, 0)")
+        assert tiers.remembered == {"Carol": ("Master", "rgb(241, 95, 0)")}
+
+
+def listing_item(url, votes):
+    return {
+        'title': url, 'url': url, 'author': None, 'author_tier': None, 'tier_color': None,
+        'vote_count': votes, 'comment_count': 0, 'category': 'discussion', 'is_pinned': False,
+    }
+
+
+class TestDiscussionsFromBundle:
+    """get_discussions の1ページ目の並列取得のテスト"""
+
+    @pytest.fixture
+    def scraper(self, fake_redis, monkeypatch):
+        cache = CacheService.__new__(CacheService)
+        cache.redis = fake_redis
+        scraper = ScraperService(profile_dir="", author_tiers=FakeAuthorTiers())
+        scraper.cache_service = cache
+        self.paged = []
+        monkeypatch.setattr(
+            scraper, '_page_discussion_tabs',
+            lambda comp_id, tabs, max_pages, known_items, all_discussions, seen_urls: self.paged.extend(tabs)
+        )
+        return scraper
+
+    def test_first_pages_in_one_bundle(self, scraper, monkeypatch):
+        """両タブの1ページ目を1回のバンドルで取得し、重複を除いて投票数順にまとめる"""
+        requested = []
+
+        def bundle(comp_id, tabs, force_refresh=False):
+            requested.append(tabs)
+            return {
+                'discussion': {'items': [listing_item("/d/1", 3), listing_item("/d/2", 9)]},
+                'writeups': {'items': [listing_item("/w/1", 5), listing_item("/d/2", 9)]},
+            }
+        monkeypatch.setattr(scraper, 'scrape_competition_bundle', bundle)
+
+        discussions = scraper.get_discussions("titanic", max_pages=1)
+
+        assert requested == [['discussion', 'writeups']]
+        assert [item['url'] for item in discussions] == ["/d/2", "/w/1", "/d/1"]
+        assert self.paged == []
+
+    def test_later_pages_and_failed_tabs(self, scraper, monkeypatch):
+        """2ページ目以降は順に取得し、1ページ目が取得できなかったタブは1ページ目から"""
+        monkeypatch.setattr(scraper, 'scrape_competition_bundle', lambda comp_id, tabs, force_refresh=False: {
+            'discussion': {'items': [listing_item("/d/1", 3)]},
+            'writeups': None,
+        })
+
+        scraper.get_discussions("titanic", max_pages=3)
+
+        assert [(tab_type, first_page) for tab_type, _, first_page in self.paged] == [('discussion', 2), ('writeup', 1)]
+
+    def test_browser_worker_pages_all_tabs(self, scraper, monkeypatch):
+        """browser_worker の実行中はバンドルを使わず、全ページをワーカーのブラウザで順に取得する"""
+        monkeypatch.setattr(scraper_module, 'BrowserWorker', lambda launch, **options: BrowserWorker(
+            lambda p: FakeBrowser(), start_playwright=FakePlaywright, rss_reader=lambda: None, **options
+        ))
+        monkeypatch.setattr(scraper, 'scrape_competition_bundle', lambda *args, **kwargs: pytest.fail("bundle used"))
+
+        with scraper.browser_worker():
+            discussions = scraper.get_discussions("titanic", max_pages=2)
+
+        assert discussions == []
+        assert [(tab_type, first_page) for tab_type, _, first_page in self.paged] == [('discussion', 1), ('writeup', 1)]
+
+    def test_incremental_stops_after_unchanged_first_page(self, scraper, monkeypatch):
+        """差分同期は新しいコメント順の1ページ目をキャッシュなしで取得し、新規・変化がなければ打ち切る"""
+        item = listing_item("/d/1", 3)
+        requested = []
+
+        def bundle(comp_id, tabs, force_refresh=False):
+            requested.append((tabs, force_refresh))
+            return {'discussion_recent': {'items': [item]}, 'writeups_recent': {'items': []}}
+        monkeypatch.setattr(scraper, 'scrape_competition_bundle', bundle)
+
+        known_items = {"/d/1": {'vote_count': 3, 'comment_count': 0}}
+        discussions = scraper.get_discussions("titanic", max_pages=3, known_items=known_items)
+
+        assert requested == [(['discussion_recent', 'writeups_recent'], True)]
+        assert discussions == [item]
+        assert self.paged == []
+
+    def test_incremental_finds_new_item_on_later_page(self, scraper, monkeypatch):
+        """新しいコメント順で1ページ目に変化があれば次のページへ進み、そこにある新規投稿も取得する"""
+        commented = {**listing_item("/d/1", 3), 'comment_count': 1}
+        new_post = listing_item("/d/9", 0)
+        monkeypatch.setattr(scraper, 'scrape_competition_bundle', lambda comp_id, tabs, force_refresh=False: {
+            'discussion_recent': {'items': [commented]},
+            'writeups_recent': {'items': []},
+        })
+
+        def page_tabs(comp_id, tabs, max_pages, known_items, all_discussions, seen_urls):
+            self.paged.extend(tabs)
+            all_discussions.append(new_post)
+        monkeypatch.setattr(scraper, '_page_discussion_tabs', page_tabs)
+
+        known_items = {"/d/1": {'vote_count': 3, 'comment_count': 0}}
+        discussions = scraper.get_discussions("titanic", max_pages=3, known_items=known_items)
+
+        assert [item['url'] for item in discussions] == ["/d/1", "/d/9"]
+        (tab_type, tab_url, first_page), = self.paged
+        assert (tab_type, first_page) == ('discussion', 2)
+        assert "sort=recent-comments" in tab_url
@@ -0,0 +1,205 @@
+"""
+ページアーカイブとアーカイブからの再解析のテスト
+"""
+import asyncio
+from datetime import datetime
+
+from app.batch.reparse import parse_discussion_pages, parse_notebook_pages, reparse_competition
+from app.services.scraper_service import ScraperService
+from app.services.snapshot_archive import SnapshotArchive
+
+
+DISCUSSION_URL = "https://www.kaggle.com/competitions/titanic/discussion?sort=votes"
+WRITEUPS_URL = f"{DISCUSSION_URL}&tab=writeups"
+NOTEBOOKS_URL = "https://www.kaggle.com/competitions/titanic/code?sortBy=voteCount"
+
+
+def listing_html(href, title, votes):
+    return f"""
+    <ul><li class="MuiListItem-root">
+      <a href="{href}">{title}</a>
+      <a aria-label="Alice's profile" href="/alice"></a>
+      <span aria-label="{votes} votes">{votes}</span>
+    </li></ul>
+    """
+
+
+NOTEBOOK_HTML = """
+<div class="km-listitem--large">
+  <a aria-label="Titanic EDA" role="link" href="/code/bob/titanic-eda"></a>
+  <a aria-label="Bob's profile" href="/bob"></a>
+  <span aria-label="120 votes">120</span>
+  <a href="/code/bob/titanic-eda/comments">15 comments</a>
+</div>
+"""
+
+
+class FakeAuthorTiers:
+    def get(self, name):
+        return None
+
+    def remember(self, name, tier, tier_color):
+        pass
+
+
+class FakeListingService:
+    """DiscussionService / SolutionService の代わり（呼び出しを記録）"""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_listing_index(self, competition_id):
+        return {}
+
+    def sync_discussions(self, competition_id, discussions_data, known_items):
+        self.calls.append(('sync_discussions', [d['url'] for d in discussions_data]))
+        return {'saved': len(discussions_data)}
+
+    def fetch_and_save_solutions(self, competition_id, discussions_data, **kwargs):
+        self.calls.append(('solutions', [d['url'] for d in discussions_data]))
+        return {'saved': len(discussions_data)}
+
+    def fetch_and_save_notebooks(self, competition_id, notebooks_data):
+        self.calls.append(('notebooks', [d['url'] for d in notebooks_data]))
+        return {'saved': len(notebooks_data)}
+
+
+def make_scraper():
+    return ScraperService(profile_dir="", http_first=False, snapshot_archive=False, author_tiers=FakeAuthorTiers())
+
+
+class TestSnapshotArchive:
+    """SnapshotArchiveのテスト"""
+
+    def test_content_addressed(self, tmp_path):
+        """同じ内容は1回だけ保存し、取得のたびに索引を追記する"""
+        archive = SnapshotArchive(tmp_path)
+        first = archive.save(DISCUSSION_URL, "<html>a</html>", 'discussion_listing', comp_id='titanic')
+        second = archive.save(DISCUSSION_URL, "<html>a</html>", 'discussion_listing', comp_id='titanic')
+
+        assert first == second
+        assert archive.stats()['snapshots'] == 2
+        assert archive.stats()['objects'] == 1
+
+    def test_latest_by_time(self, tmp_path):
+        """URLの最新スナップショット（日時指定で過去の版も取得できる）"""
+        archive = SnapshotArchive(tmp_path)
+        archive.save(DISCUSSION_URL, "old", 'discussion_listing', fetched_at=datetime(2025, 1, 1))
+        archive.save(DISCUSSION_URL, "new", 'discussion_listing', fetched_at=datetime(2025, 2, 1))
+
+        assert archive.latest(DISCUSSION_URL)['content'] == "new"
+        assert archive.latest(DISCUSSION_URL, before=datetime(2025, 1, 15))['content'] == "old"
+        assert archive.latest(WRITEUPS_URL) is None
+
+    def test_scraper_archive_disabled_by_default(self):
+        """アーカイブは設定で有効にした場合のみ"""
+        assert make_scraper().snapshot_archive is None
+
+
+class FakeAsyncPage:
+    """_scrape_bundle_tab 用の async ページ"""
+
+    def __init__(self, html):
+        self.html = html
+
+    async def inner_text(self, selector):
+        return "text"
+
+    async def content(self):
+        return self.html
+
+    async def wait_for_timeout(self, ms):
+        pass
+
+    async def close(self):
+        pass
+
+
+class TestBundleArchive:
+    """scrape_competition_bundle のタブのアーカイブのテスト"""
+
+    def scrape_tab(self, tmp_path, monkeypatch, tab, html):
+        scraper = ScraperService(
+            profile_dir="", http_first=False, snapshot_archive=True, snapshot_dir=str(tmp_path),
+            author_tiers=FakeAuthorTiers(), json_capture=False
+        )
+
+        async def new_page(context):
+            return FakeAsyncPage(html), []
+
+        async def goto(page, url, api_responses, **kwargs):
+            return None
+        monkeypatch.setattr(scraper, '_new_page_async', new_page)
+        monkeypatch.setattr(scraper, '_goto_async', goto)
+
+        asyncio.run(scraper._scrape_bundle_tab(None, 'titanic', tab))
+        return scraper
+
+    def test_listing_tab_is_reparsed(self, tmp_path, monkeypatch):
+        """ディスカッション一覧の1ページ目（バンドル経由）も再解析できる"""
+        scraper = self.scrape_tab(
+            tmp_path, monkeypatch, 'discussion', listing_html("/competitions/titanic/discussion/1", "Tips", 10)
+        )
+
+        discussions = parse_discussion_pages(scraper.snapshot_archive, make_scraper(), 'titanic')
+
+        assert [(d['title'], d['vote_count']) for d in discussions] == [("Tips", 10)]
+
+    def test_other_tabs(self, tmp_path, monkeypatch):
+        """概要・データなどのタブは competition_tab として保存"""
+        scraper = self.scrape_tab(tmp_path, monkeypatch, 'data', "<div id='site-content'>train.csv</div>")
+
+        snapshot = scraper.snapshot_archive.latest("https://www.kaggle.com/competitions/titanic/data")
+
+        assert snapshot['page_type'] == 'competition_tab'
+        assert "train.csv" in snapshot['content']
+
+
+class TestReparse:
+    """アーカイブからの再解析のテスト"""
+
+    def test_parse_latest_pages(self, tmp_path):
+        """各URLの最新のHTMLを解析する"""
+        archive = SnapshotArchive(tmp_path)
+        archive.save(DISCUSSION_URL, listing_html("/competitions/titanic/discussion/1", "Old", 1),
+                     'discussion_listing', comp_id='titanic', fetched_at=datetime(2025, 1, 1))
+        archive.save(DISCUSSION_URL, listing_html("/competitions/titanic/discussion/1", "Tips", 10),
+                     'discussion_listing', comp_id='titanic', fetched_at=datetime(2025, 2, 1))
+        archive.save(WRITEUPS_URL, listing_html("/competitions/titanic/writeups/alice-1st", "1st Place", 50),
+                     'discussion_listing', comp_id='titanic', fetched_at=datetime(2025, 2, 1))
+        archive.save(NOTEBOOKS_URL, NOTEBOOK_HTML, 'notebook_listing', comp_id='titanic')
+
+        scraper = make_scraper()
+        discussions = parse_discussion_pages(archive, scraper, 'titanic')
+        notebooks = parse_notebook_pages(archive, scraper, 'titanic')
+
+        assert [(d['title'], d['vote_count'], d['category']) for d in discussions] == [
+            ("1st Place", 50, 'writeup'),
+            ("Tips", 10, 'discussion'),
+        ]
+        assert notebooks[0]['url'] == "https://www.kaggle.com/code/bob/titanic-eda"
+        assert notebooks[0]['comment_count'] == 15
+
+    def test_reparse_competition_writes_tables(self, tmp_path):
+        """解析結果を discussions / solutions テーブルに同期"""
+        archive = SnapshotArchive(tmp_path)
+        archive.save(DISCUSSION_URL, listing_html("/competitions/titanic/discussion/1", "Tips", 10),
+                     'discussion_listing', comp_id='titanic')
+        archive.save(NOTEBOOKS_URL, NOTEBOOK_HTML, 'notebook_listing', comp_id='titanic')
+        service = FakeListingService()
+
+        result = reparse_competition('titanic', archive, make_scraper(), service, service)
+
+        assert result['listing_items'] == 1
+        assert [name for name, _ in service.calls] == ['sync_discussions', 'solutions', 'notebooks']
+
+    def test_dry_run(self, tmp_path):
+        """dry-run ではDBに書き込まない"""
+        archive = SnapshotArchive(tmp_path)
+        archive.save(NOTEBOOKS_URL, NOTEBOOK_HTML, 'notebook_listing', comp_id='titanic')
+        service = FakeListingService()
+
+        result = reparse_competition('titanic', archive, make_scraper(), service, service, dry_run=True)
+
+        assert result == {'listing_items': 0, 'notebooks': 1}
+        assert service.calls == []
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+ブラウザプロファイル再利用のベンチマーク（コールド vs ウォーム）
+
+空のプロファイルで起動した場合（コールド）と、前回の起動で Cookie・
+ストレージ・HTTPディスクキャッシュが残っているプロファイルで起動した場合（ウォーム）の
+ページ読み込み時間を比較する。
+
+使い方:
+    python benchmark_browser_profile.py
+    python benchmark_browser_profile.py --urls https://www.kaggle.com/competitions/titanic --runs 3
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# パス設定
+script_dir = os.path.dirname(__file__)
+backend_dir = os.path.join(script_dir, '..', '02_backend')
+sys.path.insert(0, backend_dir)
+
+from playwright.sync_api import sync_playwright
+from app.services.scraper_service import ScraperService
+
+
+DEFAULT_URLS = [
+    "https://www.kaggle.com/competitions/titanic",
+    "https://www.kaggle.com/competitions/titanic/discussion?sort=votes",
+    "https://www.kaggle.com/competitions/titanic/code?sortBy=voteCount",
+]
+
+
+def load_pages(scraper: ScraperService, urls: list[str], delay: float) -> list[tuple[float, int]]:
+    """
+    1回のブラウザ起動で各URLを読み込み、読み込み時間とネットワーク応答数を返す
+
+    Returns:
+        [(秒, ネットワーク応答数)]
+    """
+    results = []
+    with sync_playwright() as p:
+        browser = scraper._launch_browser(p)
+        page = browser.new_page()
+
+        network_responses = []
+        page.on('response', lambda response: network_responses.append(response))
+
+        for url in urls:
+            network_responses.clear()
+            start = time.perf_counter()
+            page.goto(url, wait_until='networkidle', timeout=60000)
+            elapsed = time.perf_counter() - start
+            results.append((elapsed, len(network_responses)))
+            time.sleep(delay)  # kaggle.com への負荷を抑える
+
+        browser.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ブラウザプロファイル再利用のベンチマーク')
+    parser.add_argument('--urls', nargs='+', default=DEFAULT_URLS, help='計測するURL')
+    parser.add_argument('--runs', type=int, default=2, help='ウォーム計測の回数')
+    parser.add_argument('--delay', type=float, default=2.0, help='ページ間の待機秒数')
+    args = parser.parse_args()
+
+    profile_dir = tempfile.mkdtemp(prefix='kaggledb_profile_')
+    scraper = ScraperService(profile_dir=profile_dir)
+
+    print("=" * 80)
+    print(f"ブラウザプロファイルベンチマーク: {len(args.urls)}ページ  プロファイル: {profile_dir}")
+    print("=" * 80)
+
+    try:
+        runs = [('cold', load_pages(scraper, args.urls, args.delay))]
+        for i in range(args.runs):
+            runs.append((f'warm{i + 1}', load_pages(scraper, args.urls, args.delay)))
+
+        for url_index, url in enumerate(args.urls):
+            print(f"\n{url}")
+            for label, results in runs:
+                elapsed, responses = results[url_index]
+                print(f"  {label:6s} {elapsed:6.2f}秒  応答{responses:4d}件")
+
+        print("\n" + "=" * 80)
+        cold_total = sum(elapsed for elapsed, _ in runs[0][1])
+        for label, results in runs:
+            total = sum(elapsed for elapsed, _ in results)
+            print(f"  {label:6s} 合計 {total:6.2f}秒  (コールド比 {total / cold_total * 100:5.1f}%)")
+        print("=" * 80)
+
+    finally:
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
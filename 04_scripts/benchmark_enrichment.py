@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+コンペ充実化のベンチマーク（個別の呼び出し vs 1回の構造化出力）
+
+DB のコンペについて、要約・評価指標・評価指標の説明・タグ（・データセット情報）を
+両方の経路で生成し、1コンペあたりの API 呼び出し回数・トークン数・処理時間を比較する。
+レスポンスキャッシュは使わずに毎回 API を呼び出す（OPENAI_API_KEY が必要）
+
+使い方:
+    python benchmark_enrichment.py --limit 5
+    python benchmark_enrichment.py titanic spaceship-titanic --data-tab
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import time
+from threading import Lock
+from typing import Dict, List
+
+# パス設定
+script_dir = os.path.dirname(__file__)
+backend_dir = os.path.join(script_dir, '..', '02_backend')
+sys.path.insert(0, backend_dir)
+
+from app.config import DATABASE_PATH
+from app.services.llm_service import LLMService
+
+
+# 生成結果として消去するフィールド（全フィールドを生成させる）
+ENRICHED_FIELDS = ('summary', 'metric', 'metric_description', 'tags', 'data_types', 'domain', 'dataset_info')
+
+
+class UsageRecorder:
+    """chat.completions.create を包んで呼び出し回数とトークン数を集計する"""
+
+    def __init__(self, service: LLMService):
+        self._create = service.client.chat.completions.create
+        self._lock = Lock()
+        self.reset()
+        service.client.chat.completions.create = self.create
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    def create(self, **kwargs):
+        response = self._create(**kwargs)
+        usage = getattr(response, 'usage', None)
+        with self._lock:
+            self.calls += 1
+            if usage:
+                self.prompt_tokens += usage.prompt_tokens
+                self.completion_tokens += usage.completion_tokens
+        return response
+
+
+def load_competitions(comp_ids: List[str], limit: int) -> List[Dict]:
+    """説明文のあるコンペを取得"""
+    conn = sqlite3.connect(DATABASE_PATH)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    if comp_ids:
+        placeholders = ",".join("?" for _ in comp_ids)
+        cursor.execute(f"SELECT id, title, description FROM competitions WHERE id IN ({placeholders})", comp_ids)
+    else:
+        cursor.execute(
+            "SELECT id, title, description FROM competitions "
+            "WHERE description IS NOT NULL AND description != '' ORDER BY end_date DESC LIMIT ?",
+            (limit,)
+        )
+    rows = [dict(row) for row in cursor.fetchall()]
+    conn.close()
+    return rows
+
+
+def get_available_tags() -> Dict[str, List[str]]:
+    """タグマスタを取得"""
+    conn = sqlite3.connect(DATABASE_PATH)
+    rows = conn.execute("SELECT name, category FROM tags ORDER BY category, display_order").fetchall()
+    conn.close()
+    tags_by_category: Dict[str, List[str]] = {}
+    for name, category in rows:
+        tags_by_category.setdefault(category, []).append(name)
+    return tags_by_category
+
+
+def main():
+    parser = argparse.ArgumentParser(description='コンペ充実化のベンチマーク（個別 vs 一括）')
+    parser.add_argument('comp_ids', nargs='*', help='対象コンペID（省略時は最近のコンペ）')
+    parser.add_argument('--limit', type=int, default=3, help='comp_ids を省略した場合の件数（デフォルト: 3）')
+    parser.add_argument('--data-tab', action='store_true', help='Dataタブもスクレイピングしてデータセット情報を含める')
+    args = parser.parse_args()
+
+    competitions = load_competitions(args.comp_ids, args.limit)
+    if not competitions:
+        print("対象のコンペがありません")
+        sys.exit(1)
+
+    available_tags = get_available_tags()
+    service = LLMService(use_cache=False)
+    recorder = UsageRecorder(service)
+
+    data_tab_texts = {}
+    if args.data_tab:
+        from app.services.scraper_service import get_scraper_service
+        scraper = get_scraper_service()
+        for comp in competitions:
+            tab = scraper.get_tab_content(comp['id'], tab='data')
+            data_tab_texts[comp['id']] = (tab or {}).get('full_text')
+
+    print("=" * 78)
+    print(f"コンペ充実化ベンチマーク: {len(competitions)}件")
+    print("=" * 78)
+    print(f"  {'コンペ':30s} {'経路':8s} {'呼出':>4s} {'入力トークン':>10s} {'出力トークン':>10s} {'時間':>8s}")
+
+    totals = {mode: {'calls': 0, 'prompt': 0, 'completion': 0, 'elapsed': 0.0} for mode in ('個別', '一括')}
+    for comp in competitions:
+        for mode, combined in (('個別', False), ('一括', True)):
+            target = {key: value for key, value in comp.items() if key not in ENRICHED_FIELDS}
+            recorder.reset()
+            start = time.perf_counter()
+            service.enrich_competition(
+                target,
+                available_tags,
+                data_tab_text=data_tab_texts.get(comp['id']),
+                combined=combined
+            )
+            elapsed = time.perf_counter() - start
+
+            total = totals[mode]
+            total['calls'] += recorder.calls
+            total['prompt'] += recorder.prompt_tokens
+            total['completion'] += recorder.completion_tokens
+            total['elapsed'] += elapsed
+            print(
+                f"  {comp['id'][:30]:30s} {mode:8s} {recorder.calls:4d} "
+                f"{recorder.prompt_tokens:10d} {recorder.completion_tokens:10d} {elapsed:7.2f}秒"
+            )
+
+    count = len(competitions)
+    print("=" * 78)
+    print("1コンペあたりの平均")
+    for mode, total in totals.items():
+        print(
+            f"  {mode}: 呼び出し {total['calls'] / count:.1f}回, "
+            f"入力 {total['prompt'] / count:.0f} / 出力 {total['completion'] / count:.0f} トークン, "
+            f"{total['elapsed'] / count:.2f}秒"
+        )
+    separate, combined = totals['個別'], totals['一括']
+    if separate['prompt'] and separate['elapsed']:
+        print(
+            f"  一括/個別: 入力トークン {combined['prompt'] / separate['prompt']:.0%}, "
+            f"時間 {combined['elapsed'] / separate['elapsed']:.0%}"
+        )
+    print("=" * 78)
+
+
+if __name__ == '__main__':
+    main()
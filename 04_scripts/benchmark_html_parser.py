@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+HTMLパーサーのベンチマーク
+
+フィクスチャ（benchmark_scraper_replay.py --record で記録）のHTMLを使い、
+パーサーごとに1ページあたりのパース時間とピークメモリを比較する。
+コンペ一覧の要素検索は従来の lambda マッチャーと CSS セレクタの両方で計測する。
+
+使い方:
+    python benchmark_html_parser.py
+    python benchmark_html_parser.py --repeat 10 --fixture-dir ../02_backend/data/fixtures
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+# パス設定
+script_dir = os.path.dirname(__file__)
+backend_dir = os.path.join(script_dir, '..', '02_backend')
+sys.path.insert(0, backend_dir)
+
+from app.config import SCRAPER_FIXTURE_DIR
+from app.services.fixture_store import FixtureStore
+from app.services.html_parser import available_backends, parse_html
+
+
+def find_with_lambda(soup):
+    """従来の要素ごとの lambda マッチャー"""
+    cards = soup.find_all('div', class_=lambda x: x and 'sc-kSaXSp' in str(x))
+    links = soup.find_all('a', href=lambda x: x and x.startswith('/competitions/') and x != '/competitions')
+    return len(cards) + len(links)
+
+
+def find_with_css(soup):
+    """CSS セレクタ"""
+    cards = soup.select('div[class*="sc-kSaXSp"]')
+    links = soup.select('a[href^="/competitions/"]')
+    return len(cards) + len(links)
+
+
+def measure(html: str, backend: str, finder, repeat: int) -> tuple[float, float, int]:
+    """
+    パース＋要素検索の平均時間（ミリ秒）とピークメモリ（MB）を計測
+
+    Returns:
+        (平均時間ms, ピークメモリMB, 検出要素数)
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        found = finder(parse_html(html, backend))
+    elapsed_ms = (time.perf_counter() - start) / repeat * 1000
+
+    tracemalloc.start()
+    finder(parse_html(html, backend))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed_ms, peak / 1024 / 1024, found
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTMLパーサーのベンチマーク')
+    parser.add_argument('--fixture-dir', default=str(SCRAPER_FIXTURE_DIR), help='フィクスチャの保存先')
+    parser.add_argument('--repeat', type=int, default=5, help='1ページあたりの繰り返し回数')
+    args = parser.parse_args()
+
+    store = FixtureStore(args.fixture_dir)
+    urls = store.urls()
+    if not urls:
+        print(f"❌ フィクスチャがありません: {args.fixture_dir}")
+        print("   benchmark_scraper_replay.py --record で記録してください")
+        sys.exit(1)
+
+    backends = available_backends()
+    finders = [('lambda', find_with_lambda), ('css', find_with_css)]
+
+    print("=" * 80)
+    print(f"HTMLパーサーベンチマーク: {len(urls)}ページ × {args.repeat}回  パーサー: {', '.join(backends)}")
+    print("=" * 80)
+
+    totals = {}
+    for url in urls:
+        html = store.load(url)['html']
+        print(f"\n{url} ({len(html) / 1024:.0f} KB)")
+
+        for backend in backends:
+            for finder_name, finder in finders:
+                elapsed_ms, peak_mb, found = measure(html, backend, finder, args.repeat)
+                key = (backend, finder_name)
+                total = totals.setdefault(key, [0.0, 0.0])
+                total[0] += elapsed_ms
+                total[1] = max(total[1], peak_mb)
+                print(f"  {backend:12s} {finder_name:7s} {elapsed_ms:8.1f} ms  {peak_mb:6.1f} MB  ({found}要素)")
+
+    print("\n" + "=" * 80)
+    print("ページ平均")
+    print("=" * 80)
+    for (backend, finder_name), (elapsed_ms, peak_mb) in totals.items():
+        print(f"  {backend:12s} {finder_name:7s} {elapsed_ms / len(urls):8.1f} ms  最大 {peak_mb:6.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+LLMパイプラインの負荷試験（OpenAI互換の代替サーバーを使用、APIキー不要）
+
+フェイクOpenAIサーバー（app.services.fake_openai）をバックグラウンドで起動し、
+コンペ充実化（enrich_competition）とディスカッション・解法・ノートブックの要約を
+合成データで並列に実行する。パイプラインごとのスループット、メソッドごとの
+呼び出し数・再試行・失敗・レイテンシ（p50/p95）、サーバーが注入した 429・不正出力の件数を表示する。
+レート制限は LLM_RATE_LIMIT_RPM / LLM_RATE_LIMIT_TPM の設定どおりに適用される
+（推定トークン数に max_tokens を含むため、既定の TPM では要約系の呼び出しが律速になる）。
+
+使い方:
+    python benchmark_llm_pipeline.py
+    python benchmark_llm_pipeline.py --items 50 --workers 8 --latency 0.8 --rate-limit-rate 0.1 --malformed-rate 0.05
+    python benchmark_llm_pipeline.py --base-url http://127.0.0.1:8100/v1   # 起動済みのサーバーを使う
+    LLM_RATE_LIMIT_TPM=0 LLM_RATE_LIMIT_RPM=0 python benchmark_llm_pipeline.py  # レート制限なしのスループット
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import httpx
+
+# パス設定
+script_dir = os.path.dirname(__file__)
+backend_dir = os.path.join(script_dir, '..', '02_backend')
+sys.path.insert(0, backend_dir)
+
+from app.config import LLM_RATE_LIMIT_RPM, LLM_RATE_LIMIT_TPM
+from app.services.fake_openai import FakeOpenAI, serve_in_thread
+from app.services.llm_service import LLMService
+from app.services.llm_telemetry import LLMTelemetry
+
+
+AVAILABLE_TAGS = {
+    'data_type': ['テーブル', '画像', 'テキスト', '時系列'],
+    'task_type': ['分類', '回帰', '物体検出', 'セグメンテーション'],
+    'domain': ['医療', '金融', '小売'],
+}
+
+PARAGRAPH = (
+    "We trained LightGBM and CatBoost models on 5-fold stratified splits and blended them with a ridge "
+    "stacker. Target encoding of the high-cardinality categories and lag features gave the largest gains. "
+)
+
+
+def synthetic_text(index: int, tokens: int) -> str:
+    """約 tokens トークンの英文（1段落 ≒ 40 トークン）"""
+    return f"Item {index}. " + PARAGRAPH * max(1, tokens // 40)
+
+
+def build_pipelines(service: LLMService, content_tokens: int) -> Dict[str, Callable[[int], bool]]:
+    """
+    パイプライン名 → 1アイテムの処理（全ての出力が検証を通れば True）
+    """
+    def enrichment(index: int) -> bool:
+        competition = {
+            'title': f"Benchmark Competition {index}",
+            'description': synthetic_text(index, 600) + " Submissions are evaluated on RMSE.",
+        }
+        enriched = service.enrich_competition(competition, AVAILABLE_TAGS, data_tab_text="train.csv 12 MB\ntest.csv 3 MB")
+        return all(enriched.get(field) for field in ('summary', 'metric', 'metric_description', 'tags'))
+
+    def discussion(index: int) -> bool:
+        content = synthetic_text(index, content_tokens)
+        results = service.run_many({
+            'summary': lambda: service.generate_structured_discussion_summary(content, f"Discussion {index}"),
+            'translation': lambda: service.translate_and_organize_discussion(content),
+        })
+        return results['summary'] not in ("", "{}") and bool(results['translation'])
+
+    def solution(index: int) -> bool:
+        content = synthetic_text(index, content_tokens)
+        results = service.run_many({
+            'summary': lambda: service.generate_structured_solution_summary(content, f"Solution {index}"),
+            'techniques': lambda: service.extract_solution_techniques(content, f"Solution {index}"),
+        })
+        return results['summary'] != "{}" and results['techniques'] != "[]"
+
+    def notebook(index: int) -> bool:
+        summary = service.summarize_notebook(synthetic_text(index, content_tokens), f"Notebook {index}")
+        return bool(json.loads(summary or "{}"))
+
+    return {'enrichment': enrichment, 'discussion': discussion, 'solution': solution, 'notebook': notebook}
+
+
+def run_pipeline(process: Callable[[int], bool], items: int, workers: int) -> Dict[str, Any]:
+    """アイテムを workers 並列で処理し、所要時間と検証を通った件数を返す"""
+    def safe(index: int) -> bool:
+        try:
+            return process(index)
+        except Exception as e:
+            print(f"   ❌ アイテム{index}: {type(e).__name__}: {e}")
+            return False
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(safe, range(items)))
+    return {'seconds': time.perf_counter() - start, 'ok': sum(results)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='LLMパイプラインの負荷試験（フェイクOpenAIサーバー）')
+    parser.add_argument('--pipelines', default='enrichment,discussion,solution,notebook',
+                        help='実行するパイプライン（カンマ区切り）')
+    parser.add_argument('--items', type=int, default=20, help='パイプラインごとのアイテム数')
+    parser.add_argument('--workers', type=int, default=4, help='アイテムの並列数')
+    parser.add_argument('--content-tokens', type=int, default=1200,
+                        help='要約する本文のトークン数（予算を超えると map-reduce になる）')
+    parser.add_argument('--base-url', help='起動済みのOpenAI互換サーバー（省略時はフェイクサーバーを起動）')
+    parser.add_argument('--latency', type=float, default=0.3, help='基本レイテンシ（秒）')
+    parser.add_argument('--latency-jitter', type=float, default=0.2, help='レイテンシの揺らぎ（秒）')
+    parser.add_argument('--tokens-per-second', type=float, default=0.0, help='出力トークンの生成速度（0 で無制限）')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.05, help='429 を返す割合')
+    parser.add_argument('--retry-after', type=float, default=1.0, help='429 の Retry-After（秒）')
+    parser.add_argument('--malformed-rate', type=float, default=0.02, help='不正なJSONを返す割合')
+    parser.add_argument('--seed', type=int, default=0, help='乱数シード')
+    args = parser.parse_args()
+
+    pipelines: List[str] = [name.strip() for name in args.pipelines.split(',') if name.strip()]
+
+    server = None
+    base_url = args.base_url
+    if not base_url:
+        fake = FakeOpenAI(
+            latency=args.latency,
+            latency_jitter=args.latency_jitter,
+            tokens_per_second=args.tokens_per_second,
+            rate_limit_rate=args.rate_limit_rate,
+            retry_after=args.retry_after,
+            malformed_rate=args.malformed_rate,
+            seed=args.seed
+        )
+        base_url, server = serve_in_thread(fake)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        telemetry = LLMTelemetry(Path(temp_dir) / "telemetry.db")
+        service = LLMService(api_key="fake-key", base_url=base_url, use_cache=False, telemetry=telemetry)
+        service.retry_delay = 0.1
+        process = build_pipelines(service, args.content_tokens)
+
+        print("=" * 90)
+        print(f"LLMパイプライン負荷試験: {base_url}")
+        print(f"  アイテム {args.items}件 × 並列 {args.workers}  本文 {args.content_tokens}トークン  "
+              f"レート制限 RPM {LLM_RATE_LIMIT_RPM:g} / TPM {LLM_RATE_LIMIT_TPM:g}")
+        if server:
+            print(f"  注入: レイテンシ {args.latency}+0〜{args.latency_jitter}秒  429 {args.rate_limit_rate:.0%}"
+                  f"（Retry-After {args.retry_after:g}秒）  不正出力 {args.malformed_rate:.0%}")
+        print("=" * 90)
+
+        for name in pipelines:
+            if name not in process:
+                print(f"⚠️  不明なパイプライン: {name}")
+                continue
+            result = run_pipeline(process[name], args.items, args.workers)
+            print(f"  {name:12s} {result['seconds']:7.1f}秒  {args.items / result['seconds']:6.2f} 件/秒  "
+                  f"検証OK {result['ok']}/{args.items}")
+
+        stats = telemetry.stats(days=1)['methods']
+        print("\nメソッド別（テレメトリ）")
+        print(f"  {'メソッド':40s} {'呼出':>5s} {'再試行':>5s} {'失敗':>4s} {'p50 ms':>7s} {'p95 ms':>7s}")
+        for method, row in sorted(stats.items(), key=lambda item: -item[1]['calls']):
+            print(f"  {method:40s} {row['calls']:5d} {row['retries']:5d} {row['errors']:4d} "
+                  f"{row['p50_ms'] or 0:7d} {row['p95_ms'] or 0:7d}")
+
+    try:
+        injected = httpx.get(base_url.rsplit('/v1', 1)[0] + "/fake/stats", timeout=5).json()
+    except (httpx.HTTPError, ValueError):
+        injected = {}
+    if injected:
+        print("\nサーバー側（フェイクサーバーの統計）")
+        print(f"  {'プロンプトの種類':40s} {'受信':>5s} {'429':>5s} {'不正出力':>6s}")
+        for family, row in injected.items():
+            print(f"  {family:40s} {row['requests']:5d} {row['rate_limited']:5d} {row['malformed']:6d}")
+
+    if server:
+        server.should_exit = True
+
+
+if __name__ == '__main__':
+    main()
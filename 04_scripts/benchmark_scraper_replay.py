@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+フィクスチャを使ったスクレイピングのオフラインベンチマーク
+
+1. --record で実際の kaggle.com から取得し、HTML/JSON をフィクスチャに保存
+   （あわせて各ページの解析結果を expected.json に保存）
+2. 以降は replay でネットワークなしに同じページを解析し、
+   処理時間と解析結果（expected.json との差分）を確認する
+
+使い方:
+    python benchmark_scraper_replay.py --record titanic spaceship-titanic
+    python benchmark_scraper_replay.py titanic spaceship-titanic
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+# パス設定
+script_dir = os.path.dirname(__file__)
+backend_dir = os.path.join(script_dir, '..', '02_backend')
+sys.path.insert(0, backend_dir)
+
+from app.config import SCRAPER_FIXTURE_DIR
+from app.services.scraper_service import ScraperService
+
+
+EXPECTED_FILE = "expected.json"
+
+
+def run_targets(scraper: ScraperService, comp_id: str) -> dict:
+    """1コンペ分のスクレイピングを実行し、対象ごとの結果と処理時間を返す"""
+    targets = {
+        'overview': lambda: scraper.get_tab_content(comp_id, force_refresh=True),
+        'discussions': lambda: scraper.get_discussions(comp_id, force_refresh=True),
+        'notebooks': lambda: scraper.get_notebooks(comp_id, force_refresh=True),
+    }
+
+    results = {}
+    for name, func in targets.items():
+        start = time.perf_counter()
+        data = func()
+        elapsed = time.perf_counter() - start
+
+        if isinstance(data, dict):
+            summary = len(data.get('full_text', ''))
+        elif isinstance(data, list):
+            summary = sorted(item['url'] for item in data)
+        else:
+            summary = None
+
+        results[name] = {'elapsed': elapsed, 'summary': summary}
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='フィクスチャを使ったスクレイピングのベンチマーク')
+    parser.add_argument('comp_ids', nargs='+', help='対象コンペID')
+    parser.add_argument('--record', action='store_true', help='kaggle.com から取得してフィクスチャを記録')
+    parser.add_argument('--fixture-dir', default=str(SCRAPER_FIXTURE_DIR), help='フィクスチャの保存先')
+    parser.add_argument('--json-capture', action='store_true', help='JSONキャプチャ経路を計測')
+    args = parser.parse_args()
+
+    fixture_dir = Path(args.fixture_dir)
+    expected_path = fixture_dir / EXPECTED_FILE
+    mode = 'record' if args.record else 'replay'
+
+    scraper = ScraperService(
+        json_capture=args.json_capture,
+        fixture_mode=mode,
+        fixture_dir=str(fixture_dir)
+    )
+
+    expected = {}
+    if mode == 'replay' and expected_path.exists():
+        with open(expected_path, 'r', encoding='utf-8') as f:
+            expected = json.load(f)
+
+    print("=" * 60)
+    print(f"スクレイピングベンチマーク（{mode}）: {fixture_dir}")
+    print("=" * 60)
+
+    all_results = {}
+    mismatches = 0
+    total_start = time.perf_counter()
+
+    for comp_id in args.comp_ids:
+        results = run_targets(scraper, comp_id)
+        all_results[comp_id] = {name: r['summary'] for name, r in results.items()}
+
+        for name, r in results.items():
+            status = ""
+            if comp_id in expected:
+                if expected[comp_id].get(name) == r['summary']:
+                    status = "✓"
+                else:
+                    status = "✗ 記録時と不一致"
+                    mismatches += 1
+            count = len(r['summary']) if isinstance(r['summary'], list) else r['summary']
+            print(f"  {comp_id:40s} {name:12s} {r['elapsed']:7.2f}秒  {count}  {status}")
+
+    total_elapsed = time.perf_counter() - total_start
+
+    if mode == 'record':
+        fixture_dir.mkdir(parents=True, exist_ok=True)
+        expected_all = {}
+        if expected_path.exists():
+            with open(expected_path, 'r', encoding='utf-8') as f:
+                expected_all = json.load(f)
+        expected_all.update(all_results)
+        with open(expected_path, 'w', encoding='utf-8') as f:
+            json.dump(expected_all, f, ensure_ascii=False, indent=2)
+
+    print("=" * 60)
+    print(f"合計: {total_elapsed:.2f}秒 ({len(args.comp_ids) / total_elapsed:.2f} コンペ/秒)")
+    if mode == 'replay' and expected:
+        print(f"不一致: {mismatches}件")
+    print("=" * 60)
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
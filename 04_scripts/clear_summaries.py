@@ -86,6 +86,9 @@ def main():
     print("\n📝 新しい要約形式で再生成するには：")
     print("   - コンペ詳細ページで「要約を生成」ボタンをクリック")
     print("   - ノートブック詳細ページで「要約を生成」ボタンをクリック")
+    print("\n📦 まとめて再生成する場合は Batch API を使うと低コストです：")
+    print("   python 04_scripts/enrich_competitions.py --batch")
+    print("   python 04_scripts/summarize_discussions.py <competition_id> --max 100 --batch")
 
 
 if __name__ == "__main__":
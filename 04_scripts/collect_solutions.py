@@ -288,13 +288,14 @@ def collect_solutions_for_competition(comp_id: str, max_discussions: int = 50, e
             content = detail['content']
             print(f"   本文長: {len(content)}文字")
 
-            # 要約生成
-            print(f"   📝 要約生成中...")
-            summary = llm.summarize_discussion(content, sol['title'])
-
-            # 技術抽出
-            print(f"   🔧 技術抽出中...")
-            techniques_json = llm.extract_solution_techniques(content, sol['title'])
+            # 要約生成と技術抽出（並列に実行）
+            print(f"   📝 要約生成・🔧 技術抽出中...")
+            results = llm.run_many({
+                "summary": lambda: llm.summarize_discussion(content, sol['title']),
+                "techniques": lambda: llm.extract_solution_techniques(content, sol['title']),
+            })
+            summary = results["summary"]
+            techniques_json = results["techniques"]
 
             # データベース更新
             cursor.execute("""
@@ -9,7 +9,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '02_backend'))
 
 from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
+from app.services.html_parser import parse_html
 import time
 
 
@@ -35,7 +35,7 @@ def debug_discussion_page():
             time.sleep(3)
 
             html = page.content()
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = parse_html(html)
 
             # HTMLをファイルに保存
             output_file = '/tmp/kaggle_discussion_debug.html'
@@ -9,7 +9,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '02_backend'))
 
 from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
+from app.services.html_parser import parse_html
 
 url = "https://www.kaggle.com/competitions/titanic/discussion"
 
@@ -21,7 +21,7 @@ with sync_playwright() as p:
     page.wait_for_timeout(3000)
 
     html = page.content()
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = parse_html(html)
 
     # ディスカッションリストを取得
     discussion_items = soup.select('li.MuiListItem-root')
@@ -57,20 +57,21 @@ with sync_playwright() as p:
 
         # メダル関連のアイコンを探す
         # 一般的なパターン: 'medal', 'gold', 'badge' などのクラス名やテキスト
-        medals = item.find_all(string=lambda x: x and ('medal' in x.lower() or 'gold' in x.lower()))
+        medals = [text for text in item.stripped_strings if 'medal' in text.lower() or 'gold' in text.lower()]
         if medals:
             print(f"\nMedal-related text found: {medals}")
 
         # SVGアイコンを確認
-        svgs = item.find_all('svg')
+        svgs = item.select('svg')
         if svgs:
             print(f"\nFound {len(svgs)} SVG icons")
             for svg in svgs[:3]:  # 最初の3個だけ
                 # aria-labelやtitleを確認
                 if svg.get('aria-label'):
                     print(f"  SVG aria-label: {svg['aria-label']}")
-                if svg.find('title'):
-                    print(f"  SVG title: {svg.find('title').text}")
+                svg_title = svg.select_one('title')
+                if svg_title:
+                    print(f"  SVG title: {svg_title.text}")
 
     print("\n\nPress Enter to close browser...")
     input()
@@ -9,6 +9,9 @@
    - データタイプ (data_types)
    - タグ (tags)
    - ドメイン (domain)
+
+--batch を指定すると、全件のスクレイピング後にLLM呼び出しを OpenAI Batch API で
+まとめて実行し（料金・レート制限が緩い）、結果を各コンペに反映します。
 """
 
 import sys
@@ -20,7 +23,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '02_backend'))
 import sqlite3
 import json
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from app.config import DATABASE_PATH
 from app.services.llm_service import get_llm_service
@@ -169,6 +172,40 @@ def update_competition(competition: Dict) -> bool:
         return False
 
 
+def scrape_competition_texts(comp: Dict, scraper_service) -> Optional[str]:
+    """
+    Overview（と dataset_info が空の場合は Data タブ）をスクレイピングして comp に反映
+
+    Returns:
+        Dataタブのテキスト（取得しない・失敗した場合は None）
+    """
+    # Overview と Dataタブ（dataset_infoが空の場合のみ）を1回のブラウザ起動で並列取得
+    tabs = ['overview'] if comp.get('dataset_info') else ['overview', 'data']
+    bundle = scraper_service.scrape_competition_bundle(comp['id'], tabs=tabs)
+    scraped_data = bundle['overview']
+
+    if scraped_data and scraped_data.get('full_text'):
+        print(f"  🌐 Overview スクレイピング: {len(scraped_data['full_text'])}文字取得")
+        # スクレイピングした詳細テキストを使用
+        comp['description'] = scraped_data['full_text']
+        comp['last_scraped_at'] = scraped_data['scraped_at']
+    else:
+        print(f"  ⚠️  スクレイピング失敗 - API の description を使用")
+        comp['last_scraped_at'] = None
+
+    # Dataタブのスクレイピング結果（dataset_infoが空の場合のみ）
+    data_tab_text = None
+    if not comp.get('dataset_info'):
+        data_tab_data = bundle['data']
+        if data_tab_data and data_tab_data.get('full_text'):
+            data_tab_text = data_tab_data['full_text']
+            print(f"  🌐 Data タブスクレイピング: {len(data_tab_text)}文字取得")
+        else:
+            print(f"  ⚠️  Data タブスクレイピング失敗")
+
+    return data_tab_text
+
+
 def main():
     """メイン処理"""
     import argparse
@@ -185,6 +222,11 @@ def main():
         action="store_true",
         help="実際には更新せず、処理内容のみ表示"
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="LLM呼び出しを OpenAI Batch API でまとめて実行（完了まで待機）"
+    )
 
     args = parser.parse_args()
 
@@ -222,6 +264,25 @@ def main():
     print(f"📊 充実化対象: {len(competitions)}件")
     print("-" * 60)
 
+    # バッチモード: 先に全件をスクレイピングし、LLM呼び出しをバッチAPIで実行してキャッシュに保存
+    data_tab_texts = {}
+    if args.batch:
+        print("\n📦 バッチモード: スクレイピング中...")
+        for comp in competitions:
+            try:
+                data_tab_texts[comp['id']] = scrape_competition_texts(comp, scraper_service)
+            except Exception as e:
+                print(f"  ❌ スクレイピングエラー ({comp['id']}): {e}")
+
+        result = llm_service.prefetch_batch(
+            [comp for comp in competitions if comp['id'] in data_tab_texts],
+            lambda comp: llm_service.enrich_competition(
+                dict(comp), available_tags, data_tab_text=data_tab_texts[comp['id']]
+            )
+        )
+        print(f"📦 バッチ完了: {result['rounds']}回、{result['responses']}/{result['requests']}件のレスポンス")
+        print("-" * 60)
+
     # 各コンペティションを処理
     success_count = 0
     error_count = 0
@@ -231,29 +292,13 @@ def main():
         print(f"  ID: {comp['id']}")
 
         try:
-            # 1. Webスクレイピングで詳細情報を取得
-            scraped_data = scraper_service.get_competition_details(comp['id'])
-
-            if scraped_data and scraped_data.get('full_text'):
-                print(f"  🌐 Overview スクレイピング: {len(scraped_data['full_text'])}文字取得")
-                # スクレイピングした詳細テキストを使用
-                comp['description'] = scraped_data['full_text']
-                comp['last_scraped_at'] = scraped_data['scraped_at']
+            # 1. Webスクレイピングで詳細情報を取得（バッチモードではスクレイピング済み）
+            if args.batch and comp['id'] in data_tab_texts:
+                data_tab_text = data_tab_texts[comp['id']]
             else:
-                print(f"  ⚠️  スクレイピング失敗 - API の description を使用")
-                comp['last_scraped_at'] = None
-
-            # 2. Dataタブのスクレイピング（dataset_infoが空の場合のみ）
-            data_tab_text = None
-            if not comp.get('dataset_info'):
-                data_tab_data = scraper_service.get_tab_content(comp['id'], tab='data')
-                if data_tab_data and data_tab_data.get('full_text'):
-                    data_tab_text = data_tab_data['full_text']
-                    print(f"  🌐 Data タブスクレイピング: {len(data_tab_text)}文字取得")
-                else:
-                    print(f"  ⚠️  Data タブスクレイピング失敗")
+                data_tab_text = scrape_competition_texts(comp, scraper_service)
 
-            # 3. LLMで充実化
+            # 2. LLMで充実化（バッチモードではキャッシュから返る）
             enriched = llm_service.enrich_competition(comp, available_tags, data_tab_text=data_tab_text)
 
             # 結果を表示
@@ -304,6 +349,9 @@ def main():
     print(f"✅ 成功: {success_count}件")
     if error_count > 0:
         print(f"❌ 失敗: {error_count}件")
+    if llm_service.cache:
+        for line in llm_service.cache.report():
+            print(line)
     if args.dry_run:
         print("🔍 DRY RUN モード: 実際のデータベース更新は行われていません")
 
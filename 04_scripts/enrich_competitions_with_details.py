@@ -21,11 +21,15 @@ from app.config import DATABASE_PATH
 def enrich_competition(
     comp_id: str,
     scraper,
-    llm_service
+    llm_service,
+    recheck_missing: bool = False
 ) -> Optional[Dict[str, Any]]:
     """
     コンペ詳細を取得してLLMで構造化
 
+    Args:
+        recheck_missing: 取得失敗のキャッシュ（404・内容なし）を無視して再確認
+
     Returns:
         構造化されたコンペ情報（日本語）
     """
@@ -35,7 +39,7 @@ def enrich_competition(
 
     # Step 1: 詳細ページをスクレイピング
     print("[1/3] 詳細ページをスクレイピング中...")
-    scraped_data = scraper.get_tab_content(comp_id, tab="", force_refresh=False)
+    scraped_data = scraper.get_tab_content(comp_id, tab="", force_refresh=False, recheck_missing=recheck_missing)
 
     if not scraped_data:
         print(f"❌ スクレイピング失敗: {comp_id}")
@@ -219,11 +223,13 @@ def save_to_db(comp_id: str, enriched_data: Dict[str, Any]) -> bool:
         return False
 
 
-def main(limit=None, offset=0):
+def main(limit=None, offset=0, max_pages_per_browser=None, max_rss_mb=None):
     """
     Args:
         limit: 処理する件数（Noneの場合は全件）
         offset: 開始位置（デフォルト0）
+        max_pages_per_browser: ブラウザをリサイクルするページ数（Noneの場合は設定値）
+        max_rss_mb: ブラウザをリサイクルするRSS（MB、Noneの場合は設定値）
     """
     print("=" * 60)
     if limit:
@@ -253,20 +259,22 @@ def main(limit=None, offset=0):
     success_count = 0
     failed_count = 0
 
-    for i, comp_id in enumerate(comp_ids, 1):
-        print(f"\n進捗: {i}/{len(comp_ids)}")
+    # 1つのブラウザを使い回し、ページ数・メモリ上限でリサイクル（終了時にメモリプロファイルを出力）
+    with scraper.browser_worker(max_pages=max_pages_per_browser, max_rss_mb=max_rss_mb):
+        for i, comp_id in enumerate(comp_ids, 1):
+            print(f"\n進捗: {i}/{len(comp_ids)}")
 
-        # 詳細取得＆構造化
-        enriched_data = enrich_competition(comp_id, scraper, llm_service)
+            # 詳細取得＆構造化
+            enriched_data = enrich_competition(comp_id, scraper, llm_service)
 
-        if enriched_data:
-            # DB保存
-            if save_to_db(comp_id, enriched_data):
-                success_count += 1
+            if enriched_data:
+                # DB保存
+                if save_to_db(comp_id, enriched_data):
+                    success_count += 1
+                else:
+                    failed_count += 1
             else:
                 failed_count += 1
-        else:
-            failed_count += 1
 
     # サマリー
     print("\n" + "=" * 60)
@@ -274,6 +282,9 @@ def main(limit=None, offset=0):
     print("=" * 60)
     print(f"成功: {success_count}件")
     print(f"失敗: {failed_count}件")
+    if llm_service.cache:
+        for line in llm_service.cache.report():
+            print(line)
     print("=" * 60)
 
 
@@ -284,6 +295,10 @@ if __name__ == "__main__":
     parser.add_argument('--limit', type=int, default=None, help='処理する件数（デフォルト: 全件）')
     parser.add_argument('--offset', type=int, default=0, help='開始位置（デフォルト: 0）')
     parser.add_argument('--test', action='store_true', help='テストモード（1件のみ）')
+    parser.add_argument('--max-pages-per-browser', type=int, default=None,
+                        help='ブラウザをリサイクルするページ数（デフォルト: SCRAPER_BROWSER_MAX_PAGES）')
+    parser.add_argument('--max-rss-mb', type=float, default=None,
+                        help='ブラウザをリサイクルするRSS（MB、デフォルト: SCRAPER_BROWSER_MAX_RSS_MB）')
 
     args = parser.parse_args()
 
@@ -295,7 +310,12 @@ if __name__ == "__main__":
         offset = args.offset
 
     try:
-        main(limit=limit, offset=offset)
+        main(
+            limit=limit,
+            offset=offset,
+            max_pages_per_browser=args.max_pages_per_browser,
+            max_rss_mb=args.max_rss_mb
+        )
     except KeyboardInterrupt:
         print("\n\n中断されました")
         sys.exit(1)
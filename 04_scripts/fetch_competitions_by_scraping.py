@@ -17,7 +17,7 @@ import sqlite3
 from datetime import datetime
 from app.services.scraper_service import get_scraper_service
 from app.services.kaggle_client import get_kaggle_client
-from app.config import DATABASE_PATH
+from app.config import DATABASE_PATH, SCRAPER_LIST_CONCURRENCY
 
 
 def parse_args():
@@ -43,6 +43,17 @@ def parse_args():
         action='store_true',
         help='キャッシュを無視して再取得'
     )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='DBにあるコンペだけのページで打ち切る（新規コンペの追加のみ。既存コンペの情報は更新されない）'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=SCRAPER_LIST_CONCURRENCY,
+        help=f'並列に取得するページ数（デフォルト: {SCRAPER_LIST_CONCURRENCY}）'
+    )
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -52,6 +63,17 @@ def parse_args():
     return parser.parse_args()
 
 
+def get_known_competition_ids() -> set:
+    """DBに保存済みのコンペID"""
+    conn = sqlite3.connect(DATABASE_PATH)
+    try:
+        return {row[0] for row in conn.execute("SELECT id FROM competitions")}
+    except sqlite3.OperationalError:
+        return set()
+    finally:
+        conn.close()
+
+
 def is_in_year_range(comp_data: dict, year_from: int) -> bool:
     """指定された年以降のコンペかどうかを判定"""
     try:
@@ -84,11 +106,18 @@ def main():
     # Step 1: スクレイピングでコンペIDリストを取得
     print("\n[1/3] コンペIDリストをスクレイピング中...")
     scraper = get_scraper_service(cache_ttl_days=7)  # 1週間キャッシュ
+    # 差分取得（--incremental）: DBにあるコンペだけのページで打ち切る（新しいコンペは一覧の先頭に追加される）。
+    # 既存コンペの終了日などの変更は取り込まれないため、既定では全ページを取得する
+    known_ids = get_known_competition_ids() if args.incremental else None
+    if known_ids:
+        print(f"   DB登録済み: {len(known_ids)}件（既知のコンペだけのページで打ち切り）")
     comp_ids = scraper.scrape_competitions_list(
         max_pages=args.max_pages,
         prestige_filter="medals",
         participation_filter="open",
-        force_refresh=args.force_refresh
+        force_refresh=args.force_refresh,
+        known_ids=known_ids or None,
+        concurrency=args.concurrency
     )
 
     if not comp_ids:
@@ -4,8 +4,12 @@ Kaggle コンペティションページの HTML 構造を調査するスクリ
 """
 
 import requests
-from bs4 import BeautifulSoup
 import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '02_backend'))
+
+from app.services.html_parser import parse_html
 
 
 def inspect_page(comp_id: str):
@@ -33,7 +37,7 @@ def inspect_page(comp_id: str):
         response.raise_for_status()
         print(f"✅ ステータスコード: {response.status_code}\n")
 
-        soup = BeautifulSoup(response.text, 'lxml')
+        soup = parse_html(response.text)
 
         # HTML を保存
         output_file = f"/tmp/{comp_id}_page.html"
@@ -47,14 +51,14 @@ def inspect_page(comp_id: str):
         print("=" * 80)
 
         # タイトル
-        title = soup.find('title')
+        title = soup.select_one('title')
         if title:
             print(f"\n📌 ページタイトル:\n{title.get_text(strip=True)}\n")
 
         # すべての div のクラスを調査
         print("\n📦 div 要素のクラス名（最初の50個）:")
         print("-" * 80)
-        divs = soup.find_all('div', class_=True)
+        divs = soup.select('div[class]')
         unique_classes = set()
         for div in divs[:50]:
             classes = ' '.join(div.get('class', []))
@@ -67,14 +71,14 @@ def inspect_page(comp_id: str):
         # id 属性を持つ要素
         print("\n🆔 id 属性を持つ要素（最初の30個）:")
         print("-" * 80)
-        elements_with_id = soup.find_all(id=True)
+        elements_with_id = soup.select('[id]')
         for elem in elements_with_id[:30]:
             print(f"  - <{elem.name} id=\"{elem.get('id')}\">")
 
         # script タグ（JSON データが含まれている可能性）
         print("\n📜 script タグ（JSON データを探索）:")
         print("-" * 80)
-        scripts = soup.find_all('script')
+        scripts = soup.select('script')
         for i, script in enumerate(scripts[:10]):
             script_text = script.get_text()[:200]
             if 'competition' in script_text.lower() or 'description' in script_text.lower():
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+LLM呼び出しのコスト・レイテンシのレポート
+
+LLMService が記録したテレメトリ（LLM_TELEMETRY_PATH）から、日・メソッドごとの
+呼び出し数・キャッシュヒット・トークン数・レイテンシ（p50/p95）を表示し、
+期間全体でトークン数の多いメソッドから順に並べる。
+
+使い方:
+    python llm_stats_report.py
+    python llm_stats_report.py --days 30 --method translate_and_organize_discussion
+"""
+
+import argparse
+import os
+import sys
+
+# パス設定
+script_dir = os.path.dirname(__file__)
+backend_dir = os.path.join(script_dir, '..', '02_backend')
+sys.path.insert(0, backend_dir)
+
+from app.services.llm_telemetry import get_llm_telemetry
+
+
+def format_ms(value) -> str:
+    return f"{value / 1000:.1f}s" if value is not None else "-"
+
+
+def format_row(label: str, stat: dict) -> str:
+    return (
+        f"  {label:44s} {stat['calls']:6d} {stat['cache_hits']:6d} {stat['retries']:5d} {stat['errors']:4d} "
+        f"{stat['prompt_tokens']:11,d} {stat['completion_tokens']:11,d} "
+        f"{format_ms(stat['p50_ms']):>7s} {format_ms(stat['p95_ms']):>7s}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='LLM呼び出しのコスト・レイテンシのレポート')
+    parser.add_argument('--days', type=int, default=7, help='今日を含む直近の日数（デフォルト: 7）')
+    parser.add_argument('--method', help='メソッド名で絞り込む')
+    args = parser.parse_args()
+
+    stats = get_llm_telemetry().stats(days=args.days, method=args.method)
+    if not stats['days']:
+        print(f"直近{args.days}日間のLLM呼び出しの記録がありません")
+        return
+
+    header = (
+        f"  {'':44s} {'呼出':>6s} {'ヒット':>6s} {'再試行':>5s} {'失敗':>4s} "
+        f"{'入力トークン':>11s} {'出力トークン':>11s} {'p50':>7s} {'p95':>7s}"
+    )
+
+    print("=" * 120)
+    print(f"LLM呼び出しレポート（直近{args.days}日間）")
+    print("=" * 120)
+
+    current_day = None
+    for row in stats['days']:
+        if row['day'] != current_day:
+            current_day = row['day']
+            print(f"\n📅 {current_day}")
+            print(header)
+        print(format_row(row['method'], row))
+
+    methods = stats['methods']
+    total_tokens = sum(stat['prompt_tokens'] + stat['completion_tokens'] for stat in methods.values())
+    print(f"\n📊 期間合計（トークン数の多い順）")
+    print(header + f" {'割合':>6s}")
+    for method, stat in sorted(
+        methods.items(),
+        key=lambda item: item[1]['prompt_tokens'] + item[1]['completion_tokens'],
+        reverse=True
+    ):
+        share = (stat['prompt_tokens'] + stat['completion_tokens']) / total_tokens if total_tokens else 0
+        print(format_row(method, stat) + f" {share:6.1%}")
+    print("=" * 120)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+投稿者テーブル追加マイグレーション
+
+authors テーブル（投稿者名 → 称号・称号色の判定キャッシュ）を作成し、
+既存の discussions / solutions に保存済みの称号で初期化します。
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '02_backend'))
+
+import sqlite3
+from app.config import DATABASE_PATH
+
+
+def migrate():
+    """投稿者テーブルを追加"""
+    conn = sqlite3.connect(DATABASE_PATH)
+    cursor = conn.cursor()
+
+    # authors テーブル作成
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS authors (
+            name TEXT PRIMARY KEY,
+            tier TEXT,
+            tier_color TEXT,
+            updated_at TEXT NOT NULL
+        )
+    """)
+
+    # 既存データから初期化（投稿者ごとに最新の行を採用。ノートブックのメダル表記は除外）
+    for table in ['discussions', 'solutions']:
+        cursor.execute(f"""
+            INSERT OR IGNORE INTO authors (name, tier, tier_color, updated_at)
+            SELECT author, author_tier, tier_color, MAX(updated_at)
+            FROM {table}
+            WHERE author IS NOT NULL
+              AND (author_tier IS NOT NULL OR tier_color IS NOT NULL)
+              AND (author_tier IS NULL OR author_tier IN ('Grandmaster', 'Master', 'Expert', 'Contributor', 'Novice'))
+            GROUP BY author
+        """)
+
+    conn.commit()
+
+    cursor.execute("SELECT COUNT(*) FROM authors")
+    count = cursor.fetchone()[0]
+    conn.close()
+
+    print("✅ authors テーブルを作成しました")
+    print("  - name: 投稿者名（主キー）")
+    print("  - tier: 称号")
+    print("  - tier_color: 称号色")
+    print("  - updated_at: 判定日時（一定期間後に再判定）")
+    print(f"  既存データから {count}件の投稿者を登録")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+discussions / solutions テーブルに content_hash カラムを追加するマイグレーション
+
+content_hash: summary（と techniques）を生成した本文の正規化ハッシュ。
+再取得した本文が同じならLLM処理をスキップするために使う
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '02_backend'))
+
+import sqlite3
+from app.config import DATABASE_PATH
+
+
+def migrate():
+    """content_hashカラムを追加"""
+
+    print("=" * 60)
+    print("マイグレーション: content_hash カラム追加")
+    print("=" * 60)
+
+    conn = sqlite3.connect(DATABASE_PATH)
+    cursor = conn.cursor()
+
+    try:
+        for table in ['discussions', 'solutions']:
+            try:
+                cursor.execute(f"""
+                    ALTER TABLE {table}
+                    ADD COLUMN content_hash TEXT
+                """)
+                print(f"✅ {table}.content_hash カラムを追加しました")
+            except sqlite3.OperationalError as e:
+                if "duplicate column name" in str(e).lower():
+                    print(f"⚠️  {table}.content_hash カラムは既に存在します")
+                else:
+                    raise
+
+        conn.commit()
+
+    finally:
+        conn.close()
+
+    print("=" * 60)
+    print("マイグレーション完了")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    try:
+        migrate()
+    except Exception as e:
+        print(f"\n❌ エラーが発生しました: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+本文クリーニングの削減効果レポート
+
+フィクスチャ（benchmark_scraper_replay.py --record で記録）のディスカッション・Writeup・
+ノートブックのページについて、従来の #site-content の全テキストとクリーニング後の本文を比較し、
+1件ごとの文字数・トークン数・Redis キャッシュのサイズ・LLM呼び出し数の削減を表示する。
+LLMのレイテンシはテレメトリ（data/llm_telemetry.db）に記録があれば、
+メソッドの p50 × 呼び出し数で見積もる。
+
+使い方:
+    python report_content_cleaning.py
+    python report_content_cleaning.py --max-comments 3 --method generate_structured_discussion_summary
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+# パス設定
+script_dir = os.path.dirname(__file__)
+backend_dir = os.path.join(script_dir, '..', '02_backend')
+sys.path.insert(0, backend_dir)
+
+from app.config import (
+    SCRAPER_FIXTURE_DIR,
+    SCRAPER_CONTENT_MAX_COMMENTS,
+    LLM_CHUNK_TOKENS,
+    LLM_MAX_CHUNKS,
+    LLM_TELEMETRY_PATH,
+)
+from app.services.content_cleaner import extract_main_content, inner_text
+from app.services.fixture_store import FixtureStore
+from app.services.html_parser import parse_html
+from app.services.llm_chunking import count_tokens
+from app.services.llm_service import LLMService
+from app.services.llm_telemetry import LLMTelemetry
+
+DETAIL_PATHS = ('/discussion/', '/writeups/', '/code/')
+
+
+def llm_calls(tokens: int, budget: int) -> int:
+    """本文1件の処理に必要なLLM呼び出し数（予算超過時は map-reduce のチャンク数 + 統合1回）"""
+    if tokens <= budget:
+        return 1
+    return min(math.ceil(tokens / LLM_CHUNK_TOKENS), LLM_MAX_CHUNKS) + 1
+
+
+def cache_bytes(url: str, content: str) -> int:
+    """get_discussion_detail が Redis に保存するJSONのバイト数"""
+    return len(json.dumps({'url': url, 'content': content}, ensure_ascii=False).encode('utf-8'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='本文クリーニングの削減効果レポート')
+    parser.add_argument('--fixture-dir', default=str(SCRAPER_FIXTURE_DIR), help='フィクスチャの保存先')
+    parser.add_argument('--max-comments', type=int, default=SCRAPER_CONTENT_MAX_COMMENTS, help='含めるコメント数')
+    parser.add_argument(
+        '--method', default='translate_and_organize_discussion',
+        choices=sorted(LLMService.CONTENT_TOKEN_BUDGETS), help='トークン予算・レイテンシを見積もるメソッド'
+    )
+    args = parser.parse_args()
+
+    store = FixtureStore(args.fixture_dir)
+    urls = [url for url in store.urls() if any(path in url for path in DETAIL_PATHS)]
+    if not urls:
+        print(f"❌ 詳細ページのフィクスチャがありません: {args.fixture_dir}")
+        print("   benchmark_scraper_replay.py --record で記録してください")
+        sys.exit(1)
+
+    budget = LLMService.CONTENT_TOKEN_BUDGETS[args.method]
+    p50_ms = None
+    if LLM_TELEMETRY_PATH.exists():
+        p50_ms = LLMTelemetry(LLM_TELEMETRY_PATH).stats(days=30, method=args.method)['methods'].get(
+            args.method, {}
+        ).get('p50_ms')
+
+    print("=" * 100)
+    print(f"本文クリーニング: {len(urls)}ページ  メソッド: {args.method}（予算 {budget} トークン）"
+          f"  コメント: {args.max_comments}件")
+    print("=" * 100)
+    print(f"{'ページ':40s} {'文字数':>17s} {'トークン':>15s} {'キャッシュKB':>15s} {'LLM呼出':>7s} {'処理ms':>6s}")
+
+    totals = {'raw_tokens': 0, 'clean_tokens': 0, 'raw_bytes': 0, 'clean_bytes': 0, 'raw_calls': 0, 'clean_calls': 0}
+    for url in urls:
+        html = store.load(url)['html']
+        content = parse_html(html).select_one('#site-content')
+        raw = inner_text(content) if content else ''
+        if not raw:
+            continue
+
+        start = time.perf_counter()
+        cleaned = extract_main_content(html, url, max_comments=args.max_comments) or raw
+        clean_ms = (time.perf_counter() - start) * 1000
+
+        raw_tokens, clean_tokens = count_tokens(raw), count_tokens(cleaned)
+        raw_bytes, clean_bytes = cache_bytes(url, raw), cache_bytes(url, cleaned)
+        raw_calls, clean_calls = llm_calls(raw_tokens, budget), llm_calls(clean_tokens, budget)
+        for key, value in (
+            ('raw_tokens', raw_tokens), ('clean_tokens', clean_tokens), ('raw_bytes', raw_bytes),
+            ('clean_bytes', clean_bytes), ('raw_calls', raw_calls), ('clean_calls', clean_calls)
+        ):
+            totals[key] += value
+
+        name = url.split('kaggle.com')[-1][-40:]
+        print(
+            f"{name:40s} {len(raw):7d} → {len(cleaned):7d} {raw_tokens:6d} → {clean_tokens:6d} "
+            f"{raw_bytes / 1024:6.1f} → {clean_bytes / 1024:6.1f} {raw_calls:3d} → {clean_calls:<3d} {clean_ms:6.1f}"
+        )
+
+    def reduction(before, after):
+        return f"{(1 - after / before) * 100:5.1f}%" if before else "  -  "
+
+    print("\n" + "=" * 100)
+    print("合計")
+    print("=" * 100)
+    print(f"  入力トークン:     {totals['raw_tokens']:8d} → {totals['clean_tokens']:8d}"
+          f"  ({reduction(totals['raw_tokens'], totals['clean_tokens'])} 削減)")
+    print(f"  キャッシュ(KB):   {totals['raw_bytes'] / 1024:8.1f} → {totals['clean_bytes'] / 1024:8.1f}"
+          f"  ({reduction(totals['raw_bytes'], totals['clean_bytes'])} 削減)")
+    print(f"  LLM呼び出し:      {totals['raw_calls']:8d} → {totals['clean_calls']:8d}"
+          f"  ({reduction(totals['raw_calls'], totals['clean_calls'])} 削減)")
+    if p50_ms:
+        print(f"  推定LLM時間(秒):  {totals['raw_calls'] * p50_ms / 1000:8.1f} → "
+              f"{totals['clean_calls'] * p50_ms / 1000:8.1f}  (p50 {p50_ms} ms × 呼び出し数)")
+    else:
+        print("  推定LLM時間:      テレメトリに記録がないため省略（LLM_TELEMETRY_ENABLED で記録）")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 """
 失敗したコンペ2件を再取得
+
+404・内容なしで失敗したページは一定時間（SCRAPER_NEGATIVE_CACHE_TTL_HOURS）記録され、
+その間はブラウザを起動せずに失敗を返す。ページが復旧したか確認する場合は --recheck-missing を指定する
 """
 
+import argparse
 import sys
 import os
 
@@ -24,7 +28,7 @@ FAILED_IDS = [
 ]
 
 
-def main():
+def main(recheck_missing: bool = False):
     print("=" * 60)
     print("失敗したコンペ2件の再取得")
     print("=" * 60)
@@ -39,7 +43,7 @@ def main():
         print(f"\n進捗: {i}/{len(FAILED_IDS)}\n")
 
         # Step 1 & 2: スクレイピング + LLM処理
-        enriched_data = enrich_competition(comp_id, scraper, llm_service)
+        enriched_data = enrich_competition(comp_id, scraper, llm_service, recheck_missing=recheck_missing)
 
         if not enriched_data:
             fail_count += 1
@@ -60,8 +64,13 @@ def main():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='失敗したコンペの再取得')
+    parser.add_argument('--recheck-missing', action='store_true',
+                        help='取得失敗のキャッシュ（404・内容なし）を無視して再確認')
+    args = parser.parse_args()
+
     try:
-        main()
+        main(recheck_missing=args.recheck_missing)
     except KeyboardInterrupt:
         print("\n\n中断されました")
         sys.exit(1)
@@ -4,6 +4,7 @@
 
 指定したコンペティションのディスカッション詳細を取得し、
 LLMで要約してデータベースに保存します。
+--batch を指定すると要約を OpenAI Batch API でまとめて実行します。
 """
 
 import sys
@@ -18,13 +19,14 @@ from app.services.scraper_service import get_scraper_service
 from app.services.llm_service import get_llm_service
 
 
-def summarize_discussion_for_competition(comp_id: str, max_discussions: int = 10):
+def summarize_discussion_for_competition(comp_id: str, max_discussions: int = 10, batch: bool = False):
     """
     コンペティションのディスカッションを取得・要約してDBに保存
     
     Args:
         comp_id: コンペティションID
         max_discussions: 要約する最大ディスカッション数
+        batch: 要約をバッチAPIでまとめて実行する
     """
     print(f"\n{'='*60}")
     print(f"ディスカッション要約: {comp_id}")
@@ -59,6 +61,20 @@ def summarize_discussion_for_competition(comp_id: str, max_discussions: int = 10
 
     print(f"📋 {len(discussions)}件のディスカッションを要約します\n")
 
+    # バッチモード: 先に全件の本文を取得し、要約をバッチAPIで実行してキャッシュに保存
+    contents = {}
+    if batch:
+        for disc in discussions:
+            detail = scraper.get_discussion_detail(disc['url'], force_refresh=False)
+            if detail and detail.get('content'):
+                contents[disc['id']] = detail['content']
+
+        result = llm.prefetch_batch(
+            [disc for disc in discussions if disc['id'] in contents],
+            lambda disc: llm.summarize_discussion(content=contents[disc['id']], title=disc['title'])
+        )
+        print(f"📦 バッチ完了: {result['responses']}/{result['requests']}件の要約\n")
+
     # 各ディスカッションを処理
     summarized_count = 0
     skipped_count = 0
@@ -71,8 +87,11 @@ def summarize_discussion_for_competition(comp_id: str, max_discussions: int = 10
 
         print(f"[{idx}/{len(discussions)}] {title[:60]}... (👍 {vote_count})")
 
-        # ディスカッション詳細を取得
-        detail = scraper.get_discussion_detail(url, force_refresh=False)
+        # ディスカッション詳細を取得（バッチモードでは取得済み）
+        if disc_id in contents:
+            detail = {'content': contents[disc_id]}
+        else:
+            detail = scraper.get_discussion_detail(url, force_refresh=False)
 
         if not detail or not detail.get('content'):
             print(f"  ⚠️  内容取得失敗 - スキップ")
@@ -111,6 +130,9 @@ def summarize_discussion_for_competition(comp_id: str, max_discussions: int = 10
 
     print(f"{'='*60}")
     print(f"✅ 完了: {summarized_count}件要約、{skipped_count}件スキップ")
+    if llm.cache:
+        for line in llm.cache.report():
+            print(line)
     print(f"{'='*60}\n")
 
 
@@ -121,12 +143,14 @@ def main():
     parser = argparse.ArgumentParser(description='ディスカッション要約スクリプト')
     parser.add_argument('competition_id', help='コンペティションID（例: titanic）')
     parser.add_argument('--max', type=int, default=10, help='要約する最大ディスカッション数（デフォルト: 10）')
+    parser.add_argument('--batch', action='store_true', help='要約を OpenAI Batch API でまとめて実行（完了まで待機）')
 
     args = parser.parse_args()
 
     summarize_discussion_for_competition(
         comp_id=args.competition_id,
-        max_discussions=args.max
+        max_discussions=args.max,
+        batch=args.batch
     )
 
 